@@ -0,0 +1,423 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-process fakes of the BigQuery REST API and the BigQuery Storage API.
+
+The fakes serve a single table with one of the schemas in ``SCHEMAS``. Every
+response body is encoded once and then replayed, so that the time and memory
+spent by the fakes stays small and constant, and the benchmarks measure the
+client libraries rather than the backend.
+"""
+
+import datetime
+import io
+import json
+import re
+
+import requests
+import requests.structures
+import six
+from six.moves import urllib
+
+from google.auth.credentials import AnonymousCredentials
+from google.cloud._helpers import UTC
+from google.cloud import bigquery
+from google.cloud.bigquery.schema import SchemaField
+
+try:
+    from concurrent import futures
+    import fastavro
+    import grpc
+    from google.cloud import bigquery_storage_v1beta1
+    from google.cloud.bigquery_storage_v1beta1.gapic.transports import (
+        big_query_storage_grpc_transport,
+    )
+    from google.cloud.bigquery_storage_v1beta1.proto import storage_pb2_grpc
+except ImportError:  # pragma: NO COVER
+    bigquery_storage_v1beta1 = None
+    storage_pb2_grpc = None
+
+
+PROJECT = "bench-project"
+DATASET = "bench_dataset"
+TABLE = "bench_table"
+TABLE_ID = "{}.{}.{}".format(PROJECT, DATASET, TABLE)
+
+# The number of distinct rows in each tabledata.list page and each BQ
+# Storage block. Larger tables repeat these rows.
+PAGE_SIZE = 1000
+NUM_STREAMS = 4
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=UTC)
+_BASE_TIMESTAMP = datetime.datetime(2019, 3, 15, tzinfo=UTC)
+_WIDE_TYPES = ("INTEGER", "FLOAT", "STRING", "BOOLEAN", "TIMESTAMP")
+
+SCHEMAS = {
+    "narrow": [
+        SchemaField("int_col", "INTEGER"),
+        SchemaField("float_col", "FLOAT"),
+        SchemaField("str_col", "STRING"),
+    ],
+    "wide": [
+        SchemaField(
+            "{}_col_{}".format(_WIDE_TYPES[index % 5].lower(), index),
+            _WIDE_TYPES[index % 5],
+        )
+        for index in range(100)
+    ],
+    "nested": [
+        SchemaField("id", "INTEGER"),
+        SchemaField("tags", "STRING", mode="REPEATED"),
+        SchemaField(
+            "record",
+            "RECORD",
+            fields=[
+                SchemaField("sub_int", "INTEGER"),
+                SchemaField("sub_str", "STRING"),
+                SchemaField("sub_ts", "TIMESTAMP"),
+                SchemaField(
+                    "items",
+                    "RECORD",
+                    mode="REPEATED",
+                    fields=[
+                        SchemaField("name", "STRING"),
+                        SchemaField("value", "FLOAT"),
+                    ],
+                ),
+            ],
+        ),
+    ],
+}
+
+_TABLE_PATH_RE = re.compile(
+    r"^/bigquery/v2/projects/[^/]+/datasets/[^/]+/tables/[^/]+(?P<method>/data|/insertAll)?$"
+)
+_JOB_PATH_RE = re.compile(r"^/bigquery/v2/projects/[^/]+/jobs/[^/]+$")
+_UPLOAD_PATH_RE = re.compile(r"^/upload/bigquery/v2/projects/[^/]+/jobs$")
+_UPLOAD_URL = "https://bigquery.googleapis.com/upload/bigquery/v2/projects/{}/jobs?upload_id=fake".format(
+    PROJECT
+)
+
+
+def _value(field, index):
+    """Return a deterministic Python value for ``field`` in row ``index``."""
+    if field.mode == "REPEATED":
+        single = SchemaField(field.name, field.field_type, fields=field.fields)
+        return [_value(single, index + offset) for offset in range(index % 3 + 1)]
+    if field.field_type == "RECORD":
+        return {sub_field.name: _value(sub_field, index) for sub_field in field.fields}
+    if field.field_type == "INTEGER":
+        return index
+    if field.field_type == "FLOAT":
+        return index * 0.5
+    if field.field_type == "STRING":
+        return u"{} {}".format(field.name, index)
+    if field.field_type == "BOOLEAN":
+        return index % 2 == 0
+    if field.field_type == "TIMESTAMP":
+        return _BASE_TIMESTAMP + datetime.timedelta(seconds=index)
+    raise ValueError("Unsupported type: {}".format(field.field_type))
+
+
+def make_row(schema, index):
+    """Return row ``index`` of the table as a tuple of Python values."""
+    return tuple(_value(field, index) for field in schema)
+
+
+def make_rows(schema, num_rows):
+    """Return ``num_rows`` rows of the table, repeating the first page."""
+    page = [make_row(schema, index) for index in range(min(num_rows, PAGE_SIZE))]
+    return [page[index % PAGE_SIZE] for index in range(num_rows)]
+
+
+def _cell_to_json(field, value):
+    """Encode a value like a ``tabledata.list`` cell."""
+    if field.mode == "REPEATED":
+        single = SchemaField(field.name, field.field_type, fields=field.fields)
+        return [{"v": _cell_to_json(single, item)} for item in value]
+    if field.field_type == "RECORD":
+        return {
+            "f": [
+                {"v": _cell_to_json(sub_field, value[sub_field.name])}
+                for sub_field in field.fields
+            ]
+        }
+    if field.field_type == "BOOLEAN":
+        return "true" if value else "false"
+    if field.field_type == "TIMESTAMP":
+        return "{!r}".format((value - _EPOCH).total_seconds())
+    return six.text_type(value)
+
+
+def row_to_json(schema, row):
+    """Encode a row like a row of a ``tabledata.list`` response."""
+    return {
+        "f": [{"v": _cell_to_json(field, value)} for field, value in zip(schema, row)]
+    }
+
+
+def _avro_type(field, namespace):
+    """Return the Avro type the BigQuery Storage API uses for ``field``."""
+    name = "{}_{}".format(namespace, field.name)
+    if field.field_type == "RECORD":
+        avro_type = {
+            "type": "record",
+            "name": name,
+            "fields": [
+                {"name": sub_field.name, "type": _avro_type(sub_field, name)}
+                for sub_field in field.fields
+            ],
+        }
+    elif field.field_type == "TIMESTAMP":
+        avro_type = {"type": "long", "logicalType": "timestamp-micros"}
+    else:
+        avro_type = {
+            "INTEGER": "long",
+            "FLOAT": "double",
+            "STRING": "string",
+            "BOOLEAN": "boolean",
+        }[field.field_type]
+
+    if field.mode == "REPEATED":
+        return {"type": "array", "items": avro_type}
+    return ["null", avro_type]
+
+
+def avro_schema(schema):
+    """Return the Avro schema of a read session, as a dictionary."""
+    return {
+        "type": "record",
+        "name": "__root__",
+        "fields": [
+            {"name": field.name, "type": _avro_type(field, "root")} for field in schema
+        ],
+    }
+
+
+def table_resource(schema, num_rows):
+    """Return a ``tables.get`` response for the benchmark table."""
+    return {
+        "tableReference": {
+            "projectId": PROJECT,
+            "datasetId": DATASET,
+            "tableId": TABLE,
+        },
+        "schema": {"fields": [field.to_api_repr() for field in schema]},
+        "numRows": str(num_rows),
+        "type": "TABLE",
+    }
+
+
+def _make_response(status_code, content, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    response.headers["content-type"] = "application/json"
+    return response
+
+
+class FakeHttp(object):
+    """Serve the REST API requests of the benchmarks from memory.
+
+    Supports ``tables.get``, ``tabledata.list``, ``tabledata.insertAll``,
+    ``jobs.get`` and resumable uploads for load jobs. Use as the ``_http``
+    argument of :class:`~google.cloud.bigquery.client.Client`.
+
+    Args:
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the table.
+        num_rows (int): The number of rows in the table.
+    """
+
+    def __init__(self, schema, num_rows):
+        self.num_rows = num_rows
+        self.bytes_uploaded = 0
+        self.rows_inserted = 0
+        self._table = json.dumps(table_resource(schema, num_rows)).encode("utf-8")
+        self._page_rows = [
+            row_to_json(schema, row) for row in make_rows(schema, PAGE_SIZE)
+        ]
+        self._pages = {}
+        self._load_job = None
+
+    def _page(self, num_rows):
+        """Return the encoded rows of a page, encoding each page size once."""
+        if num_rows not in self._pages:
+            self._pages[num_rows] = json.dumps(self._page_rows[:num_rows]).encode(
+                "utf-8"
+            )
+        return self._pages[num_rows]
+
+    def request(self, method, url, data=None, headers=None, **kwargs):
+        parsed = urllib.parse.urlparse(url)
+        query = dict(urllib.parse.parse_qsl(parsed.query))
+
+        table_match = _TABLE_PATH_RE.match(parsed.path)
+        if table_match and table_match.group("method") == "/data":
+            return self._list_rows(query)
+        if table_match and table_match.group("method") == "/insertAll":
+            # Count the rows without decoding the JSON body.
+            if isinstance(data, six.binary_type):
+                data = data.decode("utf-8")
+            self.rows_inserted += data.count(u'"insertId"')
+            return _make_response(200, b"{}")
+        if table_match:
+            return _make_response(200, self._table)
+        if _JOB_PATH_RE.match(parsed.path):
+            return _make_response(200, json.dumps(self._load_job).encode("utf-8"))
+        if _UPLOAD_PATH_RE.match(parsed.path):
+            return self._upload(method, data, headers)
+        return _make_response(404, b'{"error": {"message": "Not found"}}')
+
+    def _list_rows(self, query):
+        start = int(query.get("pageToken") or query.get("startIndex") or 0)
+        page_size = min(int(query.get("maxResults") or PAGE_SIZE), PAGE_SIZE)
+        end = min(start + page_size, self.num_rows)
+
+        content = b'{"totalRows":"' + str(self.num_rows).encode("ascii") + b'"'
+        if end < self.num_rows:
+            content += b',"pageToken":"' + str(end).encode("ascii") + b'"'
+        content += b',"rows":' + self._page(end - start) + b"}"
+        return _make_response(200, content)
+
+    def _upload(self, method, data, headers):
+        if method == "POST":
+            metadata = json.loads(data.decode("utf-8"))
+            self._load_job = dict(metadata, status={"state": "DONE"})
+            self.bytes_uploaded = 0
+            return _make_response(200, b"", headers={"location": _UPLOAD_URL})
+
+        self.bytes_uploaded += len(data)
+        content_range = headers["content-range"]
+        if content_range.endswith("/*"):
+            return _make_response(
+                308,
+                b"",
+                headers={"range": "bytes=0-{}".format(self.bytes_uploaded - 1)},
+            )
+
+        resource = dict(self._load_job, status={"state": "RUNNING"})
+        return _make_response(200, json.dumps(resource).encode("utf-8"))
+
+
+if storage_pb2_grpc is not None:
+
+    class FakeBigQueryStorage(storage_pb2_grpc.BigQueryStorageServicer):
+        """Serve Avro read sessions of the benchmark table.
+
+        Args:
+            schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+                The schema of the table.
+            num_rows (int): The number of rows in the table.
+        """
+
+        def __init__(self, schema, num_rows):
+            self.num_rows = num_rows
+            self._avro_schema = avro_schema(schema)
+            self._block = self._make_block(schema)
+
+        def _make_block(self, schema):
+            parsed_schema = fastavro.parse_schema(self._avro_schema)
+            buffer = io.BytesIO()
+            for row in make_rows(schema, PAGE_SIZE):
+                fastavro.schemaless_writer(
+                    buffer,
+                    parsed_schema,
+                    {field.name: value for field, value in zip(schema, row)},
+                )
+            return buffer.getvalue()
+
+        def CreateReadSession(self, request, context):
+            session = bigquery_storage_v1beta1.types.ReadSession(
+                name="projects/{}/sessions/fake".format(PROJECT)
+            )
+            session.avro_schema.schema = json.dumps(self._avro_schema)
+            session.table_reference.CopyFrom(request.table_reference)
+            num_streams = request.requested_streams or NUM_STREAMS
+            for index in range(num_streams):
+                session.streams.add(
+                    name="projects/{}/streams/{}-{}".format(PROJECT, index, num_streams)
+                )
+            return session
+
+        def ReadRows(self, request, context):
+            stream_name = request.read_position.stream.name.rsplit("/", 1)[1]
+            stream_index, num_streams = [int(part) for part in stream_name.split("-")]
+
+            # Split the rows evenly between the streams, in whole blocks.
+            num_blocks = -(-self.num_rows // PAGE_SIZE)
+            for block_index in range(stream_index, num_blocks, num_streams):
+                row_count = min(PAGE_SIZE, self.num_rows - block_index * PAGE_SIZE)
+                response = bigquery_storage_v1beta1.types.ReadRowsResponse()
+                if row_count == PAGE_SIZE:
+                    response.avro_rows.serialized_binary_rows = self._block
+                else:
+                    response.avro_rows.serialized_binary_rows = self._partial_block(
+                        row_count
+                    )
+                response.avro_rows.row_count = row_count
+                yield response
+
+        def _partial_block(self, row_count):
+            reader = io.BytesIO(self._block)
+            parsed_schema = fastavro.parse_schema(self._avro_schema)
+            for _ in range(row_count):
+                fastavro.schemaless_reader(reader, parsed_schema)
+            return self._block[: reader.tell()]
+
+
+def make_client(schema, num_rows):
+    """Return a BigQuery client which talks to a :class:`FakeHttp`."""
+    http = FakeHttp(schema, num_rows)
+    client = bigquery.Client(
+        project=PROJECT, credentials=AnonymousCredentials(), _http=http
+    )
+    return client, http
+
+
+class FakeStorageServer(object):
+    """Run a :class:`FakeBigQueryStorage` on a local port.
+
+    Use as a context manager, which returns a BigQuery Storage client
+    connected to the server.
+    """
+
+    def __init__(self, schema, num_rows):
+        if storage_pb2_grpc is None:
+            raise ImportError(
+                "The google-cloud-bigquery-storage, fastavro and grpcio packages "
+                "are required for BigQuery Storage API benchmarks."
+            )
+        self.servicer = FakeBigQueryStorage(schema, num_rows)
+        self._server = None
+        self._channel = None
+
+    def __enter__(self):
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=NUM_STREAMS))
+        storage_pb2_grpc.add_BigQueryStorageServicer_to_server(
+            self.servicer, self._server
+        )
+        port = self._server.add_insecure_port("localhost:0")
+        self._server.start()
+
+        self._channel = grpc.insecure_channel("localhost:{}".format(port))
+        transport = big_query_storage_grpc_transport.BigQueryStorageGrpcTransport(
+            channel=self._channel
+        )
+        return bigquery_storage_v1beta1.BigQueryStorageClient(transport=transport)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._channel.close()
+        self._server.stop(None)
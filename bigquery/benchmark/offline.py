@@ -0,0 +1,254 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Offline benchmarks of reading, writing and decoding table rows.
+
+Each benchmark runs against the in-process fakes in ``fake_backend.py``, so
+no network access or credentials are needed. Each combination of benchmark
+and schema runs in a fresh subprocess, so that its peak resident set size
+(RSS) is not affected by the other benchmarks.
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from google.cloud.bigquery import _helpers
+
+import fake_backend
+
+
+_INSERT_BATCH_SIZE = 500
+
+
+def bench_schema_decoding(schema, num_rows):
+    json_rows = [
+        fake_backend.row_to_json(schema, row)
+        for row in fake_backend.make_rows(schema, fake_backend.PAGE_SIZE)
+    ]
+
+    def run():
+        decoded = 0
+        while decoded < num_rows:
+            decoded += len(_helpers._rows_from_json(json_rows, schema))
+        return decoded
+
+    return run
+
+
+def bench_list_rows(schema, num_rows):
+    client, _ = fake_backend.make_client(schema, num_rows)
+    table = client.get_table(fake_backend.TABLE_ID)
+
+    def run():
+        return sum(1 for _ in client.list_rows(table))
+
+    return run
+
+
+def bench_to_dataframe_tabledata(schema, num_rows):
+    client, _ = fake_backend.make_client(schema, num_rows)
+    table = client.get_table(fake_backend.TABLE_ID)
+
+    def run():
+        return len(client.list_rows(table).to_dataframe())
+
+    return run
+
+
+def bench_to_dataframe_bqstorage(schema, num_rows):
+    client, _ = fake_backend.make_client(schema, num_rows)
+    table = client.get_table(fake_backend.TABLE_ID)
+    server = fake_backend.FakeStorageServer(schema, num_rows)
+
+    def run():
+        with server as bqstorage_client:
+            dataframe = client.list_rows(table).to_dataframe(
+                bqstorage_client=bqstorage_client
+            )
+        return len(dataframe)
+
+    return run
+
+
+def bench_insert_rows(schema, num_rows):
+    client, http = fake_backend.make_client(schema, num_rows)
+    table = client.get_table(fake_backend.TABLE_ID)
+    batch = fake_backend.make_rows(schema, _INSERT_BATCH_SIZE)
+
+    def run():
+        http.rows_inserted = 0
+        for start in range(0, num_rows, _INSERT_BATCH_SIZE):
+            rows = batch[: min(_INSERT_BATCH_SIZE, num_rows - start)]
+            errors = client.insert_rows(table, rows)
+            if errors:
+                raise Exception("insert_rows returned errors: {}".format(errors))
+        return http.rows_inserted
+
+    return run
+
+
+def bench_load_table_from_dataframe(schema, num_rows):
+    import pandas
+
+    client, http = fake_backend.make_client(schema, num_rows)
+    dataframe = pandas.DataFrame.from_records(
+        fake_backend.make_rows(schema, num_rows),
+        columns=[field.name for field in schema],
+    )
+
+    def run():
+        client.load_table_from_dataframe(dataframe, fake_backend.TABLE_ID)
+        if not http.bytes_uploaded:
+            raise Exception("no data was uploaded")
+        return len(dataframe)
+
+    return run
+
+
+BENCHMARKS = {
+    "schema_decoding": bench_schema_decoding,
+    "list_rows": bench_list_rows,
+    "to_dataframe_tabledata": bench_to_dataframe_tabledata,
+    "to_dataframe_bqstorage": bench_to_dataframe_bqstorage,
+    "insert_rows": bench_insert_rows,
+    "load_table_from_dataframe": bench_load_table_from_dataframe,
+}
+
+
+def _max_rss_mb():
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    if sys.platform == "darwin":
+        return max_rss / (1024.0 * 1024.0)
+    return max_rss / 1024.0
+
+
+def run_one(benchmark, schema_name, num_rows, repeat):
+    """Run a single benchmark in this process and print its result as JSON."""
+    schema = fake_backend.SCHEMAS[schema_name]
+    run = BENCHMARKS[benchmark](schema, num_rows)
+    setup_rss = _max_rss_mb()
+
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        rows = run()
+        elapsed = time.time() - start
+        if rows != num_rows:
+            raise Exception("expected {} rows, got {}".format(num_rows, rows))
+        best = elapsed if best is None else min(best, elapsed)
+
+    print(
+        json.dumps(
+            {
+                "seconds": best,
+                "rows_per_second": num_rows / best,
+                "setup_rss_mb": setup_rss,
+                "peak_rss_mb": _max_rss_mb(),
+            }
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="Benchmark to run. May be repeated. Defaults to all benchmarks.",
+    )
+    parser.add_argument(
+        "--schema",
+        action="append",
+        choices=sorted(fake_backend.SCHEMAS),
+        help="Schema of the table. May be repeated. Defaults to all schemas.",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    parser.add_argument("--run-one", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    benchmarks = args.benchmark or sorted(BENCHMARKS)
+    schemas = args.schema or sorted(fake_backend.SCHEMAS)
+
+    if args.run_one:
+        run_one(benchmarks[0], schemas[0], args.rows, args.repeat)
+        return
+
+    results = []
+    failed = False
+    if not args.json:
+        print(
+            "{:<26} {:<7} {:>12} {:>14} {:>14}".format(
+                "benchmark", "schema", "rows/sec", "setup RSS MB", "peak RSS MB"
+            )
+        )
+
+    for benchmark in benchmarks:
+        for schema_name in schemas:
+            command = [
+                sys.executable,
+                os.path.abspath(__file__),
+                "--run-one",
+                "--benchmark",
+                benchmark,
+                "--schema",
+                schema_name,
+                "--rows",
+                str(args.rows),
+                "--repeat",
+                str(args.repeat),
+            ]
+            process = subprocess.Popen(
+                command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+            stdout, stderr = process.communicate()
+            if process.returncode != 0:
+                failed = True
+                result = {"error": stderr.decode("utf-8").strip().splitlines()[-1]}
+            else:
+                result = json.loads(stdout.decode("utf-8").strip().splitlines()[-1])
+            result.update(benchmark=benchmark, schema=schema_name, rows=args.rows)
+            results.append(result)
+
+            if args.json:
+                continue
+            if "error" in result:
+                print("{:<26} {:<7} {}".format(benchmark, schema_name, result["error"]))
+            else:
+                print(
+                    "{:<26} {:<7} {:>12.0f} {:>14.1f} {:>14.1f}".format(
+                        benchmark,
+                        schema_name,
+                        result["rows_per_second"],
+                        result["setup_rss_mb"],
+                        result["peak_rss_mb"],
+                    )
+                )
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Micro-benchmark for converting tabledata.list JSON rows to tuples.
+
+Compares the per-cell lookups in ``_row_tuple_from_json`` with the
+schema-compiled decoder from ``_row_tuple_decoder``. No network access or
+credentials are needed.
+"""
+
+import argparse
+import timeit
+
+from google.cloud.bigquery import _helpers
+from google.cloud.bigquery.schema import SchemaField
+
+
+SCHEMA = [
+    SchemaField("int_col", "INTEGER"),
+    SchemaField("float_col", "FLOAT"),
+    SchemaField("str_col", "STRING"),
+    SchemaField("bool_col", "BOOLEAN"),
+    SchemaField("ts_col", "TIMESTAMP"),
+    SchemaField("date_col", "DATE"),
+    SchemaField("num_col", "NUMERIC"),
+    SchemaField("tags", "STRING", mode="REPEATED"),
+    SchemaField(
+        "struct_col",
+        "RECORD",
+        fields=[SchemaField("sub_int", "INTEGER"), SchemaField("sub_str", "STRING")],
+    ),
+]
+
+
+def make_rows(num_rows):
+    rows = []
+    for index in range(num_rows):
+        # Make every tenth row all nulls.
+        if index % 10 == 0:
+            rows.append(
+                {"f": [{"v": None} for _ in SCHEMA[:-2]] + [{"v": []}, {"v": None}]}
+            )
+            continue
+        rows.append(
+            {
+                "f": [
+                    {"v": str(index)},
+                    {"v": "{}.5".format(index)},
+                    {"v": "row {}".format(index)},
+                    {"v": "true" if index % 2 else "false"},
+                    {"v": "1.5523488E9"},
+                    {"v": "2019-03-15"},
+                    {"v": "123.456789"},
+                    {"v": [{"v": "a"}, {"v": "b"}]},
+                    {"v": {"f": [{"v": str(index)}, {"v": "sub"}]}},
+                ]
+            }
+        )
+    return rows
+
+
+def decode_per_cell(rows):
+    return [_helpers._row_tuple_from_json(row, SCHEMA) for row in rows]
+
+
+def decode_compiled(rows):
+    decode_row = _helpers._row_tuple_decoder(SCHEMA)
+    return [decode_row(row) for row in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    if decode_per_cell(rows) != decode_compiled(rows):
+        raise Exception("decoders returned different values")
+
+    for name, decode in (("per-cell", decode_per_cell), ("compiled", decode_compiled)):
+        best = min(timeit.repeat(lambda: decode(rows), number=1, repeat=args.repeat))
+        print(
+            "{0}: {1} rows in {2:.3f} sec, {3:.0f} rows/sec".format(
+                name, args.rows, best, args.rows / best
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
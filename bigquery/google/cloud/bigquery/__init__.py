@@ -60,6 +60,7 @@ from google.cloud.bigquery.job import SchemaUpdateOption
 from google.cloud.bigquery.job import SourceFormat
 from google.cloud.bigquery.job import UnknownJob
 from google.cloud.bigquery.job import WriteDisposition
+from google.cloud.bigquery.job_monitor import JobMonitor
 from google.cloud.bigquery.model import Model
 from google.cloud.bigquery.model import ModelReference
 from google.cloud.bigquery.query import ArrayQueryParameter
@@ -68,6 +69,7 @@ from google.cloud.bigquery.query import StructQueryParameter
 from google.cloud.bigquery.query import UDFResource
 from google.cloud.bigquery.retry import DEFAULT_RETRY
 from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.streaming import StreamingInserter
 from google.cloud.bigquery.table import EncryptionConfiguration
 from google.cloud.bigquery.table import Table
 from google.cloud.bigquery.table import TableReference
@@ -93,6 +95,7 @@ __all__ = [
     "Table",
     "TableReference",
     "Row",
+    "StreamingInserter",
     "CopyJob",
     "CopyJobConfig",
     "ExtractJob",
@@ -100,6 +103,7 @@ __all__ = [
     "LoadJob",
     "LoadJobConfig",
     "UnknownJob",
+    "JobMonitor",
     "TimePartitioningType",
     "TimePartitioning",
     # Models
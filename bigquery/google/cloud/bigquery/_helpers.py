@@ -18,6 +18,7 @@ import base64
 import copy
 import datetime
 import decimal
+import functools
 
 from google.cloud._helpers import UTC
 from google.cloud._helpers import _date_from_iso8601_date
@@ -161,12 +162,7 @@ def _record_from_json(value, field):
         record = {}
         record_iter = zip(field.fields, value["f"])
         for subfield, cell in record_iter:
-            converter = _CELLDATA_FROM_JSON[subfield.field_type]
-            if subfield.mode == "REPEATED":
-                value = [converter(item["v"], subfield) for item in cell["v"]]
-            else:
-                value = converter(cell["v"], subfield)
-            record[subfield.name] = value
+            record[subfield.name] = _field_from_json(cell["v"], subfield)
         return record
 
 
@@ -197,6 +193,25 @@ def _field_to_index_mapping(schema):
     return {f.name: i for i, f in enumerate(schema)}
 
 
+def _field_from_json(resource, field):
+    """Convert a JSON cell value to the native type for ``field``.
+
+    :type resource: object
+    :param resource: The ``v`` value of a JSON response cell.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The field describing the cell.
+
+    :rtype: object
+    :returns: The cell value converted to a native type.
+    """
+    converter = _CELLDATA_FROM_JSON[field.field_type]
+    if field.mode == "REPEATED":
+        return [converter(item["v"], field) for item in resource]
+    else:
+        return converter(resource, field)
+
+
 def _row_tuple_from_json(row, schema):
     """Convert JSON row data to row with appropriate types.
 
@@ -214,21 +229,153 @@ def _row_tuple_from_json(row, schema):
     """
     row_data = []
     for field, cell in zip(schema, row["f"]):
-        converter = _CELLDATA_FROM_JSON[field.field_type]
-        if field.mode == "REPEATED":
-            row_data.append([converter(item["v"], field) for item in cell["v"]])
-        else:
-            row_data.append(converter(cell["v"], field))
+        row_data.append(_field_from_json(cell["v"], field))
 
     return tuple(row_data)
 
 
+def _identity(value):
+    """Return ``value`` unchanged."""
+    return value
+
+
+def _bool_value_from_json(value):
+    """Coerce a non-null 'value' to a bool."""
+    return value.lower() in ["t", "true", "1"]
+
+
+def _timestamp_value_from_json(value):
+    """Coerce a non-null 'value' to a datetime."""
+    return _datetime_from_microseconds(1e6 * float(value))
+
+
+def _date_value_from_json(value):
+    """Coerce a non-null 'value' in YYYY-MM-DD form to a date."""
+    if len(value) == 10:
+        # Slicing is much faster than strptime for the canonical format.
+        return datetime.date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+    return _date_from_iso8601_date(value)
+
+
+# Converters for cell values which are not null. The compiled decoders use
+# these to avoid checking the field mode for every cell.
+_CELL_VALUE_FROM_JSON = {
+    "INTEGER": int,
+    "INT64": int,
+    "FLOAT": float,
+    "FLOAT64": float,
+    "NUMERIC": decimal.Decimal,
+    "BOOLEAN": _bool_value_from_json,
+    "BOOL": _bool_value_from_json,
+    "STRING": _identity,
+    "GEOGRAPHY": _identity,
+    "TIMESTAMP": _timestamp_value_from_json,
+    "DATE": _date_value_from_json,
+}
+
+# Compiled row decoders, keyed by schema.
+_ROW_DECODER_CACHE = {}
+_ROW_DECODER_CACHE_SIZE = 128
+
+
+def _record_decoder(field):
+    """Build a function converting a non-null JSON record for ``field``."""
+    names = [subfield.name for subfield in field.fields]
+    decoders = [_cell_decoder(subfield) for subfield in field.fields]
+
+    def decode_record(value):
+        return {
+            name: decode(cell["v"])
+            for name, decode, cell in zip(names, decoders, value["f"])
+        }
+
+    return decode_record
+
+
+def _cell_decoder(field):
+    """Build a function converting JSON cell values for ``field``.
+
+    The type and mode of the field are looked up once, when the decoder is
+    built, rather than for every cell.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The field describing the cells.
+
+    :rtype: Callable[[object], object]
+    :returns: A function converting the ``v`` value of a JSON response cell
+              to the same value as :func:`_field_from_json`.
+    """
+    converter = _CELLDATA_FROM_JSON.get(field.field_type)
+    if converter is None:
+        # Unknown types fail when a cell is converted, not before.
+        return functools.partial(_field_from_json, field=field)
+
+    if field.field_type == "RECORD":
+        decode_value = _record_decoder(field)
+    else:
+        decode_value = _CELL_VALUE_FROM_JSON.get(field.field_type)
+        if decode_value is None:
+            decode_value = functools.partial(_call_converter, converter, field)
+
+    if field.mode == "REPEATED":
+        return lambda value: [decode_value(item["v"]) for item in value]
+
+    if field.mode == "NULLABLE" and decode_value is not _identity:
+        return lambda value: None if value is None else decode_value(value)
+
+    return decode_value
+
+
+def _call_converter(converter, field, value):
+    """Call one of the ``_CELLDATA_FROM_JSON`` converters."""
+    return converter(value, field)
+
+
+def _build_row_tuple_decoder(schema):
+    decoders = [_cell_decoder(field) for field in schema]
+
+    def decode_row(row):
+        return tuple([decode(cell["v"]) for decode, cell in zip(decoders, row["f"])])
+
+    return decode_row
+
+
+def _row_tuple_decoder(schema):
+    """Get a compiled function converting JSON rows to tuples.
+
+    Decoders are cached by schema, so iterators over tables with the same
+    schema share them.
+
+    :type schema: Sequence[:class:`~google.cloud.bigquery.schema.SchemaField`]
+    :param schema: The schema of the rows.
+
+    :rtype: Callable[[dict], tuple]
+    :returns: A function returning the same values as
+              :func:`_row_tuple_from_json` for a JSON row in ``schema``.
+    """
+    key = tuple(schema)
+    try:
+        return _ROW_DECODER_CACHE[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable schema, don't cache.
+        return _build_row_tuple_decoder(schema)
+
+    decoder = _build_row_tuple_decoder(schema)
+    if len(_ROW_DECODER_CACHE) >= _ROW_DECODER_CACHE_SIZE:
+        _ROW_DECODER_CACHE.clear()
+    _ROW_DECODER_CACHE[key] = decoder
+    return decoder
+
+
 def _rows_from_json(values, schema):
     """Convert JSON row data to rows with appropriate types."""
     from google.cloud.bigquery import Row
 
     field_to_index = _field_to_index_mapping(schema)
-    return [Row(_row_tuple_from_json(r, schema), field_to_index) for r in values]
+    decode_row = _row_tuple_decoder(schema)
+    return [Row(decode_row(r), field_to_index) for r in values]
 
 
 def _int_to_json(value):
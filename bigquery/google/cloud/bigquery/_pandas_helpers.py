@@ -0,0 +1,474 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared helper functions for connecting BigQuery and pandas / pyarrow."""
+
+import io
+import json
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+from google.cloud.bigquery import _helpers
+from google.cloud.bigquery.schema import SchemaField
+
+
+_STRUCT_TYPES = ("RECORD", "STRUCT")
+
+_PARQUET_ROW_GROUP_SIZE = 100000
+
+
+def pyarrow_datetime():
+    return pyarrow.timestamp("us", tz=None)
+
+
+def pyarrow_numeric():
+    return pyarrow.decimal128(38, 9)
+
+
+def pyarrow_time():
+    return pyarrow.time64("us")
+
+
+def pyarrow_timestamp():
+    return pyarrow.timestamp("us", tz="UTC")
+
+
+if pyarrow:
+    BQ_TO_ARROW_SCALARS = {
+        "BOOL": pyarrow.bool_,
+        "BOOLEAN": pyarrow.bool_,
+        "BYTES": pyarrow.binary,
+        "DATE": pyarrow.date32,
+        "DATETIME": pyarrow_datetime,
+        "FLOAT": pyarrow.float64,
+        "FLOAT64": pyarrow.float64,
+        "GEOGRAPHY": pyarrow.string,
+        "INT64": pyarrow.int64,
+        "INTEGER": pyarrow.int64,
+        "NUMERIC": pyarrow_numeric,
+        "STRING": pyarrow.string,
+        "TIME": pyarrow_time,
+        "TIMESTAMP": pyarrow_timestamp,
+    }
+else:  # pragma: NO COVER
+    BQ_TO_ARROW_SCALARS = {}
+
+
+def bq_to_arrow_struct_data_type(field):
+    """Return the Arrow struct type for a RECORD field.
+
+    Returns :data:`None` if any of the subfield types are unknown.
+    """
+    arrow_fields = []
+    for subfield in field.fields:
+        arrow_subfield = bq_to_arrow_field(subfield)
+        if arrow_subfield is None:
+            return None
+        arrow_fields.append(arrow_subfield)
+    return pyarrow.struct(arrow_fields)
+
+
+def bq_to_arrow_data_type(field):
+    """Return the Arrow data type, corresponding to a given BigQuery column.
+
+    Returns:
+        None: if default Arrow type inspection should be used.
+    """
+    if field.mode is not None and field.mode.upper() == "REPEATED":
+        inner_type = bq_to_arrow_data_type(
+            SchemaField(field.name, field.field_type, fields=field.fields)
+        )
+        if inner_type is None:
+            return None
+        return pyarrow.list_(inner_type)
+
+    field_type_upper = field.field_type.upper() if field.field_type else ""
+    if field_type_upper in _STRUCT_TYPES:
+        return bq_to_arrow_struct_data_type(field)
+
+    data_type_constructor = BQ_TO_ARROW_SCALARS.get(field_type_upper)
+    if data_type_constructor is None:
+        return None
+    return data_type_constructor()
+
+
+def bq_to_arrow_field(bq_field):
+    """Return the Arrow field, corresponding to a given BigQuery column.
+
+    Returns:
+        None: if the Arrow type cannot be determined.
+    """
+    arrow_type = bq_to_arrow_data_type(bq_field)
+    if arrow_type is None:
+        return None
+    return pyarrow.field(bq_field.name, arrow_type)
+
+
+def bq_to_arrow_schema(bq_schema):
+    """Return the Arrow schema, corresponding to a given BigQuery schema.
+
+    Returns:
+        None: if any Arrow type cannot be determined.
+    """
+    arrow_fields = []
+    for bq_field in bq_schema:
+        arrow_field = bq_to_arrow_field(bq_field)
+        if arrow_field is None:
+            # Auto-detect the schema if there is an unknown field type.
+            return None
+        arrow_fields.append(arrow_field)
+    return pyarrow.schema(arrow_fields)
+
+
+def bq_to_arrow_array(values, bq_field):
+    """Build an Arrow array from a sequence of Python values for a column.
+
+    Uses Arrow type inference if the column type is not known.
+    """
+    return pyarrow.array(values, type=bq_to_arrow_data_type(bq_field))
+
+
+def tabledata_list_page_columns(schema, response):
+    """Make a generator of all the columns in a page from tabledata.list.
+
+    Each column is converted lazily, directly from the JSON cells, so that
+    column-oriented data structures such as :class:`pyarrow.RecordBatch` can
+    be built without constructing a
+    :class:`~google.cloud.bigquery.table.Row` per row.
+    """
+    columns = []
+    rows = response.get("rows", [])
+
+    def get_column_data(field_index, field):
+        decode = _helpers._cell_decoder(field)
+        for row in rows:
+            yield decode(row["f"][field_index]["v"])
+
+    for field_index, field in enumerate(schema):
+        columns.append(get_column_data(field_index, field))
+
+    return columns
+
+
+def tabledata_list_page_to_arrow(page, schema):
+    """Convert a page of tabledata.list rows to a :class:`pyarrow.RecordBatch`.
+
+    Args:
+        page (google.api_core.page_iterator.Page):
+            A page whose ``_columns`` attribute was populated by
+            :func:`tabledata_list_page_columns`.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the rows in the page.
+
+    Returns:
+        pyarrow.RecordBatch: The page's rows, in columnar form.
+    """
+    arrays = [
+        bq_to_arrow_array(list(column), field)
+        for column, field in zip(page._columns, schema)
+    ]
+    names = [field.name for field in schema]
+    return pyarrow.RecordBatch.from_arrays(arrays, names)
+
+
+def bqstorage_arrow_schema(session):
+    """Parse the Arrow schema of a BigQuery Storage API read session.
+
+    Args:
+        session (google.cloud.bigquery_storage_v1beta1.types.ReadSession):
+            A read session.
+
+    Returns:
+        Optional[pyarrow.Schema]:
+            The schema of the session's record batches, or :data:`None` if
+            the session uses the Avro data format.
+    """
+    if session.WhichOneof("schema") != "arrow_schema":
+        return None
+    return pyarrow.ipc.read_schema(
+        pyarrow.py_buffer(session.arrow_schema.serialized_schema)
+    )
+
+
+def bqstorage_column_names(session):
+    """Find the column names of a BigQuery Storage API read session.
+
+    The read session determines the column order, which may differ from the
+    order of the fields in the table's schema.
+
+    Args:
+        session (google.cloud.bigquery_storage_v1beta1.types.ReadSession):
+            A read session, using either the Arrow or the Avro data format.
+
+    Returns:
+        List[str]: The column names, in the order defined by the session.
+    """
+    if session.WhichOneof("schema") == "arrow_schema":
+        return bqstorage_arrow_schema(session).names
+    avro_schema = json.loads(session.avro_schema.schema)
+    return [field["name"] for field in avro_schema["fields"]]
+
+
+def bqstorage_avro_page_to_arrow(page, column_names, schema):
+    """Convert a page of a BigQuery Storage API Avro stream to a record batch.
+
+    The page is decoded straight into columns by
+    :meth:`~google.cloud.bigquery_storage_v1beta1.reader.ReadRowsPage.to_dataframe`,
+    with the ``object`` dtype so that the Python values are kept (integers in
+    nullable columns would otherwise become floats), and each column is then
+    converted to Arrow. Pages of an Arrow stream need no conversion; use
+    :meth:`~google.cloud.bigquery_storage_v1beta1.reader.ReadRowsPage.to_arrow`.
+
+    Args:
+        page (google.cloud.bigquery_storage_v1beta1.reader.ReadRowsPage):
+            A page of rows from an Avro read session stream.
+        column_names (Sequence[str]):
+            The column names, in the order defined by the read session.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The BigQuery schema for the columns, in the same order as
+            ``column_names``.
+
+    Returns:
+        pyarrow.RecordBatch: The page's rows, in columnar form.
+    """
+    df = page.to_dataframe(dtypes=dict.fromkeys(column_names, "object"))
+    arrays = [
+        bq_to_arrow_array(df[name], field) for name, field in zip(column_names, schema)
+    ]
+    return pyarrow.RecordBatch.from_arrays(arrays, column_names)
+
+
+def record_batches_to_table(record_batches, schema):
+    """Combine record batches into a single :class:`pyarrow.Table`.
+
+    Args:
+        record_batches (Sequence[pyarrow.RecordBatch]):
+            Record batches sharing the same columns.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The BigQuery schema of the record batches' columns.
+
+    Returns:
+        pyarrow.Table: A table referencing the record batches without
+        copying their buffers.
+    """
+    arrow_schema = bq_to_arrow_schema(schema)
+    if arrow_schema is not None:
+        return pyarrow.Table.from_batches(record_batches, schema=arrow_schema)
+
+    if not record_batches:
+        arrays = [pyarrow.array([]) for _ in schema]
+        names = [field.name for field in schema]
+        record_batches = [pyarrow.RecordBatch.from_arrays(arrays, names)]
+    return pyarrow.Table.from_batches(record_batches)
+
+
+def dataframe_to_bq_schema(dataframe, bq_schema):
+    """Select the BigQuery fields describing a DataFrame's columns.
+
+    Args:
+        dataframe (pandas.DataFrame): The DataFrame to be converted.
+        bq_schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            A BigQuery schema, such as the schema of the destination table.
+
+    Returns:
+        Optional[List[google.cloud.bigquery.schema.SchemaField]]:
+            The fields in the DataFrame's column order, or :data:`None` if
+            a column is missing from ``bq_schema`` or has an unknown type.
+    """
+    fields_by_name = {field.name: field for field in bq_schema or ()}
+    selected_fields = []
+    for column in dataframe.columns:
+        field = fields_by_name.get(column)
+        if field is None or bq_to_arrow_field(field) is None:
+            return None
+        selected_fields.append(field)
+    return selected_fields
+
+
+def dataframe_to_arrow(dataframe, bq_schema):
+    """Convert a DataFrame to a :class:`pyarrow.Table`.
+
+    Args:
+        dataframe (pandas.DataFrame): The DataFrame to be converted.
+        bq_schema (Optional[Sequence[google.cloud.bigquery.schema.SchemaField]]):
+            The BigQuery fields for the DataFrame's columns, in the same
+            order. If :data:`None`, the Arrow types are inferred from the
+            DataFrame.
+
+    Returns:
+        pyarrow.Table: The DataFrame's columns, in Arrow format.
+    """
+    if bq_schema is None:
+        return pyarrow.Table.from_pandas(dataframe)
+
+    arrays = [bq_to_arrow_array(dataframe[field.name], field) for field in bq_schema]
+    return pyarrow.Table.from_arrays(arrays, schema=bq_to_arrow_schema(bq_schema))
+
+
+class ParquetStream(io.RawIOBase):
+    """A readable stream of a DataFrame encoded as a Parquet file.
+
+    Row groups are encoded lazily, as the stream is read, so at most one
+    row group and one read's worth of bytes are held in memory at a time.
+    This lets the file be sent chunk by chunk in a resumable upload without
+    first writing it to disk.
+
+    The stream can seek back to the start of the most recent read, which
+    is what a resumable upload needs to recover from a failed chunk.
+
+    Args:
+        dataframe (pandas.DataFrame): The DataFrame to encode.
+        bq_schema (Optional[Sequence[google.cloud.bigquery.schema.SchemaField]]):
+            The BigQuery fields for the DataFrame's columns, used as the
+            Parquet file's schema. If :data:`None`, the types are inferred.
+        row_group_size (Optional[int]):
+            The number of DataFrame rows to encode in each row group.
+    """
+
+    def __init__(self, dataframe, bq_schema=None, row_group_size=None):
+        if row_group_size is None:
+            row_group_size = _PARQUET_ROW_GROUP_SIZE
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be positive")
+
+        self._dataframe = dataframe
+        self._bq_schema = bq_schema
+        # Without BigQuery fields, infer the Arrow types once, from the
+        # whole DataFrame, so every row group has the same schema even if a
+        # column is all null in some of them.
+        self._arrow_schema = None
+        if bq_schema is None:
+            self._arrow_schema = pyarrow.Schema.from_pandas(dataframe)
+        self._row_group_size = row_group_size
+        self._next_row = 0
+        self._writer = None
+        # Encoded bytes which have not been discarded yet. The first byte
+        # in the buffer is at ``self._buffer_start`` in the stream.
+        self._buffer = bytearray()
+        self._buffer_start = 0
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("can only seek relative to the start")
+
+        buffer_end = self._buffer_start + len(self._buffer)
+        if not self._buffer_start <= offset <= buffer_end:
+            raise io.UnsupportedOperation(
+                "can only seek back to the start of the most recent read"
+            )
+        self._position = offset
+        return offset
+
+    def read(self, size=-1):
+        if self.closed:
+            raise ValueError("I/O operation on closed stream.")
+
+        # Bytes before the current position will not be re-read.
+        del self._buffer[: self._position - self._buffer_start]
+        self._buffer_start = self._position
+
+        while size is None or size < 0 or len(self._buffer) < size:
+            if not self._encode_next_row_group():
+                break
+
+        if size is None or size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        self._position += len(data)
+        return data
+
+    def readall(self):
+        return self.read()
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self):
+        self._writer = None
+        self._dataframe = None
+        del self._buffer[:]
+        super(ParquetStream, self).close()
+
+    def _encode_next_row_group(self):
+        """Encode the next row group, or the file footer, into the buffer.
+
+        Returns:
+            bool: :data:`False` if the whole file has been encoded.
+        """
+        if self._dataframe is None:
+            return False
+
+        stop = self._next_row + self._row_group_size
+        chunk = self._dataframe.iloc[self._next_row : stop]
+        if self._arrow_schema is not None:
+            table = pyarrow.Table.from_pandas(chunk, schema=self._arrow_schema)
+        else:
+            table = dataframe_to_arrow(chunk, self._bq_schema)
+        if self._writer is None:
+            self._writer = pyarrow.parquet.ParquetWriter(
+                _ParquetSink(self._buffer), table.schema
+            )
+
+        if table.num_rows:
+            self._writer.write_table(table)
+        self._next_row = stop
+
+        if self._next_row >= len(self._dataframe.index):
+            self._writer.close()
+            self._writer = None
+            self._dataframe = None
+        return True
+
+
+class _ParquetSink(object):
+    """Writable file-like object which appends to a :class:`bytearray`."""
+
+    closed = False
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        self._bytes_written = 0
+
+    def write(self, data):
+        self._buffer.extend(data)
+        self._bytes_written += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._bytes_written
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
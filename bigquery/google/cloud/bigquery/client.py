@@ -41,6 +41,7 @@ import google.cloud._helpers
 from google.cloud import exceptions
 from google.cloud.client import ClientWithProject
 
+from google.cloud.bigquery import _pandas_helpers
 from google.cloud.bigquery._helpers import _record_field_to_json
 from google.cloud.bigquery._helpers import _str_or_none
 from google.cloud.bigquery._http import Connection
@@ -1254,6 +1255,19 @@ class Client(ClientWithProject):
                 does not yet exist, the schema is inferred from the
                 :class:`~pandas.DataFrame`.
 
+                The DataFrame is encoded as Parquet, one row group at a time,
+                while it is uploaded. When :mod:`pyarrow` is installed, no
+                temporary file is written and the column types are taken
+                from the destination table's schema (or
+                ``job_config.schema``), when known.
+
+                To find the destination table's schema, this method makes an
+                extra ``tables.get`` API request, unless ``job_config.schema``
+                is set, ``destination`` is a
+                :class:`~google.cloud.bigquery.table.Table` with a schema, or
+                ``job_config.write_disposition`` is ``WRITE_TRUNCATE``, which
+                replaces the table's schema.
+
                 If a string is passed in, this method attempts to create a
                 table reference from a string using
                 :func:`google.cloud.bigquery.table.TableReference.from_string`.
@@ -1292,6 +1306,27 @@ class Client(ClientWithProject):
         if location is None:
             location = self.location
 
+        if _pandas_helpers.pyarrow is not None:
+            bq_schema = _pandas_helpers.dataframe_to_bq_schema(
+                dataframe, self._get_load_schema(destination, job_config)
+            )
+            parquet_stream = _pandas_helpers.ParquetStream(dataframe, bq_schema)
+            try:
+                return self.load_table_from_file(
+                    parquet_stream,
+                    destination,
+                    num_retries=num_retries,
+                    job_id=job_id,
+                    job_id_prefix=job_id_prefix,
+                    location=location,
+                    project=project,
+                    job_config=job_config,
+                )
+            finally:
+                parquet_stream.close()
+
+        # Without pyarrow, fall back to the pandas Parquet engine (such as
+        # fastparquet), which can only write to a file.
         tmpfd, tmppath = tempfile.mkstemp(suffix="_job_{}.parquet".format(job_id[:8]))
         os.close(tmpfd)
 
@@ -1314,6 +1349,34 @@ class Client(ClientWithProject):
         finally:
             os.remove(tmppath)
 
+    def _get_load_schema(self, destination, job_config):
+        """Find the schema of the table a DataFrame is loaded into.
+
+        Uses the schema from ``job_config`` if set. Otherwise, the schema of
+        the destination table, fetching it with an extra API request if
+        necessary. A ``WRITE_TRUNCATE`` load replaces the table's schema, so
+        the table is not fetched for one.
+
+        Returns:
+            Optional[Sequence[google.cloud.bigquery.schema.SchemaField]]:
+                The schema, or :data:`None` if the table does not exist yet,
+                or can not be fetched, such as without permission to get its
+                metadata, in which case the types are inferred.
+        """
+        if job_config.schema:
+            return job_config.schema
+
+        if isinstance(destination, Table) and destination.schema:
+            return destination.schema
+
+        if job_config.write_disposition == job.WriteDisposition.WRITE_TRUNCATE:
+            return None
+
+        try:
+            return self.get_table(destination).schema
+        except google.api_core.exceptions.GoogleAPICallError:
+            return None
+
     def _do_resumable_upload(self, stream, metadata, num_retries):
         """Perform a resumable upload.
 
@@ -1843,6 +1906,7 @@ class Client(ClientWithProject):
         start_index=None,
         page_size=None,
         retry=DEFAULT_RETRY,
+        prefetch_pages=0,
     ):
         """List the rows of the table.
 
@@ -1889,6 +1953,11 @@ class Client(ClientWithProject):
                 to a sensible value set by the API.
             retry (:class:`google.api_core.retry.Retry`):
                 (Optional) How to retry the RPC.
+            prefetch_pages (int):
+                Optional. The number of pages to fetch in background threads
+                while the current page is processed. When the total number of
+                rows is known, pages are fetched in parallel by row index.
+                Defaults to ``0``, which fetches pages one at a time.
 
         Returns:
             google.cloud.bigquery.table.RowIterator:
@@ -1935,6 +2004,7 @@ class Client(ClientWithProject):
             # Pass in selected_fields separately from schema so that full
             # tables can be fetched without a column filter.
             selected_fields=selected_fields,
+            prefetch_pages=prefetch_pages,
         )
         return row_iterator
 
@@ -23,10 +23,17 @@ class Connection(object):
 
     :type client: :class:`~google.cloud.bigquery.Client`
     :param client: A client used to connect to BigQuery.
+
+    :type bqstorage_client: \
+        :class:`~google.cloud.bigquery_storage_v1beta1.BigQueryStorageClient`
+    :param bqstorage_client:
+        (Optional) A client used to fetch query results with the BigQuery
+        Storage API.
     """
 
-    def __init__(self, client):
+    def __init__(self, client, bqstorage_client=None):
         self._client = client
+        self._bqstorage_client = bqstorage_client
 
     def close(self):
         """No-op."""
@@ -43,7 +50,7 @@ class Connection(object):
         return cursor.Cursor(self)
 
 
-def connect(client=None):
+def connect(client=None, bqstorage_client=None):
     """Construct a DB-API connection to Google BigQuery.
 
     :type client: :class:`~google.cloud.bigquery.Client`
@@ -51,9 +58,17 @@ def connect(client=None):
         (Optional) A client used to connect to BigQuery. If not passed, a
         client is created using default options inferred from the environment.
 
+    :type bqstorage_client: \
+        :class:`~google.cloud.bigquery_storage_v1beta1.BigQueryStorageClient`
+    :param bqstorage_client:
+        **Beta Feature** (Optional) A client used to fetch query results with
+        the faster, but billable, BigQuery Storage API. Pages of results are
+        downloaded in background threads while the cursor is read. If the
+        API cannot read the results table, tabledata.list is used instead.
+
     :rtype: :class:`~google.cloud.bigquery.dbapi.Connection`
     :returns: A new DB-API connection to BigQuery.
     """
     if client is None:
         client = bigquery.Client()
-    return Connection(client)
+    return Connection(client, bqstorage_client=bqstorage_client)
@@ -15,19 +15,61 @@
 """Cursor for the Google BigQuery DB-API."""
 
 import collections
+import json
+import re
 
 try:
     from collections import abc as collections_abc
 except ImportError:  # Python 2.7
     import collections as collections_abc
 
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 import six
 
+import google.api_core.exceptions
+from google.cloud.bigquery import _pandas_helpers
 from google.cloud.bigquery import job
+from google.cloud.bigquery import table
 from google.cloud.bigquery.dbapi import _helpers
 from google.cloud.bigquery.dbapi import exceptions
 import google.cloud.exceptions
 
+# Fetch the next page of tabledata.list results in the background while the
+# current page is read.
+_PREFETCH_PAGES = 1
+
+# Read results with fewer rows than this with tabledata.list, even if the
+# connection has a BigQuery Storage API client. Creating a read session and
+# opening its streams costs more than a few tabledata.list pages.
+_BQSTORAGE_MIN_ROWS = 10000
+
+# Limits for combining executemany() parameter sets into one INSERT statement.
+# See: https://cloud.google.com/bigquery/quotas#query_jobs
+_MAX_BATCH_QUERY_LENGTH = 1024 * 1024
+_MAX_BATCH_QUERY_PARAMETERS = 10000
+# Serialized parameter bytes per statement, leaving room for the statement
+# itself under the 10 MB maximum request size.
+_MAX_BATCH_PARAMETER_BYTES = 8 * 1024 * 1024
+# Maximum number of batched INSERT jobs from executemany() to run at once.
+_MAX_CONCURRENT_BATCH_JOBS = 4
+
+# An INSERT statement ending with a single VALUES row, such as
+# "INSERT INTO `dataset.table` (a, b) VALUES (%s, %s)".
+_INSERT_VALUES_RE = re.compile(
+    r"^(?P<prefix>\s*INSERT\s+(?:INTO\s+)?(?:`[^`]+`|[^\s(]+)\s*"
+    r"(?:\([^)]*\)\s*)?VALUES\s*)(?P<values>\(.*\))\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
 # Per PEP 249: A 7-item sequence containing information describing one result
 # column. The first two items (name and type_code) are mandatory, the other
 # five are optional and are set to None if no meaningful values can be
@@ -149,7 +191,6 @@ class Cursor(object):
         """
         self._query_data = None
         self._query_job = None
-        client = self.connection._client
 
         # The DB-API uses the pyformat formatting, since the way BigQuery does
         # query parameters was not one of the standard options. Convert both
@@ -158,34 +199,99 @@ class Cursor(object):
         formatted_operation = _format_operation(operation, parameters=parameters)
         query_parameters = _helpers.to_query_parameters(parameters)
 
+        self._query_job = self._start_query(
+            formatted_operation, query_parameters, job_id=job_id
+        )
+        query_results = self._wait_for_query(self._query_job)
+        self._set_rowcount(query_results)
+        self._set_description(query_results.schema)
+
+    def _start_query(self, formatted_operation, query_parameters, job_id=None):
+        """Start a query job, without waiting for it to finish.
+
+        :rtype: :class:`~google.cloud.bigquery.job.QueryJob`
+        :returns: The started query job.
+        """
         config = job.QueryJobConfig()
         config.query_parameters = query_parameters
         config.use_legacy_sql = False
-        self._query_job = client.query(
+        return self.connection._client.query(
             formatted_operation, job_config=config, job_id=job_id
         )
 
-        # Wait for the query to finish.
+    def _wait_for_query(self, query_job):
+        """Wait for a query job to finish.
+
+        :rtype: :class:`~google.cloud.bigquery.query._QueryResults`
+        :returns: The results of the query.
+        :raises: :class:`~google.cloud.bigquery.dbapi.DatabaseError`
+            if the query failed.
+        """
         try:
-            self._query_job.result()
+            query_job.result()
         except google.cloud.exceptions.GoogleCloudError as exc:
             raise exceptions.DatabaseError(exc)
-
-        query_results = self._query_job._query_results
-        self._set_rowcount(query_results)
-        self._set_description(query_results.schema)
+        return query_job._query_results
 
     def executemany(self, operation, seq_of_parameters):
         """Prepare and execute a database operation multiple times.
 
+        An ``INSERT`` statement which ends in a single ``VALUES`` row is
+        executed as a few multi-row statements, combining as many
+        parameter sets into each statement as the query size limits allow.
+        Up to four of these statements run concurrently, so the order in
+        which rows are inserted is not defined. Other statements are
+        executed once per parameter set, in order.
+
+        If a combined statement fails, no more statements are started, and
+        the error is raised once the statements already running have
+        finished. Rows inserted by the other statements are **not** rolled
+        back, so some of the parameter sets may have been inserted.
+
         :type operation: str
         :param operation: A Google BigQuery query string.
 
         :type seq_of_parameters: Sequence[Mapping[str, Any] or Sequence[Any]]
         :param parameters: Sequence of many sets of parameter values.
         """
-        for parameters in seq_of_parameters:
-            self.execute(operation, parameters)
+        seq_of_parameters = list(seq_of_parameters)
+        batches = _format_insert_batches(operation, seq_of_parameters)
+        if batches is None:
+            for parameters in seq_of_parameters:
+                self.execute(operation, parameters)
+            return
+
+        self._query_data = None
+        self._query_job = None
+        self.rowcount = -1
+        rowcount = 0
+        running_jobs = collections.deque()
+
+        try:
+            for formatted_operation, query_parameters in batches:
+                if len(running_jobs) >= _MAX_CONCURRENT_BATCH_JOBS:
+                    query_results = self._wait_for_query(running_jobs.popleft())
+                    rowcount += query_results.num_dml_affected_rows or 0
+                self._query_job = self._start_query(
+                    formatted_operation, query_parameters
+                )
+                running_jobs.append(self._query_job)
+
+            while running_jobs:
+                query_results = self._wait_for_query(running_jobs.popleft())
+                rowcount += query_results.num_dml_affected_rows or 0
+        except Exception:
+            # Don't leave statements running after the error is raised. Their
+            # rows may already be committed, so let them finish.
+            for query_job in running_jobs:
+                try:
+                    query_job.result()
+                except google.cloud.exceptions.GoogleCloudError:
+                    pass
+            raise
+
+        self.rowcount = rowcount
+        self._set_description(None)
 
     def _try_fetch(self, size=None):
         """Try to start fetching data, if not yet started.
@@ -197,22 +303,160 @@ class Cursor(object):
                 "No query results: execute() must be called before fetch."
             )
 
-        is_dml = (
-            self._query_job.statement_type
-            and self._query_job.statement_type.upper() != "SELECT"
-        )
-        if is_dml:
+        if self._is_dml():
             self._query_data = iter([])
             return
 
         if self._query_data is None:
-            client = self.connection._client
-            rows_iter = client.list_rows(
-                self._query_job.destination,
-                selected_fields=self._query_job._query_results.schema,
-                page_size=self.arraysize,
+            self._query_data = self._fetch_rows()
+
+    def _is_dml(self):
+        """Check whether the last ``execute*()`` call was a DML statement."""
+        return (
+            self._query_job.statement_type
+            and self._query_job.statement_type.upper() != "SELECT"
+        )
+
+    def _list_rows(self, **kwargs):
+        """List the rows of the query's destination table."""
+        client = self.connection._client
+        return client.list_rows(
+            self._query_job.destination,
+            selected_fields=self._query_job._query_results.schema,
+            **kwargs
+        )
+
+    def _fetch_rows(self):
+        """Start iterating over the rows of the query results.
+
+        Uses the BigQuery Storage API for large results, if the connection
+        has a client for it, and otherwise tabledata.list. Either way, pages
+        are downloaded in the background while the current page is read.
+        """
+        rows_iter = self._list_rows(
+            page_size=self.arraysize, prefetch_pages=_PREFETCH_PAGES
+        )
+
+        bqstorage_client = self.connection._bqstorage_client
+        if bqstorage_client is None:
+            return iter(rows_iter)
+
+        total_rows = self._query_job._query_results.total_rows
+        if total_rows is not None and total_rows < _BQSTORAGE_MIN_ROWS:
+            return iter(rows_iter)
+
+        # Read a single stream if needed, so that rows stay in order.
+        rows_iter._preserve_order = job._contains_order_by(self._query_job.query)
+        try:
+            session = rows_iter._create_bqstorage_read_session(bqstorage_client)
+        except google.api_core.exceptions.Forbidden as exc:
+            # Don't hide errors such as insufficient permissions to create
+            # a read session, or the API is not enabled.
+            raise exceptions.DatabaseError(exc)
+        except google.api_core.exceptions.GoogleAPICallError:
+            # There is a known issue with reading from small anonymous
+            # query results tables, so fall back to tabledata.list.
+            return iter(rows_iter)
+
+        return rows_iter._to_row_iterable_bqstorage(bqstorage_client, session)
+
+    def _fetch_started(self):
+        """Check whether rows have been fetched from the last ``execute*()``.
+
+        :rtype: bool
+        :returns: True if the remaining rows must be read from the cursor's
+            row iterator, rather than downloaded from the start.
+        :raises: :class:`~google.cloud.bigquery.dbapi.InterfaceError`
+            if called before ``execute()``.
+        """
+        if self._query_job is None or self._is_dml():
+            self._try_fetch()
+        return self._query_data is not None
+
+    def _remaining_rows_to_arrow(self):
+        """Convert the rows not yet fetched to a :class:`pyarrow.Table`."""
+        schema = self._query_job._query_results.schema or ()
+        rows = list(self._query_data)
+        if rows:
+            columns = [list(column) for column in zip(*rows)]
+        else:
+            columns = [[] for _ in schema]
+
+        arrays = [
+            _pandas_helpers.bq_to_arrow_array(column, field)
+            for column, field in zip(columns, schema)
+        ]
+        return pyarrow.Table.from_arrays(arrays, [field.name for field in schema])
+
+    def fetch_arrow_all(self):
+        """Fetch all remaining results as a :class:`pyarrow.Table`.
+
+        This is an extension to the DB-API. If no rows have been fetched yet,
+        the whole result set is downloaded directly into Arrow columns, with
+        the BigQuery Storage API if the connection has a client for it.
+
+        :rtype: :class:`pyarrow.Table`
+        :returns: The remaining rows of the results.
+        :raises: :class:`~google.cloud.bigquery.dbapi.InterfaceError`
+            if called before ``execute()``, or if :mod:`pyarrow` is not
+            installed.
+        """
+        if pyarrow is None:
+            raise exceptions.InterfaceError(table._NO_PYARROW_ERROR)
+
+        if self._fetch_started():
+            return self._remaining_rows_to_arrow()
+
+        rows_iter = self._list_rows()
+        rows_iter._preserve_order = job._contains_order_by(self._query_job.query)
+        try:
+            arrow_table = rows_iter.to_arrow(
+                bqstorage_client=self.connection._bqstorage_client
+            )
+        except google.cloud.exceptions.GoogleCloudError as exc:
+            raise exceptions.DatabaseError(exc)
+
+        self._query_data = iter([])
+        return arrow_table
+
+    def fetch_dataframe(self, dtypes=None):
+        """Fetch all remaining results as a :class:`pandas.DataFrame`.
+
+        This is an extension to the DB-API. If no rows have been fetched yet,
+        the whole result set is downloaded directly into a DataFrame, with
+        the BigQuery Storage API if the connection has a client for it.
+
+        :type dtypes: Mapping[str, Union[str, pandas.Series.dtype]]
+        :param dtypes:
+            (Optional) A dictionary of column names to pandas ``dtype``s,
+            used when the results are downloaded from the start.
+
+        :rtype: :class:`pandas.DataFrame`
+        :returns: The remaining rows of the results.
+        :raises: :class:`~google.cloud.bigquery.dbapi.InterfaceError`
+            if called before ``execute()``, or if :mod:`pandas` is not
+            installed.
+        """
+        if pandas is None:
+            raise exceptions.InterfaceError(table._NO_PANDAS_ERROR)
+
+        if self._fetch_started():
+            schema = self._query_job._query_results.schema or ()
+            return pandas.DataFrame.from_records(
+                list(self._query_data), columns=[field.name for field in schema]
             )
-            self._query_data = iter(rows_iter)
+
+        rows_iter = self._list_rows()
+        rows_iter._preserve_order = job._contains_order_by(self._query_job.query)
+        try:
+            dataframe = rows_iter.to_dataframe(
+                bqstorage_client=self.connection._bqstorage_client, dtypes=dtypes
+            )
+        except google.cloud.exceptions.GoogleCloudError as exc:
+            raise exceptions.DatabaseError(exc)
+
+        self._query_data = iter([])
+        return dataframe
 
     def fetchone(self):
         """Fetch a single row from the results of the last ``execute*()`` call.
@@ -356,3 +600,119 @@ def _format_operation(operation, parameters=None):
         return _format_operation_dict(operation, parameters)
 
     return _format_operation_list(operation, parameters)
+
+
+def _format_insert_row(values, parameters, row_index):
+    """Format the ``VALUES`` row of an INSERT statement for one parameter set.
+
+    Named parameters are renamed with the row index, so that the rows can
+    be combined into a single statement.
+
+    :type values: str
+    :param values: The parenthesized ``VALUES`` row, such as ``(%s, %s)``.
+
+    :type parameters: Mapping[str, Any] or Sequence[Any]
+    :param parameters: Parameter values for this row.
+
+    :type row_index: int
+    :param row_index: The position of this row in the combined statement.
+
+    :rtype: Tuple[str, List[google.cloud.bigquery.query._AbstractQueryParameter]]
+    :returns: The formatted row and its query parameters.
+    """
+    if not isinstance(parameters, collections_abc.Mapping):
+        formatted_row = _format_operation_list(values, parameters)
+        return formatted_row, _helpers.to_query_parameters_list(parameters)
+
+    renamed = {}
+    formatted_params = {}
+    for name, value in six.iteritems(parameters):
+        row_name = "{}__{}".format(name, row_index)
+        renamed[row_name] = value
+        formatted_params[name] = "@`{}`".format(row_name.replace("`", r"\`"))
+
+    try:
+        formatted_row = values % formatted_params
+    except KeyError as exc:
+        raise exceptions.ProgrammingError(exc)
+    return formatted_row, _helpers.to_query_parameters_dict(renamed)
+
+
+def _query_parameters_bytes(query_parameters):
+    """Estimate the size of query parameters in a jobs.insert request.
+
+    :type query_parameters:
+        List[google.cloud.bigquery.query._AbstractQueryParameter]
+    :param query_parameters: The query parameters.
+
+    :rtype: int
+    :returns: The length of the parameters, serialized as JSON.
+    """
+    return sum(
+        len(json.dumps(parameter.to_api_repr())) + 2 for parameter in query_parameters
+    )
+
+
+def _format_insert_batches(operation, seq_of_parameters):
+    """Combine an INSERT statement's parameter sets into multi-row statements.
+
+    :type operation: str
+    :param operation: A Google BigQuery query string.
+
+    :type seq_of_parameters: Sequence[Mapping[str, Any] or Sequence[Any]]
+    :param seq_of_parameters: Sequence of many sets of parameter values.
+
+    :rtype: List[Tuple[str, List]]
+    :returns:
+        Pairs of formatted statements and their query parameters, or
+        ``None`` if the operation cannot be combined into multi-row
+        statements.
+    """
+    match = _INSERT_VALUES_RE.match(operation)
+    if match is None or len(seq_of_parameters) < 2:
+        return None
+
+    is_mapping = [
+        isinstance(parameters, collections_abc.Mapping)
+        for parameters in seq_of_parameters
+    ]
+    if any(parameters is None for parameters in seq_of_parameters):
+        return None
+    if any(is_mapping) and not all(is_mapping):
+        return None
+
+    prefix = match.group("prefix")
+    values = match.group("values")
+    batches = []
+    rows = []
+    query_parameters = []
+    query_length = len(prefix)
+    parameter_bytes = 0
+
+    for parameters in seq_of_parameters:
+        formatted_row, row_parameters = _format_insert_row(
+            values, parameters, len(rows)
+        )
+        row_bytes = _query_parameters_bytes(row_parameters)
+        too_long = query_length + len(formatted_row) > _MAX_BATCH_QUERY_LENGTH
+        too_many_parameters = (
+            len(query_parameters) + len(row_parameters) > _MAX_BATCH_QUERY_PARAMETERS
+        )
+        too_large = parameter_bytes + row_bytes > _MAX_BATCH_PARAMETER_BYTES
+        if rows and (too_long or too_many_parameters or too_large):
+            batches.append((prefix + ", ".join(rows), query_parameters))
+            rows = []
+            query_parameters = []
+            query_length = len(prefix)
+            parameter_bytes = 0
+            formatted_row, row_parameters = _format_insert_row(values, parameters, 0)
+            row_bytes = _query_parameters_bytes(row_parameters)
+
+        rows.append(formatted_row)
+        query_parameters.extend(row_parameters)
+        # Include the ", " separating this row from the next.
+        query_length += len(formatted_row) + 2
+        parameter_bytes += row_bytes
+
+    batches.append((prefix + ", ".join(rows), query_parameters))
+    return batches
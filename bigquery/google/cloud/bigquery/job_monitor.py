@@ -0,0 +1,369 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wait for many jobs at once from a single background thread."""
+
+from __future__ import absolute_import
+
+import collections
+import concurrent.futures
+import logging
+import threading
+import time
+
+import google.api_core.exceptions
+from google.cloud.bigquery.job import _DONE_STATE
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# With at least this many unfinished jobs in a project, find the finished
+# ones with jobs.list rather than one jobs.get request per job.
+_LIST_JOBS_MIN_JOBS = 10
+
+
+class JobMonitor(object):
+    """Track many jobs and poll them together on one background thread.
+
+    Each :class:`~google.cloud.bigquery.job._AsyncJob` polls its own status
+    when waited on, so waiting on many jobs needs many threads and many
+    ``jobs.get`` requests. A monitor polls all of the jobs it is watching in
+    a single sweep every ``poll_interval`` seconds. When a project has many
+    unfinished jobs, a sweep lists the project's recently finished jobs with
+    ``jobs.list`` instead of getting each job.
+
+    When a job finishes, its properties are updated, its future is resolved
+    (so :meth:`~google.cloud.bigquery.job._AsyncJob.result` returns or raises
+    without another request) and any callbacks passed to :meth:`watch` are
+    called on the monitor's thread.
+
+    Args:
+        client (google.cloud.bigquery.client.Client):
+            Client used to poll the jobs.
+        poll_interval (Optional[float]):
+            Seconds to wait between sweeps. Defaults to 1 second.
+        retry (Optional[google.api_core.retry.Retry]):
+            How to retry each polling request.
+    """
+
+    def __init__(self, client, poll_interval=1.0, retry=DEFAULT_RETRY):
+        self._client = client
+        self._poll_interval = poll_interval
+        self._retry = retry
+        # Unfinished jobs and their callbacks, keyed by (project, job ID).
+        self._jobs = collections.OrderedDict()
+        self._callbacks = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def pending_jobs(self):
+        """List[google.cloud.bigquery.job._AsyncJob]: Jobs not yet finished."""
+        with self._condition:
+            return list(self._jobs.values())
+
+    def watch(self, job, callback=None):
+        """Start tracking a job.
+
+        Args:
+            job (google.cloud.bigquery.job._AsyncJob):
+                A job which has been started, such as a job returned by
+                :meth:`~google.cloud.bigquery.client.Client.query`.
+            callback (Optional[Callable[[google.cloud.bigquery.job._AsyncJob], None]]):
+                Called with the job once it has finished. Callbacks for
+                jobs which have already finished are called immediately.
+
+        Returns:
+            google.cloud.bigquery.job._AsyncJob: The job.
+
+        Raises:
+            ValueError: If the job has not been started.
+            RuntimeError: If the monitor has been closed.
+        """
+        _check_started(job)
+
+        with self._condition:
+            watched = self._register([job], callback=callback)
+
+        if not watched and callback is not None:
+            callback(job)
+        return job
+
+    def wait(
+        self, jobs=None, timeout=None, return_when=concurrent.futures.ALL_COMPLETED
+    ):
+        """Wait for jobs to finish.
+
+        Args:
+            jobs (Optional[Iterable[google.cloud.bigquery.job._AsyncJob]]):
+                The jobs to wait for. Jobs which are not being watched yet
+                are watched. Defaults to every job the monitor is watching.
+            timeout (Optional[float]):
+                The maximum number of seconds to wait.
+            return_when (Optional[str]):
+                Either :data:`concurrent.futures.ALL_COMPLETED` (the default)
+                or :data:`concurrent.futures.FIRST_COMPLETED`.
+
+        Returns:
+            Tuple[Set[google.cloud.bigquery.job._AsyncJob], \
+                  Set[google.cloud.bigquery.job._AsyncJob]]:
+                The jobs which finished and the jobs which did not, like
+                :func:`concurrent.futures.wait`.
+        """
+        jobs = set(self._watch_all(jobs))
+        deadline = None if timeout is None else time.time() + timeout
+
+        with self._condition:
+            while True:
+                not_done = set(job for job in jobs if not _is_finished(job))
+                if not not_done or self._closed:
+                    break
+                if return_when == concurrent.futures.FIRST_COMPLETED and len(
+                    not_done
+                ) < len(jobs):
+                    break
+
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+        return jobs - not_done, not_done
+
+    def as_completed(self, jobs=None, timeout=None):
+        """Iterate over jobs as they finish.
+
+        Args:
+            jobs (Optional[Iterable[google.cloud.bigquery.job._AsyncJob]]):
+                The jobs to wait for. Jobs which are not being watched yet
+                are watched. Defaults to every job the monitor is watching.
+            timeout (Optional[float]):
+                The maximum number of seconds to wait for all of the jobs.
+
+        Yields:
+            google.cloud.bigquery.job._AsyncJob: Each job, once finished.
+
+        Raises:
+            concurrent.futures.TimeoutError:
+                If the jobs do not all finish before ``timeout``.
+            RuntimeError: If the monitor is closed while waiting.
+        """
+        pending = set(self._watch_all(jobs))
+        deadline = None if timeout is None else time.time() + timeout
+
+        while pending:
+            remaining = None if deadline is None else deadline - time.time()
+            if remaining is not None and remaining <= 0:
+                raise concurrent.futures.TimeoutError(
+                    "{} jobs did not finish in time.".format(len(pending))
+                )
+
+            done, pending = self.wait(
+                pending,
+                timeout=remaining,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            if not done and self._closed:
+                raise RuntimeError("The monitor was closed while waiting for jobs.")
+            for job in done:
+                yield job
+
+    def close(self):
+        """Stop polling. Jobs which have not finished are no longer tracked."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _watch_all(self, jobs):
+        """Watch the given jobs, or return every job being watched."""
+        if jobs is None:
+            return self.pending_jobs
+
+        jobs = list(jobs)
+        for job in jobs:
+            _check_started(job)
+
+        # Register every job before the polling thread is started or woken,
+        # so that its first sweep sees all of them.
+        with self._condition:
+            self._register(
+                [job for job in jobs if (job.project, job.job_id) not in self._jobs]
+            )
+        return jobs
+
+    def _register(self, jobs, callback=None):
+        """Track the unfinished jobs. Call with the lock held.
+
+        Returns:
+            List[google.cloud.bigquery.job._AsyncJob]:
+                The jobs which are now being watched.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot watch jobs after the monitor is closed.")
+
+        watched = [job for job in jobs if not _is_finished(job)]
+        for job in watched:
+            key = (job.project, job.job_id)
+            self._jobs[key] = job
+            if callback is not None:
+                self._callbacks.setdefault(key, []).append(callback)
+
+        if watched:
+            self._start_thread()
+            # Wakes the polling thread if it is idle. A sweep in progress, or
+            # the sleep between sweeps, is not cut short.
+            self._condition.notify_all()
+        return watched
+
+    def _start_thread(self):
+        """Start the polling thread, if needed. Call with the lock held."""
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(
+            name="Thread-BigQueryJobMonitor", target=self._run
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        """Poll the watched jobs until the monitor is closed."""
+        while True:
+            with self._condition:
+                while not self._jobs and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                jobs = list(self._jobs.values())
+
+            try:
+                self._poll(jobs)
+            except Exception:  # pragma: NO COVER
+                _LOGGER.exception("Error while polling %s jobs.", len(jobs))
+
+            # The condition is also notified when jobs are watched or
+            # finished, so wait out the rest of the interval after each
+            # notification rather than sweeping early.
+            deadline = time.time() + self._poll_interval
+            with self._condition:
+                while not self._closed and self._jobs:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+    def _poll(self, jobs):
+        """Refresh the jobs and finish any which are done."""
+        jobs_by_project = collections.defaultdict(list)
+        for job in jobs:
+            jobs_by_project[job.project].append(job)
+
+        for project, project_jobs in jobs_by_project.items():
+            if len(project_jobs) >= _LIST_JOBS_MIN_JOBS:
+                try:
+                    self._poll_with_list(project, project_jobs)
+                    continue
+                except google.api_core.exceptions.GoogleAPICallError:
+                    _LOGGER.warning(
+                        "Failed to list jobs in project %s. Getting each job.",
+                        project,
+                        exc_info=True,
+                    )
+
+            for job in project_jobs:
+                self._poll_with_get(job)
+
+    def _poll_with_list(self, project, jobs):
+        """Find finished jobs with one jobs.list sweep of the project."""
+        jobs_by_id = {job.job_id: job for job in jobs}
+        created = [job.created for job in jobs if job.created is not None]
+        min_creation_time = min(created) if len(created) == len(jobs) else None
+
+        listed_jobs = self._client.list_jobs(
+            project=project,
+            state_filter="done",
+            min_creation_time=min_creation_time,
+            retry=self._retry,
+        )
+        for listed_job in listed_jobs:
+            job = jobs_by_id.pop(listed_job.job_id, None)
+            if job is not None:
+                self._update_job(job, listed_job._properties)
+            if not jobs_by_id:
+                break
+
+    def _poll_with_get(self, job):
+        """Refresh a single job with jobs.get."""
+        path = "/projects/{}/jobs/{}".format(job.project, job.job_id)
+        query_params = {}
+        if job.location:
+            query_params["location"] = job.location
+
+        try:
+            resource = self._client._call_api(
+                self._retry, method="GET", path=path, query_params=query_params
+            )
+        except google.api_core.exceptions.NotFound as exc:
+            # The job will never finish, so fail it rather than polling forever.
+            job.set_exception(exc)
+            self._finish_job(job)
+            return
+        except google.api_core.exceptions.GoogleAPICallError:
+            _LOGGER.warning("Failed to get job %s.", job.job_id, exc_info=True)
+            return
+
+        self._update_job(job, resource)
+
+    def _update_job(self, job, resource):
+        """Copy a job resource into the job, finishing the job if it is done."""
+        job._set_properties(resource)
+        if job.state == _DONE_STATE:
+            self._finish_job(job)
+
+    def _finish_job(self, job):
+        """Stop tracking a finished job and call its callbacks."""
+        key = (job.project, job.job_id)
+        with self._condition:
+            self._jobs.pop(key, None)
+            callbacks = self._callbacks.pop(key, ())
+            self._condition.notify_all()
+
+        for callback in callbacks:
+            try:
+                callback(job)
+            except Exception:
+                _LOGGER.exception("Callback for job %s raised.", job.job_id)
+
+
+def _check_started(job):
+    """Raise :exc:`ValueError` if a job has not been started."""
+    if job.state is None:
+        raise ValueError("Job {} has not been started.".format(job.job_id))
+
+
+def _is_finished(job):
+    """Check whether a job's future has been resolved, without a request."""
+    return job._result_set or job.state == _DONE_STATE
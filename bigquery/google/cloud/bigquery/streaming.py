@@ -0,0 +1,482 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batch rows from many threads into streaming insert requests."""
+
+from __future__ import absolute_import
+
+import collections
+import concurrent.futures
+import heapq
+import itertools
+import json
+import logging
+import threading
+import time
+import uuid
+
+import six
+
+from google.cloud.bigquery._helpers import _record_field_to_json
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+from google.cloud.bigquery.table import _table_arg_to_table
+from google.cloud.bigquery.table import _table_arg_to_table_ref
+from google.cloud.bigquery.table import Table
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# See: https://cloud.google.com/bigquery/quotas#streaming_inserts
+_MAX_ROWS_PER_REQUEST = 10000
+_MAX_BYTES_PER_REQUEST = 10 * 1024 * 1024
+
+# Rows which failed for these reasons will fail again if retried.
+_NON_RETRYABLE_REASONS = frozenset(["accessDenied", "invalid", "notFound"])
+
+# Bytes for the JSON punctuation around each row in the request body.
+_ROW_OVERHEAD_BYTES = len('{"insertId":"","json":},')
+
+# Seconds to wait before sending a failed row again, growing exponentially
+# with each attempt.
+_INITIAL_RETRY_DELAY = 1.0
+_MAXIMUM_RETRY_DELAY = 32.0
+_RETRY_DELAY_MULTIPLIER = 2.0
+
+
+class InsertRowError(Exception):
+    """A row could not be inserted.
+
+    Args:
+        errors (Sequence[Mapping]):
+            Mappings describing one or more problems with the row, from the
+            ``insertErrors`` of the insertAll response.
+    """
+
+    def __init__(self, errors):
+        super(InsertRowError, self).__init__("Failed to insert row: {}".format(errors))
+        self.errors = errors
+
+
+class _PendingRow(object):
+    """A row waiting to be sent, and the future for its result."""
+
+    __slots__ = ("json", "insert_id", "size", "future", "attempt")
+
+    def __init__(self, json_row, insert_id, future):
+        self.json = json_row
+        self.insert_id = insert_id
+        self.size = (
+            len(json.dumps(json_row, separators=(",", ":")))
+            + len(insert_id)
+            + _ROW_OVERHEAD_BYTES
+        )
+        self.future = future
+        self.attempt = 1
+
+
+class StreamingInserter(object):
+    """Insert rows into a table via the streaming API, in batches.
+
+    Rows may be added from any number of threads. A background thread packs
+    them into insertAll requests of at most ``max_rows`` rows and
+    ``max_bytes`` bytes, and sends up to ``max_concurrent_requests`` requests
+    at once. Rows which fail with a retryable error are sent again, with the
+    same insert ID, so that BigQuery can de-duplicate them, after a delay
+    which doubles with each attempt.
+
+    Use as a context manager, or call :meth:`close`, to send any remaining
+    rows and stop the background threads.
+
+    See
+    https://cloud.google.com/bigquery/docs/reference/rest/v2/tabledata/insertAll
+
+    Args:
+        client (google.cloud.bigquery.client.Client):
+            The client used to send requests.
+        table (Union[ \
+            :class:`~google.cloud.bigquery.table.Table`, \
+            :class:`~google.cloud.bigquery.table.TableReference`, \
+            str, \
+        ]):
+            The destination table for the row data, or a reference to it.
+        selected_fields (Sequence[ \
+            :class:`~google.cloud.bigquery.schema.SchemaField`, \
+        ]):
+            (Optional) The fields used to convert rows passed to
+            :meth:`insert_rows`. Defaults to the schema of ``table``.
+        max_rows (int):
+            (Optional) The maximum number of rows in each request. Defaults
+            to 500, the recommended batch size.
+        max_bytes (int):
+            (Optional) The maximum size of each request, in bytes. Defaults
+            to 5 MB.
+        max_latency (float):
+            (Optional) The maximum number of seconds to wait for more rows
+            before sending a partial batch. Defaults to 0.05 seconds.
+        max_concurrent_requests (int):
+            (Optional) The maximum number of requests in progress at once.
+            Defaults to 4.
+        max_attempts (int):
+            (Optional) The number of times to send a row before failing
+            its future. Defaults to 5.
+        skip_invalid_rows (bool):
+            (Optional) Insert all valid rows of a request, even if invalid
+            rows exist.
+        ignore_unknown_values (bool):
+            (Optional) Accept rows that contain values that do not match the
+            schema. The unknown values are ignored.
+        template_suffix (str):
+            (Optional) treat ``name`` as a template table and provide a suffix.
+        retry (:class:`google.api_core.retry.Retry`):
+            (Optional) How to retry each insertAll request.
+    """
+
+    def __init__(
+        self,
+        client,
+        table,
+        selected_fields=None,
+        max_rows=500,
+        max_bytes=5 * 1024 * 1024,
+        max_latency=0.05,
+        max_concurrent_requests=4,
+        max_attempts=5,
+        skip_invalid_rows=None,
+        ignore_unknown_values=None,
+        template_suffix=None,
+        retry=DEFAULT_RETRY,
+    ):
+        if not 0 < max_rows <= _MAX_ROWS_PER_REQUEST:
+            raise ValueError(
+                "max_rows must be between 1 and {}".format(_MAX_ROWS_PER_REQUEST)
+            )
+        if not 0 < max_bytes <= _MAX_BYTES_PER_REQUEST:
+            raise ValueError(
+                "max_bytes must be between 1 and {}".format(_MAX_BYTES_PER_REQUEST)
+            )
+
+        table = _table_arg_to_table(table, default_project=client.project)
+        self._schema = selected_fields
+        if self._schema is None and isinstance(table, Table):
+            self._schema = table.schema
+
+        self._client = client
+        self._table = _table_arg_to_table_ref(table, default_project=client.project)
+        self._max_rows = max_rows
+        self._max_bytes = max_bytes
+        self._max_latency = max_latency
+        self._max_attempts = max_attempts
+        self._insert_kwargs = {
+            "skip_invalid_rows": skip_invalid_rows,
+            "ignore_unknown_values": ignore_unknown_values,
+            "template_suffix": template_suffix,
+            "retry": retry,
+        }
+
+        # These members are all communicated between threads; ensure that
+        # any reads and writes of them hold the condition's lock.
+        self._condition = threading.Condition()
+        self._pending = collections.deque()
+        # Rows waiting to be retried, as a heap of (time, sequence, row).
+        self._retrying = []
+        self._retry_sequence = itertools.count()
+        self._pending_bytes = 0
+        self._oldest_pending_time = None
+        self._unfinished_rows = 0
+        self._flushing = False
+        self._closed = False
+
+        self._request_slots = threading.BoundedSemaphore(max_concurrent_requests)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrent_requests
+        )
+        self._thread = threading.Thread(
+            name="Thread-StreamingInserter", target=self._run
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def insert_rows(self, rows, row_ids=None):
+        """Add rows, converting them to JSON with the table schema.
+
+        Args:
+            rows (Union[ \
+                Sequence[Tuple], \
+                Sequence[dict], \
+            ]):
+                Row data to be inserted. See
+                :meth:`~google.cloud.bigquery.client.Client.insert_rows`.
+            row_ids (Sequence[str]):
+                (Optional) Unique ids, one per row being inserted. If
+                omitted, unique IDs are created.
+
+        Returns:
+            List[concurrent.futures.Future]:
+                One future per row. Each future's result is the row's insert
+                ID, or it raises :class:`InsertRowError` if the row could not
+                be inserted.
+
+        Raises:
+            ValueError:
+                if the schema of the table is not known, or if ``row_ids``
+                does not have one ID per row.
+        """
+        if not self._schema:
+            raise ValueError(
+                (
+                    "Could not determine schema for table '{}'. Pass in a table "
+                    "with a schema or a list of schema fields to the "
+                    "selected_fields argument."
+                ).format(self._table)
+            )
+
+        json_rows = [_record_field_to_json(self._schema, row) for row in rows]
+        return self.insert_rows_json(json_rows, row_ids=row_ids)
+
+    def insert_rows_json(self, json_rows, row_ids=None):
+        """Add rows without applying local type conversions.
+
+        Args:
+            json_rows (Sequence[dict]):
+                Row data to be inserted. Keys must match the table schema
+                fields and values must be JSON-compatible representations.
+            row_ids (Sequence[str]):
+                (Optional) Unique ids, one per row being inserted. If
+                omitted, unique IDs are created.
+
+        Returns:
+            List[concurrent.futures.Future]:
+                One future per row. Each future's result is the row's insert
+                ID, or it raises :class:`InsertRowError` if the row could not
+                be inserted.
+
+        Raises:
+            ValueError: if ``row_ids`` does not have one ID per row.
+            RuntimeError: if the inserter has been closed.
+        """
+        if row_ids is None:
+            row_ids = [str(uuid.uuid4()) for _ in json_rows]
+        elif len(row_ids) != len(json_rows):
+            raise ValueError(
+                "Got {} row_ids for {} rows. Pass one ID per row.".format(
+                    len(row_ids), len(json_rows)
+                )
+            )
+
+        new_rows = [
+            _PendingRow(json_row, insert_id, concurrent.futures.Future())
+            for json_row, insert_id in six.moves.zip(json_rows, row_ids)
+        ]
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot insert rows after the inserter is closed.")
+
+            self._unfinished_rows += len(new_rows)
+            self._add_pending(new_rows)
+
+        return [row.future for row in new_rows]
+
+    def flush(self):
+        """Send all pending rows now, and wait until every row is finished."""
+        with self._condition:
+            self._flushing = True
+            self._condition.notify_all()
+            while self._unfinished_rows:
+                self._condition.wait()
+            self._flushing = False
+
+    def close(self):
+        """Send all pending rows, then stop the background threads.
+
+        Rows may not be inserted once closing has started. Waits until every
+        row is finished, including rows waiting to be retried.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+
+        # The background thread exits once every row is finished.
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def _add_pending(self, rows, retry=False):
+        """Queue rows to be sent. The caller must hold the lock."""
+        if not rows:
+            return
+
+        if retry:
+            # Send retried rows before newer rows.
+            self._pending.extendleft(reversed(rows))
+        else:
+            self._pending.extend(rows)
+
+        self._pending_bytes += sum(row.size for row in rows)
+        if self._oldest_pending_time is None:
+            self._oldest_pending_time = time.time()
+        self._condition.notify_all()
+
+    def _add_retrying(self, rows):
+        """Queue rows to be sent after a delay. The caller must hold the lock."""
+        now = time.time()
+        for row in rows:
+            delay = min(
+                _INITIAL_RETRY_DELAY * _RETRY_DELAY_MULTIPLIER ** (row.attempt - 2),
+                _MAXIMUM_RETRY_DELAY,
+            )
+            heapq.heappush(
+                self._retrying, (now + delay, next(self._retry_sequence), row)
+            )
+        self._condition.notify_all()
+
+    def _pend_retrying(self):
+        """Queue the rows whose retry delay has elapsed.
+
+        The caller must hold the lock.
+
+        Returns:
+            Optional[float]:
+                The number of seconds until the next row's retry delay
+                elapses, or :data:`None` if no rows are waiting to be retried.
+        """
+        now = time.time()
+        ready = []
+        while self._retrying and self._retrying[0][0] <= now:
+            ready.append(heapq.heappop(self._retrying)[2])
+        self._add_pending(ready, retry=True)
+
+        if not self._retrying:
+            return None
+        return self._retrying[0][0] - now
+
+    def _batch_ready(self):
+        """Check whether a full batch is pending. The caller must hold the lock."""
+        return (
+            len(self._pending) >= self._max_rows
+            or self._pending_bytes >= self._max_bytes
+            or self._flushing
+            or self._closed
+        )
+
+    def _take_batch(self):
+        """Remove the next batch of rows. The caller must hold the lock."""
+        batch = []
+        batch_bytes = 0
+        while self._pending and len(batch) < self._max_rows:
+            row = self._pending[0]
+            # Always send at least one row, even if it is too large, so that
+            # the API can report the error for that row.
+            if batch and batch_bytes + row.size > self._max_bytes:
+                break
+            batch.append(self._pending.popleft())
+            batch_bytes += row.size
+
+        self._pending_bytes -= batch_bytes
+        self._oldest_pending_time = time.time() if self._pending else None
+        return batch
+
+    def _run(self):
+        """Form batches and hand them to worker threads until closed."""
+        while True:
+            # Wait for a free request slot before forming a batch, so that
+            # rows keep accumulating into full batches while all requests
+            # are in progress.
+            self._request_slots.acquire()
+
+            with self._condition:
+                while True:
+                    retry_wait = self._pend_retrying()
+                    if self._pending:
+                        break
+                    if self._closed and not self._unfinished_rows:
+                        self._request_slots.release()
+                        return
+                    self._condition.wait(retry_wait)
+
+                while not self._batch_ready():
+                    remaining = (
+                        self._oldest_pending_time + self._max_latency - time.time()
+                    )
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                batch = self._take_batch()
+
+            self._executor.submit(self._send_batch, batch)
+
+    def _send_batch(self, batch):
+        """Send one insertAll request and resolve the futures of its rows."""
+        try:
+            errors = self._client.insert_rows_json(
+                self._table,
+                [row.json for row in batch],
+                row_ids=[row.insert_id for row in batch],
+                **self._insert_kwargs
+            )
+        except Exception as exc:
+            # Catch everything, so that no future is left unresolved and
+            # flush() cannot hang.
+            _LOGGER.exception("Failed to insert %s rows.", len(batch))
+            self._finish_rows([(row, None, exc) for row in batch])
+            return
+        finally:
+            self._request_slots.release()
+
+        errors_by_index = {error["index"]: error["errors"] for error in errors}
+        finished = []
+        retry_rows = []
+
+        for index, row in enumerate(batch):
+            row_errors = errors_by_index.get(index)
+            if row_errors is None:
+                finished.append((row, row.insert_id, None))
+            elif row.attempt < self._max_attempts and _is_retryable(row_errors):
+                row.attempt += 1
+                retry_rows.append(row)
+            else:
+                finished.append((row, None, InsertRowError(row_errors)))
+
+        with self._condition:
+            self._add_retrying(retry_rows)
+
+        self._finish_rows(finished)
+
+    def _finish_rows(self, finished):
+        """Resolve futures, then wake up any threads waiting in flush."""
+        for row, result, exc in finished:
+            if exc is None:
+                row.future.set_result(result)
+            else:
+                row.future.set_exception(exc)
+
+        with self._condition:
+            self._unfinished_rows -= len(finished)
+            self._condition.notify_all()
+
+
+def _is_retryable(errors):
+    """Check whether a row which failed with ``errors`` may succeed later."""
+    for error in errors:
+        if error.get("reason") in _NON_RETRYABLE_REASONS:
+            return False
+    return True
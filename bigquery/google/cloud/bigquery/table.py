@@ -20,6 +20,7 @@ import collections
 import concurrent.futures
 import copy
 import datetime
+import functools
 import json
 import operator
 import threading
@@ -39,6 +40,11 @@ try:
 except ImportError:  # pragma: NO COVER
     pandas = None
 
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 try:
     import tqdm
 except ImportError:  # pragma: NO COVER
@@ -46,9 +52,11 @@ except ImportError:  # pragma: NO COVER
 
 import google.api_core.exceptions
 from google.api_core.page_iterator import HTTPIterator
+from google.api_core.page_iterator import Page
 
 import google.cloud._helpers
 from google.cloud.bigquery import _helpers
+from google.cloud.bigquery import _pandas_helpers
 from google.cloud.bigquery.schema import SchemaField
 from google.cloud.bigquery.schema import _build_schema_resource
 from google.cloud.bigquery.schema import _parse_schema_resource
@@ -63,6 +71,10 @@ _NO_PANDAS_ERROR = (
     "The pandas library is not installed, please install "
     "pandas to use the to_dataframe() function."
 )
+_NO_PYARROW_ERROR = (
+    "The pyarrow library is not installed, please install "
+    "pyarrow to use the to_arrow() function."
+)
 _NO_TQDM_ERROR = (
     "A progress bar was requested, but there was an error loading the tqdm "
     "library. Please install tqdm to use the progress bar functionality."
@@ -76,6 +88,9 @@ _PROGRESS_INTERVAL = 0.2  # Time between download status updates, in seconds.
 _PROGRESS_UPDATES_PER_INTERVAL = 3
 _PROGRESS_WORKER_INTERVAL = _PROGRESS_INTERVAL / _PROGRESS_UPDATES_PER_INTERVAL
 
+# Sentinel for to_dataframe_iterable(): buffer one DataFrame per stream.
+_MAX_QUEUE_SIZE_DEFAULT = object()
+
 
 def _reference_getter(table):
     """A :class:`~google.cloud.bigquery.table.TableReference` pointing to
@@ -1318,6 +1333,17 @@ class RowIterator(HTTPIterator):
             google.cloud.bigquery.schema.SchemaField, \
         ]):
             Optional. A subset of columns to select from this table.
+        prefetch_pages (int):
+            Optional. The number of pages to fetch in background threads
+            while the current page is being processed. If the total number
+            of rows is known after the first page, the remaining pages are
+            fetched in parallel by ``startIndex``. Otherwise, each page needs
+            the previous page's token, so only the next page is fetched
+            ahead. Defaults to ``0``, which fetches pages sequentially.
+
+            The background threads stop once the last page is read, or when
+            the iteration is closed or garbage collected. Call :meth:`close`
+            to stop them when the iterator is abandoned before it starts.
 
     """
 
@@ -1333,6 +1359,7 @@ class RowIterator(HTTPIterator):
         extra_params=None,
         table=None,
         selected_fields=None,
+        prefetch_pages=0,
     ):
         super(RowIterator, self).__init__(
             client,
@@ -1347,6 +1374,7 @@ class RowIterator(HTTPIterator):
             next_token="pageToken",
         )
         self._field_to_index = _helpers._field_to_index_mapping(schema)
+        self._decode_row = _helpers._row_tuple_decoder(schema)
         self._page_size = page_size
         self._preserve_order = False
         self._project = client.project
@@ -1354,6 +1382,13 @@ class RowIterator(HTTPIterator):
         self._selected_fields = selected_fields
         self._table = table
         self._total_rows = getattr(table, "num_rows", None)
+        self._prefetch_pages = prefetch_pages
+        # Row offsets are only known when starting from the beginning (or
+        # from startIndex) rather than from a page token.
+        self._prefetch_by_index = page_token is None
+        self._prefetch_pool = None
+        self._prefetch_queue = collections.deque()
+        self._prefetch_ranges = None
 
     def _get_next_page_response(self):
         """Requests the next page from the path provided.
@@ -1369,6 +1404,177 @@ class RowIterator(HTTPIterator):
             method=self._HTTP_METHOD, path=self.path, query_params=params
         )
 
+    def _next_page(self):
+        """Get the next page in the iterator.
+
+        Returns:
+            Optional[google.api_core.page_iterator.Page]:
+                The next page in the iterator or :data:`None` if there are no
+                pages left.
+        """
+        if not self._prefetch_pages:
+            return super(RowIterator, self)._next_page()
+
+        if self.page_number == 0:
+            # The first page tells us the total number of rows and a
+            # reasonable page size, so fetch it before fanning out.
+            page = super(RowIterator, self)._next_page()
+            self._start_prefetch(page)
+            return page
+
+        if not self._prefetch_queue:
+            self._stop_prefetch()
+            return None
+
+        future, start_index, row_count = self._prefetch_queue.popleft()
+        response = future.result()
+        items = response.get(self._items_key, ())
+
+        if start_index is None:
+            self.next_page_token = response.get(self._next_token)
+            self._prefetch_next_token(len(items))
+        elif not items:
+            # The table has fewer rows than expected. Don't read past the end.
+            self._stop_prefetch()
+        elif len(items) < row_count:
+            # The API may return fewer rows than requested, for example when
+            # rows are large. Fetch the rest of this range before any of the
+            # ranges already queued after it.
+            missing = self._submit_prefetch(
+                start_index=start_index + len(items), row_count=row_count - len(items)
+            )
+            self._prefetch_queue.appendleft(missing)
+
+        if start_index is not None:
+            self._fill_prefetch_queue()
+
+        page = Page(self, items, self.item_to_value)
+        self._page_start(self, page, response)
+        return page
+
+    def _page_iter(self, increment):
+        """Generator of pages, which stops prefetching when it is closed.
+
+        Args:
+            increment (bool):
+                Whether to count the results a page at a time, rather than
+                per item.
+
+        Yields:
+            google.api_core.page_iterator.Page: Each page of rows.
+        """
+        try:
+            for page in super(RowIterator, self)._page_iter(increment):
+                yield page
+        finally:
+            # The caller may stop iterating before the last page.
+            self._stop_prefetch()
+
+    def close(self):
+        """Stop fetching pages in the background.
+
+        Outstanding requests are cancelled and the worker threads are
+        released. Iterating over the rows after closing reads no more pages
+        ahead.
+        """
+        self._stop_prefetch()
+
+    def _start_prefetch(self, first_page):
+        """Begin fetching pages after the first one in background threads."""
+        if first_page is None:
+            return
+
+        self._prefetch_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._prefetch_pages
+        )
+
+        if (
+            not self._prefetch_by_index
+            or self._total_rows is None
+            or first_page.num_items == 0
+        ):
+            self._prefetch_next_token(first_page.num_items)
+            return
+
+        start_index = int(self.extra_params.get("startIndex", 0))
+        end_index = int(self._total_rows)
+        if self.max_results is not None:
+            end_index = min(end_index, start_index + self.max_results)
+        page_size = self._page_size or first_page.num_items
+
+        self._prefetch_ranges = iter(
+            [
+                (range_start, min(page_size, end_index - range_start))
+                for range_start in six.moves.range(
+                    start_index + first_page.num_items, end_index, page_size
+                )
+            ]
+        )
+        self._fill_prefetch_queue()
+
+    def _prefetch_next_token(self, rows_in_page):
+        """Fetch the page after ``next_page_token`` in the background."""
+        if self.next_page_token is None:
+            return
+
+        row_count = None
+        if self.max_results is not None:
+            row_count = self.max_results - self.num_results - rows_in_page
+            if row_count <= 0:
+                return
+
+        future, _, _ = self._submit_prefetch(row_count=row_count)
+        self._prefetch_queue.append((future, None, row_count))
+
+    def _fill_prefetch_queue(self):
+        """Keep up to ``prefetch_pages`` row ranges downloading at once."""
+        while len(self._prefetch_queue) < self._prefetch_pages:
+            next_range = next(self._prefetch_ranges, None)
+            if next_range is None:
+                return
+            start_index, row_count = next_range
+            self._prefetch_queue.append(
+                self._submit_prefetch(start_index=start_index, row_count=row_count)
+            )
+
+    def _submit_prefetch(self, start_index=None, row_count=None):
+        """Request a page in a background thread.
+
+        Returns:
+            Tuple[concurrent.futures.Future, Optional[int], Optional[int]]:
+                The future API response, the index of the first row
+                requested, and the number of rows requested.
+        """
+        params = dict(self.extra_params)
+        if start_index is None:
+            params[self._PAGE_TOKEN] = self.next_page_token
+        else:
+            params["startIndex"] = start_index
+
+        max_results = self._page_size
+        if row_count is not None and (max_results is None or row_count < max_results):
+            max_results = row_count
+        if max_results is not None:
+            params[self._MAX_RESULTS] = max_results
+
+        future = self._prefetch_pool.submit(
+            self.api_request,
+            method=self._HTTP_METHOD,
+            path=self.path,
+            query_params=params,
+        )
+        return future, start_index, row_count
+
+    def _stop_prefetch(self):
+        """Cancel outstanding requests and release the worker threads."""
+        for future, _, _ in self._prefetch_queue:
+            future.cancel()
+        self._prefetch_queue.clear()
+        self._prefetch_ranges = iter(())
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=False)
+            self._prefetch_pool = None
+
     @property
     def schema(self):
         """List[google.cloud.bigquery.schema.SchemaField]: Table's schema."""
@@ -1410,6 +1616,51 @@ class RowIterator(HTTPIterator):
 
         return pandas.concat(frames, ignore_index=True)
 
+    def _to_dataframe_iterable_tabledata_list(self, dtypes):
+        """Use tabledata.list to construct one DataFrame per page."""
+        column_names = [field.name for field in self.schema]
+
+        for page in iter(self.pages):
+            if pyarrow is None:
+                yield self._to_dataframe_dtypes(page, column_names, dtypes)
+                continue
+
+            record_batch = _pandas_helpers.tabledata_list_page_to_arrow(
+                page, self._schema
+            )
+            df = record_batch.to_pandas()
+            for column in dtypes:
+                df[column] = pandas.Series(df[column], dtype=dtypes[column])
+            yield df
+
+    def _to_arrow_tabledata_list(self, progress_bar=None):
+        """Use tabledata.list to construct a :class:`pyarrow.Table`.
+
+        Each page of results is converted directly from the JSON response to
+        a :class:`pyarrow.RecordBatch`, skipping the per-row
+        :class:`~google.cloud.bigquery.table.Row` objects.
+        """
+        record_batches = []
+
+        for page in iter(self.pages):
+            record_batch = _pandas_helpers.tabledata_list_page_to_arrow(
+                page, self._schema
+            )
+            record_batches.append(record_batch)
+
+            if progress_bar is not None:
+                # In some cases, the number of total rows is not populated
+                # until the first page of rows is fetched. Update the
+                # progress bar's total to keep an accurate count.
+                progress_bar.total = progress_bar.total or self.total_rows
+                progress_bar.update(record_batch.num_rows)
+
+        if progress_bar is not None:
+            # Indicate that the download has finished.
+            progress_bar.close()
+
+        return _pandas_helpers.record_batches_to_table(record_batches, self._schema)
+
     def _to_dataframe_bqstorage_stream(
         self, bqstorage_client, dtypes, columns, session, stream, worker_queue
     ):
@@ -1418,7 +1669,7 @@ class RowIterator(HTTPIterator):
 
         frames = []
         for page in rowstream.pages:
-            if self._to_dataframe_finished:
+            if self._download_finished:
                 return
             frames.append(page.to_dataframe(dtypes=dtypes))
 
@@ -1438,6 +1689,27 @@ class RowIterator(HTTPIterator):
         # the end using manually-parsed schema.
         return pandas.concat(frames)[columns]
 
+    def _to_arrow_bqstorage_stream(
+        self, bqstorage_client, page_to_arrow, session, stream, worker_queue
+    ):
+        position = bigquery_storage_v1beta1.types.StreamPosition(stream=stream)
+        rowstream = bqstorage_client.read_rows(position).rows(session)
+
+        record_batches = []
+        for page in rowstream.pages:
+            if self._download_finished:
+                return
+            record_batches.append(page_to_arrow(page))
+
+            try:
+                worker_queue.put_nowait(page.num_items)
+            except queue.Full:
+                # It's okay if we miss a few progress updates. Don't slow
+                # down parsing for that.
+                pass
+
+        return record_batches
+
     def _process_worker_updates(self, worker_queue, progress_queue):
         last_update_time = time.time()
         current_update = 0
@@ -1458,7 +1730,7 @@ class RowIterator(HTTPIterator):
             except queue.Empty:
                 # Keep going, unless there probably aren't going to be any
                 # additional updates.
-                if self._to_dataframe_finished:
+                if self._download_finished:
                     progress_queue.put(current_update)
                     return
 
@@ -1474,12 +1746,21 @@ class RowIterator(HTTPIterator):
             except queue.Empty:
                 break
 
-        if self._to_dataframe_finished:
+        if self._download_finished:
             progress_bar.close()
             return
 
-    def _to_dataframe_bqstorage(self, bqstorage_client, dtypes, progress_bar=None):
-        """Use (faster, but billable) BQ Storage API to construct DataFrame."""
+    def _create_bqstorage_read_session(self, bqstorage_client, arrow=False):
+        """Create a BQ Storage API read session for this iterator's table.
+
+        Args:
+            bqstorage_client ( \
+                google.cloud.bigquery_storage_v1beta1.BigQueryStorageClient \
+            ):
+                A BigQuery Storage API client.
+            arrow (bool):
+                Request Arrow record batches, rather than Avro rows.
+        """
         if bigquery_storage_v1beta1 is None:
             raise ValueError(_NO_BQSTORAGE_ERROR)
 
@@ -1501,28 +1782,41 @@ class RowIterator(HTTPIterator):
         if self._preserve_order:
             requested_streams = 1
 
-        session = bqstorage_client.create_read_session(
+        kwargs = {}
+        if arrow:
+            kwargs["format_"] = bigquery_storage_v1beta1.enums.DataFormat.ARROW
+
+        return bqstorage_client.create_read_session(
             self._table.to_bqstorage(),
             "projects/{}".format(self._project),
             read_options=read_options,
             requested_streams=requested_streams,
+            **kwargs
         )
 
-        # We need to parse the schema manually so that we can rearrange the
-        # columns.
-        schema = json.loads(session.avro_schema.schema)
-        columns = [field["name"] for field in schema["fields"]]
+    def _download_bqstorage(self, session, download_stream, progress_bar=None):
+        """Download all streams of a read session in parallel.
 
-        # Avoid reading rows from an empty table. pandas.concat will fail on an
-        # empty list.
-        if not session.streams:
-            return pandas.DataFrame(columns=columns)
+        Args:
+            session (google.cloud.bigquery_storage_v1beta1.types.ReadSession):
+                A read session with at least one stream.
+            download_stream (Callable[[ \
+                google.cloud.bigquery_storage_v1beta1.types.Stream, \
+                queue.Queue, \
+            ], Any]):
+                Downloads a single stream, sending the number of rows in
+                each page to the queue passed in as the second argument.
+            progress_bar (Optional[tqdm.tqdm]):
+                A progress bar to update with the number of rows downloaded.
 
+        Returns:
+            List[Any]: The results of ``download_stream`` for each stream.
+        """
         total_streams = len(session.streams)
 
-        # Use _to_dataframe_finished to notify worker threads when to quit.
+        # Use _download_finished to notify worker threads when to quit.
         # See: https://stackoverflow.com/a/29237343/101923
-        self._to_dataframe_finished = False
+        self._download_finished = False
 
         # Create a queue to track progress updates across threads.
         worker_queue = _NoopProgressBarQueue()
@@ -1536,23 +1830,15 @@ class RowIterator(HTTPIterator):
             )
             progress_thread.start()
 
-        def get_frames(pool):
-            frames = []
+        def get_results(pool):
+            results = []
 
             # Manually submit jobs and wait for download to complete rather
             # than using pool.map because pool.map continues running in the
             # background even if there is an exception on the main thread.
             # See: https://github.com/googleapis/google-cloud-python/pull/7698
             not_done = [
-                pool.submit(
-                    self._to_dataframe_bqstorage_stream,
-                    bqstorage_client,
-                    dtypes,
-                    columns,
-                    session,
-                    stream,
-                    worker_queue,
-                )
+                pool.submit(download_stream, stream, worker_queue)
                 for stream in session.streams
             ]
 
@@ -1560,22 +1846,22 @@ class RowIterator(HTTPIterator):
                 done, not_done = concurrent.futures.wait(
                     not_done, timeout=_PROGRESS_INTERVAL
                 )
-                frames.extend([future.result() for future in done])
+                results.extend([future.result() for future in done])
 
                 # The progress bar needs to update on the main thread to avoid
                 # contention over stdout / stderr.
                 self._process_progress_updates(progress_queue, progress_bar)
 
-            return frames
+            return results
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=total_streams) as pool:
             try:
-                frames = get_frames(pool)
+                results = get_results(pool)
             finally:
                 # No need for a lock because reading/replacing a variable is
                 # defined to be an atomic operation in the Python language
                 # definition (enforced by the global interpreter lock).
-                self._to_dataframe_finished = True
+                self._download_finished = True
 
                 # Shutdown all background threads, now that they should know to
                 # exit early.
@@ -1585,8 +1871,226 @@ class RowIterator(HTTPIterator):
 
         # Update the progress bar one last time to close it.
         self._process_progress_updates(progress_queue, progress_bar)
+        return results
+
+    def _to_dataframe_bqstorage(self, bqstorage_client, dtypes, progress_bar=None):
+        """Use (faster, but billable) BQ Storage API to construct DataFrame."""
+        session = self._create_bqstorage_read_session(bqstorage_client)
+
+        # We need to parse the schema manually so that we can rearrange the
+        # columns.
+        schema = json.loads(session.avro_schema.schema)
+        columns = [field["name"] for field in schema["fields"]]
+
+        # Avoid reading rows from an empty table. pandas.concat will fail on an
+        # empty list.
+        if not session.streams:
+            return pandas.DataFrame(columns=columns)
+
+        download_stream = functools.partial(
+            self._to_dataframe_bqstorage_stream,
+            bqstorage_client,
+            dtypes,
+            columns,
+            session,
+        )
+        frames = self._download_bqstorage(
+            session, download_stream, progress_bar=progress_bar
+        )
         return pandas.concat(frames, ignore_index=True)
 
+    def _bqstorage_page_iterable_stream(
+        self, bqstorage_client, session, convert_page, stream, item_queue
+    ):
+        position = bigquery_storage_v1beta1.types.StreamPosition(stream=stream)
+        rowstream = bqstorage_client.read_rows(position).rows(session)
+
+        for page in rowstream.pages:
+            if self._download_finished:
+                return
+
+            item = convert_page(page)
+
+            # Block while the queue is full, so that a slow consumer limits
+            # how many pages are held in memory. Wake up periodically to
+            # check whether the consumer has stopped iterating.
+            while True:
+                try:
+                    item_queue.put(item, timeout=_PROGRESS_INTERVAL)
+                    break
+                except queue.Full:
+                    if self._download_finished:
+                        return
+
+    def _bqstorage_page_iterable(
+        self, bqstorage_client, session, convert_page, max_queue_size
+    ):
+        """Download the pages of a read session in background threads.
+
+        Each stream of the read session is downloaded in a background thread.
+        Each page is passed to ``convert_page`` and the result is yielded as
+        soon as it is ready. Pages from different streams are yielded in no
+        particular order.
+        """
+        if not session.streams:
+            return
+
+        total_streams = len(session.streams)
+        if max_queue_size is _MAX_QUEUE_SIZE_DEFAULT:
+            max_queue_size = total_streams
+        # A maxsize of 0 means an unbounded queue.
+        item_queue = queue.Queue(maxsize=max_queue_size or 0)
+
+        # Use _download_finished to notify worker threads when to quit.
+        self._download_finished = False
+
+        download_stream = functools.partial(
+            self._bqstorage_page_iterable_stream,
+            bqstorage_client,
+            session,
+            convert_page,
+        )
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=total_streams) as pool:
+            try:
+                not_done = [
+                    pool.submit(download_stream, stream, item_queue)
+                    for stream in session.streams
+                ]
+
+                while True:
+                    try:
+                        item = item_queue.get(timeout=_PROGRESS_INTERVAL)
+                    except queue.Empty:
+                        pass
+                    else:
+                        yield item
+                        continue
+
+                    done, not_done = concurrent.futures.wait(not_done, timeout=0)
+                    for future in done:
+                        # Raise any errors from the worker threads.
+                        future.result()
+
+                    # Workers put all of their items on the queue before
+                    # finishing, so once they are done, an empty queue means
+                    # there are no more items.
+                    if not not_done and item_queue.empty():
+                        break
+            finally:
+                # No need for a lock because reading/replacing a variable is
+                # defined to be an atomic operation in the Python language
+                # definition (enforced by the global interpreter lock).
+                self._download_finished = True
+
+                # Shutdown all background threads, now that they should know to
+                # exit early.
+                pool.shutdown(wait=True)
+
+    def _to_dataframe_iterable_bqstorage(
+        self, bqstorage_client, session, dtypes, max_queue_size
+    ):
+        """Use (faster, but billable) BQ Storage API to construct DataFrames.
+
+        Each page is converted to a DataFrame and yielded as soon as it is
+        ready, in no particular order.
+        """
+        # page.to_dataframe() does not preserve the column order of Avro
+        # sessions, so find it from the session's schema.
+        columns = _pandas_helpers.bqstorage_column_names(session)
+
+        def page_to_dataframe(page):
+            # page.to_dataframe() does not preserve column order.
+            return page.to_dataframe(dtypes=dtypes)[columns]
+
+        return self._bqstorage_page_iterable(
+            bqstorage_client, session, page_to_dataframe, max_queue_size
+        )
+
+    def _to_row_iterable_bqstorage(
+        self, bqstorage_client, session, max_queue_size=_MAX_QUEUE_SIZE_DEFAULT
+    ):
+        """Use (faster, but billable) BQ Storage API to iterate over rows.
+
+        Pages are downloaded ahead of the caller in background threads. The
+        rows are in table order only if the read session has one stream.
+
+        The Avro data format encodes ``DATETIME`` values as strings, so they
+        are parsed into :class:`datetime.datetime` objects, including in
+        ``REPEATED`` and ``RECORD`` fields, as tabledata.list rows have.
+
+        Yields:
+            google.cloud.bigquery.table.Row: The rows, with the same fields and
+            value types as rows from tabledata.list.
+        """
+        columns = [
+            (field.name, _bqstorage_value_converter(field)) for field in self._schema
+        ]
+
+        def page_to_rows(page):
+            return [
+                Row(
+                    tuple(
+                        row[name] if convert is None else convert(row[name])
+                        for name, convert in columns
+                    ),
+                    self._field_to_index,
+                )
+                for row in page
+            ]
+
+        pages = self._bqstorage_page_iterable(
+            bqstorage_client, session, page_to_rows, max_queue_size
+        )
+        try:
+            for rows in pages:
+                for row in rows:
+                    yield row
+        finally:
+            # Stop the download threads if the caller stops iterating early.
+            pages.close()
+
+    def _to_arrow_bqstorage(self, bqstorage_client, progress_bar=None):
+        """Use (faster, but billable) BQ Storage API to construct an Arrow table.
+
+        Requests a read session using the Arrow data format, so that each
+        page's record batch is used as is. If the session uses Avro instead,
+        each page is decoded into columns and converted.
+        """
+        session = self._create_bqstorage_read_session(bqstorage_client, arrow=True)
+
+        arrow_schema = _pandas_helpers.bqstorage_arrow_schema(session)
+        if arrow_schema is not None:
+            page_to_arrow = operator.methodcaller("to_arrow")
+        else:
+            # The read session determines the column order, which may differ
+            # from the order of the fields in the table's schema.
+            columns = _pandas_helpers.bqstorage_column_names(session)
+            fields_by_name = {field.name: field for field in self._schema}
+            schema = [fields_by_name[name] for name in columns]
+            page_to_arrow = functools.partial(
+                _pandas_helpers.bqstorage_avro_page_to_arrow,
+                column_names=columns,
+                schema=schema,
+            )
+
+        record_batches = []
+        if session.streams:
+            download_stream = functools.partial(
+                self._to_arrow_bqstorage_stream,
+                bqstorage_client,
+                page_to_arrow,
+                session,
+            )
+            for stream_batches in self._download_bqstorage(
+                session, download_stream, progress_bar=progress_bar
+            ):
+                record_batches.extend(stream_batches)
+
+        if arrow_schema is not None:
+            return pyarrow.Table.from_batches(record_batches, schema=arrow_schema)
+        return _pandas_helpers.record_batches_to_table(record_batches, schema)
+
     def _get_progress_bar(self, progress_bar_type):
         """Construct a tqdm progress bar object, if tqdm is installed."""
         if tqdm is None:
@@ -1624,8 +2128,11 @@ class RowIterator(HTTPIterator):
                 supplied, use the faster BigQuery Storage API to fetch rows
                 from BigQuery. This API is a billable API.
 
-                This method requires the ``fastavro`` and
-                ``google-cloud-bigquery-storage`` libraries.
+                This method requires the ``google-cloud-bigquery-storage``
+                library. If ``pyarrow`` is installed, rows are read as Arrow
+                record batches and converted with
+                :meth:`pyarrow.Table.to_pandas`. Otherwise, the ``fastavro``
+                library is required to read the rows as Avro.
 
                 Reading from a specific partition or snapshot is not
                 currently supported by this method.
@@ -1684,9 +2191,14 @@ class RowIterator(HTTPIterator):
 
         if bqstorage_client is not None:
             try:
-                return self._to_dataframe_bqstorage(
-                    bqstorage_client, dtypes, progress_bar=progress_bar
+                if pyarrow is None:
+                    return self._to_dataframe_bqstorage(
+                        bqstorage_client, dtypes, progress_bar=progress_bar
+                    )
+                arrow_table = self._to_arrow_bqstorage(
+                    bqstorage_client, progress_bar=progress_bar
                 )
+                return self._arrow_table_to_dataframe(arrow_table, dtypes)
             except google.api_core.exceptions.Forbidden:
                 # Don't hide errors such as insufficient permissions to create
                 # a read session, or the API is not enabled. Both of those are
@@ -1700,7 +2212,165 @@ class RowIterator(HTTPIterator):
                 # with the tabledata.list API.
                 pass
 
-        return self._to_dataframe_tabledata_list(dtypes, progress_bar=progress_bar)
+        if pyarrow is None:
+            return self._to_dataframe_tabledata_list(dtypes, progress_bar=progress_bar)
+
+        # Building columnar record batches per page and converting them all
+        # at once avoids a list append per cell and the copies made by
+        # pandas.concat.
+        arrow_table = self._to_arrow_tabledata_list(progress_bar=progress_bar)
+        return self._arrow_table_to_dataframe(arrow_table, dtypes)
+
+    @staticmethod
+    def _arrow_table_to_dataframe(arrow_table, dtypes):
+        """Convert a :class:`pyarrow.Table` to a DataFrame, applying ``dtypes``."""
+        df = arrow_table.to_pandas()
+        for column in dtypes:
+            df[column] = pandas.Series(df[column], dtype=dtypes[column])
+        return df
+
+    def to_dataframe_iterable(
+        self, bqstorage_client=None, dtypes=None, max_queue_size=_MAX_QUEUE_SIZE_DEFAULT
+    ):
+        """Create an iterable of pandas DataFrames, to process the table as a stream.
+
+        Unlike :meth:`to_dataframe`, the rows are not combined into a single
+        DataFrame, so only a bounded number of pages need to be held in
+        memory at once.
+
+        Args:
+            bqstorage_client ( \
+                google.cloud.bigquery_storage_v1beta1.BigQueryStorageClient \
+            ):
+                **Beta Feature** Optional. A BigQuery Storage API client. If
+                supplied, use the faster BigQuery Storage API to fetch rows
+                from BigQuery. Streams are downloaded in parallel, so the
+                DataFrames are yielded in no particular order. This API is a
+                billable API.
+
+                This method requires the ``fastavro`` and
+                ``google-cloud-bigquery-storage`` libraries.
+
+                Reading from a specific partition or snapshot is not
+                currently supported by this method.
+            dtypes ( \
+                Map[str, Union[str, pandas.Series.dtype]] \
+            ):
+                Optional. A dictionary of column names pandas ``dtype``s. The
+                provided ``dtype`` is used when constructing the series for
+                the column specified. Otherwise, the default pandas behavior
+                is used.
+            max_queue_size (Optional[int]):
+                The maximum number of downloaded pages to buffer while
+                waiting for the caller to consume them. When the buffer is
+                full, the BigQuery Storage API download threads wait. Defaults
+                to the number of streams in the read session. If ``None`` or
+                ``0``, the buffer is unbounded.
+
+                Ignored if the BigQuery Storage API is not used.
+
+        Returns:
+            Iterable[pandas.DataFrame]:
+                An iterable of :class:`~pandas.DataFrame`, one per page of
+                rows. The column headers are derived from the destination
+                table's schema.
+
+        Raises:
+            ValueError:
+                If the :mod:`pandas` library cannot be imported, or the
+                :mod:`google.cloud.bigquery_storage_v1beta1` module is
+                required but cannot be imported.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+        if dtypes is None:
+            dtypes = {}
+
+        if bqstorage_client is not None:
+            try:
+                session = self._create_bqstorage_read_session(
+                    bqstorage_client, arrow=pyarrow is not None
+                )
+            except google.api_core.exceptions.Forbidden:
+                # Don't hide errors such as insufficient permissions to create
+                # a read session, or the API is not enabled.
+                raise
+            except google.api_core.exceptions.GoogleAPICallError:
+                # There is a known issue with reading from small anonymous
+                # query results tables, so fall back to tabledata.list.
+                pass
+            else:
+                return self._to_dataframe_iterable_bqstorage(
+                    bqstorage_client, session, dtypes, max_queue_size
+                )
+
+        return self._to_dataframe_iterable_tabledata_list(dtypes)
+
+    def to_arrow(self, progress_bar_type=None, bqstorage_client=None):
+        """Create a :class:`pyarrow.Table` by loading all pages of a table or query.
+
+        Rows are converted to Arrow columns one page at a time, directly from
+        the API responses, so no Python objects are kept for each row.
+
+        Args:
+            progress_bar_type (Optional[str]):
+                If set, use the `tqdm <https://tqdm.github.io/>`_ library to
+                display a progress bar while the data downloads. Install the
+                ``tqdm`` package to use this feature.
+
+                See
+                :func:`~google.cloud.bigquery.table.RowIterator.to_dataframe`
+                for details.
+            bqstorage_client ( \
+                google.cloud.bigquery_storage_v1beta1.BigQueryStorageClient \
+            ):
+                **Beta Feature** Optional. A BigQuery Storage API client. If
+                supplied, use the faster BigQuery Storage API to fetch rows
+                from BigQuery. This API is a billable API.
+
+                This method requires the ``google-cloud-bigquery-storage``
+                library. The read session requests the Arrow data format, so
+                record batches are used as returned by the API.
+
+                Reading from a specific partition or snapshot is not
+                currently supported by this method.
+
+                When a problem is encountered reading a table, the
+                tabledata.list method from the BigQuery API is used, instead.
+
+        Returns:
+            pyarrow.Table:
+                A :class:`pyarrow.Table` populated with row data and column
+                headers from the query results. The column headers are derived
+                from the destination table's schema.
+
+        Raises:
+            ValueError:
+                If the :mod:`pyarrow` library cannot be imported, or the
+                :mod:`google.cloud.bigquery_storage_v1beta1` module is
+                required but cannot be imported.
+
+        ..versionadded:: 1.13.0
+        """
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+
+        progress_bar = self._get_progress_bar(progress_bar_type)
+
+        if bqstorage_client is not None:
+            try:
+                return self._to_arrow_bqstorage(
+                    bqstorage_client, progress_bar=progress_bar
+                )
+            except google.api_core.exceptions.Forbidden:
+                # Don't hide errors such as insufficient permissions to create
+                # a read session, or the API is not enabled.
+                raise
+            except google.api_core.exceptions.GoogleAPICallError:
+                # Fall back to the tabledata.list API. See to_dataframe().
+                pass
+
+        return self._to_arrow_tabledata_list(progress_bar=progress_bar)
 
 
 class _EmptyRowIterator(object):
@@ -1734,6 +2404,44 @@ class _EmptyRowIterator(object):
             raise ValueError(_NO_PANDAS_ERROR)
         return pandas.DataFrame()
 
+    def to_dataframe_iterable(
+        self, bqstorage_client=None, dtypes=None, max_queue_size=None
+    ):
+        """Create an iterable of pandas DataFrames.
+
+        Args:
+            bqstorage_client (Any):
+                Ignored. Added for compatibility with RowIterator.
+            dtypes (Any):
+                Ignored. Added for compatibility with RowIterator.
+            max_queue_size (Any):
+                Ignored. Added for compatibility with RowIterator.
+
+        Returns:
+            Iterable[pandas.DataFrame]:
+                An iterator yielding a single empty :class:`~pandas.DataFrame`.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+        return iter((pandas.DataFrame(),))
+
+    def to_arrow(self, progress_bar_type=None, bqstorage_client=None):
+        """Create an empty :class:`pyarrow.Table`.
+
+        Args:
+            progress_bar_type (Any):
+                Ignored. Added for compatibility with RowIterator.
+            bqstorage_client (Any):
+                Ignored. Added for compatibility with RowIterator.
+
+        Returns:
+            pyarrow.Table:
+                An empty :class:`pyarrow.Table`.
+        """
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+        return pyarrow.Table.from_arrays(())
+
     def __iter__(self):
         return iter(())
 
@@ -1887,6 +2595,49 @@ class TimePartitioning(object):
         return "TimePartitioning({})".format(",".join(key_vals))
 
 
+def _bqstorage_value_converter(field):
+    """Find how to convert a BQ Storage API Avro value to a tabledata.list value.
+
+    Args:
+        field (google.cloud.bigquery.schema.SchemaField): The value's field.
+
+    Returns:
+        Optional[Callable[[Any], Any]]:
+            A function converting the field's values, or :data:`None` if the
+            values are already of the same types as tabledata.list values.
+    """
+    if field.field_type == "DATETIME":
+
+        def convert(value):
+            if value is None:
+                return None
+            return _helpers._datetime_from_json(value, field)
+
+    elif field.field_type in ("RECORD", "STRUCT"):
+        subfields = [
+            (subfield.name, _bqstorage_value_converter(subfield))
+            for subfield in field.fields
+        ]
+        subfields = [(name, sub) for name, sub in subfields if sub is not None]
+        if not subfields:
+            return None
+
+        def convert(value):
+            if value is None:
+                return None
+            value = dict(value)
+            for name, convert_subfield in subfields:
+                value[name] = convert_subfield(value[name])
+            return value
+
+    else:
+        return None
+
+    if field.mode != "REPEATED":
+        return convert
+    return lambda values: None if values is None else [convert(v) for v in values]
+
+
 def _item_to_row(iterator, resource):
     """Convert a JSON row to the native object.
 
@@ -1905,10 +2656,7 @@ def _item_to_row(iterator, resource):
     :rtype: :class:`~google.cloud.bigquery.table.Row`
     :returns: The next row in the page.
     """
-    return Row(
-        _helpers._row_tuple_from_json(resource, iterator.schema),
-        iterator._field_to_index,
-    )
+    return Row(iterator._decode_row(resource), iterator._field_to_index)
 
 
 # pylint: disable=unused-argument
@@ -1924,6 +2672,10 @@ def _rows_page_start(iterator, page, response):
     :type response: dict
     :param response: The JSON API response for a page of rows in a table.
     """
+    page._columns = _pandas_helpers.tabledata_list_page_columns(
+        iterator._schema, response
+    )
+
     total_rows = response.get("totalRows")
     if total_rows is not None:
         total_rows = int(total_rows)
@@ -525,6 +525,75 @@ class Test_row_tuple_from_json(unittest.TestCase):
         )
 
 
+class Test_row_tuple_decoder(Test_row_tuple_from_json):
+    def _call_fut(self, row, schema):
+        from google.cloud.bigquery._helpers import _row_tuple_decoder
+
+        return _row_tuple_decoder(schema)(row)
+
+    def test_w_nullable_scalar_columns(self):
+        int_col = _Field("NULLABLE", "int_col", "INTEGER")
+        str_col = _Field("NULLABLE", "str_col", "STRING")
+        bool_col = _Field("NULLABLE", "bool_col", "BOOLEAN")
+        schema = [int_col, str_col, bool_col]
+        row_w_values = {u"f": [{u"v": u"1"}, {u"v": u"abc"}, {u"v": u"true"}]}
+        row_w_nulls = {u"f": [{u"v": None}, {u"v": None}, {u"v": None}]}
+        self.assertEqual(self._call_fut(row_w_values, schema), (1, u"abc", True))
+        self.assertEqual(self._call_fut(row_w_nulls, schema), (None, None, None))
+
+    def test_w_date_and_timestamp_columns(self):
+        from google.cloud._helpers import UTC
+
+        date_col = _Field("NULLABLE", "date_col", "DATE")
+        ts_col = _Field("REQUIRED", "ts_col", "TIMESTAMP")
+        row = {u"f": [{u"v": u"2019-03-15"}, {u"v": u"1.4338368E9"}]}
+        self.assertEqual(
+            self._call_fut(row, schema=[date_col, ts_col]),
+            (
+                datetime.date(2019, 3, 15),
+                datetime.datetime(2015, 6, 9, 8, 0, tzinfo=UTC),
+            ),
+        )
+
+    def test_w_nullable_struct_column(self):
+        sub_1 = _Field("NULLABLE", "sub_1", "INTEGER")
+        col = _Field("NULLABLE", "col", "RECORD", fields=[sub_1])
+        row = {u"f": [{u"v": None}]}
+        self.assertEqual(self._call_fut(row, schema=[col]), (None,))
+
+    def test_w_unknown_type_raises_on_decode(self):
+        col = _Field("NULLABLE", "col", "UNKNOWN_TYPE")
+        decode_row = self._get_decoder([col])
+        with self.assertRaises(KeyError):
+            decode_row({u"f": [{u"v": u"1"}]})
+
+    def test_caches_by_schema(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [SchemaField("col", "INTEGER")]
+        same_schema = [SchemaField("col", "INTEGER")]
+        other_schema = [SchemaField("col", "STRING")]
+        self.assertIs(self._get_decoder(schema), self._get_decoder(same_schema))
+        self.assertIsNot(self._get_decoder(schema), self._get_decoder(other_schema))
+
+    def test_w_unhashable_schema(self):
+        from google.cloud.bigquery import _helpers
+
+        class _UnhashableField(_Field):
+            __hash__ = None
+
+        col = _UnhashableField("NULLABLE", "col", "INTEGER")
+        cache_size = len(_helpers._ROW_DECODER_CACHE)
+        decode_row = self._get_decoder([col])
+        self.assertEqual(decode_row({u"f": [{u"v": u"7"}]}), (7,))
+        self.assertEqual(len(_helpers._ROW_DECODER_CACHE), cache_size)
+
+    def _get_decoder(self, schema):
+        from google.cloud.bigquery._helpers import _row_tuple_decoder
+
+        return _row_tuple_decoder(schema)
+
+
 class Test_rows_from_json(unittest.TestCase):
     def _call_fut(self, rows, schema):
         from google.cloud.bigquery._helpers import _rows_from_json
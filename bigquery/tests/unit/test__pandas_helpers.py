@@ -0,0 +1,496 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import decimal
+import functools
+import io
+import json
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+try:
+    import pyarrow
+    import pyarrow.parquet
+    import pyarrow.types
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+import pytest
+
+try:
+    from google.cloud import bigquery_storage_v1beta1
+except ImportError:  # pragma: NO COVER
+    bigquery_storage_v1beta1 = None
+
+from google.cloud._helpers import UTC
+from google.cloud.bigquery import schema
+
+
+@pytest.fixture
+def module_under_test():
+    from google.cloud.bigquery import _pandas_helpers
+
+    return _pandas_helpers
+
+
+def is_none(value):
+    return value is None
+
+
+def is_datetime(type_):
+    # See: https://arrow.apache.org/docs/python/api/datatypes.html#type-checking
+    return all_(
+        pyarrow.types.is_timestamp,
+        lambda type_: type_.unit == "us",
+        lambda type_: type_.tz is None,
+    )(type_)
+
+
+def is_numeric(type_):
+    # See: https://cloud.google.com/bigquery/docs/reference/standard-sql/data-types#numeric-type
+    return all_(
+        pyarrow.types.is_decimal,
+        lambda type_: type_.precision == 38,
+        lambda type_: type_.scale == 9,
+    )(type_)
+
+
+def is_timestamp(type_):
+    # See: https://arrow.apache.org/docs/python/api/datatypes.html#type-checking
+    return all_(
+        pyarrow.types.is_timestamp,
+        lambda type_: type_.unit == "us",
+        lambda type_: type_.tz == "UTC",
+    )(type_)
+
+
+def do_all(functions, value):
+    return all((func(value) for func in functions))
+
+
+def all_(*functions):
+    return functools.partial(do_all, functions)
+
+
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+def test_is_datetime():
+    assert is_datetime(pyarrow.timestamp("us", tz=None))
+    assert not is_datetime(pyarrow.timestamp("ms", tz=None))
+    assert not is_datetime(pyarrow.timestamp("us", tz="UTC"))
+    assert not is_datetime(pyarrow.string())
+
+
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+@pytest.mark.parametrize(
+    "bq_type,bq_mode,is_correct_type",
+    [
+        ("STRING", "NULLABLE", pyarrow.types.is_string if pyarrow else None),
+        ("STRING", None, pyarrow.types.is_string if pyarrow else None),
+        ("string", "NULLABLE", pyarrow.types.is_string if pyarrow else None),
+        ("BYTES", "NULLABLE", pyarrow.types.is_binary if pyarrow else None),
+        ("INTEGER", "NULLABLE", pyarrow.types.is_int64 if pyarrow else None),
+        ("INT64", "NULLABLE", pyarrow.types.is_int64 if pyarrow else None),
+        ("FLOAT", "NULLABLE", pyarrow.types.is_float64 if pyarrow else None),
+        ("FLOAT64", "NULLABLE", pyarrow.types.is_float64 if pyarrow else None),
+        ("NUMERIC", "NULLABLE", is_numeric),
+        ("BOOLEAN", "NULLABLE", pyarrow.types.is_boolean if pyarrow else None),
+        ("BOOL", "NULLABLE", pyarrow.types.is_boolean if pyarrow else None),
+        ("TIMESTAMP", "NULLABLE", is_timestamp),
+        ("DATE", "NULLABLE", pyarrow.types.is_date32 if pyarrow else None),
+        ("TIME", "NULLABLE", pyarrow.types.is_time64 if pyarrow else None),
+        ("DATETIME", "NULLABLE", is_datetime),
+        ("GEOGRAPHY", "NULLABLE", pyarrow.types.is_string if pyarrow else None),
+        ("UNKNOWN_TYPE", "NULLABLE", is_none),
+        # Use pyarrow.list_(item_type) for repeated (array) fields.
+        (
+            "STRING",
+            "REPEATED",
+            all_(
+                pyarrow.types.is_list,
+                lambda type_: pyarrow.types.is_string(type_.value_type),
+            )
+            if pyarrow
+            else None,
+        ),
+        (
+            "INTEGER",
+            "REPEATED",
+            all_(
+                pyarrow.types.is_list,
+                lambda type_: pyarrow.types.is_int64(type_.value_type),
+            )
+            if pyarrow
+            else None,
+        ),
+        (
+            "TIMESTAMP",
+            "REPEATED",
+            all_(pyarrow.types.is_list, lambda type_: is_timestamp(type_.value_type))
+            if pyarrow
+            else None,
+        ),
+        ("UNKNOWN_TYPE", "REPEATED", is_none),
+    ],
+)
+def test_bq_to_arrow_data_type(module_under_test, bq_type, bq_mode, is_correct_type):
+    field = schema.SchemaField("ignored_name", bq_type, mode=bq_mode)
+    actual = module_under_test.bq_to_arrow_data_type(field)
+    assert is_correct_type(actual)
+
+
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+@pytest.mark.parametrize("bq_type", ["RECORD", "record", "STRUCT", "struct"])
+def test_bq_to_arrow_data_type_w_struct(module_under_test, bq_type):
+    fields = (
+        schema.SchemaField("field01", "STRING"),
+        schema.SchemaField("field02", "BYTES"),
+        schema.SchemaField("field03", "INTEGER"),
+        schema.SchemaField("field04", "FLOAT"),
+        schema.SchemaField("field05", "NUMERIC"),
+        schema.SchemaField("field06", "BOOLEAN"),
+        schema.SchemaField("field07", "TIMESTAMP"),
+        schema.SchemaField("field08", "DATE"),
+        schema.SchemaField("field09", "TIME"),
+        schema.SchemaField("field10", "DATETIME"),
+        schema.SchemaField("field11", "GEOGRAPHY"),
+    )
+    field = schema.SchemaField("ignored_name", bq_type, mode="NULLABLE", fields=fields)
+    actual = module_under_test.bq_to_arrow_data_type(field)
+    expected = pyarrow.struct(
+        (
+            pyarrow.field("field01", pyarrow.string()),
+            pyarrow.field("field02", pyarrow.binary()),
+            pyarrow.field("field03", pyarrow.int64()),
+            pyarrow.field("field04", pyarrow.float64()),
+            pyarrow.field("field05", module_under_test.pyarrow_numeric()),
+            pyarrow.field("field06", pyarrow.bool_()),
+            pyarrow.field("field07", module_under_test.pyarrow_timestamp()),
+            pyarrow.field("field08", pyarrow.date32()),
+            pyarrow.field("field09", module_under_test.pyarrow_time()),
+            pyarrow.field("field10", module_under_test.pyarrow_datetime()),
+            pyarrow.field("field11", pyarrow.string()),
+        )
+    )
+    assert pyarrow.types.is_struct(actual)
+    assert actual.num_fields == len(fields)
+    assert actual.equals(expected)
+
+
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+def test_bq_to_arrow_data_type_w_struct_unknown_subfield(module_under_test):
+    fields = (
+        schema.SchemaField("field1", "STRING"),
+        schema.SchemaField("field2", "INTEGER"),
+        # Don't know what to convert UNKNOWN_TYPE to, let type inference work,
+        # instead.
+        schema.SchemaField("field3", "UNKNOWN_TYPE"),
+    )
+    field = schema.SchemaField("ignored_name", "RECORD", mode="NULLABLE", fields=fields)
+    actual = module_under_test.bq_to_arrow_data_type(field)
+    assert actual is None
+
+
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+@pytest.mark.parametrize(
+    "bq_type,rows",
+    [
+        ("STRING", ["abc", None, "def", None]),
+        ("BYTES", [b"abc", None, b"def", None]),
+        ("INTEGER", [123, None, 456, None]),
+        ("FLOAT", [1.25, None, 3.5, None]),
+        ("NUMERIC", [decimal.Decimal("-123.456789"), None, decimal.Decimal("1")]),
+        ("BOOLEAN", [True, None, False, None]),
+        (
+            "TIMESTAMP",
+            [
+                datetime.datetime(1, 1, 1, 0, 0, 0, tzinfo=UTC),
+                None,
+                datetime.datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=UTC),
+            ],
+        ),
+        ("DATE", [datetime.date(1, 1, 1), None, datetime.date(9999, 12, 31)]),
+        ("TIME", [datetime.time(0, 0, 0), None, datetime.time(23, 59, 59, 999999)]),
+        (
+            "DATETIME",
+            [
+                datetime.datetime(1, 1, 1, 0, 0, 0),
+                None,
+                datetime.datetime(9999, 12, 31, 23, 59, 59, 999999),
+            ],
+        ),
+        ("GEOGRAPHY", ["POINT(30 10)", None, "LINESTRING (30 10, 10 30, 40 40)"]),
+    ],
+)
+def test_bq_to_arrow_array_w_nullable_scalars(module_under_test, bq_type, rows):
+    bq_field = schema.SchemaField("field_name", bq_type)
+    arrow_array = module_under_test.bq_to_arrow_array(rows, bq_field)
+    roundtrip = arrow_array.to_pylist()
+    assert rows == roundtrip
+
+
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+def test_bq_to_arrow_array_w_arrays(module_under_test):
+    rows = [[1, 2, 3], [], [4, 5, 6]]
+    bq_field = schema.SchemaField("field_name", "INTEGER", mode="REPEATED")
+    arrow_array = module_under_test.bq_to_arrow_array(rows, bq_field)
+    roundtrip = arrow_array.to_pylist()
+    assert rows == roundtrip
+
+
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+def test_bq_to_arrow_array_w_structs(module_under_test):
+    rows = [
+        {"int_col": 123, "string_col": "abc"},
+        None,
+        {"int_col": 456, "string_col": "def"},
+    ]
+    bq_field = schema.SchemaField(
+        "field_name",
+        "RECORD",
+        fields=(
+            schema.SchemaField("int_col", "INTEGER"),
+            schema.SchemaField("string_col", "STRING"),
+        ),
+    )
+    arrow_array = module_under_test.bq_to_arrow_array(rows, bq_field)
+    roundtrip = arrow_array.to_pylist()
+    assert rows == roundtrip
+
+
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+def test_bq_to_arrow_schema_w_unknown_type(module_under_test):
+    fields = (
+        schema.SchemaField("field1", "STRING"),
+        schema.SchemaField("field2", "INTEGER"),
+        schema.SchemaField("field3", "UNKNOWN_TYPE"),
+    )
+    actual = module_under_test.bq_to_arrow_schema(fields)
+    assert actual is None
+
+
+def test_tabledata_list_page_columns(module_under_test):
+    fields = (
+        schema.SchemaField("name", "STRING"),
+        schema.SchemaField("age", "INTEGER"),
+        schema.SchemaField("tags", "STRING", mode="REPEATED"),
+    )
+    response = {
+        "rows": [
+            {"f": [{"v": "Phred"}, {"v": "32"}, {"v": [{"v": "a"}, {"v": "b"}]}]},
+            {"f": [{"v": "Wylma"}, {"v": None}, {"v": []}]},
+        ]
+    }
+
+    columns = module_under_test.tabledata_list_page_columns(fields, response)
+
+    assert [list(column) for column in columns] == [
+        ["Phred", "Wylma"],
+        [32, None],
+        [["a", "b"], []],
+    ]
+
+
+def test_tabledata_list_page_columns_wo_rows(module_under_test):
+    fields = (schema.SchemaField("name", "STRING"),)
+
+    columns = module_under_test.tabledata_list_page_columns(fields, {})
+
+    assert [list(column) for column in columns] == [[]]
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+def test_dataframe_to_bq_schema(module_under_test):
+    dataframe = pandas.DataFrame({"name": ["Phred"], "age": [32]})
+    bq_schema = (
+        schema.SchemaField("age", "INTEGER"),
+        schema.SchemaField("name", "STRING"),
+        schema.SchemaField("unused", "STRING"),
+    )
+
+    fields = module_under_test.dataframe_to_bq_schema(dataframe, bq_schema)
+
+    assert fields == [bq_schema[1], bq_schema[0]]
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+@pytest.mark.parametrize(
+    "bq_schema",
+    [
+        None,
+        (schema.SchemaField("name", "STRING"),),
+        (
+            schema.SchemaField("name", "STRING"),
+            schema.SchemaField("age", "UNKNOWN_TYPE"),
+        ),
+    ],
+)
+def test_dataframe_to_bq_schema_w_unusable_schema(module_under_test, bq_schema):
+    dataframe = pandas.DataFrame({"name": ["Phred"], "age": [32]})
+    assert module_under_test.dataframe_to_bq_schema(dataframe, bq_schema) is None
+
+
+def _read_parquet_stream(stream, chunk_size):
+    return b"".join(iter(lambda: stream.read(chunk_size), b""))
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+def test_parquet_stream_w_bq_schema(module_under_test):
+    dataframe = pandas.DataFrame(
+        {"id": list(range(25)), "name": ["row {}".format(i) for i in range(25)]}
+    )
+    bq_schema = [
+        schema.SchemaField("id", "FLOAT"),
+        schema.SchemaField("name", "STRING"),
+    ]
+    stream = module_under_test.ParquetStream(dataframe, bq_schema, row_group_size=10)
+
+    data = _read_parquet_stream(stream, 100)
+
+    parquet_file = pyarrow.parquet.ParquetFile(io.BytesIO(data))
+    assert parquet_file.num_row_groups == 3
+    table = parquet_file.read()
+    assert table.schema.field("id").type == pyarrow.float64()
+    assert table.column("id").to_pylist() == [float(i) for i in range(25)]
+    assert table.column("name").to_pylist() == list(dataframe["name"])
+    assert stream.tell() == len(data)
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+def test_parquet_stream_wo_rows(module_under_test):
+    dataframe = pandas.DataFrame({"name": pandas.Series([], dtype="object")})
+    stream = module_under_test.ParquetStream(dataframe)
+
+    table = pyarrow.parquet.read_table(io.BytesIO(stream.read()))
+
+    assert table.num_rows == 0
+    assert table.column_names == ["name"]
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+def test_parquet_stream_w_null_row_group(module_under_test):
+    dataframe = pandas.DataFrame(
+        {"a": [1, 2, 3], "s": pandas.Series([None, None, "x"], dtype="object")}
+    )
+    stream = module_under_test.ParquetStream(dataframe, row_group_size=2)
+
+    table = pyarrow.parquet.read_table(io.BytesIO(stream.read()))
+
+    assert table.column("s").type == pyarrow.string()
+    assert table.column("s").to_pylist() == [None, None, "x"]
+    assert table.column("a").to_pylist() == [1, 2, 3]
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+def test_parquet_stream_seek_to_last_read(module_under_test):
+    dataframe = pandas.DataFrame({"id": list(range(100))})
+    stream = module_under_test.ParquetStream(dataframe, row_group_size=10)
+
+    stream.read(50)
+    second = stream.read(50)
+    stream.seek(75)
+    assert stream.read(25) == second[25:]
+    stream.seek(-25, io.SEEK_CUR)
+    assert stream.read(25) == second[25:]
+
+    # Bytes before the most recent read have been discarded.
+    with pytest.raises(io.UnsupportedOperation):
+        stream.seek(0)
+    with pytest.raises(io.UnsupportedOperation):
+        stream.seek(0, io.SEEK_END)
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+def test_parquet_stream_w_invalid_row_group_size(module_under_test):
+    dataframe = pandas.DataFrame({"id": [1]})
+    with pytest.raises(ValueError):
+        module_under_test.ParquetStream(dataframe, row_group_size=0)
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+def test_parquet_stream_closed(module_under_test):
+    dataframe = pandas.DataFrame({"id": [1]})
+    stream = module_under_test.ParquetStream(dataframe)
+    stream.close()
+
+    assert stream.closed
+    with pytest.raises(ValueError):
+        stream.read(10)
+
+
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+@pytest.mark.skipif(
+    bigquery_storage_v1beta1 is None, reason="Requires `google-cloud-bigquery-storage`"
+)
+def test_bqstorage_column_names_w_arrow_session(module_under_test):
+    arrow_schema = pyarrow.schema(
+        [
+            pyarrow.field("colB", pyarrow.string()),
+            pyarrow.field("colA", pyarrow.int64()),
+        ]
+    )
+    session = bigquery_storage_v1beta1.types.ReadSession()
+    session.arrow_schema.serialized_schema = arrow_schema.serialize().to_pybytes()
+
+    assert module_under_test.bqstorage_arrow_schema(session) == arrow_schema
+    assert module_under_test.bqstorage_column_names(session) == ["colB", "colA"]
+
+
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+@pytest.mark.skipif(
+    bigquery_storage_v1beta1 is None, reason="Requires `google-cloud-bigquery-storage`"
+)
+def test_bqstorage_column_names_w_avro_session(module_under_test):
+    session = bigquery_storage_v1beta1.types.ReadSession()
+    session.avro_schema.schema = json.dumps(
+        {"fields": [{"name": "colB"}, {"name": "colA"}]}
+    )
+
+    assert module_under_test.bqstorage_arrow_schema(session) is None
+    assert module_under_test.bqstorage_column_names(session) == ["colB", "colA"]
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
+def test_bqstorage_avro_page_to_arrow_keeps_nullable_integers(module_under_test):
+    class FakePage(object):
+        def to_dataframe(self, dtypes=None):
+            self.dtypes = dtypes
+            return pandas.DataFrame(
+                {"big": [2 ** 62 + 1, None], "name": ["a", None]}, dtype="object"
+            )
+
+    page = FakePage()
+    bq_schema = [
+        schema.SchemaField("big", "INTEGER"),
+        schema.SchemaField("name", "STRING"),
+    ]
+
+    batch = module_under_test.bqstorage_avro_page_to_arrow(
+        page, ["big", "name"], bq_schema
+    )
+
+    assert page.dtypes == {"big": "object", "name": "object"}
+    assert batch.schema.names == ["big", "name"]
+    assert batch.column(0).to_pylist() == [2 ** 62 + 1, None]
+    assert batch.column(1).to_pylist() == ["a", None]
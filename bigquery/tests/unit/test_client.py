@@ -4904,10 +4904,15 @@ class TestClientUpload(object):
         records = [{"name": "Monty", "age": 100}, {"name": "Python", "age": 60}]
         dataframe = pandas.DataFrame(records)
 
+        get_table_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.get_table",
+            autospec=True,
+            side_effect=google.api_core.exceptions.NotFound("Table not found"),
+        )
         load_patch = mock.patch(
             "google.cloud.bigquery.client.Client.load_table_from_file", autospec=True
         )
-        with load_patch as load_table_from_file:
+        with load_patch as load_table_from_file, get_table_patch:
             client.load_table_from_dataframe(dataframe, self.TABLE_REF)
 
         load_table_from_file.assert_called_once_with(
@@ -4915,7 +4920,6 @@ class TestClientUpload(object):
             mock.ANY,
             self.TABLE_REF,
             num_retries=_DEFAULT_NUM_RETRIES,
-            rewind=True,
             job_id=mock.ANY,
             job_id_prefix=None,
             location=None,
@@ -4939,10 +4943,15 @@ class TestClientUpload(object):
         records = [{"name": "Monty", "age": 100}, {"name": "Python", "age": 60}]
         dataframe = pandas.DataFrame(records)
 
+        get_table_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.get_table",
+            autospec=True,
+            side_effect=google.api_core.exceptions.NotFound("Table not found"),
+        )
         load_patch = mock.patch(
             "google.cloud.bigquery.client.Client.load_table_from_file", autospec=True
         )
-        with load_patch as load_table_from_file:
+        with load_patch as load_table_from_file, get_table_patch:
             client.load_table_from_dataframe(dataframe, self.TABLE_REF)
 
         load_table_from_file.assert_called_once_with(
@@ -4950,7 +4959,6 @@ class TestClientUpload(object):
             mock.ANY,
             self.TABLE_REF,
             num_retries=_DEFAULT_NUM_RETRIES,
-            rewind=True,
             job_id=mock.ANY,
             job_id_prefix=None,
             location=self.LOCATION,
@@ -4975,10 +4983,15 @@ class TestClientUpload(object):
         dataframe = pandas.DataFrame(records)
         job_config = job.LoadJobConfig()
 
+        get_table_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.get_table",
+            autospec=True,
+            side_effect=google.api_core.exceptions.NotFound("Table not found"),
+        )
         load_patch = mock.patch(
             "google.cloud.bigquery.client.Client.load_table_from_file", autospec=True
         )
-        with load_patch as load_table_from_file:
+        with load_patch as load_table_from_file, get_table_patch:
             client.load_table_from_dataframe(
                 dataframe, self.TABLE_REF, job_config=job_config, location=self.LOCATION
             )
@@ -4988,7 +5001,6 @@ class TestClientUpload(object):
             mock.ANY,
             self.TABLE_REF,
             num_retries=_DEFAULT_NUM_RETRIES,
-            rewind=True,
             job_id=mock.ANY,
             job_id_prefix=None,
             location=self.LOCATION,
@@ -5000,6 +5012,146 @@ class TestClientUpload(object):
         assert sent_config is job_config
         assert sent_config.source_format == job.SourceFormat.PARQUET
 
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_load_table_from_dataframe_w_get_table_forbidden(self):
+        import pyarrow.parquet
+        from google.cloud.bigquery import job
+
+        client = self._make_client()
+        records = [{"name": "Monty", "age": 100}, {"name": "Python", "age": 60}]
+        dataframe = pandas.DataFrame(records)
+        uploaded = []
+
+        def do_resumable_upload(stream, metadata, num_retries):
+            uploaded.append(stream.read())
+            return self._make_response(
+                http_client.OK,
+                json.dumps(metadata),
+                {"Content-Type": "application/json"},
+            )
+
+        get_table_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.get_table",
+            autospec=True,
+            side_effect=google.api_core.exceptions.Forbidden("Access denied"),
+        )
+        upload_patch = mock.patch.object(
+            client, "_do_resumable_upload", side_effect=do_resumable_upload
+        )
+        with get_table_patch, upload_patch:
+            load_job = client.load_table_from_dataframe(dataframe, self.TABLE_REF)
+
+        assert load_job.source_format == job.SourceFormat.PARQUET
+        arrow_table = pyarrow.parquet.read_table(io.BytesIO(uploaded[0]))
+        assert arrow_table.schema.field("age").type == pyarrow.int64()
+        assert arrow_table.column("name").to_pylist() == ["Monty", "Python"]
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_load_table_from_dataframe_w_destination_schema(self):
+        import pyarrow.parquet
+        from google.cloud.bigquery import job
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        client = self._make_client()
+        records = [{"name": "Monty", "age": 100}, {"name": "Python", "age": 60}]
+        dataframe = pandas.DataFrame(records)
+        table = Table(
+            self.TABLE_REF,
+            schema=[SchemaField("age", "FLOAT"), SchemaField("name", "STRING")],
+        )
+        uploaded = []
+
+        def do_resumable_upload(stream, metadata, num_retries):
+            # Read in small chunks, as the resumable upload does.
+            chunks = iter(lambda: stream.read(64), b"")
+            uploaded.append(b"".join(chunks))
+            return self._make_response(
+                http_client.OK,
+                json.dumps(metadata),
+                {"Content-Type": "application/json"},
+            )
+
+        get_table_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.get_table",
+            autospec=True,
+            return_value=table,
+        )
+        upload_patch = mock.patch.object(
+            client, "_do_resumable_upload", side_effect=do_resumable_upload
+        )
+        mkstemp_patch = mock.patch("tempfile.mkstemp")
+        with get_table_patch, upload_patch, mkstemp_patch as mkstemp:
+            load_job = client.load_table_from_dataframe(dataframe, self.TABLE_REF)
+
+        mkstemp.assert_not_called()
+        assert isinstance(load_job, job.LoadJob)
+        assert load_job.source_format == job.SourceFormat.PARQUET
+
+        arrow_table = pyarrow.parquet.read_table(io.BytesIO(uploaded[0]))
+        assert arrow_table.column_names == ["name", "age"]
+        assert arrow_table.schema.field("age").type == pyarrow.float64()
+        assert arrow_table.column("age").to_pylist() == [100.0, 60.0]
+        assert arrow_table.column("name").to_pylist() == ["Monty", "Python"]
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_load_table_from_dataframe_w_job_config_schema(self):
+        from google.cloud.bigquery import job
+        from google.cloud.bigquery.schema import SchemaField
+
+        client = self._make_client()
+        records = [{"name": "Monty", "age": 100}, {"name": "Python", "age": 60}]
+        dataframe = pandas.DataFrame(records)
+        schema = [SchemaField("name", "STRING"), SchemaField("age", "INTEGER")]
+        job_config = job.LoadJobConfig(schema=schema)
+
+        get_table_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.get_table", autospec=True
+        )
+        load_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.load_table_from_file", autospec=True
+        )
+        with load_patch as load_table_from_file, get_table_patch as get_table:
+            client.load_table_from_dataframe(
+                dataframe, self.TABLE_REF, job_config=job_config
+            )
+
+        get_table.assert_not_called()
+        sent_file = load_table_from_file.mock_calls[0][1][1]
+        assert sent_file._bq_schema == schema
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_load_table_from_dataframe_w_write_truncate(self):
+        from google.cloud.bigquery import job
+
+        client = self._make_client()
+        records = [{"name": "Monty", "age": 100}, {"name": "Python", "age": 60}]
+        dataframe = pandas.DataFrame(records)
+        job_config = job.LoadJobConfig(
+            write_disposition=job.WriteDisposition.WRITE_TRUNCATE
+        )
+
+        get_table_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.get_table", autospec=True
+        )
+        load_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.load_table_from_file", autospec=True
+        )
+        with load_patch as load_table_from_file, get_table_patch as get_table:
+            client.load_table_from_dataframe(
+                dataframe, self.TABLE_REF, job_config=job_config
+            )
+
+        # The table's schema is replaced, so it is not fetched, and the types
+        # are inferred from the DataFrame.
+        get_table.assert_not_called()
+        sent_file = load_table_from_file.mock_calls[0][1][1]
+        assert sent_file._bq_schema is None
+
     # Low-level tests
 
     @classmethod
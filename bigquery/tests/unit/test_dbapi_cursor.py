@@ -16,6 +16,23 @@ import unittest
 
 import mock
 
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+try:
+    from google.cloud import bigquery_storage_v1beta1
+except ImportError:  # pragma: NO COVER
+    bigquery_storage_v1beta1 = None
+
+import google.api_core.exceptions
+
 
 class TestCursor(unittest.TestCase):
     @staticmethod
@@ -46,8 +63,11 @@ class TestCursor(unittest.TestCase):
 
     def _mock_job(self, total_rows=0, schema=None, num_dml_affected_rows=None):
         from google.cloud.bigquery import job
+        from google.cloud.bigquery.table import TableReference
 
         mock_job = mock.create_autospec(job.QueryJob)
+        mock_job.query = "SELECT a, b FROM tbl;"
+        mock_job.destination = TableReference.from_string("proj.dset.anon_tbl")
         mock_job.error_result = None
         mock_job.state = "DONE"
         mock_job.result.return_value = mock_job
@@ -276,6 +296,551 @@ class TestCursor(unittest.TestCase):
         self.assertIsNone(cursor.description)
         self.assertEqual(cursor.rowcount, 12)
 
+    def _make_row_iterator(self, schema, rows):
+        from google.cloud.bigquery import table
+
+        client = mock.Mock(project="proj", spec=["project"])
+        api_request = mock.Mock(
+            return_value={
+                "rows": [{"f": [{"v": value} for value in row]} for row in rows]
+            }
+        )
+        return table.RowIterator(
+            client,
+            api_request,
+            "/projects/proj/datasets/dset/tables/anon_tbl/data",
+            schema,
+            table=table.TableReference.from_string("proj.dset.anon_tbl"),
+            selected_fields=schema,
+        )
+
+    def _mock_bqstorage_client(self, pages, stream_count=1):
+        from google.cloud.bigquery_storage_v1beta1 import reader
+
+        streams = [
+            {"name": "streams/{}".format(index)} for index in range(stream_count)
+        ]
+        session = bigquery_storage_v1beta1.types.ReadSession(streams=streams)
+        bqstorage_client = mock.create_autospec(
+            bigquery_storage_v1beta1.BigQueryStorageClient
+        )
+        bqstorage_client.create_read_session.return_value = session
+
+        mock_rowstream = mock.create_autospec(reader.ReadRowsStream)
+        bqstorage_client.read_rows.return_value = mock_rowstream
+        mock_rows = mock.create_autospec(reader.ReadRowsIterable)
+        mock_rowstream.rows.return_value = mock_rows
+        type(mock_rows).pages = mock.PropertyMock(side_effect=lambda: iter(pages))
+        return bqstorage_client
+
+    def _mock_large_results_client(self, schema):
+        from google.cloud.bigquery.dbapi import cursor as cursor_module
+
+        client = self._mock_client(schema=schema)
+        query_results = client.query.return_value._query_results
+        query_results.total_rows = cursor_module._BQSTORAGE_MIN_ROWS
+        return client
+
+    def _bqstorage_schema(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        return [SchemaField("a", "INTEGER"), SchemaField("b", "STRING")]
+
+    def test_fetchone_prefetches_pages(self):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery.dbapi import cursor as cursor_module
+
+        client = self._mock_client(rows=[(1,)])
+        cursor = dbapi.connect(client).cursor()
+        cursor.arraysize = 500
+        cursor.execute("SELECT 1;")
+        cursor.fetchone()
+
+        _, kwargs = client.list_rows.call_args
+        self.assertEqual(kwargs["page_size"], 500)
+        self.assertEqual(kwargs["prefetch_pages"], cursor_module._PREFETCH_PAGES)
+
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_fetchall_w_bqstorage_client(self):
+        from google.cloud.bigquery import dbapi
+
+        schema = self._bqstorage_schema()
+        client = self._mock_large_results_client(schema)
+        rows_iter = self._make_row_iterator(schema, [])
+        client.list_rows.return_value = rows_iter
+        bqstorage_client = self._mock_bqstorage_client(
+            [[{"b": "one", "a": 1}, {"b": "two", "a": 2}], [{"b": "three", "a": 3}]]
+        )
+        cursor = dbapi.connect(client, bqstorage_client).cursor()
+
+        cursor.execute("SELECT a, b FROM tbl;")
+        first = cursor.fetchone()
+        rest = cursor.fetchall()
+
+        self.assertEqual(first.values(), (1, "one"))
+        self.assertEqual(first["b"], "one")
+        self.assertEqual([row.values() for row in rest], [(2, "two"), (3, "three")])
+        self.assertIsNone(cursor.fetchone())
+        rows_iter.api_request.assert_not_called()
+        _, kwargs = bqstorage_client.create_read_session.call_args
+        self.assertEqual(kwargs["requested_streams"], 0)
+        self.assertEqual(list(kwargs["read_options"].selected_fields), ["a", "b"])
+
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_fetchall_w_bqstorage_client_small_results(self):
+        from google.cloud.bigquery import dbapi
+
+        schema = self._bqstorage_schema()
+        client = self._mock_client(schema=schema, rows=[(1, "one")])
+        rows_iter = self._make_row_iterator(schema, [("1", "one")])
+        client.list_rows.return_value = rows_iter
+        bqstorage_client = self._mock_bqstorage_client([])
+        cursor = dbapi.connect(client, bqstorage_client).cursor()
+
+        cursor.execute("SELECT a, b FROM tbl;")
+        rows = cursor.fetchall()
+
+        self.assertEqual([row.values() for row in rows], [(1, "one")])
+        rows_iter.api_request.assert_called_once()
+        bqstorage_client.create_read_session.assert_not_called()
+
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_fetchall_w_bqstorage_client_converts_datetimes(self):
+        import datetime
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [
+            SchemaField("dt", "DATETIME"),
+            SchemaField("dts", "DATETIME", mode="REPEATED"),
+            SchemaField(
+                "rec",
+                "RECORD",
+                fields=[SchemaField("dt", "DATETIME"), SchemaField("n", "INTEGER")],
+            ),
+        ]
+        client = self._mock_large_results_client(schema)
+        client.list_rows.return_value = self._make_row_iterator(schema, [])
+        bqstorage_client = self._mock_bqstorage_client(
+            [
+                [
+                    {
+                        "dt": "2019-01-02T03:04:05.123456",
+                        "dts": ["2019-01-02T03:04:05"],
+                        "rec": {"dt": "2019-01-02T03:04:05", "n": 1},
+                    },
+                    {"dt": None, "dts": [], "rec": None},
+                ]
+            ]
+        )
+        cursor = dbapi.connect(client, bqstorage_client).cursor()
+
+        cursor.execute("SELECT dt, dts, rec FROM tbl;")
+        rows = cursor.fetchall()
+
+        expected = datetime.datetime(2019, 1, 2, 3, 4, 5)
+        self.assertEqual(
+            [row.values() for row in rows],
+            [
+                (
+                    expected.replace(microsecond=123456),
+                    [expected],
+                    {"dt": expected, "n": 1},
+                ),
+                (None, [], None),
+            ],
+        )
+
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_fetchall_w_bqstorage_client_w_order_by(self):
+        from google.cloud.bigquery import dbapi
+
+        schema = self._bqstorage_schema()
+        client = self._mock_large_results_client(schema)
+        client.query.return_value.query = "SELECT a, b FROM tbl ORDER BY a;"
+        client.list_rows.return_value = self._make_row_iterator(schema, [])
+        bqstorage_client = self._mock_bqstorage_client([[{"a": 1, "b": "one"}]])
+        cursor = dbapi.connect(client, bqstorage_client).cursor()
+
+        cursor.execute("SELECT a, b FROM tbl ORDER BY a;")
+        rows = cursor.fetchall()
+
+        self.assertEqual([row.values() for row in rows], [(1, "one")])
+        _, kwargs = bqstorage_client.create_read_session.call_args
+        self.assertEqual(kwargs["requested_streams"], 1)
+
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_fetchall_w_bqstorage_client_fallback_to_tabledata_list(self):
+        from google.cloud.bigquery import dbapi
+
+        schema = self._bqstorage_schema()
+        client = self._mock_large_results_client(schema)
+        rows_iter = self._make_row_iterator(schema, [("1", "one")])
+        client.list_rows.return_value = rows_iter
+        bqstorage_client = self._mock_bqstorage_client([])
+        bqstorage_client.create_read_session.side_effect = google.api_core.exceptions.InternalServerError(
+            "can't read with bqstorage_client"
+        )
+        cursor = dbapi.connect(client, bqstorage_client).cursor()
+
+        cursor.execute("SELECT a, b FROM tbl;")
+        rows = cursor.fetchall()
+
+        self.assertEqual([row.values() for row in rows], [(1, "one")])
+        rows_iter.api_request.assert_called_once()
+        bqstorage_client.read_rows.assert_not_called()
+
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_fetchall_w_bqstorage_client_forbidden(self):
+        from google.cloud.bigquery import dbapi
+
+        schema = self._bqstorage_schema()
+        client = self._mock_large_results_client(schema)
+        client.list_rows.return_value = self._make_row_iterator(schema, [])
+        bqstorage_client = self._mock_bqstorage_client([])
+        bqstorage_client.create_read_session.side_effect = google.api_core.exceptions.Forbidden(
+            "TEST BigQuery Storage API not enabled."
+        )
+        cursor = dbapi.connect(client, bqstorage_client).cursor()
+
+        cursor.execute("SELECT a, b FROM tbl;")
+        with self.assertRaises(dbapi.DatabaseError):
+            cursor.fetchall()
+
+    def test_fetch_arrow_all_wo_execute_raises_error(self):
+        from google.cloud.bigquery import dbapi
+
+        cursor = dbapi.connect(self._mock_client()).cursor()
+        self.assertRaises(dbapi.Error, cursor.fetch_arrow_all)
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_fetch_arrow_all(self):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery import table
+
+        client = self._mock_client(schema=self._bqstorage_schema())
+        rows_iter = mock.create_autospec(table.RowIterator, instance=True)
+        arrow_table = pyarrow.Table.from_arrays([pyarrow.array([1])], ["a"])
+        rows_iter.to_arrow.return_value = arrow_table
+        client.list_rows.return_value = rows_iter
+        bqstorage_client = object()
+        cursor = dbapi.connect(client, bqstorage_client).cursor()
+
+        cursor.execute("SELECT a, b FROM tbl;")
+        self.assertIs(cursor.fetch_arrow_all(), arrow_table)
+
+        rows_iter.to_arrow.assert_called_once_with(bqstorage_client=bqstorage_client)
+        _, kwargs = client.list_rows.call_args
+        self.assertNotIn("page_size", kwargs)
+        # All of the rows have been fetched.
+        self.assertIsNone(cursor.fetchone())
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_fetch_arrow_all_after_fetchone(self):
+        from google.cloud.bigquery import dbapi
+
+        client = self._mock_client(
+            rows=[(1, "one"), (2, "two"), (3, None)], schema=self._bqstorage_schema()
+        )
+        cursor = dbapi.connect(client).cursor()
+
+        cursor.execute("SELECT a, b FROM tbl;")
+        cursor.fetchone()
+        arrow_table = cursor.fetch_arrow_all()
+
+        self.assertEqual(arrow_table.column_names, ["a", "b"])
+        self.assertEqual(arrow_table.schema.field("a").type, pyarrow.int64())
+        self.assertEqual(arrow_table.column("a").to_pylist(), [2, 3])
+        self.assertEqual(arrow_table.column("b").to_pylist(), ["two", None])
+        self.assertEqual(cursor.fetch_arrow_all().num_rows, 0)
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_fetch_arrow_all_w_dml(self):
+        from google.cloud.bigquery import dbapi
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=12)
+        cursor = dbapi.connect(client).cursor()
+
+        cursor.execute("DELETE FROM UserSessions WHERE user_id = 'test';")
+        arrow_table = cursor.fetch_arrow_all()
+
+        self.assertEqual(arrow_table.num_rows, 0)
+        client.list_rows.assert_not_called()
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_fetch_dataframe(self):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery import table
+
+        client = self._mock_client(schema=self._bqstorage_schema())
+        rows_iter = mock.create_autospec(table.RowIterator, instance=True)
+        dataframe = pandas.DataFrame({"a": [1]})
+        rows_iter.to_dataframe.return_value = dataframe
+        client.list_rows.return_value = rows_iter
+        bqstorage_client = object()
+        cursor = dbapi.connect(client, bqstorage_client).cursor()
+
+        cursor.execute("SELECT a, b FROM tbl;")
+        self.assertIs(cursor.fetch_dataframe(dtypes={"a": "int8"}), dataframe)
+
+        rows_iter.to_dataframe.assert_called_once_with(
+            bqstorage_client=bqstorage_client, dtypes={"a": "int8"}
+        )
+        self.assertIsNone(cursor.fetchone())
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_fetch_dataframe_after_fetchmany(self):
+        from google.cloud.bigquery import dbapi
+
+        client = self._mock_client(
+            rows=[(1, "one"), (2, "two"), (3, "three")], schema=self._bqstorage_schema()
+        )
+        cursor = dbapi.connect(client).cursor()
+
+        cursor.execute("SELECT a, b FROM tbl;")
+        cursor.fetchmany(size=2)
+        dataframe = cursor.fetch_dataframe()
+
+        self.assertEqual(list(dataframe.columns), ["a", "b"])
+        self.assertEqual(list(dataframe["a"]), [3])
+        self.assertEqual(list(dataframe["b"]), ["three"])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_fetch_dataframe_raises_if_download_raises(self):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery import table
+
+        client = self._mock_client(schema=self._bqstorage_schema())
+        rows_iter = mock.create_autospec(table.RowIterator, instance=True)
+        rows_iter.to_dataframe.side_effect = google.api_core.exceptions.NotFound(
+            "TEST table expired"
+        )
+        client.list_rows.return_value = rows_iter
+        cursor = dbapi.connect(client).cursor()
+
+        cursor.execute("SELECT a, b FROM tbl;")
+        with self.assertRaises(dbapi.DatabaseError):
+            cursor.fetch_dataframe()
+
+    def _mock_insert_client(self, affected_rows_per_job):
+        client = self._mock_client()
+        jobs = [
+            self._mock_job(num_dml_affected_rows=num_rows)
+            for num_rows in affected_rows_per_job
+        ]
+        for mock_job in jobs:
+            mock_job.statement_type = "INSERT"
+        client.query.side_effect = jobs
+        return client, jobs
+
+    def test_executemany_w_insert_combines_rows(self):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery.dbapi import cursor as cursor_module
+
+        client, jobs = self._mock_insert_client([2, 2, 1])
+        cursor = dbapi.connect(client).cursor()
+
+        with mock.patch.object(cursor_module, "_MAX_BATCH_QUERY_PARAMETERS", 4):
+            cursor.executemany(
+                "INSERT INTO `dset.tbl` (a, b) VALUES (%s, %s);",
+                [(index, str(index)) for index in range(5)],
+            )
+
+        self.assertEqual(client.query.call_count, 3)
+        first_args, first_kwargs = client.query.call_args_list[0]
+        self.assertEqual(
+            first_args[0], "INSERT INTO `dset.tbl` (a, b) VALUES (?, ?), (?, ?)"
+        )
+        self.assertEqual(
+            [param.value for param in first_kwargs["job_config"].query_parameters],
+            [0, "0", 1, "1"],
+        )
+        last_args, last_kwargs = client.query.call_args_list[2]
+        self.assertEqual(last_args[0], "INSERT INTO `dset.tbl` (a, b) VALUES (?, ?)")
+        self.assertEqual(cursor.rowcount, 5)
+        self.assertIsNone(cursor.description)
+        self.assertEqual(cursor.fetchall(), [])
+
+    def test_executemany_w_insert_named_parameters(self):
+        from google.cloud.bigquery import dbapi
+
+        client, _ = self._mock_insert_client([2])
+        cursor = dbapi.connect(client).cursor()
+
+        cursor.executemany(
+            "INSERT INTO dset.tbl VALUES (%(a)s, %(b)s)",
+            [{"a": 1, "b": "one"}, {"a": 2, "b": "two"}],
+        )
+
+        args, kwargs = client.query.call_args
+        self.assertEqual(
+            args[0],
+            "INSERT INTO dset.tbl VALUES (@`a__0`, @`b__0`), (@`a__1`, @`b__1`)",
+        )
+        params = {
+            param.name: param.value for param in kwargs["job_config"].query_parameters
+        }
+        self.assertEqual(params, {"a__0": 1, "b__0": "one", "a__1": 2, "b__1": "two"})
+        self.assertEqual(cursor.rowcount, 2)
+
+    def test_executemany_w_insert_limits_concurrent_jobs(self):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery.dbapi import cursor as cursor_module
+
+        client, jobs = self._mock_insert_client([1] * 5)
+        events = []
+        running = []
+        for index, mock_job in enumerate(jobs):
+
+            def result(index=index):
+                events.append(("result", index, len(running)))
+                running.remove(index)
+                return jobs[index]
+
+            mock_job.result.side_effect = result
+
+        def query(*args, **kwargs):
+            index = client.query.call_count - 1
+            running.append(index)
+            return jobs[index]
+
+        client.query.side_effect = query
+        cursor = dbapi.connect(client).cursor()
+
+        patch_parameters = mock.patch.object(
+            cursor_module, "_MAX_BATCH_QUERY_PARAMETERS", 1
+        )
+        patch_jobs = mock.patch.object(cursor_module, "_MAX_CONCURRENT_BATCH_JOBS", 2)
+        with patch_parameters, patch_jobs:
+            cursor.executemany(
+                "INSERT INTO dset.tbl (a) VALUES (%s)", [(index,) for index in range(5)]
+            )
+
+        self.assertEqual(client.query.call_count, 5)
+        # Jobs are waited for in the order they were started, with at most
+        # two jobs running at once.
+        self.assertEqual([event[1] for event in events], [0, 1, 2, 3, 4])
+        self.assertTrue(all(event[2] <= 2 for event in events))
+        self.assertEqual(events[0][2], 2)
+        self.assertEqual(cursor.rowcount, 5)
+
+    def test_executemany_w_insert_raises_if_job_fails(self):
+        import google.cloud.exceptions
+        from google.cloud.bigquery import dbapi
+
+        client, jobs = self._mock_insert_client([2])
+        jobs[0].result.side_effect = google.cloud.exceptions.BadRequest("TEST")
+        cursor = dbapi.connect(client).cursor()
+
+        with self.assertRaises(dbapi.DatabaseError):
+            cursor.executemany("INSERT INTO dset.tbl (a) VALUES (%s)", [(1,), (2,)])
+
+    def test_executemany_w_insert_waits_for_running_jobs_if_job_fails(self):
+        import google.cloud.exceptions
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery.dbapi import cursor as cursor_module
+
+        client, jobs = self._mock_insert_client([1, 1, 1, 1])
+        jobs[0].result.side_effect = google.cloud.exceptions.BadRequest("TEST")
+        jobs[2].result.side_effect = google.cloud.exceptions.BadRequest("TEST")
+        cursor = dbapi.connect(client).cursor()
+
+        patch_parameters = mock.patch.object(
+            cursor_module, "_MAX_BATCH_QUERY_PARAMETERS", 1
+        )
+        patch_jobs = mock.patch.object(cursor_module, "_MAX_CONCURRENT_BATCH_JOBS", 3)
+        with patch_parameters, patch_jobs:
+            with self.assertRaises(dbapi.DatabaseError):
+                cursor.executemany(
+                    "INSERT INTO dset.tbl (a) VALUES (%s)",
+                    [(index,) for index in range(4)],
+                )
+
+        # No more statements are started, but the running ones are finished.
+        self.assertEqual(client.query.call_count, 3)
+        for mock_job in jobs[:3]:
+            mock_job.result.assert_called_once_with()
+        self.assertEqual(cursor.rowcount, -1)
+
+    def test_executemany_w_mixed_parameters_executes_each(self):
+        from google.cloud.bigquery import dbapi
+
+        client, _ = self._mock_insert_client([1, 1])
+        cursor = dbapi.connect(client).cursor()
+
+        cursor.executemany("INSERT INTO dset.tbl (a) VALUES (%s)", [(1,), {"a": 2}])
+
+        self.assertEqual(client.query.call_count, 2)
+        self.assertEqual(
+            client.query.call_args_list[0][0][0], "INSERT INTO dset.tbl (a) VALUES (?)"
+        )
+
+    def test__format_insert_batches_w_query_length_limit(self):
+        from google.cloud.bigquery.dbapi import cursor
+
+        operation = "INSERT INTO t VALUES (%s)"
+        prefix_length = len("INSERT INTO t VALUES ")
+        # Room for two rows, "(?), (?)", but not three.
+        limit_patch = mock.patch.object(
+            cursor, "_MAX_BATCH_QUERY_LENGTH", prefix_length + 10
+        )
+        with limit_patch:
+            batches = cursor._format_insert_batches(operation, [(1,), (2,), (3,)])
+
+        self.assertEqual(
+            [batch[0] for batch in batches],
+            ["INSERT INTO t VALUES (?), (?)", "INSERT INTO t VALUES (?)"],
+        )
+        self.assertEqual(
+            [[param.value for param in batch[1]] for batch in batches], [[1, 2], [3]]
+        )
+
+    def test__format_insert_batches_w_parameter_bytes_limit(self):
+        from google.cloud.bigquery.dbapi import cursor
+
+        operation = "INSERT INTO t VALUES (%s)"
+        parameters = [("a" * 100,), ("b" * 100,), ("c",)]
+        # Room for one large parameter, but not two.
+        limit_patch = mock.patch.object(cursor, "_MAX_BATCH_PARAMETER_BYTES", 250)
+        with limit_patch:
+            batches = cursor._format_insert_batches(operation, parameters)
+
+        self.assertEqual(
+            [[param.value for param in batch[1]] for batch in batches],
+            [["a" * 100], ["b" * 100, "c"]],
+        )
+
+    def test__format_insert_batches_w_other_statements(self):
+        from google.cloud.bigquery.dbapi import cursor
+
+        for operation in (
+            "UPDATE t SET a = %s WHERE b = %s",
+            "INSERT INTO t SELECT %s, %s",
+            "SELECT %s, %s",
+        ):
+            self.assertIsNone(
+                cursor._format_insert_batches(operation, [(1, 2), (3, 4)])
+            )
+
+    def test__format_insert_batches_w_single_parameter_set(self):
+        from google.cloud.bigquery.dbapi import cursor
+
+        self.assertIsNone(
+            cursor._format_insert_batches("INSERT INTO t VALUES (%s)", [(1,)])
+        )
+
     def test__format_operation_w_dict(self):
         from google.cloud.bigquery.dbapi import cursor
 
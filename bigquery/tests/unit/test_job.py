@@ -24,6 +24,10 @@ try:
     import pandas
 except (ImportError, AttributeError):  # pragma: NO COVER
     pandas = None
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
 try:
     from google.cloud import bigquery_storage_v1beta1
 except (ImportError, AttributeError):  # pragma: NO COVER
@@ -4662,6 +4666,41 @@ class TestQueryJob(unittest.TestCase, _Base):
         self.assertEqual(len(df), 4)  # verify the number of rows
         self.assertEqual(list(df), ["name", "age"])  # verify the column names
 
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow(self):
+        begun_resource = self._make_resource()
+        query_resource = {
+            "jobComplete": True,
+            "jobReference": {"projectId": self.PROJECT, "jobId": self.JOB_ID},
+            "totalRows": "4",
+            "schema": {
+                "fields": [
+                    {"name": "name", "type": "STRING", "mode": "NULLABLE"},
+                    {"name": "age", "type": "INTEGER", "mode": "NULLABLE"},
+                ]
+            },
+            "rows": [
+                {"f": [{"v": "Phred Phlyntstone"}, {"v": "32"}]},
+                {"f": [{"v": "Bharney Rhubble"}, {"v": "33"}]},
+                {"f": [{"v": "Wylma Phlyntstone"}, {"v": "29"}]},
+                {"f": [{"v": "Bhettye Rhubble"}, {"v": "27"}]},
+            ],
+        }
+        done_resource = copy.deepcopy(begun_resource)
+        done_resource["status"] = {"state": "DONE"}
+        connection = _make_connection(
+            begun_resource, query_resource, done_resource, query_resource
+        )
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+
+        tbl = job.to_arrow()
+
+        self.assertIsInstance(tbl, pyarrow.Table)
+        self.assertEqual(tbl.num_rows, 4)
+        self.assertEqual(tbl.column_names, ["name", "age"])
+        self.assertEqual(tbl.to_pydict()["age"], [32, 33, 29, 27])
+
     @unittest.skipIf(pandas is None, "Requires `pandas`")
     def test_to_dataframe_ddl_query(self):
         # Destination table may have no schema for some DDL and DML queries.
@@ -4680,6 +4719,7 @@ class TestQueryJob(unittest.TestCase, _Base):
         self.assertEqual(len(df), 0)
 
     @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
     @unittest.skipIf(
         bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
     )
@@ -4723,6 +4763,7 @@ class TestQueryJob(unittest.TestCase, _Base):
             read_options=mock.ANY,
             # Use default number of streams for best performance.
             requested_streams=0,
+            format_=bigquery_storage_v1beta1.enums.DataFormat.ARROW,
         )
 
     @unittest.skipIf(pandas is None, "Requires `pandas`")
@@ -5105,6 +5146,7 @@ def test__contains_order_by(query, expected):
 
 
 @pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(pyarrow is None, reason="Requires `pyarrow`")
 @pytest.mark.skipif(
     bigquery_storage_v1beta1 is None, reason="Requires `google-cloud-bigquery-storage`"
 )
@@ -5166,4 +5208,5 @@ def test_to_dataframe_bqstorage_preserve_order(query):
         read_options=mock.ANY,
         # Use a single stream to preserve row order.
         requested_streams=1,
+        format_=bigquery_storage_v1beta1.enums.DataFormat.ARROW,
     )
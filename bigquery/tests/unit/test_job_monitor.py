@@ -0,0 +1,293 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import threading
+import unittest
+
+import mock
+
+import google.api_core.exceptions
+
+
+PROJECT = "my-project"
+
+
+def _make_client():
+    import google.auth.credentials
+    import google.cloud.bigquery._http
+    from google.cloud.bigquery.client import Client
+
+    credentials = mock.Mock(spec=google.auth.credentials.Credentials)
+    client = Client(project=PROJECT, credentials=credentials)
+    client._connection = mock.create_autospec(
+        google.cloud.bigquery._http.Connection, instance=True
+    )
+    return client
+
+
+def _job_resource(job_id, state="RUNNING", error_result=None, created=1000.0):
+    resource = {
+        "jobReference": {"projectId": PROJECT, "jobId": job_id, "location": "US"},
+        "configuration": {"query": {"query": "SELECT 1"}},
+        "statistics": {"creationTime": str(created)},
+        "status": {"state": state},
+    }
+    if error_result is not None:
+        resource["status"]["errorResult"] = error_result
+    return resource
+
+
+class FakeJobsApi(object):
+    """Serve jobs.get and jobs.list from a dictionary of job resources."""
+
+    def __init__(self, resources):
+        self.resources = resources
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def api_request(self, method, path, query_params=None, **kwargs):
+        with self.lock:
+            self.requests.append((method, path, query_params))
+            job_path = "/projects/{}/jobs".format(PROJECT)
+            if path == job_path:
+                jobs = [
+                    dict(resource, state=resource["status"]["state"])
+                    for resource in self.resources.values()
+                    if resource["status"]["state"] == "DONE"
+                ]
+                return {"jobs": jobs}
+
+            job_id = path[len(job_path) + 1 :]
+            if job_id not in self.resources:
+                raise google.api_core.exceptions.NotFound("no job " + job_id)
+            return self.resources[job_id]
+
+    def finish(self, job_id, error_result=None):
+        with self.lock:
+            self.resources[job_id] = _job_resource(
+                job_id, state="DONE", error_result=error_result
+            )
+
+
+class TestJobMonitor(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.job_monitor import JobMonitor
+
+        return JobMonitor
+
+    def _make_one(self, client, **kwargs):
+        kwargs.setdefault("poll_interval", 0.01)
+        return self._get_target_class()(client, **kwargs)
+
+    def _make_jobs(self, client, job_ids):
+        resources = {job_id: _job_resource(job_id) for job_id in job_ids}
+        api = FakeJobsApi(resources)
+        client._connection.api_request.side_effect = api.api_request
+        jobs = [client.job_from_resource(resources[job_id]) for job_id in job_ids]
+        return api, jobs
+
+    def test_watch_wo_started_job(self):
+        from google.cloud.bigquery.job import QueryJob
+
+        client = _make_client()
+        job = QueryJob("job-1", "SELECT 1", client)
+
+        with self._make_one(client) as monitor:
+            with self.assertRaises(ValueError):
+                monitor.watch(job)
+
+    def test_watch_w_finished_job(self):
+        client = _make_client()
+        job = client.job_from_resource(_job_resource("job-1", state="DONE"))
+        callback = mock.Mock()
+
+        with self._make_one(client) as monitor:
+            self.assertIs(monitor.watch(job, callback=callback), job)
+            self.assertEqual(monitor.pending_jobs, [])
+
+        callback.assert_called_once_with(job)
+        client._connection.api_request.assert_not_called()
+
+    def test_watch_after_close(self):
+        client = _make_client()
+        _, jobs = self._make_jobs(client, ["job-1"])
+        monitor = self._make_one(client)
+        monitor.close()
+
+        with self.assertRaises(RuntimeError):
+            monitor.watch(jobs[0])
+
+    def test_wait_polls_with_get(self):
+        client = _make_client()
+        api, jobs = self._make_jobs(client, ["job-1", "job-2"])
+        callback = mock.Mock()
+
+        with self._make_one(client) as monitor:
+            for job in jobs:
+                monitor.watch(job, callback=callback)
+
+            done, not_done = monitor.wait(timeout=0.05)
+            self.assertEqual(done, set())
+            self.assertEqual(not_done, set(jobs))
+
+            api.finish("job-1")
+            api.finish("job-2", error_result={"reason": "invalid", "message": "bad"})
+            done, not_done = monitor.wait(jobs, timeout=5)
+
+        self.assertEqual(done, set(jobs))
+        self.assertEqual(not_done, set())
+        self.assertEqual(callback.call_count, 2)
+        self.assertTrue(
+            all(request[1].startswith("/projects/") for request in api.requests)
+        )
+        self.assertEqual(api.requests[0][2], {"location": "US"})
+
+        # The futures are resolved, so no more requests are needed.
+        num_requests = len(api.requests)
+        self.assertTrue(jobs[0].done())
+        self.assertIsNone(jobs[0].exception())
+        with self.assertRaises(google.api_core.exceptions.BadRequest):
+            jobs[1].result()
+        self.assertEqual(len(api.requests), num_requests)
+
+    def test_wait_w_missing_job(self):
+        client = _make_client()
+        api, jobs = self._make_jobs(client, ["job-1"])
+        del api.resources["job-1"]
+
+        with self._make_one(client) as monitor:
+            done, _ = monitor.wait(jobs, timeout=5)
+
+        self.assertEqual(done, set(jobs))
+        with self.assertRaises(google.api_core.exceptions.NotFound):
+            jobs[0].result()
+
+    def test_wait_polls_with_list(self):
+        from google.cloud.bigquery import job_monitor
+
+        client = _make_client()
+        job_ids = ["job-{}".format(index) for index in range(3)]
+        api, jobs = self._make_jobs(client, job_ids)
+        api.finish("job-1")
+
+        with mock.patch.object(job_monitor, "_LIST_JOBS_MIN_JOBS", 3):
+            with self._make_one(client) as monitor:
+                done, not_done = monitor.wait(
+                    jobs, timeout=5, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                self.assertEqual(done, set([jobs[1]]))
+
+                api.finish("job-0")
+                api.finish("job-2")
+                done, not_done = monitor.wait(jobs, timeout=5)
+
+        self.assertEqual(done, set(jobs))
+        # All of the jobs are registered before the first sweep, so it lists.
+        method, path, query_params = api.requests[0]
+        self.assertEqual(path, "/projects/{}/jobs".format(PROJECT))
+        self.assertEqual(query_params["stateFilter"], "done")
+        self.assertEqual(query_params["minCreationTime"], "1000")
+        # Once fewer jobs are left than the threshold, each is fetched.
+        self.assertIn(
+            "/projects/{}/jobs/job-0".format(PROJECT),
+            [request[1] for request in api.requests],
+        )
+
+    def test_wait_registers_jobs_before_starting_thread(self):
+        client = _make_client()
+        _, jobs = self._make_jobs(client, ["job-1", "job-2", "job-3"])
+        monitor = self._make_one(client)
+        pending_at_start = []
+
+        def start_thread():
+            pending_at_start.append(list(monitor._jobs.values()))
+
+        with mock.patch.object(monitor, "_start_thread", side_effect=start_thread):
+            monitor.wait(jobs, timeout=0)
+
+        self.assertEqual(pending_at_start, [jobs])
+        monitor.close()
+
+    def test_watch_does_not_cut_poll_interval_short(self):
+        client = _make_client()
+        api, jobs = self._make_jobs(client, ["job-1", "job-2"])
+        polled = threading.Event()
+
+        def api_request(*args, **kwargs):
+            try:
+                return api.api_request(*args, **kwargs)
+            finally:
+                polled.set()
+
+        client._connection.api_request.side_effect = api_request
+
+        with self._make_one(client, poll_interval=60) as monitor:
+            monitor.watch(jobs[0])
+            self.assertTrue(polled.wait(5))
+            monitor.watch(jobs[1])
+            _, not_done = monitor.wait(timeout=0.1)
+
+        self.assertEqual(not_done, set(jobs))
+        self.assertEqual(
+            [request[1] for request in api.requests],
+            ["/projects/{}/jobs/job-1".format(PROJECT)],
+        )
+
+    def test_as_completed(self):
+        client = _make_client()
+        api, jobs = self._make_jobs(client, ["job-1", "job-2"])
+
+        with self._make_one(client) as monitor:
+            completed = monitor.as_completed(jobs, timeout=5)
+            api.finish("job-2")
+            self.assertIs(next(completed), jobs[1])
+            api.finish("job-1")
+            self.assertIs(next(completed), jobs[0])
+            self.assertEqual(list(completed), [])
+
+    def test_as_completed_w_timeout(self):
+        client = _make_client()
+        _, jobs = self._make_jobs(client, ["job-1"])
+
+        with self._make_one(client) as monitor:
+            with self.assertRaises(concurrent.futures.TimeoutError):
+                list(monitor.as_completed(jobs, timeout=0.05))
+
+    def test_callback_error_does_not_stop_polling(self):
+        client = _make_client()
+        api, jobs = self._make_jobs(client, ["job-1", "job-2"])
+        callback = mock.Mock(side_effect=[ValueError("oops"), None])
+
+        with self._make_one(client) as monitor:
+            for job in jobs:
+                monitor.watch(job, callback=callback)
+            api.finish("job-1")
+            api.finish("job-2")
+            done, _ = monitor.wait(timeout=5)
+            done, _ = monitor.wait(jobs, timeout=5)
+
+        self.assertEqual(done, set(jobs))
+        self.assertEqual(callback.call_count, 2)
+
+    def test_close_stops_thread(self):
+        client = _make_client()
+        _, jobs = self._make_jobs(client, ["job-1"])
+        monitor = self._make_one(client)
+        monitor.watch(jobs[0])
+
+        monitor.close()
+
+        self.assertFalse(monitor._thread.is_alive())
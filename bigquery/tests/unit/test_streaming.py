@@ -0,0 +1,357 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+
+import mock
+import pytest
+
+import google.api_core.exceptions
+
+
+def _make_client(insert_rows_json=None):
+    from google.cloud.bigquery.client import Client
+
+    client = mock.create_autospec(Client, instance=True)
+    client.project = "proj"
+    if insert_rows_json is None:
+        client.insert_rows_json.return_value = []
+    else:
+        client.insert_rows_json.side_effect = insert_rows_json
+    return client
+
+
+class TestStreamingInserter(unittest.TestCase):
+    def setUp(self):
+        # Retry quickly, unless a test checks the delay.
+        patch = mock.patch(
+            "google.cloud.bigquery.streaming._INITIAL_RETRY_DELAY", new=0.001
+        )
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.streaming import StreamingInserter
+
+        return StreamingInserter
+
+    def _make_one(self, client, table="proj.dset.tbl", **kwargs):
+        kwargs.setdefault("max_latency", 0.01)
+        return self._get_target_class()(client, table, **kwargs)
+
+    def _sent_rows(self, client):
+        return [call[0][1] for call in client.insert_rows_json.call_args_list]
+
+    def test_ctor_w_invalid_max_rows(self):
+        with self.assertRaises(ValueError):
+            self._make_one(_make_client(), max_rows=10001)
+
+    def test_ctor_w_invalid_max_bytes(self):
+        with self.assertRaises(ValueError):
+            self._make_one(_make_client(), max_bytes=0)
+
+    def test_insert_rows_json(self):
+        from google.cloud.bigquery.table import TableReference
+
+        client = _make_client()
+
+        with self._make_one(client, skip_invalid_rows=True) as inserter:
+            futures = inserter.insert_rows_json(
+                [{"a": 1}, {"a": 2}], row_ids=["id-1", "id-2"]
+            )
+
+        self.assertEqual([future.result() for future in futures], ["id-1", "id-2"])
+        client.insert_rows_json.assert_called_once_with(
+            TableReference.from_string("proj.dset.tbl"),
+            [{"a": 1}, {"a": 2}],
+            row_ids=["id-1", "id-2"],
+            skip_invalid_rows=True,
+            ignore_unknown_values=None,
+            template_suffix=None,
+            retry=mock.ANY,
+        )
+
+    def test_insert_rows_json_w_too_few_row_ids(self):
+        client = _make_client()
+
+        with self._make_one(client) as inserter:
+            with self.assertRaises(ValueError):
+                inserter.insert_rows_json([{"a": 1}, {"a": 2}], row_ids=["id-1"])
+
+        client.insert_rows_json.assert_not_called()
+
+    def test_insert_rows_w_schema(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        client = _make_client()
+        table = Table(
+            "proj.dset.tbl",
+            schema=[SchemaField("name", "STRING"), SchemaField("age", "INTEGER")],
+        )
+
+        with self._make_one(client, table=table) as inserter:
+            futures = inserter.insert_rows([("Phred", 32)])
+
+        self.assertEqual(len(futures[0].result()), 36)  # Generated UUID.
+        self.assertEqual(self._sent_rows(client), [[{"name": "Phred", "age": "32"}]])
+
+    def test_insert_rows_wo_schema(self):
+        inserter = self._make_one(_make_client())
+        with self.assertRaises(ValueError):
+            inserter.insert_rows([("Phred", 32)])
+        inserter.close()
+
+    def test_insert_after_close(self):
+        inserter = self._make_one(_make_client())
+        inserter.close()
+        with self.assertRaises(RuntimeError):
+            inserter.insert_rows_json([{"a": 1}])
+
+    def test_insert_while_closing(self):
+        sending = threading.Event()
+        release = threading.Event()
+
+        def insert_rows_json(*args, **kwargs):
+            sending.set()
+            release.wait(5)
+            return []
+
+        client = _make_client(insert_rows_json=insert_rows_json)
+        inserter = self._make_one(client)
+        futures = inserter.insert_rows_json([{"a": 0}])
+        sending.wait(5)
+        closer = threading.Thread(target=inserter.close)
+        closer.start()
+
+        with inserter._condition:
+            while not inserter._closed:
+                inserter._condition.wait(1)
+        # Closing has started, so new rows are rejected, rather than left
+        # unsent once the background thread exits.
+        with self.assertRaises(RuntimeError):
+            inserter.insert_rows_json([{"a": 1}])
+        self.assertFalse(futures[0].done())
+
+        release.set()
+        closer.join(5)
+        self.assertFalse(closer.is_alive())
+        self.assertTrue(futures[0].done())
+        self.assertEqual(self._sent_rows(client), [[{"a": 0}]])
+
+    def test_close_waits_for_retried_rows(self):
+        responses = [[{"index": 0, "errors": [{"reason": "backendError"}]}], []]
+        client = _make_client(insert_rows_json=lambda *args, **kwargs: responses.pop(0))
+        delay_patch = mock.patch(
+            "google.cloud.bigquery.streaming._INITIAL_RETRY_DELAY", new=0.05
+        )
+
+        with delay_patch:
+            inserter = self._make_one(client)
+            futures = inserter.insert_rows_json([{"a": 0}], row_ids=["id-0"])
+            inserter.close()
+
+        self.assertEqual(futures[0].result(timeout=0), "id-0")
+        self.assertEqual(client.insert_rows_json.call_count, 2)
+
+    def test_batches_by_max_rows(self):
+        client = _make_client()
+
+        with self._make_one(client, max_rows=3) as inserter:
+            inserter.insert_rows_json([{"a": index} for index in range(7)])
+
+        self.assertEqual(
+            self._sent_rows(client),
+            [
+                [{"a": 0}, {"a": 1}, {"a": 2}],
+                [{"a": 3}, {"a": 4}, {"a": 5}],
+                [{"a": 6}],
+            ],
+        )
+
+    def test_batches_by_max_bytes(self):
+        client = _make_client()
+        # About 170 bytes per row, once the insert ID and overhead are added.
+        row = {"a": "x" * 100}
+
+        with self._make_one(client, max_bytes=400) as inserter:
+            inserter.insert_rows_json([row] * 5)
+
+        self.assertEqual(self._sent_rows(client), [[row, row]] * 2 + [[row]])
+
+    def test_sends_partial_batch_after_max_latency(self):
+        client = _make_client()
+        inserter = self._make_one(client, max_latency=0.01)
+
+        futures = inserter.insert_rows_json([{"a": 1}])
+
+        # No flush: the row is sent once the latency has elapsed.
+        futures[0].result(timeout=5)
+        inserter.close()
+        self.assertEqual(self._sent_rows(client), [[{"a": 1}]])
+
+    def test_retries_only_failed_rows(self):
+        responses = [
+            [
+                {"index": 1, "errors": [{"reason": "backendError"}]},
+                {"index": 2, "errors": [{"reason": "invalid"}]},
+            ],
+            [],
+        ]
+        client = _make_client(insert_rows_json=lambda *args, **kwargs: responses.pop(0))
+
+        with self._make_one(client) as inserter:
+            futures = inserter.insert_rows_json(
+                [{"a": 0}, {"a": 1}, {"a": 2}], row_ids=["id-0", "id-1", "id-2"]
+            )
+
+        self.assertEqual(futures[0].result(), "id-0")
+        self.assertEqual(futures[1].result(), "id-1")
+        with pytest.raises(Exception) as exc_info:
+            futures[2].result()
+        self.assertEqual(exc_info.value.errors, [{"reason": "invalid"}])
+
+        self.assertEqual(
+            self._sent_rows(client), [[{"a": 0}, {"a": 1}, {"a": 2}], [{"a": 1}]]
+        )
+        # Retried rows keep their insert ID, for de-duplication.
+        self.assertEqual(client.insert_rows_json.call_args[1]["row_ids"], ["id-1"])
+
+    def test_gives_up_after_max_attempts(self):
+        from google.cloud.bigquery.streaming import InsertRowError
+
+        errors = [{"index": 0, "errors": [{"reason": "backendError"}]}]
+        client = _make_client(insert_rows_json=lambda *args, **kwargs: errors)
+
+        with self._make_one(client, max_attempts=3) as inserter:
+            futures = inserter.insert_rows_json([{"a": 0}])
+
+        with pytest.raises(InsertRowError):
+            futures[0].result()
+        self.assertEqual(client.insert_rows_json.call_count, 3)
+
+    def test_retries_after_exponential_delay(self):
+        errors = [{"index": 0, "errors": [{"reason": "backendError"}]}]
+        sent_times = []
+
+        def insert_rows_json(*args, **kwargs):
+            sent_times.append(time.time())
+            return errors if len(sent_times) < 3 else []
+
+        client = _make_client(insert_rows_json=insert_rows_json)
+        delay_patch = mock.patch(
+            "google.cloud.bigquery.streaming._INITIAL_RETRY_DELAY", new=0.05
+        )
+
+        with delay_patch, self._make_one(client) as inserter:
+            futures = inserter.insert_rows_json([{"a": 0}], row_ids=["id-0"])
+
+        self.assertEqual(futures[0].result(), "id-0")
+        self.assertEqual(len(sent_times), 3)
+        self.assertGreaterEqual(sent_times[1] - sent_times[0], 0.05)
+        self.assertGreaterEqual(sent_times[2] - sent_times[1], 0.1)
+
+    def test_retry_delay_does_not_block_other_rows(self):
+        errors = [{"index": 0, "errors": [{"reason": "backendError"}]}]
+        failed = threading.Event()
+
+        def insert_rows_json(table, rows, **kwargs):
+            if rows == [{"a": 0}] and not failed.is_set():
+                failed.set()
+                return errors
+            return []
+
+        client = _make_client(insert_rows_json=insert_rows_json)
+        delay_patch = mock.patch(
+            "google.cloud.bigquery.streaming._INITIAL_RETRY_DELAY", new=0.5
+        )
+
+        with delay_patch, self._make_one(client) as inserter:
+            first = inserter.insert_rows_json([{"a": 0}])
+            failed.wait(5)
+            second = inserter.insert_rows_json([{"a": 1}])
+            second[0].result(timeout=0.4)
+            self.assertFalse(first[0].done())
+
+        self.assertTrue(first[0].done())
+        self.assertEqual(self._sent_rows(client), [[{"a": 0}], [{"a": 1}], [{"a": 0}]])
+
+    def test_request_error_sets_exception_on_all_rows(self):
+        exc = google.api_core.exceptions.Forbidden("TEST denied")
+
+        def insert_rows_json(*args, **kwargs):
+            raise exc
+
+        client = _make_client(insert_rows_json=insert_rows_json)
+
+        with self._make_one(client) as inserter:
+            futures = inserter.insert_rows_json([{"a": 0}, {"a": 1}])
+
+        for future in futures:
+            self.assertIs(future.exception(), exc)
+
+    def test_limits_concurrent_requests(self):
+        lock = threading.Lock()
+        state = {"in_progress": 0, "max_in_progress": 0}
+        release = threading.Event()
+
+        def insert_rows_json(*args, **kwargs):
+            with lock:
+                state["in_progress"] += 1
+                state["max_in_progress"] = max(
+                    state["max_in_progress"], state["in_progress"]
+                )
+            release.wait(0.05)
+            with lock:
+                state["in_progress"] -= 1
+            return []
+
+        client = _make_client(insert_rows_json=insert_rows_json)
+
+        with self._make_one(client, max_rows=1, max_concurrent_requests=2) as inserter:
+            futures = inserter.insert_rows_json([{"a": index} for index in range(6)])
+
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(client.insert_rows_json.call_count, 6)
+        self.assertLessEqual(state["max_in_progress"], 2)
+
+    def test_insert_from_many_threads(self):
+        client = _make_client()
+        inserter = self._make_one(client, max_rows=50)
+        futures = []
+        futures_lock = threading.Lock()
+
+        def add_rows(thread_index):
+            for index in range(100):
+                new_futures = inserter.insert_rows_json(
+                    [{"thread": thread_index, "index": index}]
+                )
+                with futures_lock:
+                    futures.extend(new_futures)
+
+        threads = [threading.Thread(target=add_rows, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        inserter.close()
+
+        self.assertEqual(len(futures), 400)
+        self.assertTrue(all(future.done() for future in futures))
+        sent = [row for rows in self._sent_rows(client) for row in rows]
+        self.assertEqual(len(sent), 400)
+        self.assertTrue(all(len(rows) <= 50 for rows in self._sent_rows(client)))
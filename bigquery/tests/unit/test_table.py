@@ -36,6 +36,11 @@ try:
 except (ImportError, AttributeError):  # pragma: NO COVER
     pandas = None
 
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 try:
     from tqdm import tqdm
 except (ImportError, AttributeError):  # pragma: NO COVER
@@ -1379,6 +1384,27 @@ class Test_EmptyRowIterator(unittest.TestCase):
         self.assertIsInstance(df, pandas.DataFrame)
         self.assertEqual(len(df), 0)  # verify the number of rows
 
+    @mock.patch("google.cloud.bigquery.table.pyarrow", new=None)
+    def test_to_arrow_error_if_pyarrow_is_none(self):
+        row_iterator = self._make_one()
+        with self.assertRaises(ValueError):
+            row_iterator.to_arrow()
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow(self):
+        row_iterator = self._make_one()
+        tbl = row_iterator.to_arrow()
+        self.assertIsInstance(tbl, pyarrow.Table)
+        self.assertEqual(tbl.num_rows, 0)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_iterable(self):
+        row_iterator = self._make_one()
+        frames = list(row_iterator.to_dataframe_iterable())
+        self.assertEqual(len(frames), 1)
+        self.assertIsInstance(frames[0], pandas.DataFrame)
+        self.assertEqual(len(frames[0]), 0)
+
 
 class TestRowIterator(unittest.TestCase):
     def _make_one(
@@ -1491,6 +1517,168 @@ class TestRowIterator(unittest.TestCase):
             query_params={"maxResults": row_iterator._page_size},
         )
 
+    @staticmethod
+    def _make_tabledata_api(
+        total_rows, first_page_size, max_page_size=None, include_total_rows=True
+    ):
+        """Fake tabledata.list, supporting both page tokens and startIndex."""
+        all_rows = [{"f": [{"v": str(index)}]} for index in range(total_rows)]
+
+        def api_request(method, path, query_params):
+            if "startIndex" in query_params:
+                start = int(query_params["startIndex"])
+            else:
+                start = int(query_params.get("pageToken", 0))
+            count = query_params.get("maxResults", first_page_size)
+            if max_page_size is not None:
+                count = min(count, max_page_size)
+            stop = min(start + count, total_rows)
+            response = {"rows": all_rows[start:stop]}
+            if include_total_rows:
+                response["totalRows"] = str(total_rows)
+            if stop < total_rows:
+                response["pageToken"] = str(stop)
+            return response
+
+        return mock.Mock(side_effect=api_request)
+
+    def test_prefetch_pages_by_start_index(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField("index", "INTEGER", mode="REQUIRED")]
+        api_request = self._make_tabledata_api(10, first_page_size=3)
+        row_iterator = self._make_one(
+            _mock_client(), api_request, "/foo", schema, prefetch_pages=2
+        )
+
+        got = [row.index for row in row_iterator]
+
+        self.assertEqual(got, list(range(10)))
+        start_indexes = [
+            call[1]["query_params"].get("startIndex")
+            for call in api_request.call_args_list
+        ]
+        self.assertEqual(sorted(start_indexes[1:]), [3, 6, 9])
+        self.assertEqual(row_iterator.page_number, 4)
+
+    def test_prefetch_pages_by_start_index_w_short_pages(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField("index", "INTEGER", mode="REQUIRED")]
+        # The API returns fewer rows than requested for every page after the
+        # first one.
+        api_request = self._make_tabledata_api(12, first_page_size=4, max_page_size=4)
+        row_iterator = self._make_one(
+            _mock_client(),
+            api_request,
+            "/foo",
+            schema,
+            page_size=5,
+            prefetch_pages=3,
+            extra_params={"startIndex": 1},
+        )
+
+        got = [row.index for row in row_iterator]
+
+        self.assertEqual(got, list(range(1, 12)))
+
+    def test_prefetch_pages_by_start_index_w_max_results(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField("index", "INTEGER", mode="REQUIRED")]
+        api_request = self._make_tabledata_api(100, first_page_size=3)
+        row_iterator = self._make_one(
+            _mock_client(),
+            api_request,
+            "/foo",
+            schema,
+            max_results=7,
+            page_size=3,
+            prefetch_pages=4,
+        )
+
+        got = [row.index for row in row_iterator]
+
+        self.assertEqual(got, list(range(7)))
+        self.assertEqual(api_request.call_count, 3)
+
+    def test_prefetch_pages_by_page_token(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField("index", "INTEGER", mode="REQUIRED")]
+        # Total rows is unknown, so pages must follow the page tokens.
+        api_request = self._make_tabledata_api(
+            10, first_page_size=4, include_total_rows=False
+        )
+        row_iterator = self._make_one(
+            _mock_client(), api_request, "/foo", schema, prefetch_pages=2
+        )
+
+        got = [row.index for row in row_iterator]
+
+        self.assertEqual(got, list(range(10)))
+        page_tokens = [
+            call[1]["query_params"].get("pageToken")
+            for call in api_request.call_args_list
+        ]
+        self.assertEqual(page_tokens, [None, "4", "8"])
+
+    def test_prefetch_pages_stops_when_iteration_is_closed(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField("index", "INTEGER", mode="REQUIRED")]
+        api_request = self._make_tabledata_api(10, first_page_size=2)
+        row_iterator = self._make_one(
+            _mock_client(), api_request, "/foo", schema, prefetch_pages=2
+        )
+
+        rows = iter(row_iterator)
+        self.assertEqual(next(rows).index, 0)
+        pool = row_iterator._prefetch_pool
+        self.assertIsNotNone(pool)
+
+        rows.close()
+
+        self.assertIsNone(row_iterator._prefetch_pool)
+        self.assertEqual(len(row_iterator._prefetch_queue), 0)
+        # The worker threads have been told to exit.
+        with self.assertRaises(RuntimeError):
+            pool.submit(lambda: None)
+
+    def test_prefetch_pages_close(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField("index", "INTEGER", mode="REQUIRED")]
+        api_request = self._make_tabledata_api(10, first_page_size=2)
+        row_iterator = self._make_one(
+            _mock_client(), api_request, "/foo", schema, prefetch_pages=2
+        )
+        pages = row_iterator.pages
+        next(pages)
+        pool = row_iterator._prefetch_pool
+
+        row_iterator.close()
+
+        self.assertIsNone(row_iterator._prefetch_pool)
+        with self.assertRaises(RuntimeError):
+            pool.submit(lambda: None)
+        # No more pages are read ahead.
+        call_count = api_request.call_count
+        self.assertEqual(list(pages), [])
+        self.assertEqual(api_request.call_count, call_count)
+
+    def test_prefetch_pages_w_empty_table(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField("index", "INTEGER", mode="REQUIRED")]
+        api_request = self._make_tabledata_api(0, first_page_size=4)
+        row_iterator = self._make_one(
+            _mock_client(), api_request, "/foo", schema, prefetch_pages=2
+        )
+
+        self.assertEqual(list(row_iterator), [])
+        api_request.assert_called_once()
+
     @unittest.skipIf(pandas is None, "Requires `pandas`")
     def test_to_dataframe(self):
         from google.cloud.bigquery.table import SchemaField
@@ -1517,6 +1705,472 @@ class TestRowIterator(unittest.TestCase):
         self.assertEqual(df.name.dtype.name, "object")
         self.assertEqual(df.age.dtype.name, "int64")
 
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_iterable(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField("name", "STRING", mode="REQUIRED"),
+            SchemaField("age", "INTEGER", mode="REQUIRED"),
+        ]
+        rows_page1 = [
+            {"f": [{"v": "Phred Phlyntstone"}, {"v": "32"}]},
+            {"f": [{"v": "Bharney Rhubble"}, {"v": "33"}]},
+        ]
+        rows_page2 = [{"f": [{"v": "Wylma Phlyntstone"}, {"v": "29"}]}]
+        path = "/foo"
+        api_request = mock.Mock(
+            side_effect=[
+                {"rows": rows_page1, "pageToken": "next-page"},
+                {"rows": rows_page2},
+            ]
+        )
+        row_iterator = self._make_one(_mock_client(), api_request, path, schema)
+
+        frames = row_iterator.to_dataframe_iterable(dtypes={"age": "int32"})
+
+        df = next(frames)
+        self.assertEqual(api_request.call_count, 1)  # pages are fetched lazily
+        self.assertIsInstance(df, pandas.DataFrame)
+        self.assertEqual(list(df), ["name", "age"])
+        self.assertEqual(list(df.name), ["Phred Phlyntstone", "Bharney Rhubble"])
+        self.assertEqual(df.age.dtype.name, "int32")
+
+        df = next(frames)
+        self.assertEqual(list(df.name), ["Wylma Phlyntstone"])
+        self.assertEqual(list(df.age), [29])
+        self.assertEqual(list(frames), [])
+
+    @mock.patch("google.cloud.bigquery.table.pandas", new=None)
+    def test_to_dataframe_iterable_error_if_pandas_is_none(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField("name", "STRING", mode="REQUIRED")]
+        row_iterator = self._make_one(_mock_client(), mock.Mock(), "/foo", schema)
+
+        with self.assertRaises(ValueError):
+            row_iterator.to_dataframe_iterable()
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField("name", "STRING", mode="REQUIRED"),
+            SchemaField("age", "INTEGER", mode="REQUIRED"),
+            SchemaField(
+                "child",
+                "RECORD",
+                mode="REPEATED",
+                fields=[
+                    SchemaField("name", "STRING", mode="REQUIRED"),
+                    SchemaField("age", "INTEGER", mode="REQUIRED"),
+                ],
+            ),
+        ]
+        rows = [
+            {
+                "f": [
+                    {"v": "Bharney Rhubble"},
+                    {"v": "33"},
+                    {
+                        "v": [
+                            {"v": {"f": [{"v": "Whamm-Whamm Rhubble"}, {"v": "3"}]}},
+                            {"v": {"f": [{"v": "Hoppy"}, {"v": "1"}]}},
+                        ]
+                    },
+                ]
+            },
+            {
+                "f": [
+                    {"v": "Wylma Phlyntstone"},
+                    {"v": "29"},
+                    {
+                        "v": [
+                            {"v": {"f": [{"v": "Bepples Phlyntstone"}, {"v": "0"}]}},
+                            {"v": {"f": [{"v": "Dino"}, {"v": "4"}]}},
+                        ]
+                    },
+                ]
+            },
+        ]
+        path = "/foo"
+        api_request = mock.Mock(
+            side_effect=[
+                {"rows": [rows[0]], "pageToken": "NEXTPAGE"},
+                {"rows": [rows[1]]},
+            ]
+        )
+        row_iterator = self._make_one(_mock_client(), api_request, path, schema)
+
+        tbl = row_iterator.to_arrow()
+
+        self.assertIsInstance(tbl, pyarrow.Table)
+        self.assertEqual(tbl.num_rows, 2)
+        # One record batch per page.
+        self.assertEqual(len(tbl.to_batches()), 2)
+
+        # Check the schema.
+        self.assertEqual(tbl.schema[0].name, "name")
+        self.assertTrue(pyarrow.types.is_string(tbl.schema[0].type))
+        self.assertEqual(tbl.schema[1].name, "age")
+        self.assertTrue(pyarrow.types.is_int64(tbl.schema[1].type))
+        child_field = tbl.schema[2]
+        self.assertEqual(child_field.name, "child")
+        self.assertTrue(pyarrow.types.is_list(child_field.type))
+        self.assertTrue(pyarrow.types.is_struct(child_field.type.value_type))
+        self.assertEqual(child_field.type.value_type[0].name, "name")
+        self.assertEqual(child_field.type.value_type[1].name, "age")
+
+        # Check the data.
+        tbl_data = tbl.to_pydict()
+        names = tbl_data["name"]
+        ages = tbl_data["age"]
+        children = tbl_data["child"]
+        self.assertEqual(names, ["Bharney Rhubble", "Wylma Phlyntstone"])
+        self.assertEqual(ages, [33, 29])
+        self.assertEqual(
+            children,
+            [
+                [
+                    {"name": "Whamm-Whamm Rhubble", "age": 3},
+                    {"name": "Hoppy", "age": 1},
+                ],
+                [{"name": "Bepples Phlyntstone", "age": 0}, {"name": "Dino", "age": 4}],
+            ],
+        )
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_w_nulls(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField("name", "STRING"), SchemaField("age", "INTEGER")]
+        rows = [
+            {"f": [{"v": "Donkey"}, {"v": 32}]},
+            {"f": [{"v": "Diddy"}, {"v": 29}]},
+            {"f": [{"v": "Dixie"}, {"v": None}]},
+            {"f": [{"v": None}, {"v": 111}]},
+        ]
+        path = "/foo"
+        api_request = mock.Mock(return_value={"rows": rows})
+        row_iterator = self._make_one(_mock_client(), api_request, path, schema)
+
+        tbl = row_iterator.to_arrow()
+
+        self.assertIsInstance(tbl, pyarrow.Table)
+        self.assertEqual(tbl.num_rows, 4)
+
+        # Check the schema.
+        self.assertEqual(tbl.schema[0].name, "name")
+        self.assertTrue(pyarrow.types.is_string(tbl.schema[0].type))
+        self.assertEqual(tbl.schema[1].name, "age")
+        self.assertTrue(pyarrow.types.is_int64(tbl.schema[1].type))
+
+        # Check the data.
+        tbl_data = tbl.to_pydict()
+        names = tbl_data["name"]
+        ages = tbl_data["age"]
+        self.assertEqual(names, ["Donkey", "Diddy", "Dixie", None])
+        self.assertEqual(ages, [32, 29, None, 111])
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_w_unknown_type(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField("name", "STRING", mode="REQUIRED"),
+            SchemaField("sport", "UNKNOWN_TYPE", mode="REQUIRED"),
+        ]
+        rows = [
+            {"f": [{"v": "Bharney Rhubble"}, {"v": "Curling"}]},
+            {"f": [{"v": "Wylma Phlyntstone"}, {"v": "Bowling"}]},
+        ]
+        path = "/foo"
+        api_request = mock.Mock(return_value={"rows": rows})
+        row_iterator = self._make_one(_mock_client(), api_request, path, schema)
+
+        with mock.patch.dict(
+            "google.cloud.bigquery._helpers._CELLDATA_FROM_JSON",
+            {"UNKNOWN_TYPE": lambda value, _: value},
+        ):
+            tbl = row_iterator.to_arrow()
+
+        self.assertIsInstance(tbl, pyarrow.Table)
+        self.assertEqual(tbl.num_rows, 2)
+        self.assertEqual(tbl.column_names, ["name", "sport"])
+        self.assertEqual(tbl.to_pydict()["sport"], ["Curling", "Bowling"])
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_w_empty_table(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField("name", "STRING", mode="REQUIRED"),
+            SchemaField("age", "INTEGER", mode="REQUIRED"),
+        ]
+        path = "/foo"
+        api_request = mock.Mock(return_value={"rows": []})
+        row_iterator = self._make_one(_mock_client(), api_request, path, schema)
+
+        tbl = row_iterator.to_arrow()
+
+        self.assertIsInstance(tbl, pyarrow.Table)
+        self.assertEqual(tbl.num_rows, 0)
+        self.assertEqual(tbl.column_names, ["name", "age"])
+
+    @mock.patch("google.cloud.bigquery.table.pyarrow", new=None)
+    def test_to_arrow_error_if_pyarrow_is_none(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField("name", "STRING", mode="REQUIRED"),
+            SchemaField("age", "INTEGER", mode="REQUIRED"),
+        ]
+        rows = [
+            {"f": [{"v": "Phred Phlyntstone"}, {"v": "32"}]},
+            {"f": [{"v": "Bharney Rhubble"}, {"v": "33"}]},
+        ]
+        path = "/foo"
+        api_request = mock.Mock(return_value={"rows": rows})
+        row_iterator = self._make_one(_mock_client(), api_request, path, schema)
+
+        with self.assertRaises(ValueError):
+            row_iterator.to_arrow()
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_to_arrow_w_bqstorage(self):
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+        from google.cloud.bigquery_storage_v1beta1 import reader
+
+        bqstorage_client = mock.create_autospec(
+            bigquery_storage_v1beta1.BigQueryStorageClient
+        )
+        streams = [
+            # Use two streams we want to check that batches are read from
+            # each stream.
+            {"name": "/projects/proj/dataset/dset/tables/tbl/streams/1234"},
+            {"name": "/projects/proj/dataset/dset/tables/tbl/streams/5678"},
+        ]
+        session = bigquery_storage_v1beta1.types.ReadSession(streams=streams)
+        session.avro_schema.schema = json.dumps(
+            {
+                "fields": [
+                    {"name": "colA"},
+                    # Not alphabetical to test column order.
+                    {"name": "colC"},
+                    {"name": "colB"},
+                ]
+            }
+        )
+        bqstorage_client.create_read_session.return_value = session
+
+        mock_rowstream = mock.create_autospec(reader.ReadRowsStream)
+        bqstorage_client.read_rows.return_value = mock_rowstream
+
+        mock_rows = mock.create_autospec(reader.ReadRowsIterable)
+        mock_rowstream.rows.return_value = mock_rows
+        page_items = [
+            {"colA": 1, "colB": "abc", "colC": 2.0},
+            {"colA": -1, "colB": "def", "colC": 4.0},
+        ]
+
+        mock_page = mock.create_autospec(reader.ReadRowsPage)
+        mock_page.to_dataframe.side_effect = lambda dtypes=None: pandas.DataFrame(
+            page_items, columns=["colA", "colC", "colB"], dtype="object"
+        )
+        mock_pages = (mock_page, mock_page, mock_page)
+        type(mock_rows).pages = mock.PropertyMock(return_value=mock_pages)
+
+        schema = [
+            schema.SchemaField("colA", "INTEGER"),
+            schema.SchemaField("colB", "STRING"),
+            schema.SchemaField("colC", "FLOAT"),
+        ]
+
+        row_iterator = mut.RowIterator(
+            _mock_client(),
+            None,  # api_request: ignored
+            None,  # path: ignored
+            schema,
+            table=mut.TableReference.from_string("proj.dset.tbl"),
+            selected_fields=schema,
+        )
+
+        tbl = row_iterator.to_arrow(bqstorage_client=bqstorage_client)
+
+        # Was an Arrow session requested?
+        _, kwargs = bqstorage_client.create_read_session.call_args
+        self.assertEqual(
+            kwargs["format_"], bigquery_storage_v1beta1.enums.DataFormat.ARROW
+        )
+
+        # Are the Avro pages decoded into columns, keeping the Python values?
+        mock_page.to_dataframe.assert_called_with(
+            dtypes={"colA": "object", "colC": "object", "colB": "object"}
+        )
+        mock_page.__iter__.assert_not_called()
+
+        # Are the columns in the expected order?
+        self.assertEqual(tbl.column_names, ["colA", "colC", "colB"])
+        self.assertTrue(pyarrow.types.is_int64(tbl.schema[0].type))
+        self.assertTrue(pyarrow.types.is_float64(tbl.schema[1].type))
+        self.assertTrue(pyarrow.types.is_string(tbl.schema[2].type))
+
+        # Have expected number of rows?
+        total_pages = len(streams) * len(mock_pages)
+        total_rows = len(page_items) * total_pages
+        self.assertEqual(tbl.num_rows, total_rows)
+        self.assertEqual(len(tbl.to_batches()), total_pages)
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_to_arrow_w_bqstorage_arrow_session(self):
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+        from google.cloud.bigquery_storage_v1beta1 import reader
+
+        bqstorage_client = mock.create_autospec(
+            bigquery_storage_v1beta1.BigQueryStorageClient
+        )
+        streams = [
+            {"name": "/projects/proj/dataset/dset/tables/tbl/streams/1234"},
+            {"name": "/projects/proj/dataset/dset/tables/tbl/streams/5678"},
+        ]
+        arrow_fields = [
+            pyarrow.field("colA", pyarrow.int64()),
+            # Not alphabetical to test column order.
+            pyarrow.field("colC", pyarrow.float64()),
+            pyarrow.field("colB", pyarrow.string()),
+        ]
+        arrow_schema = pyarrow.schema(arrow_fields)
+        session = bigquery_storage_v1beta1.types.ReadSession(streams=streams)
+        session.arrow_schema.serialized_schema = arrow_schema.serialize().to_pybytes()
+        bqstorage_client.create_read_session.return_value = session
+
+        mock_rowstream = mock.create_autospec(reader.ReadRowsStream)
+        bqstorage_client.read_rows.return_value = mock_rowstream
+
+        mock_rows = mock.create_autospec(reader.ReadRowsIterable)
+        mock_rowstream.rows.return_value = mock_rows
+        page_batch = pyarrow.RecordBatch.from_arrays(
+            [
+                pyarrow.array([1, -1]),
+                pyarrow.array([2.0, 4.0]),
+                pyarrow.array(["abc", "def"]),
+            ],
+            schema=arrow_schema,
+        )
+        mock_page = mock.create_autospec(reader.ReadRowsPage)
+        mock_page.to_arrow.return_value = page_batch
+        mock_pages = (mock_page, mock_page, mock_page)
+        type(mock_rows).pages = mock.PropertyMock(return_value=mock_pages)
+
+        schema = [
+            schema.SchemaField("colA", "INTEGER"),
+            schema.SchemaField("colB", "STRING"),
+            schema.SchemaField("colC", "FLOAT"),
+        ]
+
+        row_iterator = mut.RowIterator(
+            _mock_client(),
+            None,  # api_request: ignored
+            None,  # path: ignored
+            schema,
+            table=mut.TableReference.from_string("proj.dset.tbl"),
+            selected_fields=schema,
+        )
+
+        tbl = row_iterator.to_arrow(bqstorage_client=bqstorage_client)
+
+        # Are the record batches used as is?
+        mock_page.to_dataframe.assert_not_called()
+        mock_page.__iter__.assert_not_called()
+        self.assertEqual(tbl.schema, arrow_schema)
+
+        total_pages = len(streams) * len(mock_pages)
+        self.assertEqual(tbl.num_rows, page_batch.num_rows * total_pages)
+        self.assertEqual(len(tbl.to_batches()), total_pages)
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_to_arrow_w_bqstorage_arrow_session_no_streams(self):
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+
+        bqstorage_client = mock.create_autospec(
+            bigquery_storage_v1beta1.BigQueryStorageClient
+        )
+        arrow_schema = pyarrow.schema(
+            [
+                pyarrow.field("colA", pyarrow.string()),
+                pyarrow.field("colC", pyarrow.string()),
+                pyarrow.field("colB", pyarrow.string()),
+            ]
+        )
+        session = bigquery_storage_v1beta1.types.ReadSession()
+        session.arrow_schema.serialized_schema = arrow_schema.serialize().to_pybytes()
+        bqstorage_client.create_read_session.return_value = session
+
+        row_iterator = mut.RowIterator(
+            _mock_client(),
+            None,  # api_request: ignored
+            None,  # path: ignored
+            [
+                schema.SchemaField("colA", "STRING"),
+                schema.SchemaField("colB", "STRING"),
+                schema.SchemaField("colC", "STRING"),
+            ],
+            table=mut.TableReference.from_string("proj.dset.tbl"),
+        )
+
+        tbl = row_iterator.to_arrow(bqstorage_client=bqstorage_client)
+
+        self.assertEqual(tbl.column_names, ["colA", "colC", "colB"])
+        self.assertEqual(tbl.num_rows, 0)
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_to_arrow_w_bqstorage_no_streams(self):
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+
+        bqstorage_client = mock.create_autospec(
+            bigquery_storage_v1beta1.BigQueryStorageClient
+        )
+        session = bigquery_storage_v1beta1.types.ReadSession()
+        session.avro_schema.schema = json.dumps(
+            {"fields": [{"name": "colA"}, {"name": "colC"}, {"name": "colB"}]}
+        )
+        bqstorage_client.create_read_session.return_value = session
+
+        row_iterator = mut.RowIterator(
+            _mock_client(),
+            None,  # api_request: ignored
+            None,  # path: ignored
+            [
+                schema.SchemaField("colA", "STRING"),
+                schema.SchemaField("colB", "STRING"),
+                schema.SchemaField("colC", "STRING"),
+            ],
+            table=mut.TableReference.from_string("proj.dset.tbl"),
+        )
+
+        tbl = row_iterator.to_arrow(bqstorage_client=bqstorage_client)
+
+        self.assertEqual(tbl.column_names, ["colA", "colC", "colB"])
+        self.assertEqual(tbl.num_rows, 0)
+
     @unittest.skipIf(pandas is None, "Requires `pandas`")
     @unittest.skipIf(tqdm is None, "Requires `tqdm`")
     @mock.patch("tqdm.tqdm_gui")
@@ -1943,6 +2597,83 @@ class TestRowIterator(unittest.TestCase):
         # Make sure that this test pushed to the progress queue.
         self.assertEqual(mock_queue().put_nowait.call_count, total_pages)
 
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_to_dataframe_w_bqstorage_arrow_session(self):
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+        from google.cloud.bigquery_storage_v1beta1 import reader
+
+        bqstorage_client = mock.create_autospec(
+            bigquery_storage_v1beta1.BigQueryStorageClient
+        )
+        streams = [
+            {"name": "/projects/proj/dataset/dset/tables/tbl/streams/1234"},
+            {"name": "/projects/proj/dataset/dset/tables/tbl/streams/5678"},
+        ]
+        arrow_schema = pyarrow.schema(
+            [
+                pyarrow.field("colA", pyarrow.int64()),
+                # Not alphabetical to test column order.
+                pyarrow.field("colC", pyarrow.float64()),
+                pyarrow.field("colB", pyarrow.string()),
+            ]
+        )
+        session = bigquery_storage_v1beta1.types.ReadSession(streams=streams)
+        session.arrow_schema.serialized_schema = arrow_schema.serialize().to_pybytes()
+        bqstorage_client.create_read_session.return_value = session
+
+        mock_rowstream = mock.create_autospec(reader.ReadRowsStream)
+        bqstorage_client.read_rows.return_value = mock_rowstream
+
+        mock_rows = mock.create_autospec(reader.ReadRowsIterable)
+        mock_rowstream.rows.return_value = mock_rows
+        mock_page = mock.create_autospec(reader.ReadRowsPage)
+        mock_page.to_arrow.return_value = pyarrow.RecordBatch.from_arrays(
+            [
+                pyarrow.array([1, -1]),
+                pyarrow.array([2.0, 4.0]),
+                pyarrow.array(["abc", "def"]),
+            ],
+            schema=arrow_schema,
+        )
+        mock_pages = (mock_page, mock_page, mock_page)
+        type(mock_rows).pages = mock.PropertyMock(return_value=mock_pages)
+
+        schema = [
+            schema.SchemaField("colA", "INTEGER"),
+            schema.SchemaField("colC", "FLOAT"),
+            schema.SchemaField("colB", "STRING"),
+        ]
+
+        row_iterator = mut.RowIterator(
+            _mock_client(),
+            None,  # api_request: ignored
+            None,  # path: ignored
+            schema,
+            table=mut.TableReference.from_string("proj.dset.tbl"),
+            selected_fields=schema,
+        )
+
+        got = row_iterator.to_dataframe(
+            bqstorage_client=bqstorage_client, dtypes={"colC": "float32"}
+        )
+
+        _, kwargs = bqstorage_client.create_read_session.call_args
+        self.assertEqual(
+            kwargs["format_"], bigquery_storage_v1beta1.enums.DataFormat.ARROW
+        )
+        mock_page.to_dataframe.assert_not_called()
+
+        self.assertEqual(list(got), ["colA", "colC", "colB"])
+        self.assertEqual(list(got["colA"]), [1, -1] * 6)
+        self.assertEqual(got["colA"].dtype.name, "int64")
+        self.assertEqual(got["colC"].dtype.name, "float32")
+        self.assertEqual(list(got.index), list(range(12)))
+
     @unittest.skipIf(pandas is None, "Requires `pandas`")
     @unittest.skipIf(
         bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
@@ -2143,6 +2874,173 @@ class TestRowIterator(unittest.TestCase):
         # should have been set.
         self.assertLessEqual(mock_page.to_dataframe.call_count, 2)
 
+    def _make_bqstorage_client_w_pages(self, streams, mock_pages):
+        from google.cloud.bigquery_storage_v1beta1 import reader
+
+        session = bigquery_storage_v1beta1.types.ReadSession(streams=streams)
+        session.avro_schema.schema = json.dumps(
+            {"fields": [{"name": "colA"}, {"name": "colC"}, {"name": "colB"}]}
+        )
+
+        bqstorage_client = mock.create_autospec(
+            bigquery_storage_v1beta1.BigQueryStorageClient
+        )
+        bqstorage_client.create_read_session.return_value = session
+
+        mock_rowstream = mock.create_autospec(reader.ReadRowsStream)
+        bqstorage_client.read_rows.return_value = mock_rowstream
+
+        mock_rows = mock.create_autospec(reader.ReadRowsIterable)
+        mock_rowstream.rows.return_value = mock_rows
+        type(mock_rows).pages = mock.PropertyMock(side_effect=lambda: iter(mock_pages))
+        return bqstorage_client
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_to_dataframe_iterable_w_bqstorage(self):
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+        from google.cloud.bigquery_storage_v1beta1 import reader
+
+        # Speed up testing.
+        mut._PROGRESS_INTERVAL = 0.01
+
+        streams = [
+            {"name": "/projects/proj/dataset/dset/tables/tbl/streams/1234"},
+            {"name": "/projects/proj/dataset/dset/tables/tbl/streams/5678"},
+        ]
+        page_items = [
+            {"colA": 1, "colB": "abc", "colC": 2.0},
+            {"colA": -1, "colB": "def", "colC": 4.0},
+        ]
+        mock_page = mock.create_autospec(reader.ReadRowsPage)
+        mock_page.to_dataframe.return_value = pandas.DataFrame(
+            page_items, columns=["colA", "colB", "colC"]
+        )
+        mock_pages = (mock_page, mock_page, mock_page)
+        bqstorage_client = self._make_bqstorage_client_w_pages(streams, mock_pages)
+
+        row_iterator = self._make_one(
+            schema=[
+                schema.SchemaField("colA", "IGNORED"),
+                schema.SchemaField("colC", "IGNORED"),
+                schema.SchemaField("colB", "IGNORED"),
+            ],
+            table=mut.TableReference.from_string("proj.dset.tbl"),
+        )
+
+        frames = list(
+            row_iterator.to_dataframe_iterable(
+                bqstorage_client=bqstorage_client, max_queue_size=1
+            )
+        )
+
+        self.assertEqual(len(frames), len(streams) * len(mock_pages))
+        for frame in frames:
+            # Are the columns in the expected order?
+            self.assertEqual(list(frame), ["colA", "colC", "colB"])
+            self.assertEqual(len(frame), len(page_items))
+        self.assertTrue(row_iterator._download_finished)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_to_dataframe_iterable_w_bqstorage_stops_workers_on_close(self):
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+        from google.cloud.bigquery_storage_v1beta1 import reader
+
+        # Speed up testing.
+        mut._PROGRESS_INTERVAL = 0.01
+
+        streams = [{"name": "/projects/proj/dataset/dset/tables/tbl/streams/1234"}]
+        mock_page = mock.create_autospec(reader.ReadRowsPage)
+        mock_page.to_dataframe.return_value = pandas.DataFrame(
+            [{"colA": 1, "colB": "abc", "colC": 2.0}]
+        )
+        # Many more pages than the queue can hold.
+        mock_pages = [mock_page] * 100
+        bqstorage_client = self._make_bqstorage_client_w_pages(streams, mock_pages)
+
+        row_iterator = self._make_one(
+            schema=[schema.SchemaField("colA", "IGNORED")],
+            table=mut.TableReference.from_string("proj.dset.tbl"),
+        )
+
+        frames = row_iterator.to_dataframe_iterable(
+            bqstorage_client=bqstorage_client, max_queue_size=2
+        )
+        next(frames)
+        frames.close()
+
+        # The worker was blocked by the full queue, so it stopped well before
+        # converting every page.
+        self.assertTrue(row_iterator._download_finished)
+        self.assertLess(mock_page.to_dataframe.call_count, len(mock_pages))
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_to_dataframe_iterable_w_bqstorage_raises_worker_error(self):
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+        from google.cloud.bigquery_storage_v1beta1 import reader
+
+        # Speed up testing.
+        mut._PROGRESS_INTERVAL = 0.01
+
+        streams = [{"name": "/projects/proj/dataset/dset/tables/tbl/streams/1234"}]
+        mock_page = mock.create_autospec(reader.ReadRowsPage)
+        mock_page.to_dataframe.side_effect = google.api_core.exceptions.InternalServerError(
+            "TEST stream broke"
+        )
+        bqstorage_client = self._make_bqstorage_client_w_pages(streams, [mock_page])
+
+        row_iterator = self._make_one(
+            schema=[schema.SchemaField("colA", "IGNORED")],
+            table=mut.TableReference.from_string("proj.dset.tbl"),
+        )
+
+        frames = row_iterator.to_dataframe_iterable(bqstorage_client=bqstorage_client)
+        with pytest.raises(google.api_core.exceptions.InternalServerError):
+            list(frames)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_to_dataframe_iterable_w_bqstorage_fallback_to_tabledata_list(self):
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+
+        bqstorage_client = mock.create_autospec(
+            bigquery_storage_v1beta1.BigQueryStorageClient
+        )
+        bqstorage_client.create_read_session.side_effect = google.api_core.exceptions.InternalServerError(
+            "can't read with bqstorage_client"
+        )
+        iterator_schema = [schema.SchemaField("name", "STRING", mode="REQUIRED")]
+        rows = [{"f": [{"v": "Phred Phlyntstone"}]}, {"f": [{"v": "Bharney Rhubble"}]}]
+        api_request = mock.Mock(return_value={"rows": rows})
+        row_iterator = mut.RowIterator(
+            _mock_client(),
+            api_request,
+            "/foo",
+            iterator_schema,
+            table=mut.Table("proj.dset.tbl"),
+        )
+
+        frames = list(
+            row_iterator.to_dataframe_iterable(bqstorage_client=bqstorage_client)
+        )
+
+        self.assertEqual(len(frames), 1)
+        self.assertEqual(list(frames[0].name), ["Phred Phlyntstone", "Bharney Rhubble"])
+
     @unittest.skipIf(pandas is None, "Requires `pandas`")
     @unittest.skipIf(
         bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
@@ -2195,7 +3093,10 @@ class TestRowIterator(unittest.TestCase):
         from google.cloud.bigquery import schema
 
         iterator_schema = [schema.SchemaField("name", "STRING", mode="REQUIRED")]
-        pages = [[{"name": "Bengt"}], [{"name": "Sven"}]]
+        pages = [mock.MagicMock(), mock.MagicMock()]
+        for page, name in zip(pages, ["Bengt", "Sven"]):
+            page._columns = [[name]]
+            page.__iter__.return_value = iter([{"name": name}])
 
         mock_pages.return_value = pages
         row_iterator = self._make_one(schema=iterator_schema)
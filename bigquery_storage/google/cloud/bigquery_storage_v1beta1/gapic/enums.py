@@ -27,7 +27,10 @@ class DataFormat(enum.IntEnum):
       DATA_FORMAT_UNSPECIFIED (int): Data format is unspecified.
       AVRO (int): Avro is a standard open source row based file format.
       See https://avro.apache.org/ for more details.
+      ARROW (int): Arrow is a standard open source column-based message format.
+      See https://arrow.apache.org/ for more details.
     """
 
     DATA_FORMAT_UNSPECIFIED = 0
     AVRO = 1
+    ARROW = 3
@@ -0,0 +1,2 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+import grpc
@@ -17,6 +17,9 @@ _sym_db = _symbol_database.Default()
 
 from google.api import annotations_pb2 as google_dot_api_dot_annotations__pb2
 from google.api import resource_pb2 as google_dot_api_dot_resource__pb2
+from google.cloud.bigquery_storage_v1beta1.proto import (
+    arrow_pb2 as google_dot_cloud_dot_bigquery_dot_storage__v1beta1_dot_proto_dot_arrow__pb2,
+)
 from google.cloud.bigquery_storage_v1beta1.proto import (
     avro_pb2 as google_dot_cloud_dot_bigquery_dot_storage__v1beta1_dot_proto_dot_avro__pb2,
 )
@@ -38,11 +41,12 @@ DESCRIPTOR = _descriptor.FileDescriptor(
         "\n)com.google.cloud.bigquery.storage.v1beta1ZLgoogle.golang.org/genproto/googleapis/cloud/bigquery/storage/v1beta1;storage"
     ),
     serialized_pb=_b(
-        '\n9google/cloud/bigquery/storage_v1beta1/proto/storage.proto\x12%google.cloud.bigquery.storage.v1beta1\x1a\x1cgoogle/api/annotations.proto\x1a\x19google/api/resource.proto\x1a\x36google/cloud/bigquery/storage_v1beta1/proto/avro.proto\x1a>google/cloud/bigquery/storage_v1beta1/proto/read_options.proto\x1a\x41google/cloud/bigquery/storage_v1beta1/proto/table_reference.proto\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1fgoogle/protobuf/timestamp.proto")\n\x06Stream\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\trow_count\x18\x02 \x01(\x03"_\n\x0eStreamPosition\x12=\n\x06stream\x18\x01 \x01(\x0b\x32-.google.cloud.bigquery.storage.v1beta1.Stream\x12\x0e\n\x06offset\x18\x02 \x01(\x03"\x80\x03\n\x0bReadSession\x12\x0c\n\x04name\x18\x01 \x01(\t\x12/\n\x0b\x65xpire_time\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12H\n\x0b\x61vro_schema\x18\x05 \x01(\x0b\x32\x31.google.cloud.bigquery.storage.v1beta1.AvroSchemaH\x00\x12>\n\x07streams\x18\x04 \x03(\x0b\x32-.google.cloud.bigquery.storage.v1beta1.Stream\x12N\n\x0ftable_reference\x18\x07 \x01(\x0b\x32\x35.google.cloud.bigquery.storage.v1beta1.TableReference\x12N\n\x0ftable_modifiers\x18\x08 \x01(\x0b\x32\x35.google.cloud.bigquery.storage.v1beta1.TableModifiersB\x08\n\x06schema"\xf7\x02\n\x18\x43reateReadSessionRequest\x12N\n\x0ftable_reference\x18\x01 \x01(\x0b\x32\x35.google.cloud.bigquery.storage.v1beta1.TableReference\x12\x0e\n\x06parent\x18\x06 \x01(\t\x12N\n\x0ftable_modifiers\x18\x02 \x01(\x0b\x32\x35.google.cloud.bigquery.storage.v1beta1.TableModifiers\x12\x19\n\x11requested_streams\x18\x03 \x01(\x05\x12M\n\x0cread_options\x18\x04 \x01(\x0b\x32\x37.google.cloud.bigquery.storage.v1beta1.TableReadOptions\x12\x41\n\x06\x66ormat\x18\x05 \x01(\x0e\x32\x31.google.cloud.bigquery.storage.v1beta1.DataFormat"_\n\x0fReadRowsRequest\x12L\n\rread_position\x18\x01 \x01(\x0b\x32\x35.google.cloud.bigquery.storage.v1beta1.StreamPosition"+\n\x0cStreamStatus\x12\x1b\n\x13\x65stimated_row_count\x18\x01 \x01(\x03"*\n\x0eThrottleStatus\x12\x18\n\x10throttle_percent\x18\x01 \x01(\x05"\xf5\x01\n\x10ReadRowsResponse\x12\x44\n\tavro_rows\x18\x03 \x01(\x0b\x32/.google.cloud.bigquery.storage.v1beta1.AvroRowsH\x00\x12\x43\n\x06status\x18\x02 \x01(\x0b\x32\x33.google.cloud.bigquery.storage.v1beta1.StreamStatus\x12N\n\x0fthrottle_status\x18\x05 \x01(\x0b\x32\x35.google.cloud.bigquery.storage.v1beta1.ThrottleStatusB\x06\n\x04rows"\x86\x01\n$BatchCreateReadSessionStreamsRequest\x12\x43\n\x07session\x18\x01 \x01(\x0b\x32\x32.google.cloud.bigquery.storage.v1beta1.ReadSession\x12\x19\n\x11requested_streams\x18\x02 \x01(\x05"g\n%BatchCreateReadSessionStreamsResponse\x12>\n\x07streams\x18\x01 \x03(\x0b\x32-.google.cloud.bigquery.storage.v1beta1.Stream"V\n\x15\x46inalizeStreamRequest\x12=\n\x06stream\x18\x02 \x01(\x0b\x32-.google.cloud.bigquery.storage.v1beta1.Stream"`\n\x16SplitReadStreamRequest\x12\x46\n\x0foriginal_stream\x18\x01 \x01(\x0b\x32-.google.cloud.bigquery.storage.v1beta1.Stream"\xa9\x01\n\x17SplitReadStreamResponse\x12\x45\n\x0eprimary_stream\x18\x01 \x01(\x0b\x32-.google.cloud.bigquery.storage.v1beta1.Stream\x12G\n\x10remainder_stream\x18\x02 \x01(\x0b\x32-.google.cloud.bigquery.storage.v1beta1.Stream*3\n\nDataFormat\x12\x1b\n\x17\x44\x41TA_FORMAT_UNSPECIFIED\x10\x00\x12\x08\n\x04\x41VRO\x10\x01\x32\xc7\x08\n\x0f\x42igQueryStorage\x12\x87\x02\n\x11\x43reateReadSession\x12?.google.cloud.bigquery.storage.v1beta1.CreateReadSessionRequest\x1a\x32.google.cloud.bigquery.storage.v1beta1.ReadSession"}\x82\xd3\xe4\x93\x02w"0/v1beta1/{table_reference.project_id=projects/*}:\x01*Z@";/v1beta1/{table_reference.dataset_id=projects/*/datasets/*}:\x01*\x12\xc0\x01\n\x08ReadRows\x12\x36.google.cloud.bigquery.storage.v1beta1.ReadRowsRequest\x1a\x37.google.cloud.bigquery.storage.v1beta1.ReadRowsResponse"A\x82\xd3\xe4\x93\x02;\x12\x39/v1beta1/{read_position.stream.name=projects/*/streams/*}0\x01\x12\xf4\x01\n\x1d\x42\x61tchCreateReadSessionStreams\x12K.google.cloud.bigquery.storage.v1beta1.BatchCreateReadSessionStreamsRequest\x1aL.google.cloud.bigquery.storage.v1beta1.BatchCreateReadSessionStreamsResponse"8\x82\xd3\xe4\x93\x02\x32"-/v1beta1/{session.name=projects/*/sessions/*}:\x01*\x12\x9e\x01\n\x0e\x46inalizeStream\x12<.google.cloud.bigquery.storage.v1beta1.FinalizeStreamRequest\x1a\x16.google.protobuf.Empty"6\x82\xd3\xe4\x93\x02\x30"+/v1beta1/{stream.name=projects/*/streams/*}:\x01*\x12\xce\x01\n\x0fSplitReadStream\x12=.google.cloud.bigquery.storage.v1beta1.SplitReadStreamRequest\x1a>.google.cloud.bigquery.storage.v1beta1.SplitReadStreamResponse"<\x82\xd3\xe4\x93\x02\x36\x12\x34/v1beta1/{original_stream.name=projects/*/streams/*}By\n)com.google.cloud.bigquery.storage.v1beta1ZLgoogle.golang.org/genproto/googleapis/cloud/bigquery/storage/v1beta1;storageb\x06proto3'
+        '\n9google/cloud/bigquery/storage_v1beta1/proto/storage.proto\x12%google.cloud.bigquery.storage.v1beta1\x1a\x1cgoogle/api/annotations.proto\x1a\x19google/api/resource.proto\x1a\x37google/cloud/bigquery/storage_v1beta1/proto/arrow.proto\x1a\x36google/cloud/bigquery/storage_v1beta1/proto/avro.proto\x1a>google/cloud/bigquery/storage_v1beta1/proto/read_options.proto\x1a\x41google/cloud/bigquery/storage_v1beta1/proto/table_reference.proto\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1fgoogle/protobuf/timestamp.proto")\n\x06Stream\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\trow_count\x18\x02 \x01(\x03"_\n\x0eStreamPosition\x12=\n\x06stream\x18\x01 \x01(\x0b\x32-.google.cloud.bigquery.storage.v1beta1.Stream\x12\x0e\n\x06offset\x18\x02 \x01(\x03"\xcc\x03\n\x0bReadSession\x12\x0c\n\x04name\x18\x01 \x01(\t\x12/\n\x0b\x65xpire_time\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12H\n\x0b\x61vro_schema\x18\x05 \x01(\x0b\x32\x31.google.cloud.bigquery.storage.v1beta1.AvroSchemaH\x00\x12J\n\x0c\x61rrow_schema\x18\x06 \x01(\x0b\x32\x32.google.cloud.bigquery.storage.v1beta1.ArrowSchemaH\x00\x12>\n\x07streams\x18\x04 \x03(\x0b\x32-.google.cloud.bigquery.storage.v1beta1.Stream\x12N\n\x0ftable_reference\x18\x07 \x01(\x0b\x32\x35.google.cloud.bigquery.storage.v1beta1.TableReference\x12N\n\x0ftable_modifiers\x18\x08 \x01(\x0b\x32\x35.google.cloud.bigquery.storage.v1beta1.TableModifiersB\x08\n\x06schema"\xf7\x02\n\x18\x43reateReadSessionRequest\x12N\n\x0ftable_reference\x18\x01 \x01(\x0b\x32\x35.google.cloud.bigquery.storage.v1beta1.TableReference\x12\x0e\n\x06parent\x18\x06 \x01(\t\x12N\n\x0ftable_modifiers\x18\x02 \x01(\x0b\x32\x35.google.cloud.bigquery.storage.v1beta1.TableModifiers\x12\x19\n\x11requested_streams\x18\x03 \x01(\x05\x12M\n\x0cread_options\x18\x04 \x01(\x0b\x32\x37.google.cloud.bigquery.storage.v1beta1.TableReadOptions\x12\x41\n\x06\x66ormat\x18\x05 \x01(\x0e\x32\x31.google.cloud.bigquery.storage.v1beta1.DataFormat"_\n\x0fReadRowsRequest\x12L\n\rread_position\x18\x01 \x01(\x0b\x32\x35.google.cloud.bigquery.storage.v1beta1.StreamPosition"+\n\x0cStreamStatus\x12\x1b\n\x13\x65stimated_row_count\x18\x01 \x01(\x03"*\n\x0eThrottleStatus\x12\x18\n\x10throttle_percent\x18\x01 \x01(\x05"\xcc\x02\n\x10ReadRowsResponse\x12\x44\n\tavro_rows\x18\x03 \x01(\x0b\x32/.google.cloud.bigquery.storage.v1beta1.AvroRowsH\x00\x12U\n\x12\x61rrow_record_batch\x18\x04 \x01(\x0b\x32\x37.google.cloud.bigquery.storage.v1beta1.ArrowRecordBatchH\x00\x12\x43\n\x06status\x18\x02 \x01(\x0b\x32\x33.google.cloud.bigquery.storage.v1beta1.StreamStatus\x12N\n\x0fthrottle_status\x18\x05 \x01(\x0b\x32\x35.google.cloud.bigquery.storage.v1beta1.ThrottleStatusB\x06\n\x04rows"\x86\x01\n$BatchCreateReadSessionStreamsRequest\x12\x43\n\x07session\x18\x01 \x01(\x0b\x32\x32.google.cloud.bigquery.storage.v1beta1.ReadSession\x12\x19\n\x11requested_streams\x18\x02 \x01(\x05"g\n%BatchCreateReadSessionStreamsResponse\x12>\n\x07streams\x18\x01 \x03(\x0b\x32-.google.cloud.bigquery.storage.v1beta1.Stream"V\n\x15\x46inalizeStreamRequest\x12=\n\x06stream\x18\x02 \x01(\x0b\x32-.google.cloud.bigquery.storage.v1beta1.Stream"`\n\x16SplitReadStreamRequest\x12\x46\n\x0foriginal_stream\x18\x01 \x01(\x0b\x32-.google.cloud.bigquery.storage.v1beta1.Stream"\xa9\x01\n\x17SplitReadStreamResponse\x12\x45\n\x0eprimary_stream\x18\x01 \x01(\x0b\x32-.google.cloud.bigquery.storage.v1beta1.Stream\x12G\n\x10remainder_stream\x18\x02 \x01(\x0b\x32-.google.cloud.bigquery.storage.v1beta1.Stream*>\n\nDataFormat\x12\x1b\n\x17\x44\x41TA_FORMAT_UNSPECIFIED\x10\x00\x12\x08\n\x04\x41VRO\x10\x01\x12\t\n\x05\x41RROW\x10\x03\x32\xc7\x08\n\x0f\x42igQueryStorage\x12\x87\x02\n\x11\x43reateReadSession\x12?.google.cloud.bigquery.storage.v1beta1.CreateReadSessionRequest\x1a\x32.google.cloud.bigquery.storage.v1beta1.ReadSession"}\x82\xd3\xe4\x93\x02w"0/v1beta1/{table_reference.project_id=projects/*}:\x01*Z@";/v1beta1/{table_reference.dataset_id=projects/*/datasets/*}:\x01*\x12\xc0\x01\n\x08ReadRows\x12\x36.google.cloud.bigquery.storage.v1beta1.ReadRowsRequest\x1a\x37.google.cloud.bigquery.storage.v1beta1.ReadRowsResponse"A\x82\xd3\xe4\x93\x02;\x12\x39/v1beta1/{read_position.stream.name=projects/*/streams/*}0\x01\x12\xf4\x01\n\x1d\x42\x61tchCreateReadSessionStreams\x12K.google.cloud.bigquery.storage.v1beta1.BatchCreateReadSessionStreamsRequest\x1aL.google.cloud.bigquery.storage.v1beta1.BatchCreateReadSessionStreamsResponse"8\x82\xd3\xe4\x93\x02\x32"-/v1beta1/{session.name=projects/*/sessions/*}:\x01*\x12\x9e\x01\n\x0e\x46inalizeStream\x12<.google.cloud.bigquery.storage.v1beta1.FinalizeStreamRequest\x1a\x16.google.protobuf.Empty"6\x82\xd3\xe4\x93\x02\x30"+/v1beta1/{stream.name=projects/*/streams/*}:\x01*\x12\xce\x01\n\x0fSplitReadStream\x12=.google.cloud.bigquery.storage.v1beta1.SplitReadStreamRequest\x1a>.google.cloud.bigquery.storage.v1beta1.SplitReadStreamResponse"<\x82\xd3\xe4\x93\x02\x36\x12\x34/v1beta1/{original_stream.name=projects/*/streams/*}By\n)com.google.cloud.bigquery.storage.v1beta1ZLgoogle.golang.org/genproto/googleapis/cloud/bigquery/storage/v1beta1;storageb\x06proto3'
     ),
     dependencies=[
         google_dot_api_dot_annotations__pb2.DESCRIPTOR,
         google_dot_api_dot_resource__pb2.DESCRIPTOR,
+        google_dot_cloud_dot_bigquery_dot_storage__v1beta1_dot_proto_dot_arrow__pb2.DESCRIPTOR,
         google_dot_cloud_dot_bigquery_dot_storage__v1beta1_dot_proto_dot_avro__pb2.DESCRIPTOR,
         google_dot_cloud_dot_bigquery_dot_storage__v1beta1_dot_proto_dot_read__options__pb2.DESCRIPTOR,
         google_dot_cloud_dot_bigquery_dot_storage__v1beta1_dot_proto_dot_table__reference__pb2.DESCRIPTOR,
@@ -67,17 +71,21 @@ _DATAFORMAT = _descriptor.EnumDescriptor(
         _descriptor.EnumValueDescriptor(
             name="AVRO", index=1, number=1, serialized_options=None, type=None
         ),
+        _descriptor.EnumValueDescriptor(
+            name="ARROW", index=2, number=3, serialized_options=None, type=None
+        ),
     ],
     containing_type=None,
     serialized_options=None,
-    serialized_start=2345,
-    serialized_end=2396,
+    serialized_start=2565,
+    serialized_end=2627,
 )
 _sym_db.RegisterEnumDescriptor(_DATAFORMAT)
 
 DataFormat = enum_type_wrapper.EnumTypeWrapper(_DATAFORMAT)
 DATA_FORMAT_UNSPECIFIED = 0
 AVRO = 1
+ARROW = 3
 
 
 _STREAM = _descriptor.Descriptor(
@@ -132,8 +140,8 @@ _STREAM = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=406,
-    serialized_end=447,
+    serialized_start=463,
+    serialized_end=504,
 )
 
 
@@ -189,8 +197,8 @@ _STREAMPOSITION = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=449,
-    serialized_end=544,
+    serialized_start=506,
+    serialized_end=601,
 )
 
 
@@ -255,10 +263,28 @@ _READSESSION = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
+        _descriptor.FieldDescriptor(
+            name="arrow_schema",
+            full_name="google.cloud.bigquery.storage.v1beta1.ReadSession.arrow_schema",
+            index=3,
+            number=6,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
         _descriptor.FieldDescriptor(
             name="streams",
             full_name="google.cloud.bigquery.storage.v1beta1.ReadSession.streams",
-            index=3,
+            index=4,
             number=4,
             type=11,
             cpp_type=10,
@@ -276,7 +302,7 @@ _READSESSION = _descriptor.Descriptor(
         _descriptor.FieldDescriptor(
             name="table_reference",
             full_name="google.cloud.bigquery.storage.v1beta1.ReadSession.table_reference",
-            index=4,
+            index=5,
             number=7,
             type=11,
             cpp_type=10,
@@ -294,7 +320,7 @@ _READSESSION = _descriptor.Descriptor(
         _descriptor.FieldDescriptor(
             name="table_modifiers",
             full_name="google.cloud.bigquery.storage.v1beta1.ReadSession.table_modifiers",
-            index=5,
+            index=6,
             number=8,
             type=11,
             cpp_type=10,
@@ -326,8 +352,8 @@ _READSESSION = _descriptor.Descriptor(
             fields=[],
         )
     ],
-    serialized_start=547,
-    serialized_end=931,
+    serialized_start=604,
+    serialized_end=1064,
 )
 
 
@@ -455,8 +481,8 @@ _CREATEREADSESSIONREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=934,
-    serialized_end=1309,
+    serialized_start=1067,
+    serialized_end=1442,
 )
 
 
@@ -494,8 +520,8 @@ _READROWSREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1311,
-    serialized_end=1406,
+    serialized_start=1444,
+    serialized_end=1539,
 )
 
 
@@ -533,8 +559,8 @@ _STREAMSTATUS = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1408,
-    serialized_end=1451,
+    serialized_start=1541,
+    serialized_end=1584,
 )
 
 
@@ -572,8 +598,8 @@ _THROTTLESTATUS = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1453,
-    serialized_end=1495,
+    serialized_start=1586,
+    serialized_end=1628,
 )
 
 
@@ -602,10 +628,28 @@ _READROWSRESPONSE = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
+        _descriptor.FieldDescriptor(
+            name="arrow_record_batch",
+            full_name="google.cloud.bigquery.storage.v1beta1.ReadRowsResponse.arrow_record_batch",
+            index=1,
+            number=4,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
         _descriptor.FieldDescriptor(
             name="status",
             full_name="google.cloud.bigquery.storage.v1beta1.ReadRowsResponse.status",
-            index=1,
+            index=2,
             number=2,
             type=11,
             cpp_type=10,
@@ -623,7 +667,7 @@ _READROWSRESPONSE = _descriptor.Descriptor(
         _descriptor.FieldDescriptor(
             name="throttle_status",
             full_name="google.cloud.bigquery.storage.v1beta1.ReadRowsResponse.throttle_status",
-            index=2,
+            index=3,
             number=5,
             type=11,
             cpp_type=10,
@@ -655,8 +699,8 @@ _READROWSRESPONSE = _descriptor.Descriptor(
             fields=[],
         )
     ],
-    serialized_start=1498,
-    serialized_end=1743,
+    serialized_start=1631,
+    serialized_end=1963,
 )
 
 
@@ -712,8 +756,8 @@ _BATCHCREATEREADSESSIONSTREAMSREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1746,
-    serialized_end=1880,
+    serialized_start=1966,
+    serialized_end=2100,
 )
 
 
@@ -751,8 +795,8 @@ _BATCHCREATEREADSESSIONSTREAMSRESPONSE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1882,
-    serialized_end=1985,
+    serialized_start=2102,
+    serialized_end=2205,
 )
 
 
@@ -790,8 +834,8 @@ _FINALIZESTREAMREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1987,
-    serialized_end=2073,
+    serialized_start=2207,
+    serialized_end=2293,
 )
 
 
@@ -829,8 +873,8 @@ _SPLITREADSTREAMREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2075,
-    serialized_end=2171,
+    serialized_start=2295,
+    serialized_end=2391,
 )
 
 
@@ -886,8 +930,8 @@ _SPLITREADSTREAMRESPONSE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2174,
-    serialized_end=2343,
+    serialized_start=2394,
+    serialized_end=2563,
 )
 
 _STREAMPOSITION.fields_by_name["stream"].message_type = _STREAM
@@ -899,6 +943,11 @@ _READSESSION.fields_by_name[
 ].message_type = (
     google_dot_cloud_dot_bigquery_dot_storage__v1beta1_dot_proto_dot_avro__pb2._AVROSCHEMA
 )
+_READSESSION.fields_by_name[
+    "arrow_schema"
+].message_type = (
+    google_dot_cloud_dot_bigquery_dot_storage__v1beta1_dot_proto_dot_arrow__pb2._ARROWSCHEMA
+)
 _READSESSION.fields_by_name["streams"].message_type = _STREAM
 _READSESSION.fields_by_name[
     "table_reference"
@@ -916,6 +965,12 @@ _READSESSION.oneofs_by_name["schema"].fields.append(
 _READSESSION.fields_by_name[
     "avro_schema"
 ].containing_oneof = _READSESSION.oneofs_by_name["schema"]
+_READSESSION.oneofs_by_name["schema"].fields.append(
+    _READSESSION.fields_by_name["arrow_schema"]
+)
+_READSESSION.fields_by_name[
+    "arrow_schema"
+].containing_oneof = _READSESSION.oneofs_by_name["schema"]
 _CREATEREADSESSIONREQUEST.fields_by_name[
     "table_reference"
 ].message_type = (
@@ -938,6 +993,11 @@ _READROWSRESPONSE.fields_by_name[
 ].message_type = (
     google_dot_cloud_dot_bigquery_dot_storage__v1beta1_dot_proto_dot_avro__pb2._AVROROWS
 )
+_READROWSRESPONSE.fields_by_name[
+    "arrow_record_batch"
+].message_type = (
+    google_dot_cloud_dot_bigquery_dot_storage__v1beta1_dot_proto_dot_arrow__pb2._ARROWRECORDBATCH
+)
 _READROWSRESPONSE.fields_by_name["status"].message_type = _STREAMSTATUS
 _READROWSRESPONSE.fields_by_name["throttle_status"].message_type = _THROTTLESTATUS
 _READROWSRESPONSE.oneofs_by_name["rows"].fields.append(
@@ -946,6 +1006,12 @@ _READROWSRESPONSE.oneofs_by_name["rows"].fields.append(
 _READROWSRESPONSE.fields_by_name[
     "avro_rows"
 ].containing_oneof = _READROWSRESPONSE.oneofs_by_name["rows"]
+_READROWSRESPONSE.oneofs_by_name["rows"].fields.append(
+    _READROWSRESPONSE.fields_by_name["arrow_record_batch"]
+)
+_READROWSRESPONSE.fields_by_name[
+    "arrow_record_batch"
+].containing_oneof = _READROWSRESPONSE.oneofs_by_name["rows"]
 _BATCHCREATEREADSESSIONSTREAMSREQUEST.fields_by_name[
     "session"
 ].message_type = _READSESSION
@@ -1037,6 +1103,8 @@ ReadSession = _reflection.GeneratedProtocolMessageType(
           will only contain the selected fields.
       avro_schema:
           Avro schema.
+      arrow_schema:
+          Arrow schema.
       streams:
           Streams associated with this session.
       table_reference:
@@ -1166,6 +1234,8 @@ ReadRowsResponse = _reflection.GeneratedProtocolMessageType(
           creation.
       avro_rows:
           Serialized row data in AVRO format.
+      arrow_record_batch:
+          Serialized row data in Arrow RecordBatch format.
       status:
           Estimated stream statistics.
       throttle_status:
@@ -1287,8 +1357,8 @@ _BIGQUERYSTORAGE = _descriptor.ServiceDescriptor(
     file=DESCRIPTOR,
     index=0,
     serialized_options=None,
-    serialized_start=2399,
-    serialized_end=3494,
+    serialized_start=2630,
+    serialized_end=3725,
     methods=[
         _descriptor.MethodDescriptor(
             name="CreateReadSession",
@@ -14,8 +14,8 @@
 
 from __future__ import absolute_import
 
-import collections
 import json
+import operator
 
 try:
     import fastavro
@@ -27,6 +27,11 @@ try:
     import pandas
 except ImportError:  # pragma: NO COVER
     pandas = None
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
 import six
 
 from google.cloud.bigquery_storage_v1beta1 import types
@@ -35,6 +40,18 @@ from google.cloud.bigquery_storage_v1beta1 import types
 _STREAM_RESUMPTION_EXCEPTIONS = (google.api_core.exceptions.ServiceUnavailable,)
 _FASTAVRO_REQUIRED = "fastavro is required to parse Avro blocks"
 _PANDAS_REQUIRED = "pandas is required to create a DataFrame"
+_PYARROW_REQUIRED = "pyarrow is required to parse Arrow record batches"
+_ARROW_FORMAT_REQUIRED = (
+    "to_arrow requires a read session using the Arrow data format. Pass "
+    "format_=DataFormat.ARROW to create_read_session."
+)
+_AVRO_TO_PANDAS_DTYPES = {
+    "boolean": "bool",
+    "double": "float64",
+    "float": "float32",
+    "int": "int32",
+    "long": "int64",
+}
 
 
 class ReadRowsStream(object):
@@ -44,11 +61,17 @@ class ReadRowsStream(object):
     :class:`~google.cloud.bigquery_storage_v1beta1.types.ReadRowsResponse`.
     Iterate over it to fetch all row blocks.
 
-    If the fastavro library is installed, use the
+    If the fastavro library (for Avro read sessions) or the pyarrow library
+    (for Arrow read sessions) is installed, use the
     :func:`~google.cloud.bigquery_storage_v1beta1.reader.ReadRowsStream.rows()`
     method to parse all blocks into a stream of row dictionaries.
 
-    If the pandas and fastavro libraries are installed, use the
+    If the pyarrow library is installed, use the
+    :func:`~google.cloud.bigquery_storage_v1beta1.reader.ReadRowsStream.to_arrow()`
+    method to parse all blocks of an Arrow read session into a
+    :class:`pyarrow.Table`.
+
+    If the pandas library is also installed, use the
     :func:`~google.cloud.bigquery_storage_v1beta1.reader.ReadRowsStream.to_dataframe()`
     method to parse all blocks into a :class:`pandas.DataFrame`.
     """
@@ -111,7 +134,7 @@ class ReadRowsStream(object):
         while True:
             try:
                 for block in self._wrapped:
-                    rowcount = block.avro_rows.row_count
+                    rowcount = _block_row_count(block)
                     self._position.offset += rowcount
                     yield block
 
@@ -131,8 +154,8 @@ class ReadRowsStream(object):
     def rows(self, read_session):
         """Iterate over all rows in the stream.
 
-        This method requires the fastavro library in order to parse row
-        blocks.
+        This method requires the fastavro library in order to parse Avro row
+        blocks, or the pyarrow library to parse Arrow record batches.
 
         .. warning::
             DATETIME columns are not supported. They are currently parsed as
@@ -150,16 +173,38 @@ class ReadRowsStream(object):
             Iterable[Mapping]:
                 A sequence of rows, represented as dictionaries.
         """
-        if fastavro is None:
-            raise ImportError(_FASTAVRO_REQUIRED)
-
         return ReadRowsIterable(self, read_session)
 
+    def to_arrow(self, read_session):
+        """Create a :class:`pyarrow.Table` of all rows in the stream.
+
+        This method requires the pyarrow library and a stream using the Arrow
+        format.
+
+        Args:
+            read_session ( \
+                ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
+            ):
+                The read session associated with this read rows stream. This
+                contains the schema, which is required to parse the data
+                blocks.
+
+        Returns:
+            pyarrow.Table:
+                A table of all rows in the stream.
+
+        Raises:
+            ValueError:
+                If the read session does not use the Arrow data format.
+        """
+        return self.rows(read_session).to_arrow()
+
     def to_dataframe(self, read_session, dtypes=None):
         """Create a :class:`pandas.DataFrame` of all rows in the stream.
 
         This method requires the pandas libary to create a data frame and the
-        fastavro library to parse row blocks.
+        fastavro library to parse Avro row blocks (or the pyarrow library to
+        parse Arrow record batches).
 
         .. warning::
             DATETIME columns are not supported. They are currently parsed as
@@ -184,8 +229,6 @@ class ReadRowsStream(object):
             pandas.DataFrame:
                 A data frame of all rows in the stream.
         """
-        if fastavro is None:
-            raise ImportError(_FASTAVRO_REQUIRED)
         if pandas is None:
             raise ImportError(_PANDAS_REQUIRED)
 
@@ -210,6 +253,7 @@ class ReadRowsIterable(object):
         self._status = None
         self._reader = reader
         self._read_session = read_session
+        self._stream_parser = _StreamParser.from_read_session(read_session)
 
     @property
     def total_rows(self):
@@ -229,10 +273,9 @@ class ReadRowsIterable(object):
         """
         # Each page is an iterator of rows. But also has num_items, remaining,
         # and to_dataframe.
-        avro_schema, column_names = _avro_schema(self._read_session)
         for block in self._reader:
             self._status = block.status
-            yield ReadRowsPage(avro_schema, column_names, block)
+            yield ReadRowsPage(self._stream_parser, block)
 
     def __iter__(self):
         """Iterator for each row in all pages."""
@@ -265,56 +308,84 @@ class ReadRowsIterable(object):
         """
         if pandas is None:
             raise ImportError(_PANDAS_REQUIRED)
+        if dtypes is None:
+            dtypes = {}
+
+        # Arrow record batches can be combined into a table without copying,
+        # and the whole table converted at once, which avoids the copies made
+        # by pandas.concat.
+        if isinstance(self._stream_parser, _ArrowStreamParser):
+            df = self.to_arrow().to_pandas()
+            for column in dtypes:
+                df[column] = pandas.Series(df[column], dtype=dtypes[column])
+            return df
 
         frames = []
         for page in self.pages:
             frames.append(page.to_dataframe(dtypes=dtypes))
         return pandas.concat(frames)
 
+    def to_arrow(self):
+        """Create a :class:`pyarrow.Table` of all rows in the stream.
+
+        This method requires the pyarrow library and a stream using the Arrow
+        format.
+
+        Returns:
+            pyarrow.Table:
+                A table of all rows in the stream.
+
+        Raises:
+            ValueError:
+                If the read session does not use the Arrow data format.
+        """
+        record_batches = []
+        for page in self.pages:
+            record_batches.append(page.to_arrow())
+
+        if record_batches:
+            return pyarrow.Table.from_batches(record_batches)
+
+        # No data, return an empty Table.
+        return self._stream_parser.empty_table()
+
 
 class ReadRowsPage(object):
     """An iterator of rows from a read session block.
 
     Args:
-        avro_schema (fastavro.schema):
-            A parsed Avro schema, using :func:`fastavro.schema.parse_schema`
-        column_names (Tuple[str]]):
-            A read session's column names (in requested order).
-        block (google.cloud.bigquery_storage_v1beta1.types.ReadRowsResponse):
+        stream_parser (google.cloud.bigquery_storage_v1beta1.reader._StreamParser):
+            A helper for parsing messages into rows.
+        message (google.cloud.bigquery_storage_v1beta1.types.ReadRowsResponse):
             A block of data from a read rows stream.
     """
 
     # This class is modeled after google.api_core.page_iterator.Page and aims
     # to provide API compatibility where possible.
 
-    def __init__(self, avro_schema, column_names, block):
-        self._avro_schema = avro_schema
-        self._column_names = column_names
-        self._block = block
+    def __init__(self, stream_parser, message):
+        self._stream_parser = stream_parser
+        self._message = message
         self._iter_rows = None
-        self._num_items = None
-        self._remaining = None
+        self._num_items = _block_row_count(message)
+        self._remaining = self._num_items
 
-    def _parse_block(self):
-        """Parse metadata and rows from the block only once."""
+    def _parse_rows(self):
+        """Parse rows from the message only once."""
         if self._iter_rows is not None:
             return
 
-        rows = _avro_rows(self._block, self._avro_schema)
-        self._num_items = self._block.avro_rows.row_count
-        self._remaining = self._block.avro_rows.row_count
+        rows = self._stream_parser.to_rows(self._message)
         self._iter_rows = iter(rows)
 
     @property
     def num_items(self):
         """int: Total items in the page."""
-        self._parse_block()
         return self._num_items
 
     @property
     def remaining(self):
         """int: Remaining items in the page."""
-        self._parse_block()
         return self._remaining
 
     def __iter__(self):
@@ -323,7 +394,7 @@ class ReadRowsPage(object):
 
     def next(self):
         """Get the next row in the page."""
-        self._parse_block()
+        self._parse_rows()
         if self._remaining > 0:
             self._remaining -= 1
         return six.next(self._iter_rows)
@@ -331,11 +402,24 @@ class ReadRowsPage(object):
     # Alias needed for Python 2/3 support.
     __next__ = next
 
+    def to_arrow(self):
+        """Create a :class:`pyarrow.RecordBatch` of rows in the page.
+
+        This method requires the pyarrow library and a stream using the Arrow
+        format.
+
+        Returns:
+            pyarrow.RecordBatch:
+                Rows from the message, as an Arrow record batch.
+        """
+        return self._stream_parser.to_arrow(self._message)
+
     def to_dataframe(self, dtypes=None):
         """Create a :class:`pandas.DataFrame` of rows in the page.
 
         This method requires the pandas libary to create a data frame and the
-        fastavro library to parse row blocks.
+        fastavro library to parse Avro row blocks (or the pyarrow library to
+        parse Arrow record batches).
 
         .. warning::
             DATETIME columns are not supported. They are currently parsed as
@@ -360,15 +444,193 @@ class ReadRowsPage(object):
         if dtypes is None:
             dtypes = {}
 
-        columns = collections.defaultdict(list)
-        for row in self:
-            for column in row:
-                columns[column].append(row[column])
-        for column in dtypes:
-            columns[column] = pandas.Series(columns[column], dtype=dtypes[column])
+        if self._iter_rows is not None:
+            # Some rows have already been read. Only include the rest.
+            return self._stream_parser.rows_to_dataframe(self._drain_rows(), dtypes)
+
+        self._remaining = 0
+        return self._stream_parser.to_dataframe(self._message, dtypes)
+
+    def _drain_rows(self):
+        """Yield all remaining rows in the page."""
+        for row in self._iter_rows:
+            self._remaining -= 1
+            yield row
+
+
+class _StreamParser(object):
+    """Parse the messages of a read rows stream.
+
+    Use :meth:`from_read_session` to construct a parser for the data format
+    of a read session. Subclasses implement :meth:`to_dataframe`,
+    :meth:`to_rows` and :meth:`rows_to_dataframe`; only data formats which
+    can be read as Arrow record batches implement :meth:`to_arrow` and
+    :meth:`empty_table`.
+    """
+
+    def to_arrow(self, message):
+        """Parse a message into a :class:`pyarrow.RecordBatch`.
+
+        Raises:
+            ValueError: If the data format is not Arrow.
+        """
+        raise ValueError(_ARROW_FORMAT_REQUIRED)
+
+    def to_dataframe(self, message, dtypes):
+        """Parse a message into a :class:`pandas.DataFrame`."""
+        raise NotImplementedError("Not implemented.")
+
+    def to_rows(self, message):
+        """Parse a message into an iterable of row dictionaries."""
+        raise NotImplementedError("Not implemented.")
+
+    def rows_to_dataframe(self, rows, dtypes):
+        """Create a :class:`pandas.DataFrame` from an iterable of row
+        dictionaries."""
+        raise NotImplementedError("Not implemented.")
+
+    def empty_table(self):
+        """Create an empty :class:`pyarrow.Table` with the stream's schema.
+
+        Raises:
+            ValueError: If the data format is not Arrow.
+        """
+        raise ValueError(_ARROW_FORMAT_REQUIRED)
+
+    @staticmethod
+    def from_read_session(read_session):
+        """Create a parser for the data format of a read session.
+
+        Args:
+            read_session ( \
+                ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
+            ):
+                The read session associated with the stream.
+
+        Returns:
+            google.cloud.bigquery_storage_v1beta1.reader._StreamParser:
+                A parser for the messages in the read session's streams.
+        """
+        if read_session.WhichOneof("schema") == "arrow_schema":
+            return _ArrowStreamParser(read_session)
+
+        # Avro is the default data format.
+        return _AvroStreamParser(read_session)
+
+
+class _AvroStreamParser(_StreamParser):
+    """Parse Avro row blocks.
+
+    Args:
+        read_session ( \
+            ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
+        ):
+            A read session with an Avro schema.
+    """
+
+    def __init__(self, read_session):
+        if fastavro is None:
+            raise ImportError(_FASTAVRO_REQUIRED)
+
+        self._read_session = read_session
+        self._avro_schema = None
+        self._column_names = None
+
+    def _parse_avro_schema(self):
+        """Parse the read session's schema only once."""
+        if self._avro_schema is not None:
+            return
+
+        self._avro_schema, self._column_names = _avro_schema(self._read_session)
+
+    def to_rows(self, message):
+        self._parse_avro_schema()
+        return _avro_rows(message, self._avro_schema)
+
+    def to_dataframe(self, message, dtypes):
+        return self.rows_to_dataframe(self.to_rows(message), dtypes)
+
+    def rows_to_dataframe(self, rows, dtypes):
+        self._parse_avro_schema()
+
+        # Columns with a fixed-width, non-nullable Avro type can be built
+        # directly with the correct dtype, skipping pandas type inference.
+        column_dtypes = _avro_column_dtypes(self._avro_schema)
+        column_dtypes.update(dtypes)
+
+        columns = {}
+        for name, values in zip(
+            self._column_names, _rows_to_columns(rows, self._column_names)
+        ):
+            columns[name] = pandas.Series(values, dtype=column_dtypes.get(name))
         return pandas.DataFrame(columns, columns=self._column_names)
 
 
+class _ArrowStreamParser(_StreamParser):
+    """Parse Arrow record batches.
+
+    Args:
+        read_session ( \
+            ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
+        ):
+            A read session with an Arrow schema.
+    """
+
+    def __init__(self, read_session):
+        if pyarrow is None:
+            raise ImportError(_PYARROW_REQUIRED)
+
+        self._read_session = read_session
+        self._schema = None
+
+    def _parse_arrow_schema(self):
+        """Parse the read session's schema only once."""
+        if self._schema is not None:
+            return
+
+        self._schema = pyarrow.ipc.read_schema(
+            pyarrow.py_buffer(self._read_session.arrow_schema.serialized_schema)
+        )
+
+    def to_arrow(self, message):
+        self._parse_arrow_schema()
+
+        # py_buffer wraps the message bytes, so the record batch's columns
+        # reference the message rather than copying it.
+        return pyarrow.ipc.read_record_batch(
+            pyarrow.py_buffer(message.arrow_record_batch.serialized_record_batch),
+            self._schema,
+        )
+
+    def to_rows(self, message):
+        record_batch = self.to_arrow(message)
+        column_names = record_batch.schema.names
+
+        # Convert whole columns at once, then zip the values into rows.
+        columns = [column.to_pylist() for column in record_batch.columns]
+        for values in zip(*columns):
+            yield dict(zip(column_names, values))
+
+    def to_dataframe(self, message, dtypes):
+        df = self.to_arrow(message).to_pandas()
+        for column in dtypes:
+            df[column] = pandas.Series(df[column], dtype=dtypes[column])
+        return df
+
+    def rows_to_dataframe(self, rows, dtypes):
+        self._parse_arrow_schema()
+        column_names = self._schema.names
+
+        columns = {}
+        for name, values in zip(column_names, _rows_to_columns(rows, column_names)):
+            columns[name] = pandas.Series(values, dtype=dtypes.get(name))
+        return pandas.DataFrame(columns, columns=column_names)
+
+    def empty_table(self):
+        self._parse_arrow_schema()
+        return self._schema.empty_table()
+
+
 def _avro_schema(read_session):
     """Extract and parse Avro schema from a read session.
 
@@ -407,15 +669,98 @@ def _avro_rows(block, avro_schema):
             A sequence of rows, represented as dictionaries.
     """
     blockio = six.BytesIO(block.avro_rows.serialized_binary_rows)
-    while True:
-        # Loop in a while loop because schemaless_reader can only read
-        # a single record.
-        try:
-            # TODO: Parse DATETIME into datetime.datetime (no timezone),
-            #       instead of as a string.
-            yield fastavro.schemaless_reader(blockio, avro_schema)
-        except StopIteration:
-            break  # Finished with block
+    # The block header includes the row count, so there is no need to probe
+    # for the end of the buffer. schemaless_reader can only read a single
+    # record per call.
+    for _ in six.moves.range(block.avro_rows.row_count):
+        # TODO: Parse DATETIME into datetime.datetime (no timezone),
+        #       instead of as a string.
+        yield fastavro.schemaless_reader(blockio, avro_schema)
+
+
+def _rows_to_columns(rows, column_names):
+    """Append the values of each row to columns, as the rows are decoded.
+
+    Each row is discarded once its values are appended, so only the columns
+    are kept in memory, rather than every row as well. With
+    :func:`_avro_rows`, this decodes a block straight into columns.
+
+    fastavro has no reader for a block of schemaless records, so each row is
+    still decoded into a dictionary by its own call to
+    :func:`fastavro.schemaless_reader`.
+
+    Args:
+        rows (Iterable[Mapping]):
+            Rows, represented as dictionaries.
+        column_names (Tuple[str]):
+            The names of the columns to extract, in order.
+
+    Returns:
+        List[List]:
+            The values of each column, in the order of ``column_names``.
+    """
+    columns = [[] for _ in column_names]
+    if not column_names:
+        return columns
+
+    if len(column_names) == 1:
+        # itemgetter with a single key returns a scalar, not a tuple.
+        name = column_names[0]
+        append = columns[0].append
+        for row in rows:
+            append(row[name])
+        return columns
+
+    getter = operator.itemgetter(*column_names)
+    appends = [column.append for column in columns]
+    for row in rows:
+        for append, value in zip(appends, getter(row)):
+            append(value)
+    return columns
+
+
+def _avro_column_dtypes(avro_schema):
+    """Find the pandas dtypes of columns with fixed-width Avro types.
+
+    Args:
+        avro_schema (fastavro.schema):
+            A parsed Avro schema, using :func:`fastavro.schema.parse_schema`
+
+    Returns:
+        Dict[str, str]:
+            A mapping from column name to dtype for each non-nullable column
+            with a primitive Avro type that maps directly to a NumPy dtype.
+            Other columns use pandas type inference.
+    """
+    dtypes = {}
+    for field in avro_schema.get("fields", ()):
+        avro_type = field["type"]
+        # Nullable columns have a union type (a list), and logical types are
+        # described by a dictionary. Neither have a fixed-width dtype.
+        if not isinstance(avro_type, six.string_types):
+            continue
+
+        dtype = _AVRO_TO_PANDAS_DTYPES.get(avro_type)
+        if dtype is not None:
+            dtypes[field["name"]] = dtype
+    return dtypes
+
+
+def _block_row_count(block):
+    """Get the number of rows in a stream block.
+
+    Args:
+        block ( \
+            ~google.cloud.bigquery_storage_v1beta1.types.ReadRowsResponse \
+        ):
+            A block of rows in either the Avro or Arrow data format.
+
+    Returns:
+        int: The number of rows in the block.
+    """
+    if block.WhichOneof("rows") == "arrow_record_batch":
+        return block.arrow_record_batch.row_count
+    return block.avro_rows.row_count
 
 
 def _copy_stream_position(position):
@@ -0,0 +1,157 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Read Arrow sessions end-to-end against an in-process gRPC server."""
+
+from concurrent import futures
+
+import grpc
+import pandas
+import pyarrow
+import pytest
+
+from google.cloud.bigquery_storage_v1beta1 import enums
+from google.cloud.bigquery_storage_v1beta1 import types
+from google.cloud.bigquery_storage_v1beta1.proto import storage_pb2_grpc
+
+
+ARROW_SCHEMA = pyarrow.schema(
+    [
+        pyarrow.field("int_col", pyarrow.int64()),
+        pyarrow.field("str_col", pyarrow.utf8()),
+    ]
+)
+BLOCKS = [
+    [(1, u"one"), (2, u"two")],
+    [(3, u"three")],
+    [(4, None), (5, u"five"), (6, u"six")],
+]
+
+
+def _block_to_response(block):
+    int_values, str_values = zip(*block)
+    record_batch = pyarrow.RecordBatch.from_arrays(
+        [
+            pyarrow.array(int_values, type=pyarrow.int64()),
+            pyarrow.array(str_values, type=pyarrow.utf8()),
+        ],
+        ARROW_SCHEMA.names,
+    )
+    response = types.ReadRowsResponse()
+    response.arrow_record_batch.serialized_record_batch = (
+        record_batch.serialize().to_pybytes()
+    )
+    response.arrow_record_batch.row_count = len(block)
+    return response
+
+
+class FakeBigQueryStorage(storage_pb2_grpc.BigQueryStorageServicer):
+    """Serve a single-stream Arrow read session from memory."""
+
+    def __init__(self):
+        self.read_rows_requests = []
+
+    def CreateReadSession(self, request, context):
+        session = types.ReadSession(name="projects/p/sessions/fake")
+        session.arrow_schema.serialized_schema = ARROW_SCHEMA.serialize().to_pybytes()
+        session.table_reference.CopyFrom(request.table_reference)
+        session.streams.add(name="projects/p/streams/fake")
+        return session
+
+    def ReadRows(self, request, context):
+        self.read_rows_requests.append(request)
+        rows_seen = 0
+        for block in BLOCKS:
+            if rows_seen >= request.read_position.offset:
+                yield _block_to_response(block)
+            rows_seen += len(block)
+
+
+@pytest.fixture()
+def fake_server():
+    servicer = FakeBigQueryStorage()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    storage_pb2_grpc.add_BigQueryStorageServicer_to_server(servicer, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    yield servicer, "localhost:{}".format(port)
+    server.stop(None)
+
+
+@pytest.fixture()
+def client_under_test(fake_server):
+    from google.cloud.bigquery_storage_v1beta1 import client
+    from google.cloud.bigquery_storage_v1beta1.gapic.transports import (
+        big_query_storage_grpc_transport,
+    )
+
+    _, address = fake_server
+    channel = grpc.insecure_channel(address)
+    transport = big_query_storage_grpc_transport.BigQueryStorageGrpcTransport(
+        channel=channel
+    )
+    yield client.BigQueryStorageClient(transport=transport)
+    channel.close()
+
+
+def _create_session(client):
+    table_reference = types.TableReference(
+        project_id="data-project-id", dataset_id="dataset_id", table_id="table_id"
+    )
+    return client.create_read_session(
+        table_reference, "projects/other-project", format_=enums.DataFormat.ARROW
+    )
+
+
+def test_to_arrow(fake_server, client_under_test):
+    session = _create_session(client_under_test)
+    position = types.StreamPosition(stream=session.streams[0])
+
+    table = client_under_test.read_rows(position).to_arrow(session)
+
+    assert table.schema.equals(ARROW_SCHEMA)
+    assert table.column("int_col").to_pylist() == [1, 2, 3, 4, 5, 6]
+    assert table.column("str_col").to_pylist() == [
+        u"one",
+        u"two",
+        u"three",
+        None,
+        u"five",
+        u"six",
+    ]
+
+
+def test_to_dataframe(fake_server, client_under_test):
+    session = _create_session(client_under_test)
+    position = types.StreamPosition(stream=session.streams[0])
+
+    df = client_under_test.read_rows(position).to_dataframe(session)
+
+    assert isinstance(df, pandas.DataFrame)
+    assert list(df.columns) == ["int_col", "str_col"]
+    assert list(df["int_col"]) == [1, 2, 3, 4, 5, 6]
+    assert df["int_col"].dtype.name == "int64"
+
+
+def test_rows_by_page(fake_server, client_under_test):
+    servicer, _ = fake_server
+    session = _create_session(client_under_test)
+    position = types.StreamPosition(stream=session.streams[0])
+
+    rows = client_under_test.read_rows(position).rows(session)
+    pages = list(rows.pages)
+
+    assert [page.num_items for page in pages] == [2, 1, 3]
+    assert list(pages[1]) == [{"int_col": 3, "str_col": u"three"}]
+    assert len(servicer.read_rows_requests) == 1
@@ -23,6 +23,7 @@ import fastavro
 import mock
 import pandas
 import pandas.testing
+import pyarrow
 import pytest
 import pytz
 import six
@@ -44,6 +45,18 @@ BQ_TO_AVRO_TYPES = {
     "time": {"type": "long", "logicalType": "time-micros"},
     "timestamp": {"type": "long", "logicalType": "timestamp-micros"},
 }
+BQ_TO_ARROW_TYPES = {
+    "int64": pyarrow.int64(),
+    "float64": pyarrow.float64(),
+    "bool": pyarrow.bool_(),
+    "numeric": pyarrow.decimal128(38, 9),
+    "string": pyarrow.utf8(),
+    "bytes": pyarrow.binary(),
+    "date": pyarrow.date32(),
+    "datetime": pyarrow.timestamp("us"),
+    "time": pyarrow.time64("us"),
+    "timestamp": pyarrow.timestamp("us", tz="UTC"),
+}
 SCALAR_COLUMNS = [
     {"name": "int_col", "type": "int64"},
     {"name": "float_col", "type": "float64"},
@@ -173,6 +186,46 @@ def _get_avro_bytes(rows, avro_schema):
     return avro_file.getvalue()
 
 
+def _bq_to_arrow_schema(bq_columns):
+    def bq_col_as_field(column):
+        name = column["name"]
+        type_ = BQ_TO_ARROW_TYPES[column["type"]]
+        mode = column.get("mode", "nullable").lower()
+
+        return pyarrow.field(name, type_, mode == "nullable")
+
+    return pyarrow.schema(bq_col_as_field(c) for c in bq_columns)
+
+
+def _bq_to_arrow_batches(bq_blocks, arrow_schema):
+    arrow_batches = []
+    for block in bq_blocks:
+        arrays = []
+        for name in arrow_schema.names:
+            arrays.append(
+                pyarrow.array(
+                    (row[name] for row in block),
+                    type=arrow_schema.field(name).type,
+                    size=len(block),
+                )
+            )
+        record_batch = pyarrow.RecordBatch.from_arrays(arrays, arrow_schema.names)
+
+        response = bigquery_storage_v1beta1.types.ReadRowsResponse()
+        response.arrow_record_batch.serialized_record_batch = (
+            record_batch.serialize().to_pybytes()
+        )
+        response.arrow_record_batch.row_count = len(block)
+        arrow_batches.append(response)
+    return arrow_batches
+
+
+def _generate_arrow_read_session(arrow_schema):
+    return bigquery_storage_v1beta1.types.ReadSession(
+        arrow_schema={"serialized_schema": arrow_schema.serialize().to_pybytes()}
+    )
+
+
 def test_rows_raises_import_error(mut, class_under_test, mock_client, monkeypatch):
     monkeypatch.setattr(mut, "fastavro", None)
     reader = class_under_test(
@@ -517,6 +570,247 @@ def test_to_dataframe_by_page(class_under_test, mock_client):
     )
 
 
+def test_to_dataframe_by_page_w_required_columns(class_under_test, mock_client):
+    bq_columns = [
+        {"name": "int_col", "type": "int64", "mode": "required"},
+        {"name": "float_col", "type": "float64", "mode": "required"},
+        {"name": "bool_col", "type": "bool", "mode": "required"},
+        {"name": "str_col", "type": "string", "mode": "required"},
+    ]
+    avro_schema = _bq_to_avro_schema(bq_columns)
+    read_session = _generate_read_session(avro_schema)
+    block = [
+        {"int_col": 123, "float_col": 1.5, "bool_col": True, "str_col": "abc"},
+        {"int_col": 456, "float_col": 2.5, "bool_col": False, "str_col": "def"},
+    ]
+    avro_blocks = _bq_to_avro_blocks([block], avro_schema)
+
+    reader = class_under_test(
+        avro_blocks, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+    page = next(iter(reader.rows(read_session).pages))
+    got = page.to_dataframe()
+
+    assert list(got.columns) == ["int_col", "float_col", "bool_col", "str_col"]
+    assert got["int_col"].dtype.name == "int64"
+    assert got["float_col"].dtype.name == "float64"
+    assert got["bool_col"].dtype.name == "bool"
+    assert list(got["int_col"]) == [123, 456]
+    assert page.remaining == 0
+
+
+def test_to_dataframe_by_page_w_partially_read_page(class_under_test, mock_client):
+    bq_columns = [{"name": "int_col", "type": "int64"}]
+    avro_schema = _bq_to_avro_schema(bq_columns)
+    read_session = _generate_read_session(avro_schema)
+    block = [{"int_col": 123}, {"int_col": None}, {"int_col": 456}]
+    avro_blocks = _bq_to_avro_blocks([block], avro_schema)
+
+    reader = class_under_test(
+        avro_blocks, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+    page = next(iter(reader.rows(read_session).pages))
+    assert next(page) == {"int_col": 123}
+    got = page.to_dataframe()
+
+    # Only the rows remaining in the page are included.
+    assert len(got.index) == 2
+    assert got["int_col"].isnull().tolist() == [True, False]
+    assert page.remaining == 0
+
+
+def test_rows_arrow_raises_import_error(
+    mut, class_under_test, mock_client, monkeypatch
+):
+    monkeypatch.setattr(mut, "pyarrow", None)
+    arrow_schema = _bq_to_arrow_schema(SCALAR_COLUMNS)
+    read_session = _generate_arrow_read_session(arrow_schema)
+    reader = class_under_test(
+        [], mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+
+    with pytest.raises(ImportError):
+        reader.rows(read_session)
+
+
+def test_rows_arrow_wo_fastavro(mut, class_under_test, mock_client, monkeypatch):
+    monkeypatch.setattr(mut, "fastavro", None)
+    arrow_schema = _bq_to_arrow_schema(SCALAR_COLUMNS)
+    read_session = _generate_arrow_read_session(arrow_schema)
+    arrow_batches = _bq_to_arrow_batches(SCALAR_BLOCKS, arrow_schema)
+    reader = class_under_test(
+        arrow_batches, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+
+    got = tuple(reader.rows(read_session))
+
+    expected = tuple(itertools.chain.from_iterable(SCALAR_BLOCKS))
+    assert got == expected
+
+
+def test_rows_arrow_w_reconnect(class_under_test, mock_client):
+    arrow_schema = _bq_to_arrow_schema(SCALAR_COLUMNS)
+    read_session = _generate_arrow_read_session(arrow_schema)
+    arrow_batches = _bq_to_arrow_batches(SCALAR_BLOCKS, arrow_schema)
+    mock_client.read_rows.return_value = iter(arrow_batches[1:])
+
+    reader = class_under_test(
+        _avro_blocks_w_unavailable(arrow_batches[:1]),
+        mock_client,
+        bigquery_storage_v1beta1.types.StreamPosition(),
+        {"metadata": {"test-key": "test-value"}},
+    )
+    got = tuple(reader.rows(read_session))
+
+    expected = tuple(itertools.chain.from_iterable(SCALAR_BLOCKS))
+    assert got == expected
+    mock_client.read_rows.assert_called_once_with(
+        bigquery_storage_v1beta1.types.StreamPosition(offset=2),
+        metadata={"test-key": "test-value"},
+    )
+
+
+def test_to_arrow_w_scalars(class_under_test, mock_client):
+    arrow_schema = _bq_to_arrow_schema(SCALAR_COLUMNS)
+    read_session = _generate_arrow_read_session(arrow_schema)
+    arrow_batches = _bq_to_arrow_batches(SCALAR_BLOCKS, arrow_schema)
+    reader = class_under_test(
+        arrow_batches, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+
+    got = reader.to_arrow(read_session)
+
+    assert got.schema.names == SCALAR_COLUMN_NAMES
+    assert got.num_rows == 3
+    assert got.column("int_col").to_pylist() == [123, 456, 789]
+
+
+def test_to_arrow_w_empty_stream(class_under_test, mock_client):
+    arrow_schema = _bq_to_arrow_schema(SCALAR_COLUMNS)
+    read_session = _generate_arrow_read_session(arrow_schema)
+    reader = class_under_test(
+        [], mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+
+    got = reader.to_arrow(read_session)
+
+    assert got.schema.names == SCALAR_COLUMN_NAMES
+    assert got.num_rows == 0
+
+
+def test_to_arrow_w_avro_session_raises(class_under_test, mock_client):
+    avro_schema = _bq_to_avro_schema(SCALAR_COLUMNS)
+    read_session = _generate_read_session(avro_schema)
+    avro_blocks = _bq_to_avro_blocks(SCALAR_BLOCKS, avro_schema)
+    reader = class_under_test(
+        avro_blocks, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+
+    with pytest.raises(ValueError, match="DataFormat.ARROW"):
+        reader.to_arrow(read_session)
+
+
+def test_to_arrow_w_empty_avro_stream_raises(class_under_test, mock_client):
+    avro_schema = _bq_to_avro_schema(SCALAR_COLUMNS)
+    read_session = _generate_read_session(avro_schema)
+    reader = class_under_test(
+        [], mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+
+    with pytest.raises(ValueError, match="DataFormat.ARROW"):
+        reader.to_arrow(read_session)
+
+
+def test_to_dataframe_arrow_w_scalars(class_under_test, mock_client):
+    arrow_schema = _bq_to_arrow_schema(SCALAR_COLUMNS)
+    read_session = _generate_arrow_read_session(arrow_schema)
+    arrow_batches = _bq_to_arrow_batches(SCALAR_BLOCKS, arrow_schema)
+    reader = class_under_test(
+        arrow_batches, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+
+    got = reader.to_dataframe(read_session, dtypes={"float_col": "float16"})
+
+    assert list(got.columns) == SCALAR_COLUMN_NAMES
+    assert list(got["int_col"]) == [123, 456, 789]
+    assert got["int_col"].dtype.name == "int64"
+    assert got["float_col"].dtype.name == "float16"
+    assert got["bool_col"].dtype.name == "bool"
+
+
+def test_to_dataframe_arrow_by_page(class_under_test, mock_client):
+    bq_columns = [
+        {"name": "int_col", "type": "int64"},
+        {"name": "bool_col", "type": "bool"},
+    ]
+    arrow_schema = _bq_to_arrow_schema(bq_columns)
+    read_session = _generate_arrow_read_session(arrow_schema)
+    bq_blocks = [
+        [{"int_col": 123, "bool_col": True}, {"int_col": 234, "bool_col": False}],
+        [{"int_col": 345, "bool_col": True}, {"int_col": 456, "bool_col": False}],
+    ]
+    arrow_batches = _bq_to_arrow_batches(bq_blocks, arrow_schema)
+    reader = class_under_test(
+        arrow_batches, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+    pages = iter(reader.rows(read_session).pages)
+
+    page1 = next(pages)
+    assert page1.num_items == 2
+    assert next(page1) == {"int_col": 123, "bool_col": True}
+    assert page1.remaining == 1
+    page1_df = page1.to_dataframe()
+    assert list(page1_df["int_col"]) == [234]
+    assert page1.remaining == 0
+
+    page2 = next(pages)
+    page2_df = page2.to_dataframe()
+    assert list(page2_df["int_col"]) == [345, 456]
+    assert list(page2_df["bool_col"]) == [True, False]
+    assert page2.remaining == 0
+    assert page2.to_arrow().num_rows == 2
+
+
+def test_rows_to_columns(mut):
+    rows = [{"a": 1, "b": "x", "c": 2.0}, {"a": 3, "b": "y", "c": 4.0}]
+    got = mut._rows_to_columns(rows, ("c", "a"))
+    assert got == [[2.0, 4.0], [1, 3]]
+
+
+def test_rows_to_columns_w_single_column(mut):
+    rows = [{"a": 1, "b": "x"}, {"a": 3, "b": "y"}]
+    got = mut._rows_to_columns(rows, ("b",))
+    assert got == [["x", "y"]]
+
+
+def test_rows_to_columns_w_no_rows(mut):
+    assert mut._rows_to_columns([], ("a", "b")) == [[], []]
+    assert mut._rows_to_columns([], ()) == []
+
+
+def test_rows_to_columns_w_iterator(mut):
+    rows = ({"a": index, "b": str(index)} for index in range(3))
+    got = mut._rows_to_columns(rows, ("a", "b"))
+    assert got == [[0, 1, 2], ["0", "1", "2"]]
+
+
+def test_avro_column_dtypes(mut):
+    avro_schema = fastavro.parse_schema(
+        _bq_to_avro_schema(
+            [
+                {"name": "req_int", "type": "int64", "mode": "required"},
+                {"name": "req_float", "type": "float64", "mode": "required"},
+                {"name": "req_bool", "type": "bool", "mode": "required"},
+                {"name": "req_str", "type": "string", "mode": "required"},
+                {"name": "req_ts", "type": "timestamp", "mode": "required"},
+                {"name": "null_int", "type": "int64"},
+            ]
+        )
+    )
+    got = mut._avro_column_dtypes(avro_schema)
+    assert got == {"req_int": "int64", "req_float": "float64", "req_bool": "bool"}
+
+
 def test_copy_stream_position(mut):
     read_position = bigquery_storage_v1beta1.types.StreamPosition(
         stream={"name": "test"}, offset=41
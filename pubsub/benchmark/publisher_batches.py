@@ -0,0 +1,126 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark for publishing to many topics with each batch class.
+
+Compares the thread-per-batch ``thread.Batch`` with ``scheduled.Batch``,
+reporting messages per second, the most threads alive at once, and the
+number of distinct threads seen. Publish requests are answered by a fake
+API after a simulated latency, so no network access or credentials are
+needed.
+"""
+
+import argparse
+import threading
+import time
+
+from google.auth import credentials
+
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher._batch import scheduled
+from google.cloud.pubsub_v1.publisher._batch import thread
+
+
+class FakeApi(object):
+    def __init__(self, latency):
+        self._latency = latency
+
+    def publish(self, topic, messages):
+        time.sleep(self._latency)
+        return types.PublishResponse(
+            message_ids=[str(index) for index in range(len(messages))]
+        )
+
+
+class ThreadSampler(object):
+    """Record the threads alive, on a background thread."""
+
+    def __init__(self, interval=0.005):
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run)
+        self.peak = 0
+        self.seen = set()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            alive = threading.enumerate()
+            self.peak = max(self.peak, len(alive))
+            self.seen.update(id(alive_thread) for alive_thread in alive)
+            time.sleep(self._interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stopped.set()
+        self._thread.join()
+
+
+def run(batch_class, num_topics, num_messages, max_latency, rpc_latency):
+    class Client(publisher.Client):
+        _batch_class = batch_class
+
+    client = Client(
+        batch_settings=types.BatchSettings(max_latency=max_latency),
+        credentials=credentials.AnonymousCredentials(),
+    )
+    client.api = FakeApi(rpc_latency)
+    topics = ["projects/bench/topics/topic-{:d}".format(i) for i in range(num_topics)]
+
+    with ThreadSampler() as sampler:
+        start = time.time()
+        futures = [
+            client.publish(topics[index % num_topics], b"x" * 100)
+            for index in range(num_messages)
+        ]
+        for future in futures:
+            future.result()
+        elapsed = time.time() - start
+
+    return num_messages / elapsed, sampler.peak, len(sampler.seen)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--topics", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--messages", type=int, default=50000)
+    parser.add_argument("--max-latency", type=float, default=0.05)
+    parser.add_argument("--rpc-latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    for num_topics in args.topics:
+        for name, batch_class in (
+            ("thread", thread.Batch),
+            ("scheduled", scheduled.Batch),
+        ):
+            rate, peak, seen = run(
+                batch_class,
+                num_topics,
+                args.messages,
+                args.max_latency,
+                args.rpc_latency,
+            )
+            print(
+                "{0}: {1} topics, {2:.0f} messages/sec, "
+                "{3} threads at peak, {4} threads seen".format(
+                    name, num_topics, rate, peak, seen
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import asyncio
+import logging
+import threading
+import time
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher._batch import base
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Batch(base.Batch):
+    """A batch of messages, which lives on an :mod:`asyncio` event loop.
+
+    Messages are added, and the batch is committed after ``max_latency``, by
+    the event loop, and the futures returned by :meth:`publish` are
+    :class:`asyncio.Future` objects which can be awaited. The batch must only
+    be used from the thread running the event loop.
+
+    The transport is synchronous, so the publish request is run in the
+    loop's default executor: one hand-off per batch, rather than per message.
+
+    Args:
+        client (~.pubsub_v1.PublisherClient): The publisher client used to
+            create this batch.
+        topic (str): The topic. The format for this is
+            ``projects/{project}/topics/{topic}``.
+        settings (~.pubsub_v1.types.BatchSettings): The settings for batch
+            publishing. These should be considered immutable once the batch
+            has been opened.
+        autocommit (bool): Whether to autocommit the batch when the time
+            has elapsed. Defaults to True unless ``settings.max_latency`` is
+            inf.
+        loop (asyncio.AbstractEventLoop): The event loop. Defaults to the
+            current event loop.
+    """
+
+    def __init__(self, client, topic, settings, autocommit=True, loop=None):
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        self._client = client
+        self._topic = topic
+        self._settings = settings
+        self._loop = loop
+
+        self._futures = []
+        self._messages = []
+        self._size = 0
+        self._status = base.BatchStatus.ACCEPTING_MESSAGES
+
+        # If max latency is specified, commit the batch when it is reached.
+        self._timer = None
+        if autocommit and self._settings.max_latency < float("inf"):
+            self._timer = loop.call_later(self._settings.max_latency, self.commit)
+
+    @staticmethod
+    def make_lock():
+        """Return a threading lock.
+
+        The publisher client only holds it briefly, while finding the batch
+        for a topic, so it does not block the event loop.
+
+        Returns:
+            _thread.Lock: A newly created lock.
+        """
+        return threading.Lock()
+
+    @property
+    def client(self):
+        """~.pubsub_v1.client.PublisherClient: A publisher client."""
+        return self._client
+
+    @property
+    def messages(self):
+        """Sequence: The messages currently in the batch."""
+        return self._messages
+
+    @property
+    def settings(self):
+        """Return the batch settings.
+
+        Returns:
+            ~.pubsub_v1.types.BatchSettings: The batch settings. These are
+                considered immutable once the batch has been opened.
+        """
+        return self._settings
+
+    @property
+    def size(self):
+        """Return the total size of all of the messages currently in the batch.
+
+        Returns:
+            int: The total size of all of the messages currently
+                 in the batch, in bytes.
+        """
+        return self._size
+
+    @property
+    def status(self):
+        """Return the status of this batch.
+
+        Returns:
+            str: The status of this batch. All statuses are human-readable,
+                all-lowercase strings.
+        """
+        return self._status
+
+    def commit(self):
+        """Start publishing all of the messages on the batch.
+
+        This method is non-blocking. The publish request is run in the
+        event loop's default executor, and the futures of the messages are
+        resolved on the event loop when it finishes.
+
+        If the current batch is **not** accepting messages, this method
+        does nothing.
+        """
+        if self._status != base.BatchStatus.ACCEPTING_MESSAGES:
+            return
+        self._status = base.BatchStatus.IN_PROGRESS
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        # Sanity check: If there are no messages, no-op.
+        if not self._messages:
+            _LOGGER.debug("No messages to publish, exiting commit")
+            self._status = base.BatchStatus.SUCCESS
+            return
+
+        start = time.time()
+        rpc = self._loop.run_in_executor(
+            None, self._client.api.publish, self._topic, self._messages
+        )
+        rpc.add_done_callback(lambda rpc: self._on_publish_done(rpc, start))
+
+    def _on_publish_done(self, rpc, start):
+        """Resolve the futures of the messages, once they are published.
+
+        Args:
+            rpc (asyncio.Future): The future of the publish request.
+            start (float): The time at which the request started.
+        """
+        _LOGGER.debug("gRPC Publish took %s seconds.", time.time() - start)
+
+        try:
+            response = rpc.result()
+        except Exception as exc:
+            # We failed to publish, set the exception on all futures. Any
+            # error must resolve them, not only API errors, or the callers
+            # would wait forever and their flow control reservations would
+            # never be released.
+            self._status = base.BatchStatus.ERROR
+            self._set_exception(exc)
+            _LOGGER.exception("Failed to publish %s messages.", len(self._futures))
+            return
+
+        if len(response.message_ids) == len(self._futures):
+            self._status = base.BatchStatus.SUCCESS
+            for message_id, future in zip(response.message_ids, self._futures):
+                # The caller may have cancelled its future.
+                if not future.done():
+                    future.set_result(message_id)
+        else:
+            # Sanity check: If the number of message IDs is not equal to
+            # the number of futures I have, then something went wrong.
+            self._status = base.BatchStatus.ERROR
+            self._set_exception(
+                exceptions.PublishError(
+                    "Some messages were not successfully published."
+                )
+            )
+            _LOGGER.error(
+                "Only %s of %s messages were published.",
+                len(response.message_ids),
+                len(self._futures),
+            )
+
+    def _set_exception(self, exception):
+        for future in self._futures:
+            if not future.done():
+                future.set_exception(exception)
+
+    def publish(self, message):
+        """Publish a single message.
+
+        Add the given message to this object; this will cause it to be
+        published once the batch either has enough messages or a sufficient
+        period of time has elapsed.
+
+        This method is called by :meth:`~.PublisherClient.publish`.
+
+        Args:
+            message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message.
+
+        Returns:
+            Optional[asyncio.Future]: A future which resolves to the ID of
+            the message, or :data:`None`, which signals that the batch cannot
+            accept a message.
+        """
+        # Coerce the type, just in case.
+        if not isinstance(message, types.PubsubMessage):
+            message = types.PubsubMessage(**message)
+
+        if not self.will_accept(message):
+            return None
+
+        new_size = self._size + message.ByteSize()
+        new_count = len(self._messages) + 1
+        overflow = (
+            new_size > self._settings.max_bytes
+            or new_count >= self._settings.max_messages
+        )
+
+        future = None
+        if not self._messages or not overflow:
+            self._messages.append(message)
+            self._size = new_size
+            future = self._loop.create_future()
+            self._futures.append(future)
+
+        if overflow:
+            self.commit()
+
+        return future
@@ -0,0 +1,200 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batches whose timers and commits share a fixed set of threads.
+
+:class:`~.pubsub_v1.publisher._batch.thread.Batch` starts one thread per
+batch to wait for ``max_latency``, and another to commit it, so publishing
+to many topics starts many threads each second. The batches in this module
+instead register their deadlines with a :class:`Scheduler`, which waits for
+all of them on a single thread and commits batches on a bounded thread pool.
+
+To use them, set the ``_batch_class`` of the publisher client:
+
+.. code-block:: python
+
+    from google.cloud import pubsub_v1
+    from google.cloud.pubsub_v1.publisher._batch import scheduled
+
+    class PublisherClient(pubsub_v1.PublisherClient):
+        _batch_class = scheduled.Batch
+"""
+
+from __future__ import absolute_import
+
+import concurrent.futures
+import heapq
+import itertools
+import logging
+import os
+import sys
+import threading
+import time
+
+from google.cloud.pubsub_v1.publisher._batch import base
+from google.cloud.pubsub_v1.publisher._batch import thread
+
+
+_LOGGER = logging.getLogger(__name__)
+_DEFAULT_COMMIT_WORKERS = 64
+
+_DEFAULT_SCHEDULER = None
+_DEFAULT_SCHEDULER_PID = None
+_DEFAULT_SCHEDULER_LOCK = threading.Lock()
+
+
+def default_scheduler():
+    """Return the scheduler shared by batches which are not given one.
+
+    It is created on first use, and again in a process which was forked
+    after it was created, since the threads do not survive the fork.
+
+    Returns:
+        Scheduler: The shared scheduler.
+    """
+    global _DEFAULT_SCHEDULER, _DEFAULT_SCHEDULER_PID
+
+    with _DEFAULT_SCHEDULER_LOCK:
+        if _DEFAULT_SCHEDULER is None or _DEFAULT_SCHEDULER_PID != os.getpid():
+            _DEFAULT_SCHEDULER = Scheduler()
+            _DEFAULT_SCHEDULER_PID = os.getpid()
+        return _DEFAULT_SCHEDULER
+
+
+class Scheduler(object):
+    """Run callbacks at deadlines on one thread, and commits on a pool.
+
+    Deadlines are kept in a heap, and a single daemon thread sleeps until
+    the earliest one. Callbacks run on that thread, so they must be quick;
+    blocking work belongs on the pool, with :meth:`submit`.
+
+    Args:
+        max_workers (int): The number of threads which commit batches.
+            Defaults to 64.
+    """
+
+    def __init__(self, max_workers=_DEFAULT_COMMIT_WORKERS):
+        self._condition = threading.Condition(threading.Lock())
+        # Entries are ``(deadline, sequence, callback)``; the sequence keeps
+        # callbacks with the same deadline in order, and out of comparisons.
+        self._deadlines = []
+        self._sequence = itertools.count()
+        self._thread = None
+
+        executor_kwargs = {}
+        if sys.version_info[:2] == (2, 7) or sys.version_info >= (3, 6):
+            executor_kwargs["thread_name_prefix"] = "ThreadPoolExecutor-CommitBatch"
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, **executor_kwargs
+        )
+
+    def call_later(self, delay, callback):
+        """Call ``callback`` on the scheduler thread after ``delay`` seconds.
+
+        Args:
+            delay (float): The number of seconds to wait.
+            callback (Callable): The function to call, with no arguments.
+        """
+        deadline = time.time() + delay
+        with self._condition:
+            sequence = next(self._sequence)
+            heapq.heappush(self._deadlines, (deadline, sequence, callback))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    name="Thread-ScheduledBatchPublisher", target=self._run
+                )
+                self._thread.daemon = True
+                self._thread.start()
+            elif self._deadlines[0][1] == sequence:
+                # The thread may be waiting for a later deadline.
+                self._condition.notify()
+
+    def submit(self, callback):
+        """Call ``callback`` on the commit thread pool.
+
+        Args:
+            callback (Callable): The function to call, with no arguments.
+        """
+        self._executor.submit(callback)
+
+    def _run(self):
+        """Call each callback once its deadline passes. Runs forever."""
+        while True:
+            with self._condition:
+                while not self._deadlines:
+                    self._condition.wait()
+                deadline = self._deadlines[0][0]
+                remaining = deadline - time.time()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                _, _, callback = heapq.heappop(self._deadlines)
+
+            try:
+                callback()
+            except Exception:
+                _LOGGER.exception("Scheduled callback %r failed.", callback)
+
+
+class Batch(thread.Batch):
+    """A batch of messages, committed by a shared :class:`Scheduler`.
+
+    Behaves like :class:`~.pubsub_v1.publisher._batch.thread.Batch`, except
+    that it starts no threads of its own.
+
+    Args:
+        client (~.pubsub_v1.PublisherClient): The publisher client used to
+            create this batch.
+        topic (str): The topic. The format for this is
+            ``projects/{project}/topics/{topic}``.
+        settings (~.pubsub_v1.types.BatchSettings): The settings for batch
+            publishing. These should be considered immutable once the batch
+            has been opened.
+        autocommit (bool): Whether to autocommit the batch when the time
+            has elapsed. Defaults to True unless ``settings.max_latency`` is
+            inf.
+        scheduler (Scheduler): The scheduler which commits the batch.
+            Defaults to one shared by all batches in the process.
+    """
+
+    def __init__(self, client, topic, settings, autocommit=True, scheduler=None):
+        super(Batch, self).__init__(client, topic, settings, autocommit=False)
+        if scheduler is None:
+            scheduler = default_scheduler()
+        self._scheduler = scheduler
+
+        if autocommit and self._settings.max_latency < float("inf"):
+            # A batch which is committed early, because it is full, is left
+            # in the heap; committing it again when its deadline passes is a
+            # no-op.
+            scheduler.call_later(self._settings.max_latency, self.commit)
+
+    def commit(self):
+        """Actually publish all of the messages on the active batch.
+
+        .. note::
+
+            This method is non-blocking. It submits :meth:`_commit`, which
+            does block, to the scheduler's thread pool.
+
+        If the current batch is **not** accepting messages, this method
+        does nothing.
+        """
+        with self._state_lock:
+            if self._status == base.BatchStatus.ACCEPTING_MESSAGES:
+                self._status = base.BatchStatus.STARTING
+            else:
+                return
+
+        self._scheduler.submit(self._commit)
@@ -0,0 +1,77 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A publisher client for :mod:`asyncio` applications.
+
+Requires Python 3.5 or later.
+"""
+
+from __future__ import absolute_import
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import client
+from google.cloud.pubsub_v1.publisher._batch import aio
+
+
+class Client(client.Client):
+    """A publisher client whose batches live on an :mod:`asyncio` event loop.
+
+    :meth:`publish` returns an :class:`asyncio.Future`, so it can be awaited,
+    and messages are batched by the event loop, without threads. It must be
+    called from the thread running the event loop.
+
+    Flow control may use the ``IGNORE`` or ``ERROR`` behaviors; ``BLOCK``
+    would block the event loop which releases the messages.
+
+    Takes the same arguments as
+    :class:`~google.cloud.pubsub_v1.publisher.client.Client`.
+    """
+
+    _batch_class = aio.Batch
+
+    def __init__(self, batch_settings=(), flow_control=(), **kwargs):
+        super(Client, self).__init__(batch_settings, flow_control, **kwargs)
+        behavior = self.flow_control.limit_exceeded_behavior
+        if behavior == types.LimitExceededBehavior.BLOCK:
+            raise ValueError(
+                "The BLOCK flow control behavior can not be used with asyncio."
+            )
+
+    def publish(self, topic, data, **attrs):
+        """Publish a single message.
+
+        Example:
+            >>> from google.cloud.pubsub_v1.publisher import aio
+            >>> client = aio.Client()
+            >>> topic = client.topic_path('[PROJECT]', '[TOPIC]')
+            >>> message_id = await client.publish(topic, b'data', user='guido')
+
+        Args:
+            topic (str): The topic to publish messages to.
+            data (bytes): A bytestring representing the message body. This
+                must be a bytestring.
+            attrs (Mapping[str, str]): A dictionary of attributes to be
+                sent as metadata. (These may be text strings or byte strings.)
+
+        Returns:
+            asyncio.Future: A future which resolves to the ID of the message,
+            once it has been published.
+
+        Raises:
+            ~google.cloud.pubsub_v1.publisher.exceptions.FlowControlLimitError:
+                If publishing the message would exceed the flow control
+                limits, and ``flow_control.limit_exceeded_behavior`` is
+                ``ERROR``.
+        """
+        return super(Client, self).publish(topic, data, **attrs)
@@ -28,6 +28,7 @@ from google.cloud.pubsub_v1 import _gapic
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.gapic import publisher_client
 from google.cloud.pubsub_v1.gapic.transports import publisher_grpc_transport
+from google.cloud.pubsub_v1.publisher import flow_controller
 from google.cloud.pubsub_v1.publisher._batch import thread
 
 
@@ -51,6 +52,10 @@ class Client(object):
     Args:
         batch_settings (~google.cloud.pubsub_v1.types.BatchSettings): The
             settings for batch publishing.
+        flow_control (~google.cloud.pubsub_v1.types.PublishFlowControl): The
+            limits on the messages being published at once, across all
+            topics, and what to do when they are exceeded. By default, there
+            are no limits.
         kwargs (dict): Any additional arguments provided are sent as keyword
             arguments to the underlying
             :class:`~.gapic.pubsub.v1.publisher_client.PublisherClient`.
@@ -62,7 +67,7 @@ class Client(object):
 
     _batch_class = thread.Batch
 
-    def __init__(self, batch_settings=(), **kwargs):
+    def __init__(self, batch_settings=(), flow_control=(), **kwargs):
         # Sanity check: Is our goal to use the emulator?
         # If so, create a grpc insecure channel with the emulator host
         # as the target.
@@ -95,6 +100,8 @@ class Client(object):
         # client.
         self.api = publisher_client.PublisherClient(**kwargs)
         self.batch_settings = types.BatchSettings(*batch_settings)
+        self.flow_control = types.PublishFlowControl(*flow_control)
+        self._flow_controller = flow_controller.FlowController(self.flow_control)
 
         # The batches on the publisher client are responsible for holding
         # messages. One batch exists for each topic.
@@ -102,7 +109,9 @@ class Client(object):
         self._batches = {}
 
     @classmethod
-    def from_service_account_file(cls, filename, batch_settings=(), **kwargs):
+    def from_service_account_file(
+        cls, filename, batch_settings=(), flow_control=(), **kwargs
+    ):
         """Creates an instance of this client using the provided credentials
         file.
 
@@ -111,6 +120,8 @@ class Client(object):
                 file.
             batch_settings (~google.cloud.pubsub_v1.types.BatchSettings): The
                 settings for batch publishing.
+            flow_control (~google.cloud.pubsub_v1.types.PublishFlowControl):
+                The settings for publisher flow control.
             kwargs: Additional arguments to pass to the constructor.
 
         Returns:
@@ -118,7 +129,7 @@ class Client(object):
         """
         credentials = service_account.Credentials.from_service_account_file(filename)
         kwargs["credentials"] = credentials
-        return cls(batch_settings, **kwargs)
+        return cls(batch_settings, flow_control, **kwargs)
 
     from_service_account_json = from_service_account_file
 
@@ -206,6 +217,12 @@ class Client(object):
             ~google.api_core.future.Future: An object conforming to the
             ``concurrent.futures.Future`` interface (but not an instance
             of that class).
+
+        Raises:
+            ~google.cloud.pubsub_v1.publisher.exceptions.FlowControlLimitError:
+                If publishing the message would exceed the flow control
+                limits, and ``flow_control.limit_exceeded_behavior`` is
+                ``ERROR``.
         """
         # Sanity check: Is the data being sent as a bytestring?
         # If it is literally anything else, complain loudly about it.
@@ -229,12 +246,25 @@ class Client(object):
         # Create the Pub/Sub message object.
         message = types.PubsubMessage(data=data, attributes=attrs)
 
+        # Wait for room for the message (or reject it), if too many messages
+        # are being published.
+        self._flow_controller.add(message)
+
         # Delegate the publishing to the batch.
-        batch = self._batch(topic)
-        future = None
-        while future is None:
-            future = batch.publish(message)
-            if future is None:
-                batch = self._batch(topic, create=True)
+        try:
+            batch = self._batch(topic)
+            future = None
+            while future is None:
+                future = batch.publish(message)
+                if future is None:
+                    batch = self._batch(topic, create=True)
+        except Exception:
+            self._flow_controller.release(message)
+            raise
+
+        # Release the message once it is published, or fails to be.
+        behavior = self.flow_control.limit_exceeded_behavior
+        if behavior != types.LimitExceededBehavior.IGNORE:
+            future.add_done_callback(lambda _: self._flow_controller.release(message))
 
         return future
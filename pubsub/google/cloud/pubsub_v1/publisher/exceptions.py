@@ -22,4 +22,8 @@ class PublishError(GoogleAPICallError):
     pass
 
 
-__all__ = ("PublishError", "TimeoutError")
+class FlowControlLimitError(Exception):
+    """Raised when publishing a message would exceed the flow control limits."""
+
+
+__all__ = ("FlowControlLimitError", "PublishError", "TimeoutError")
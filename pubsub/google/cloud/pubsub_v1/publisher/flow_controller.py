@@ -0,0 +1,134 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import collections
+import logging
+import threading
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FlowController(object):
+    """A controller of the messages which are being published.
+
+    Messages are added before they are batched, and released once they have
+    been published (or failed to), so the totals cover every topic of the
+    client. What happens when adding a message would exceed a limit depends
+    on ``settings.limit_exceeded_behavior``.
+
+    Blocked messages are let through in the order they were added, so a
+    large message is not starved by a stream of small ones.
+
+    Args:
+        settings (~google.cloud.pubsub_v1.types.PublishFlowControl): The
+            flow control settings.
+    """
+
+    def __init__(self, settings):
+        self._settings = settings
+        self._message_count = 0
+        self._total_bytes = 0
+        self._condition = threading.Condition(threading.Lock())
+        # The reservations of blocked threads, in the order they arrived.
+        self._waiting = collections.deque()
+
+    @property
+    def message_count(self):
+        """int: The number of messages which have not been released."""
+        return self._message_count
+
+    @property
+    def total_bytes(self):
+        """int: The total size of the messages which have not been released."""
+        return self._total_bytes
+
+    def add(self, message):
+        """Add a message which is about to be published.
+
+        Args:
+            message (~google.cloud.pubsub_v1.types.PubsubMessage): The
+                message.
+
+        Raises:
+            ~google.cloud.pubsub_v1.publisher.exceptions.FlowControlLimitError:
+                If the limits would be exceeded and the behavior is
+                ``ERROR``, or if the message is too large to ever fit within
+                the limits.
+        """
+        behavior = self._settings.limit_exceeded_behavior
+        if behavior == types.LimitExceededBehavior.IGNORE:
+            return
+
+        size = message.ByteSize()
+        with self._condition:
+            if not self._waiting and self._would_fit(size):
+                self._reserve(size)
+                return
+
+            if behavior == types.LimitExceededBehavior.ERROR:
+                raise exceptions.FlowControlLimitError(
+                    "Flow control limits would be exceeded: {:d} messages "
+                    "and {:d} bytes are outstanding.".format(
+                        self._message_count, self._total_bytes
+                    )
+                )
+            if size > self._settings.byte_limit or self._settings.message_limit < 1:
+                raise exceptions.FlowControlLimitError(
+                    "A message of {:d} bytes can never fit within the flow "
+                    "control limits.".format(size)
+                )
+
+            reservation = object()
+            self._waiting.append(reservation)
+            _LOGGER.debug("Blocking until there is room for %d bytes.", size)
+            try:
+                while self._waiting[0] is not reservation or not self._would_fit(size):
+                    self._condition.wait()
+                self._reserve(size)
+            finally:
+                self._waiting.remove(reservation)
+                # The next reservation in line may fit too.
+                self._condition.notify_all()
+
+    def release(self, message):
+        """Release a message which has been published, or failed to be.
+
+        Args:
+            message (~google.cloud.pubsub_v1.types.PubsubMessage): The
+                message.
+        """
+        behavior = self._settings.limit_exceeded_behavior
+        if behavior == types.LimitExceededBehavior.IGNORE:
+            return
+
+        with self._condition:
+            self._message_count = max(0, self._message_count - 1)
+            self._total_bytes = max(0, self._total_bytes - message.ByteSize())
+            self._condition.notify_all()
+
+    def _would_fit(self, size):
+        return (
+            self._message_count + 1 <= self._settings.message_limit
+            and self._total_bytes + size <= self._settings.byte_limit
+        )
+
+    def _reserve(self, size):
+        self._message_count += 1
+        self._total_bytes += size
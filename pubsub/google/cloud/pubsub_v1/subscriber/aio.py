@@ -0,0 +1,329 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A subscriber client for :mod:`asyncio` applications.
+
+Requires Python 3.5 or later.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import collections
+import functools
+import inspect
+import logging
+import threading
+
+from six.moves import queue
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber import client
+from google.cloud.pubsub_v1.subscriber import futures
+from google.cloud.pubsub_v1.subscriber import scheduler
+from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AsyncioScheduler(scheduler.Scheduler):
+    """A scheduler which calls callbacks on an :mod:`asyncio` event loop.
+
+    Messages are received on a background thread, so waking the event loop
+    is the only hand-off between threads. Callbacks scheduled while the loop
+    has not yet run the earlier ones are run together, so the loop is woken
+    about once per response from the server, rather than once per message.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): The event loop. Defaults to the
+            current event loop.
+    """
+
+    def __init__(self, loop=None):
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        self._loop = loop
+        self._queue = queue.Queue()
+        self._pending = collections.deque()
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    @property
+    def queue(self):
+        """Queue: A thread-safe queue used for communication between callbacks
+        and the scheduling thread."""
+        return self._queue
+
+    def schedule(self, callback, *args, **kwargs):
+        """Schedule the callback to be called on the event loop.
+
+        Args:
+            callback (Callable): The function to call.
+            args: Positional arguments passed to the function.
+            kwargs: Key-word arguments passed to the function.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            self._pending.append(functools.partial(callback, *args, **kwargs))
+            wake = len(self._pending) == 1
+        if wake:
+            self._loop.call_soon_threadsafe(self._run_pending)
+
+    def _run_pending(self):
+        """Run the callbacks scheduled since the loop was last woken."""
+        with self._lock:
+            callbacks = list(self._pending)
+            self._pending.clear()
+        for callback in callbacks:
+            callback()
+
+    def shutdown(self):
+        """Shuts down the scheduler and immediately end all pending callbacks.
+        """
+        with self._lock:
+            self._shutdown = True
+            self._pending.clear()
+
+
+def _wrap_awaitable_callback(callback, on_callback_error, loop, message):
+    """Call a callback, running what it returns as a task if awaitable.
+
+    If the callback, or its task, raises an exception, the message is
+    nacked.
+
+    Args:
+        callback (Callable[None, Message]): The user callback.
+        on_callback_error (Callable[Exception]): Called with the exception,
+            if the callback fails.
+        loop (asyncio.AbstractEventLoop): The event loop.
+        message (~Message): The Pub/Sub message.
+    """
+    try:
+        result = callback(message)
+    except Exception as exc:
+        _LOGGER.exception(
+            "Top-level exception occurred in callback while processing a message"
+        )
+        message.nack()
+        on_callback_error(exc)
+        return
+
+    if inspect.isawaitable(result):
+        task = asyncio.ensure_future(result, loop=loop)
+        task.add_done_callback(
+            functools.partial(_on_task_done, on_callback_error, message)
+        )
+
+
+def _on_task_done(on_callback_error, message, task):
+    if task.cancelled():
+        message.nack()
+        return
+    exc = task.exception()
+    if exc is not None:
+        _LOGGER.error(
+            "Top-level exception occurred in callback while processing a message",
+            exc_info=(type(exc), exc, exc.__traceback__),
+        )
+        message.nack()
+        on_callback_error(exc)
+
+
+class Client(client.Client):
+    """A subscriber client which delivers messages on an :mod:`asyncio` loop.
+
+    Takes the same arguments as
+    :class:`~google.cloud.pubsub_v1.subscriber.client.Client`.
+    """
+
+    def subscribe(self, subscription, callback, flow_control=(), loop=None):
+        """Start receiving messages on a subscription, on an event loop.
+
+        Like :meth:`~google.cloud.pubsub_v1.subscriber.client.Client.subscribe`,
+        except that ``callback`` is called on the event loop. If it returns an
+        awaitable, such as when it is a coroutine function, that is run as a
+        task, and the message is nacked if the task fails.
+
+        Example:
+
+        .. code-block:: python
+
+            from google.cloud.pubsub_v1.subscriber import aio
+
+            async def callback(message):
+                await process(message.data)
+                message.ack()
+
+            future = aio.Client().subscribe(subscription, callback)
+
+        Args:
+            subscription (str): The name of the subscription.
+            callback (Callable[~google.cloud.pubsub_v1.subscriber.message.Message]):
+                The callback function, or coroutine function.
+            flow_control (~google.cloud.pubsub_v1.types.FlowControl): The flow
+                control settings. Messages count against them until they are
+                acked or nacked, including while their tasks run.
+            loop (asyncio.AbstractEventLoop): The event loop. Defaults to the
+                current event loop.
+
+        Returns:
+            google.cloud.pubsub_v1.subscriber.futures.StreamingPullFuture: A
+                Future object that can be used to manage the background stream.
+        """
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        flow_control = types.FlowControl(*flow_control)
+
+        manager = streaming_pull_manager.StreamingPullManager(
+            self,
+            subscription,
+            flow_control=flow_control,
+            scheduler=AsyncioScheduler(loop),
+        )
+
+        future = futures.StreamingPullFuture(manager)
+
+        manager.open(
+            callback=functools.partial(
+                _wrap_awaitable_callback, callback, future.set_exception, loop
+            ),
+            on_callback_error=future.set_exception,
+        )
+
+        return future
+
+    def messages(self, subscription, flow_control=(), loop=None):
+        """Iterate over the messages on a subscription, with ``async for``.
+
+        Example:
+
+        .. code-block:: python
+
+            from google.cloud.pubsub_v1.subscriber import aio
+
+            stream = aio.Client().messages(subscription)
+            try:
+                async for message in stream:
+                    await process(message.data)
+                    message.ack()
+            finally:
+                await stream.close()
+
+        Args:
+            subscription (str): The name of the subscription.
+            flow_control (~google.cloud.pubsub_v1.types.FlowControl): The flow
+                control settings, which also limit the messages waiting to be
+                iterated over.
+            loop (asyncio.AbstractEventLoop): The event loop. Defaults to the
+                current event loop.
+
+        Returns:
+            MessageStream: An asynchronous iterator of
+            :class:`~google.cloud.pubsub_v1.subscriber.message.Message`.
+        """
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        stream = MessageStream(loop)
+        stream._start(
+            self.subscribe(subscription, stream._on_message, flow_control, loop)
+        )
+        return stream
+
+
+class MessageStream(object):
+    """An asynchronous iterator of the messages received on a subscription.
+
+    Created by :meth:`Client.messages`. Iteration stops once the stream is
+    closed, or raises the error which stopped it.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): The event loop.
+    """
+
+    def __init__(self, loop):
+        self._loop = loop
+        self._messages = collections.deque()
+        self._waiters = collections.deque()
+        self._future = None
+        self._done = False
+        self._error = None
+
+    def _start(self, future):
+        self._future = future
+        future.add_done_callback(self._on_future_done)
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        result = self._loop.create_future()
+        if self._messages:
+            result.set_result(self._messages.popleft())
+        elif self._done:
+            result.set_exception(self._error or StopAsyncIteration())
+        else:
+            self._waiters.append(result)
+        return result
+
+    def close(self):
+        """Stop receiving messages, and nack those not yet iterated over.
+
+        Returns:
+            asyncio.Future: Resolved once the stream has stopped. Stopping
+            joins background threads, so it runs in the loop's default
+            executor.
+        """
+        self._finish(None)
+        return self._loop.run_in_executor(None, self._future.cancel)
+
+    def _on_message(self, message):
+        """Receive a message, on the event loop."""
+        if self._done:
+            message.nack()
+            return
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(message)
+                return
+        self._messages.append(message)
+
+    def _on_future_done(self, future):
+        """Finish the stream, from the thread which stopped it."""
+        try:
+            self._loop.call_soon_threadsafe(self._finish, future.exception())
+        except RuntimeError:
+            # The event loop has been closed.
+            pass
+
+    def _finish(self, error):
+        """Stop iteration, after any messages already received."""
+        if self._done:
+            return
+        self._done = True
+        self._error = error
+        if error is None:
+            # Closed by the caller, so nobody will process these.
+            for message in self._messages:
+                message.nack()
+            self._messages.clear()
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_exception(error or StopAsyncIteration())
@@ -14,6 +14,7 @@
 
 from __future__ import absolute_import
 import collections
+import enum
 import sys
 
 from google.api import http_pb2
@@ -72,6 +73,28 @@ FlowControl.__new__.__defaults__ = (
 )
 
 
+class LimitExceededBehavior(str, enum.Enum):
+    """The behavior of the publisher when flow control limits are exceeded."""
+
+    IGNORE = "ignore"  # Publish anyway.
+    BLOCK = "block"  # Wait for earlier messages to be published.
+    ERROR = "error"  # Raise FlowControlLimitError.
+
+
+# Define the type class and default values for publisher flow control.
+#
+# This class is used when creating a publisher client, to limit the messages
+# which are being published at once, across all topics.
+PublishFlowControl = collections.namedtuple(
+    "PublishFlowControl", ["message_limit", "byte_limit", "limit_exceeded_behavior"]
+)
+PublishFlowControl.__new__.__defaults__ = (
+    10 * BatchSettings.__new__.__defaults__[2],  # message_limit: 10,000
+    10 * BatchSettings.__new__.__defaults__[0],  # byte_limit: 100 MB
+    LimitExceededBehavior.IGNORE,  # limit_exceeded_behavior: no limits
+)
+
+
 _shared_modules = [
     http_pb2,
     iam_policy_pb2,
@@ -87,7 +110,7 @@ _shared_modules = [
 _local_modules = [pubsub_pb2]
 
 
-names = ["BatchSettings", "FlowControl"]
+names = ["BatchSettings", "FlowControl", "LimitExceededBehavior", "PublishFlowControl"]
 
 
 for module in _shared_modules:
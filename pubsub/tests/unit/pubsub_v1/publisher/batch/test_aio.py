@@ -0,0 +1,170 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mock
+import pytest
+
+import google.api_core.exceptions
+from google.auth import credentials
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher._batch.base import BatchStatus
+
+asyncio = pytest.importorskip("asyncio")
+
+from google.cloud.pubsub_v1.publisher._batch.aio import Batch  # noqa: E402
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def create_client():
+    creds = mock.Mock(spec=credentials.Credentials)
+    return publisher.Client(credentials=creds)
+
+
+def create_batch(loop, autocommit=False, **batch_settings):
+    client = create_client()
+    settings = types.BatchSettings(**batch_settings)
+    return Batch(client, "topic_name", settings, autocommit=autocommit, loop=loop)
+
+
+def patch_publish(batch, **kwargs):
+    return mock.patch.object(type(batch.client.api), "publish", **kwargs)
+
+
+def test_init(loop):
+    batch = create_batch(loop, autocommit=True, max_latency=0.5)
+    assert batch._timer is not None
+    assert batch.status == BatchStatus.ACCEPTING_MESSAGES
+    batch._timer.cancel()
+
+
+def test_init_infinite_latency(loop):
+    batch = create_batch(loop, autocommit=True, max_latency=float("inf"))
+    assert batch._timer is None
+
+
+def test_publish_after_max_latency(loop):
+    batch = create_batch(loop, autocommit=True, max_latency=0.01)
+    futures = (batch.publish({"data": b"one"}), batch.publish({"data": b"two"}))
+    assert all(isinstance(future, asyncio.Future) for future in futures)
+
+    response = types.PublishResponse(message_ids=["a", "b"])
+    with patch_publish(batch, return_value=response) as publish:
+        results = loop.run_until_complete(asyncio.gather(*futures))
+
+    assert results == ["a", "b"]
+    assert batch.status == BatchStatus.SUCCESS
+    publish.assert_called_once_with(
+        "topic_name",
+        [types.PubsubMessage(data=b"one"), types.PubsubMessage(data=b"two")],
+    )
+
+
+def test_publish_max_messages(loop):
+    batch = create_batch(loop, autocommit=True, max_messages=2)
+    first = batch.publish({"data": b"one"})
+    assert batch.status == BatchStatus.ACCEPTING_MESSAGES
+
+    response = types.PublishResponse(message_ids=["a"])
+    with patch_publish(batch, return_value=response):
+        # The second message does not fit, and commits the batch.
+        assert batch.publish({"data": b"two"}) is None
+        assert batch.status == BatchStatus.IN_PROGRESS
+        assert batch._timer is None
+        assert loop.run_until_complete(first) == "a"
+
+
+def test_publish_not_accepting(loop):
+    batch = create_batch(loop)
+    batch._status = BatchStatus.IN_PROGRESS
+    assert batch.publish({"data": b"one"}) is None
+
+
+def test_commit_no_messages(loop):
+    batch = create_batch(loop)
+    with patch_publish(batch) as publish:
+        batch.commit()
+
+    assert batch.status == BatchStatus.SUCCESS
+    publish.assert_not_called()
+
+
+def test_commit_no_op(loop):
+    batch = create_batch(loop)
+    batch._status = BatchStatus.IN_PROGRESS
+    with patch_publish(batch) as publish:
+        batch.commit()
+
+    assert batch.status == BatchStatus.IN_PROGRESS
+    publish.assert_not_called()
+
+
+def test_commit_error(loop):
+    batch = create_batch(loop)
+    future = batch.publish({"data": b"one"})
+    error = google.api_core.exceptions.InternalServerError("uh oh")
+
+    with patch_publish(batch, side_effect=error):
+        batch.commit()
+        with pytest.raises(google.api_core.exceptions.InternalServerError):
+            loop.run_until_complete(future)
+
+    assert batch.status == BatchStatus.ERROR
+
+
+def test_commit_non_api_error(loop):
+    batch = create_batch(loop)
+    futures = (batch.publish({"data": b"one"}), batch.publish({"data": b"two"}))
+    error = ValueError("not an API error")
+
+    with patch_publish(batch, side_effect=error):
+        batch.commit()
+        loop.run_until_complete(asyncio.wait(futures))
+
+    assert batch.status == BatchStatus.ERROR
+    for future in futures:
+        assert future.exception() is error
+
+
+def test_commit_wrong_messageid_length(loop):
+    batch = create_batch(loop)
+    futures = (batch.publish({"data": b"one"}), batch.publish({"data": b"two"}))
+
+    response = types.PublishResponse(message_ids=["a"])
+    with patch_publish(batch, return_value=response):
+        batch.commit()
+        loop.run_until_complete(asyncio.wait(futures))
+
+    assert batch.status == BatchStatus.ERROR
+    for future in futures:
+        assert isinstance(future.exception(), exceptions.PublishError)
+
+
+def test_commit_cancelled_future(loop):
+    batch = create_batch(loop)
+    cancelled = batch.publish({"data": b"one"})
+    future = batch.publish({"data": b"two"})
+    cancelled.cancel()
+
+    response = types.PublishResponse(message_ids=["a", "b"])
+    with patch_publish(batch, return_value=response):
+        batch.commit()
+        assert loop.run_until_complete(future) == "b"
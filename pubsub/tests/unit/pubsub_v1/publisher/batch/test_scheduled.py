@@ -0,0 +1,169 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+
+import mock
+
+from google.auth import credentials
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher._batch.base import BatchStatus
+from google.cloud.pubsub_v1.publisher._batch import scheduled
+from google.cloud.pubsub_v1.publisher._batch.scheduled import Batch
+from google.cloud.pubsub_v1.publisher._batch.scheduled import Scheduler
+
+
+def create_client():
+    creds = mock.Mock(spec=credentials.Credentials)
+    return publisher.Client(credentials=creds)
+
+
+def create_batch(autocommit=False, scheduler=None, **batch_settings):
+    client = create_client()
+    settings = types.BatchSettings(**batch_settings)
+    if scheduler is None:
+        scheduler = mock.Mock(spec=Scheduler)
+    return Batch(
+        client, "topic_name", settings, autocommit=autocommit, scheduler=scheduler
+    )
+
+
+def test_init():
+    scheduler = mock.Mock(spec=Scheduler)
+    with mock.patch.object(threading, "Thread", autospec=True) as Thread:
+        batch = create_batch(autocommit=True, scheduler=scheduler, max_latency=0.5)
+
+    # No thread is started for the batch; its deadline is scheduled instead.
+    Thread.assert_not_called()
+    scheduler.call_later.assert_called_once_with(0.5, batch.commit)
+    assert batch.status == BatchStatus.ACCEPTING_MESSAGES
+
+
+def test_init_infinite_latency():
+    scheduler = mock.Mock(spec=Scheduler)
+    create_batch(autocommit=True, scheduler=scheduler, max_latency=float("inf"))
+    scheduler.call_later.assert_not_called()
+
+
+def test_init_default_scheduler():
+    client = create_client()
+    settings = types.BatchSettings(max_latency=float("inf"))
+    batch = Batch(client, "topic_name", settings)
+    assert batch._scheduler is scheduled.default_scheduler()
+
+
+@mock.patch.object(scheduled, "_DEFAULT_SCHEDULER", new=None)
+def test_default_scheduler_after_fork():
+    first = scheduled.default_scheduler()
+    assert scheduled.default_scheduler() is first
+
+    with mock.patch.object(os, "getpid", return_value=-1):
+        second = scheduled.default_scheduler()
+
+    assert second is not first
+
+
+def test_commit():
+    scheduler = mock.Mock(spec=Scheduler)
+    batch = create_batch(scheduler=scheduler)
+
+    batch.commit()
+
+    scheduler.submit.assert_called_once_with(batch._commit)
+    assert batch.status == BatchStatus.STARTING
+
+
+def test_commit_no_op():
+    scheduler = mock.Mock(spec=Scheduler)
+    batch = create_batch(scheduler=scheduler)
+    batch._status = BatchStatus.IN_PROGRESS
+
+    batch.commit()
+
+    scheduler.submit.assert_not_called()
+    assert batch.status == BatchStatus.IN_PROGRESS
+
+
+def test_publish_max_messages_commits():
+    scheduler = mock.Mock(spec=Scheduler)
+    batch = create_batch(scheduler=scheduler, max_messages=2)
+
+    batch.publish({"data": b"one"})
+    scheduler.submit.assert_not_called()
+    batch.publish({"data": b"two"})
+
+    scheduler.submit.assert_called_once_with(batch._commit)
+
+
+def test_publishes_after_max_latency():
+    scheduler = Scheduler(max_workers=2)
+    batch = create_batch(autocommit=True, scheduler=scheduler, max_latency=0.01)
+    future = batch.publish({"data": b"message"})
+
+    response = types.PublishResponse(message_ids=["a"])
+    with mock.patch.object(type(batch.client.api), "publish", return_value=response):
+        assert future.result(timeout=5) == "a"
+
+    assert batch.status == BatchStatus.SUCCESS
+
+
+def test_scheduler_call_later_order():
+    scheduler = Scheduler(max_workers=1)
+    calls = []
+    done = threading.Event()
+
+    scheduler.call_later(0.05, lambda: calls.append("late"))
+    scheduler.call_later(0.05, done.set)
+    # An earlier deadline wakes the thread, which was waiting for the others.
+    scheduler.call_later(0.0, lambda: calls.append("early"))
+
+    assert done.wait(5)
+    assert calls == ["early", "late"]
+
+
+def test_scheduler_starts_one_thread():
+    scheduler = Scheduler(max_workers=1)
+    with mock.patch.object(threading, "Thread", autospec=True) as Thread:
+        scheduler.call_later(10.0, mock.sentinel.callback)
+        scheduler.call_later(20.0, mock.sentinel.callback)
+
+    Thread.assert_called_once_with(
+        name="Thread-ScheduledBatchPublisher", target=scheduler._run
+    )
+    Thread.return_value.start.assert_called_once_with()
+
+
+@mock.patch.object(scheduled, "_LOGGER")
+def test_scheduler_callback_error(_LOGGER):
+    scheduler = Scheduler(max_workers=1)
+    done = threading.Event()
+    callback = mock.Mock(side_effect=ValueError("failed"))
+
+    scheduler.call_later(0.0, callback)
+    scheduler.call_later(0.0, done.set)
+
+    # The thread keeps running callbacks after one fails.
+    assert done.wait(5)
+    _LOGGER.exception.assert_called_once_with("Scheduled callback %r failed.", callback)
+
+
+def test_scheduler_submit():
+    scheduler = Scheduler(max_workers=1)
+    done = threading.Event()
+
+    scheduler.submit(done.set)
+
+    assert done.wait(5)
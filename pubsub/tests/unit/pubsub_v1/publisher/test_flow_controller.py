@@ -0,0 +1,145 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+import pytest
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher.flow_controller import FlowController
+
+
+def make_controller(behavior, message_limit=10, byte_limit=1000):
+    settings = types.PublishFlowControl(
+        message_limit=message_limit,
+        byte_limit=byte_limit,
+        limit_exceeded_behavior=behavior,
+    )
+    return FlowController(settings)
+
+
+def make_message(size):
+    # Two bytes of framing for the data field, for sizes under 128.
+    return types.PubsubMessage(data=b"x" * (size - 2))
+
+
+def add_in_thread(controller, message):
+    done = threading.Event()
+
+    def target():
+        controller.add(message)
+        done.set()
+
+    thread = threading.Thread(target=target)
+    thread.daemon = True
+    thread.start()
+    return done
+
+
+def test_default_settings():
+    settings = types.PublishFlowControl()
+    assert settings.message_limit == 10000
+    assert settings.byte_limit == 100 * 1000 * 1000
+    assert settings.limit_exceeded_behavior == types.LimitExceededBehavior.IGNORE
+
+
+def test_ignore():
+    controller = make_controller(types.LimitExceededBehavior.IGNORE, message_limit=1)
+    for _ in range(3):
+        controller.add(make_message(100))
+    controller.release(make_message(100))
+
+    assert controller.message_count == 0
+    assert controller.total_bytes == 0
+
+
+def test_add_and_release():
+    controller = make_controller(types.LimitExceededBehavior.ERROR)
+    message = make_message(100)
+
+    controller.add(message)
+    controller.add(message)
+    assert controller.message_count == 2
+    assert controller.total_bytes == 200
+
+    controller.release(message)
+    controller.release(message)
+    controller.release(message)
+    assert controller.message_count == 0
+    assert controller.total_bytes == 0
+
+
+def test_error_message_limit():
+    controller = make_controller(types.LimitExceededBehavior.ERROR, message_limit=2)
+    controller.add(make_message(10))
+    controller.add(make_message(10))
+
+    with pytest.raises(exceptions.FlowControlLimitError):
+        controller.add(make_message(10))
+
+    assert controller.message_count == 2
+
+
+def test_error_byte_limit():
+    controller = make_controller(types.LimitExceededBehavior.ERROR, byte_limit=150)
+    controller.add(make_message(100))
+
+    with pytest.raises(exceptions.FlowControlLimitError):
+        controller.add(make_message(100))
+
+    assert controller.total_bytes == 100
+
+
+def test_block_until_released():
+    controller = make_controller(types.LimitExceededBehavior.BLOCK, byte_limit=150)
+    first = make_message(100)
+    controller.add(first)
+
+    done = add_in_thread(controller, make_message(100))
+    assert not done.wait(0.05)
+
+    controller.release(first)
+    assert done.wait(5)
+    assert controller.total_bytes == 100
+
+
+def test_block_in_order():
+    controller = make_controller(types.LimitExceededBehavior.BLOCK, byte_limit=100)
+    first = make_message(60)
+    controller.add(first)
+
+    large_done = add_in_thread(controller, make_message(50))
+    time.sleep(0.05)
+    small_done = add_in_thread(controller, make_message(10))
+
+    # The small message would fit, but waits behind the large one.
+    assert not small_done.wait(0.05)
+
+    controller.release(first)
+    assert large_done.wait(5)
+    assert small_done.wait(5)
+    assert controller.total_bytes == 60
+
+
+def test_block_message_too_large():
+    controller = make_controller(types.LimitExceededBehavior.BLOCK, byte_limit=50)
+
+    with pytest.raises(exceptions.FlowControlLimitError):
+        controller.add(make_message(100))
+
+    assert controller.total_bytes == 0
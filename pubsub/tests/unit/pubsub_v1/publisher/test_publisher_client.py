@@ -235,3 +235,96 @@ def test_gapic_class_method_on_instance():
     client = publisher.Client(credentials=creds)
     answer = client.topic_path("foo", "bar")
     assert answer == "projects/foo/topics/bar"
+
+
+def test_init_flow_control():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+
+    assert client.flow_control == types.PublishFlowControl()
+    assert (
+        client.flow_control.limit_exceeded_behavior
+        == types.LimitExceededBehavior.IGNORE
+    )
+
+
+def test_publish_flow_control_error():
+    from google.cloud.pubsub_v1.publisher import exceptions
+    from google.cloud.pubsub_v1.publisher import futures
+
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(
+        message_limit=1, limit_exceeded_behavior=types.LimitExceededBehavior.ERROR
+    )
+    client = publisher.Client(credentials=creds, flow_control=flow_control)
+
+    # Use a mock in lieu of the actual batch class.
+    future = futures.Future()
+    batch = mock.Mock(spec=client._batch_class)
+    batch.publish.side_effect = (future, futures.Future())
+    topic = "topic/path"
+    client._batches[topic] = batch
+
+    client.publish(topic, b"spam")
+    with pytest.raises(exceptions.FlowControlLimitError):
+        client.publish(topic, b"eggs")
+
+    # Once the first message is published, there is room for another.
+    future.set_result("1")
+    client.publish(topic, b"eggs")
+    assert client._flow_controller.message_count == 1
+
+
+def test_publish_flow_control_release_on_error():
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK
+    )
+    client = publisher.Client(credentials=creds, flow_control=flow_control)
+
+    batch = mock.Mock(spec=client._batch_class)
+    batch.publish.side_effect = ValueError("broken")
+    topic = "topic/path"
+    client._batches[topic] = batch
+
+    with pytest.raises(ValueError):
+        client.publish(topic, b"spam")
+
+    assert client._flow_controller.message_count == 0
+    assert client._flow_controller.total_bytes == 0
+
+
+def test_aio_publish():
+    asyncio = pytest.importorskip("asyncio")
+    from google.cloud.pubsub_v1.publisher import aio
+
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = aio.Client(
+        batch_settings=types.BatchSettings(max_latency=0.01), credentials=creds
+    )
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    response = types.PublishResponse(message_ids=["a"])
+    patch = mock.patch.object(type(client.api), "publish", return_value=response)
+
+    try:
+        with patch as publish:
+            future = client.publish("topic/path", b"spam")
+            assert loop.run_until_complete(future) == "a"
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+    publish.assert_called_once_with("topic/path", [types.PubsubMessage(data=b"spam")])
+
+
+def test_aio_init_flow_control_block():
+    pytest.importorskip("asyncio")
+    from google.cloud.pubsub_v1.publisher import aio
+
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK
+    )
+    with pytest.raises(ValueError):
+        aio.Client(credentials=creds, flow_control=flow_control)
@@ -0,0 +1,285 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import mock
+import pytest
+
+from google.auth import credentials
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber import futures
+from google.cloud.pubsub_v1.subscriber import message
+
+asyncio = pytest.importorskip("asyncio")
+
+from google.cloud.pubsub_v1.subscriber import aio  # noqa: E402
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def make_message():
+    return mock.create_autospec(message.Message, instance=True)
+
+
+def run_soon(loop):
+    """Run the callbacks which are ready on the event loop."""
+    loop.run_until_complete(asyncio.sleep(0))
+
+
+def test_scheduler_schedule(loop):
+    scheduler = aio.AsyncioScheduler(loop)
+    callback = mock.Mock()
+
+    scheduler.schedule(callback, "a", b="b")
+    callback.assert_not_called()
+    run_soon(loop)
+
+    callback.assert_called_once_with("a", b="b")
+
+
+def test_scheduler_wakes_loop_once(loop):
+    scheduler = aio.AsyncioScheduler(loop)
+    calls = []
+
+    with mock.patch.object(loop, "call_soon_threadsafe") as call_soon:
+        for index in range(3):
+            scheduler.schedule(calls.append, index)
+
+    call_soon.assert_called_once_with(scheduler._run_pending)
+    scheduler._run_pending()
+    assert calls == [0, 1, 2]
+
+
+def test_scheduler_from_thread(loop):
+    scheduler = aio.AsyncioScheduler(loop)
+    done = loop.create_future()
+    callers = []
+
+    def callback():
+        callers.append(threading.current_thread())
+        done.set_result(None)
+
+    thread = threading.Thread(target=scheduler.schedule, args=(callback,))
+    thread.start()
+    loop.run_until_complete(asyncio.wait_for(done, 5))
+    thread.join()
+
+    assert callers == [threading.current_thread()]
+
+
+def test_scheduler_shutdown(loop):
+    scheduler = aio.AsyncioScheduler(loop)
+    callback = mock.Mock()
+
+    scheduler.schedule(callback)
+    scheduler.shutdown()
+    scheduler.schedule(callback)
+    run_soon(loop)
+
+    callback.assert_not_called()
+
+
+def test_wrap_awaitable_callback_sync(loop):
+    msg = make_message()
+    callback = mock.Mock(return_value=None)
+    on_error = mock.Mock()
+
+    aio._wrap_awaitable_callback(callback, on_error, loop, msg)
+
+    callback.assert_called_once_with(msg)
+    on_error.assert_not_called()
+    msg.nack.assert_not_called()
+
+
+def test_wrap_awaitable_callback_sync_error(loop):
+    msg = make_message()
+    error = ValueError("failed")
+    on_error = mock.Mock()
+
+    aio._wrap_awaitable_callback(mock.Mock(side_effect=error), on_error, loop, msg)
+
+    msg.nack.assert_called_once_with()
+    on_error.assert_called_once_with(error)
+
+
+def test_wrap_awaitable_callback_awaitable(loop):
+    msg = make_message()
+    result = loop.create_future()
+    on_error = mock.Mock()
+
+    aio._wrap_awaitable_callback(lambda m: result, on_error, loop, msg)
+    result.set_result(None)
+    run_soon(loop)
+
+    msg.nack.assert_not_called()
+    on_error.assert_not_called()
+
+
+def test_wrap_awaitable_callback_awaitable_error(loop):
+    msg = make_message()
+    result = loop.create_future()
+    on_error = mock.Mock()
+    error = ValueError("failed")
+
+    aio._wrap_awaitable_callback(lambda m: result, on_error, loop, msg)
+    result.set_exception(error)
+    run_soon(loop)
+
+    msg.nack.assert_called_once_with()
+    on_error.assert_called_once_with(error)
+
+
+def test_wrap_awaitable_callback_awaitable_cancelled(loop):
+    msg = make_message()
+    result = loop.create_future()
+    on_error = mock.Mock()
+
+    aio._wrap_awaitable_callback(lambda m: result, on_error, loop, msg)
+    result.cancel()
+    run_soon(loop)
+
+    msg.nack.assert_called_once_with()
+    on_error.assert_not_called()
+
+
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager."
+    "StreamingPullManager.open",
+    autospec=True,
+)
+def test_subscribe(manager_open, loop):
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = aio.Client(credentials=creds)
+    flow_control = types.FlowControl(max_bytes=42)
+    callback = mock.Mock()
+
+    future = client.subscribe("sub_name_a", callback, flow_control, loop=loop)
+
+    assert isinstance(future, futures.StreamingPullFuture)
+    manager = future._manager
+    assert manager._subscription == "sub_name_a"
+    assert manager.flow_control == flow_control
+    assert isinstance(manager._scheduler, aio.AsyncioScheduler)
+    assert manager._scheduler._loop is loop
+
+    manager_open.assert_called_once_with(
+        manager, mock.ANY, on_callback_error=future.set_exception
+    )
+    wrapped = manager_open.call_args[1]["callback"]
+    msg = make_message()
+    wrapped(msg)
+    callback.assert_called_once_with(msg)
+
+
+def make_stream(loop):
+    stream = aio.MessageStream(loop)
+    stream._start(futures.StreamingPullFuture(mock.Mock()))
+    return stream
+
+
+def test_messages(loop):
+    client = aio.Client(credentials=mock.Mock(spec=credentials.Credentials))
+    future = futures.StreamingPullFuture(mock.Mock())
+
+    with mock.patch.object(aio.Client, "subscribe", return_value=future) as sub:
+        stream = client.messages("sub_name_a", loop=loop)
+
+    assert isinstance(stream, aio.MessageStream)
+    sub.assert_called_once_with("sub_name_a", stream._on_message, (), loop)
+    assert stream._future is future
+
+
+def test_stream_buffered_messages(loop):
+    stream = make_stream(loop)
+    messages = [make_message(), make_message()]
+    for msg in messages:
+        stream._on_message(msg)
+
+    assert loop.run_until_complete(stream.__anext__()) is messages[0]
+    assert loop.run_until_complete(stream.__anext__()) is messages[1]
+
+
+def test_stream_waits_for_message(loop):
+    stream = make_stream(loop)
+    msg = make_message()
+
+    waiter = stream.__anext__()
+    assert not waiter.done()
+    stream._on_message(msg)
+
+    assert loop.run_until_complete(waiter) is msg
+
+
+def test_stream_skips_cancelled_waiter(loop):
+    stream = make_stream(loop)
+    msg = make_message()
+
+    cancelled = stream.__anext__()
+    cancelled.cancel()
+    waiter = stream.__anext__()
+    stream._on_message(msg)
+
+    assert loop.run_until_complete(waiter) is msg
+
+
+def test_stream_close(loop):
+    stream = make_stream(loop)
+    unprocessed = make_message()
+    stream._on_message(unprocessed)
+    waiter = loop.create_future()
+    stream._waiters.append(waiter)
+
+    loop.run_until_complete(stream.close())
+
+    stream._future._manager.close.assert_called_once_with()
+    unprocessed.nack.assert_called_once_with()
+    with pytest.raises(StopAsyncIteration):
+        loop.run_until_complete(waiter)
+    with pytest.raises(StopAsyncIteration):
+        loop.run_until_complete(stream.__anext__())
+
+    # Messages which arrive after closing are nacked.
+    late = make_message()
+    stream._on_message(late)
+    late.nack.assert_called_once_with()
+
+
+def test_stream_error(loop):
+    stream = make_stream(loop)
+    msg = make_message()
+    stream._on_message(msg)
+    error = ValueError("failed")
+
+    stream._future.set_exception(error)
+    run_soon(loop)
+
+    # Messages received before the error are still delivered.
+    assert loop.run_until_complete(stream.__anext__()) is msg
+    msg.nack.assert_not_called()
+    with pytest.raises(ValueError):
+        loop.run_until_complete(stream.__anext__())
+
+
+def test_stream_done_after_loop_closed():
+    loop = asyncio.new_event_loop()
+    stream = make_stream(loop)
+    loop.close()
+
+    stream._future.set_result(True)
@@ -0,0 +1,134 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Micro-benchmark for parsing multipart/mixed batch responses.
+
+Compares ``_unpack_batch_response`` with the ``email`` package based
+parser which it replaced. No network access or credentials are needed.
+"""
+
+import argparse
+from email.parser import Parser
+import json
+import timeit
+
+import requests
+
+from google.cloud.storage import batch
+
+_BOUNDARY = "batch_pK7JBAk73-E=_AA5eFwv4m2Q="
+
+
+def make_response(num_parts):
+    parts = []
+    for index in range(num_parts):
+        if index % 10 == 0:
+            status, body = "204 No Content", ""
+        else:
+            status = "200 OK"
+            body = json.dumps(
+                {
+                    "kind": "storage#object",
+                    "name": "logs/2019/03/15/part-{:05d}.json".format(index),
+                    "bucket": "my-bucket",
+                    "generation": "1552608000000000",
+                    "metageneration": "2",
+                    "contentType": "application/json",
+                    "size": str(index * 1024),
+                    "metadata": {"owner": "benchmark", "index": str(index)},
+                }
+            )
+        parts.append(
+            "--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            "Content-ID: <response-{index}>\r\n\r\n"
+            "HTTP/1.1 {status}\r\n"
+            "Content-Type: application/json; charset=UTF-8\r\n"
+            "Content-Length: {length}\r\n\r\n"
+            "{body}\r\n".format(
+                boundary=_BOUNDARY,
+                index=index,
+                status=status,
+                length=len(body),
+                body=body,
+            )
+        )
+    parts.append("--{}--\r\n".format(_BOUNDARY))
+
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["content-type"] = 'multipart/mixed; boundary="{}"'.format(
+        _BOUNDARY
+    )
+    response._content = "".join(parts).encode("utf-8")
+    return response
+
+
+def unpack_with_email(response):
+    """The batch response parser before the bytes-level parser."""
+    parser = Parser()
+    content_type = response.headers["content-type"].encode("utf-8")
+    faux_message = b"".join(
+        [b"Content-Type: ", content_type, b"\nMIME-Version: 1.0\n\n", response.content]
+    )
+    message = parser.parsestr(faux_message.decode("utf-8"))
+
+    for subrequest in message._payload:
+        status_line, rest = subrequest._payload.split("\n", 1)
+        _, status, _ = status_line.split(" ", 2)
+        sub_message = parser.parsestr(rest)
+        payload = sub_message._payload
+        msg_headers = dict(sub_message._headers)
+        content_id = msg_headers.get("Content-ID")
+
+        subresponse = requests.Response()
+        subresponse.request = requests.Request(
+            method="BATCH", url="contentid://{}".format(content_id)
+        ).prepare()
+        subresponse.status_code = int(status)
+        subresponse.headers.update(msg_headers)
+        subresponse._content = payload.encode("utf-8")
+
+        yield subresponse
+
+
+def unpack_with_bytes(response):
+    return batch._unpack_batch_response(response)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--parts", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    response = make_response(args.parts)
+    email_statuses = [part.status_code for part in unpack_with_email(response)]
+    bytes_statuses = [part.status_code for part in unpack_with_bytes(response)]
+    if email_statuses != bytes_statuses:
+        raise Exception("parsers returned different responses")
+
+    for name, unpack in (("email", unpack_with_email), ("bytes", unpack_with_bytes)):
+        best = min(
+            timeit.repeat(lambda: list(unpack(response)), number=1, repeat=args.repeat)
+        )
+        print(
+            "{0}: {1} parts in {2:.4f} sec, {3:.0f} parts/sec".format(
+                name, args.parts, best, args.parts / best
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Checksums, as used by Cloud Storage for object data.
+
+These are *not* part of the API.
+
+CRC32C checksums use ``google-crc32c`` when it is installed with its C
+extension (which uses the SSE4.2 ``crc32`` instruction where the CPU has
+it), then the C extension of ``crcmod``, and otherwise a much slower pure
+Python implementation.
+"""
+
+import base64
+import hashlib
+import struct
+
+try:
+    import google_crc32c
+except ImportError:  # pragma: NO COVER
+    google_crc32c = None
+
+try:
+    import crcmod
+    import crcmod.predefined
+except ImportError:  # pragma: NO COVER
+    crcmod = None
+
+
+# The bit-reversed Castagnoli polynomial.
+_CRC32C_POLYNOMIAL = 0x82F63B78
+
+
+def _make_crc32c_table():
+    table = []
+    for index in range(256):
+        crc = index
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ _CRC32C_POLYNOMIAL
+            else:
+                crc >>= 1
+        table.append(crc)
+    return table
+
+
+_CRC32C_TABLE = _make_crc32c_table()
+
+
+def _get_fast_crc32c_extend():
+    """Find a C implementation of :func:`crc32c_extend`, if one is installed.
+
+    :rtype: callable
+    :returns: A function of ``(crc, data)``, or :data:`None`.
+    """
+    if google_crc32c is not None and google_crc32c.implementation == "c":
+        return google_crc32c.extend
+    if crcmod is not None and getattr(crcmod.crcmod, "_usingExtension", False):
+        crcmod_crc32c = crcmod.predefined.mkPredefinedCrcFun("crc-32c")
+        return lambda crc, data: crcmod_crc32c(data, crc)
+    return None  # pragma: NO COVER
+
+
+_fast_crc32c_extend = _get_fast_crc32c_extend()
+
+HAS_FAST_CRC32C = _fast_crc32c_extend is not None
+"""bool: Whether CRC32C checksums are computed with a C extension."""
+
+
+def _python_crc32c_extend(crc, data):
+    """Extend a CRC32C checksum with more data, in pure Python."""
+    table = _CRC32C_TABLE
+    crc ^= 0xFFFFFFFF
+    for byte in bytearray(data):
+        crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+def crc32c_extend(crc, data):
+    """Extend a CRC32C checksum with more data.
+
+    :type crc: int
+    :param crc: The checksum of the preceding data, or ``0`` for none.
+
+    :type data: bytes
+    :param data: The data to add to the checksum.
+
+    :rtype: int
+    :returns: The checksum of the preceding data followed by ``data``.
+    """
+    if _fast_crc32c_extend is not None:
+        return _fast_crc32c_extend(crc, data)
+    return _python_crc32c_extend(crc, data)
+
+
+def _gf2_matrix_times(matrix, vector):
+    total = 0
+    index = 0
+    while vector:
+        if vector & 1:
+            total ^= matrix[index]
+        vector >>= 1
+        index += 1
+    return total
+
+
+def _gf2_matrix_square(matrix):
+    return [_gf2_matrix_times(matrix, row) for row in matrix]
+
+
+def crc32c_combine(crc1, crc2, length2):
+    """Combine the CRC32C checksums of two adjacent pieces of data.
+
+    Uses the same method as ``crc32_combine`` in zlib, which takes time
+    proportional to the logarithm of ``length2``, so that checksums of
+    slices downloaded or uploaded in parallel can be combined without
+    reading the data again.
+
+    :type crc1: int
+    :param crc1: The checksum of the first piece.
+
+    :type crc2: int
+    :param crc2: The checksum of the second piece.
+
+    :type length2: int
+    :param length2: The length of the second piece, in bytes.
+
+    :rtype: int
+    :returns: The checksum of the first piece followed by the second.
+    """
+    if length2 <= 0:
+        return crc1
+
+    # The operator for one zero bit, then for two and four zero bits.
+    odd = [_CRC32C_POLYNOMIAL] + [1 << bit for bit in range(31)]
+    even = _gf2_matrix_square(odd)
+    odd = _gf2_matrix_square(even)
+
+    # Apply ``length2`` zero bytes to ``crc1``, squaring the operator for
+    # each bit of the length.
+    while True:
+        even = _gf2_matrix_square(odd)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(even, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+
+        odd = _gf2_matrix_square(even)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(odd, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+
+    return crc1 ^ crc2
+
+
+def crc32c_to_base64(crc):
+    """Encode a CRC32C checksum like the ``crc32c`` property of a blob.
+
+    :type crc: int
+    :param crc: The checksum.
+
+    :rtype: str
+    :returns: The big-endian checksum, base64-encoded.
+    """
+    return base64.b64encode(struct.pack(">I", crc)).decode("ascii")
+
+
+class _Crc32cHash(object):
+    """A CRC32C checksum with the interface of a :mod:`hashlib` hash."""
+
+    def __init__(self):
+        self._crc = 0
+
+    def update(self, data):
+        self._crc = crc32c_extend(self._crc, data)
+
+    def digest(self):
+        return struct.pack(">I", self._crc)
+
+
+_HASH_FACTORIES = {"crc32c": _Crc32cHash, "md5": hashlib.md5}
+_HASH_PROPERTIES = {"crc32c": "crc32c", "md5": "md5Hash"}
+
+
+def get_hash(checksum):
+    """Make a hash object to compute a checksum incrementally.
+
+    :type checksum: str
+    :param checksum: Either ``"crc32c"`` or ``"md5"``.
+
+    :rtype: object
+    :returns: A hash object with ``update`` and ``digest`` methods.
+    :raises: :exc:`ValueError` if ``checksum`` is not supported.
+    """
+    try:
+        return _HASH_FACTORIES[checksum]()
+    except KeyError:
+        raise ValueError(
+            "Unsupported checksum {!r}, expected 'crc32c' or 'md5'".format(checksum)
+        )
+
+
+def get_hash_property(checksum):
+    """Get the object resource property which holds a checksum.
+
+    :type checksum: str
+    :param checksum: Either ``"crc32c"`` or ``"md5"``.
+
+    :rtype: str
+    :returns: ``"crc32c"`` or ``"md5Hash"``.
+    """
+    return _HASH_PROPERTIES[checksum]
+
+
+def base64_digest(hash_obj):
+    """Encode the digest of a hash like the checksum properties of a blob.
+
+    :type hash_obj: object
+    :param hash_obj: A hash object, as returned by :func:`get_hash`.
+
+    :rtype: str
+    :returns: The digest, base64-encoded.
+    """
+    return base64.b64encode(hash_obj.digest()).decode("ascii")
+
+
+class HashingReader(object):
+    """Wrap a stream, computing a checksum of the data as it is read.
+
+    Each byte is added to the checksum only the first time it is read, so
+    the checksum is still that of the whole stream when a resumable upload
+    seeks back to send data again after an error. Other methods (``tell``,
+    ``seek`` and so on) are passed through to the stream.
+
+    :type stream: IO[bytes]
+    :param stream: A bytes IO object open for reading.
+
+    :type checksum: str
+    :param checksum: Either ``"crc32c"`` or ``"md5"``.
+    """
+
+    def __init__(self, stream, checksum):
+        self._stream = stream
+        self._hash = get_hash(checksum)
+        self._hashed_to = stream.tell()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    def read(self, size=-1):
+        start = self._stream.tell()
+        data = self._stream.read(size)
+        end = start + len(data)
+        if end > self._hashed_to:
+            if start > self._hashed_to:
+                raise ValueError("Cannot compute a checksum of skipped data.")
+            self._hash.update(data[self._hashed_to - start :])
+            self._hashed_to = end
+        return data
+
+    def base64_digest(self):
+        """The checksum of the data read so far, base64-encoded.
+
+        :rtype: str
+        :returns: The encoded digest.
+        """
+        return base64_digest(self._hash)
@@ -0,0 +1,176 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Concurrent listing of objects.
+
+These are *not* part of the API.
+"""
+
+import concurrent.futures
+import threading
+
+from six.moves import queue
+
+from google.api_core import page_iterator
+
+
+# How long a worker waits to put a page in a full queue before checking
+# whether the listing has been abandoned.
+_PUT_TIMEOUT = 0.5
+
+
+class PrefetchingHTTPIterator(page_iterator.HTTPIterator):
+    """An iterator which requests the next page while the current one is used.
+
+    While the items of a page are consumed, the request for the next page
+    runs on a background thread, so the time spent waiting for the API is
+    overlapped with the time spent processing results.
+
+    Pages are not prefetched when ``max_results`` is set, because the size
+    of the next request depends on how many items have been consumed.
+
+    The background thread is stopped once the last page is read, or when
+    the iteration is closed or garbage collected. Call :meth:`close` to stop
+    it explicitly.
+
+    Takes the same arguments as
+    :class:`~google.api_core.page_iterator.HTTPIterator`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(PrefetchingHTTPIterator, self).__init__(*args, **kwargs)
+        self._executor = None
+        self._prefetched = None
+
+    def _next_page(self):
+        """Get the next page, and start requesting the one after it.
+
+        :rtype: :class:`~google.api_core.page_iterator.Page`
+        :returns: The next page, or :data:`None` if there are no pages left.
+        """
+        if self._prefetched is not None:
+            future, self._prefetched = self._prefetched, None
+            response = future.result()
+        elif self._has_next_page():
+            response = self._get_next_page_response()
+        else:
+            return None
+
+        items = response.get(self._items_key, ())
+        page = page_iterator.Page(self, items, self.item_to_value)
+        self._page_start(self, page, response)
+        self.next_page_token = response.get(self._next_token)
+
+        if self.next_page_token is not None and self.max_results is None:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            self._prefetched = self._executor.submit(self._get_next_page_response)
+        else:
+            self.close()
+
+        return page
+
+    def _page_iter(self, increment):
+        """Generator of pages, which stops prefetching when it is closed.
+
+        :type increment: bool
+        :param increment: Whether to count the results a page at a time,
+                          rather than per item.
+
+        :rtype: generator
+        :returns: Each page of items.
+        """
+        try:
+            for page in super(PrefetchingHTTPIterator, self)._page_iter(increment):
+                yield page
+        finally:
+            # The caller may stop iterating before the last page.
+            self.close()
+
+    def close(self):
+        """Cancel the prefetched request and release the background thread."""
+        if self._prefetched is not None:
+            self._prefetched.cancel()
+            self._prefetched = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def fan_out(list_pages, prefix, max_workers):
+    """Yield the items of a listing, and of each prefix found, in parallel.
+
+    ``list_pages`` should list with a delimiter, so that each page has the
+    ``prefixes`` found in it, and each of those is then listed on a pool of
+    ``max_workers`` threads. Items are yielded as pages arrive, so they are
+    not in order. A bounded number of pages are held in memory; workers
+    wait while the caller catches up.
+
+    :type list_pages: callable
+    :param list_pages: Called with a prefix (or :data:`None`) to get an
+                       iterable of pages of items, each with a ``prefixes``
+                       attribute.
+
+    :type prefix: str
+    :param prefix: The prefix to start from, or :data:`None`.
+
+    :type max_workers: int
+    :param max_workers: The number of prefixes to list at once.
+
+    :rtype: generator
+    :returns: The items of all of the pages.
+    """
+    pages = queue.Queue(maxsize=2 * max_workers)
+    stopped = threading.Event()
+
+    def put(message):
+        while not stopped.is_set():
+            try:
+                pages.put(message, timeout=_PUT_TIMEOUT)
+                return
+            except queue.Full:
+                continue
+
+    def list_prefix(prefix):
+        try:
+            for page in list_pages(prefix):
+                if stopped.is_set():
+                    break
+                put((list(page), page.prefixes, None))
+        except Exception as exc:
+            put((None, (), exc))
+        finally:
+            put(None)
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        executor.submit(list_prefix, prefix)
+        listing = 1
+        while listing:
+            message = pages.get()
+            if message is None:
+                listing -= 1
+                continue
+
+            items, prefixes, error = message
+            if error is not None:
+                raise error
+            for sub_prefix in prefixes:
+                executor.submit(list_prefix, sub_prefix)
+                listing += 1
+            for item in items:
+                yield item
+    finally:
+        stopped.set()
+        executor.shutdown(wait=False)
@@ -16,13 +16,16 @@
 import base64
 import binascii
 import collections
+import concurrent.futures
 import datetime
 import hashlib
 import re
+import threading
 
 import six
 
 import google.auth.credentials
+import google.auth.iam
 from google.cloud import _helpers
 
 
@@ -394,6 +397,7 @@ def generate_signed_url_v2(
 
 SEVEN_DAYS = 7 * 24 * 60 * 60  # max age for V4 signed URLs.
 DEFAULT_ENDPOINT = "https://storage.googleapis.com"
+_REMOTE_SIGNING_WORKERS = 8
 
 
 def generate_signed_url_v4(
@@ -500,6 +504,75 @@ def generate_signed_url_v4(
     :returns: A signed URL you can use to access the resource
               until expiration.
     """
+    (url,) = generate_signed_urls_v4(
+        credentials,
+        [resource],
+        expiration,
+        api_access_endpoint=api_access_endpoint,
+        method=method,
+        content_md5=content_md5,
+        content_type=content_type,
+        response_type=response_type,
+        response_disposition=response_disposition,
+        generation=generation,
+        headers=headers,
+        query_parameters=query_parameters,
+        _request_timestamp=_request_timestamp,
+    )
+    return url
+
+
+def generate_signed_urls_v4(
+    credentials,
+    resources,
+    expiration,
+    api_access_endpoint=DEFAULT_ENDPOINT,
+    method="GET",
+    content_md5=None,
+    content_type=None,
+    response_type=None,
+    response_disposition=None,
+    generation=None,
+    headers=None,
+    query_parameters=None,
+    max_workers=None,
+    reuse_for=None,
+    _request_timestamp=None,  # for testing only
+):
+    """Generate V4 signed URLs for many resources with the same arguments.
+
+    The credential scope, canonical headers and query string are computed
+    once for all of the URLs, and only the canonical request and signature
+    differ. If ``credentials`` sign remotely, with the IAM ``signBlob`` API,
+    the signatures are requested in parallel.
+
+    See :func:`generate_signed_url_v4` for the common arguments.
+
+    :type resources: list
+    :param resources: Pointers to the resources (typically,
+                      ``/bucket-name/path/to/blob.txt``).
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of signatures to request at
+                        once. Defaults to 8 when ``credentials`` sign
+                        remotely, and 1 otherwise.
+
+    :type reuse_for: Union[Integer, datetime.timedelta]
+    :param reuse_for: (Optional) Return a URL generated, with the same
+                      arguments, less than this long ago (in seconds)
+                      instead of signing it again. When ``expiration`` is
+                      relative, a reused URL expires up to this much
+                      sooner. Must be shorter than ``expiration``.
+
+    :raises: :exc:`TypeError` when expiration is not a valid type.
+    :raises: :exc:`ValueError` when ``reuse_for`` is not shorter than
+             ``expiration``.
+    :raises: :exc:`AttributeError` if credentials is not an instance
+            of :class:`google.auth.credentials.Signing`.
+
+    :rtype: list
+    :returns: A signed URL for each of ``resources``.
+    """
     ensure_signed_credentials(credentials)
     expiration_seconds = get_expiration_seconds_v4(expiration)
 
@@ -508,15 +581,46 @@ def generate_signed_url_v4(
         request_timestamp = now.strftime("%Y%m%dT%H%M%SZ")
         datestamp = now.date().strftime("%Y%m%d")
     else:
+        now = datetime.datetime.strptime(_request_timestamp, "%Y%m%dT%H%M%SZ")
         request_timestamp = _request_timestamp
         datestamp = _request_timestamp[:8]
 
+    cache_key = None
+    if reuse_for is not None:
+        if isinstance(reuse_for, datetime.timedelta):
+            reuse_for = reuse_for.total_seconds()
+        if reuse_for >= expiration_seconds:
+            raise ValueError("'reuse_for' must be shorter than 'expiration'")
+        cache_key = (
+            credentials.signer_email,
+            expiration,
+            api_access_endpoint,
+            method,
+            content_md5,
+            content_type,
+            response_type,
+            response_disposition,
+            generation,
+            frozenset((headers or {}).items()),
+            frozenset((query_parameters or {}).items()),
+        )
+        signed_after = now - datetime.timedelta(seconds=reuse_for)
+        urls = [
+            _URL_CACHE.get((cache_key, resource), signed_after)
+            for resource in resources
+        ]
+    else:
+        urls = [None] * len(resources)
+
+    unsigned = [index for index, url in enumerate(urls) if url is None]
+    if not unsigned:
+        return urls
+
     client_email = credentials.signer_email
     credential_scope = "{}/auto/storage/goog4_request".format(datestamp)
     credential = "{}/{}".format(client_email, credential_scope)
 
-    if headers is None:
-        headers = {}
+    headers = dict(headers or {})
 
     if content_type is not None:
         headers["Content-Type"] = content_type
@@ -561,31 +665,131 @@ def generate_signed_url_v4(
     ordered_query_parameters = sorted(query_parameters.items())
     canonical_query_string = six.moves.urllib.parse.urlencode(ordered_query_parameters)
 
-    canonical_elements = [
-        method,
-        resource,
-        canonical_query_string,
-        canonical_header_string,
-        signed_headers,
-        "UNSIGNED-PAYLOAD",
-    ]
-    canonical_request = "\n".join(canonical_elements)
+    # Everything in the canonical request after the resource.
+    canonical_request_tail = (
+        "\n".join([canonical_query_string, canonical_header_string, signed_headers])
+        + "\nUNSIGNED-PAYLOAD"
+    )
+    string_to_sign_head = "\n".join(
+        ["GOOG4-RSA-SHA256", request_timestamp, credential_scope]
+    )
 
-    canonical_request_hash = hashlib.sha256(
-        canonical_request.encode("ascii")
-    ).hexdigest()
+    strings_to_sign = []
+    for index in unsigned:
+        canonical_request = "\n".join(
+            [method, resources[index], canonical_request_tail]
+        )
+        canonical_request_hash = hashlib.sha256(
+            canonical_request.encode("ascii")
+        ).hexdigest()
+        string_to_sign = "\n".join([string_to_sign_head, canonical_request_hash])
+        strings_to_sign.append(string_to_sign.encode("ascii"))
+
+    signatures = _sign_all(credentials, strings_to_sign, max_workers)
+
+    for index, signature_bytes in zip(unsigned, signatures):
+        signature = binascii.hexlify(signature_bytes).decode("ascii")
+        url = "{}{}?{}&X-Goog-Signature={}".format(
+            api_access_endpoint, resources[index], canonical_query_string, signature
+        )
+        if cache_key is not None:
+            _URL_CACHE.put((cache_key, resources[index]), url, now)
+        urls[index] = url
 
-    string_elements = [
-        "GOOG4-RSA-SHA256",
-        request_timestamp,
-        credential_scope,
-        canonical_request_hash,
-    ]
-    string_to_sign = "\n".join(string_elements)
+    return urls
 
-    signature_bytes = credentials.sign_bytes(string_to_sign.encode("ascii"))
-    signature = binascii.hexlify(signature_bytes).decode("ascii")
 
-    return "{}{}?{}&X-Goog-Signature={}".format(
-        api_access_endpoint, resource, canonical_query_string, signature
-    )
+def _signs_remotely(credentials):
+    """Whether credentials sign with the IAM ``signBlob`` API.
+
+    :type credentials: :class:`google.auth.credentials.Signing`
+    :param credentials: The credentials used to sign.
+
+    :rtype: bool
+    :returns: True if each signature is an API request.
+    """
+    return isinstance(getattr(credentials, "signer", None), google.auth.iam.Signer)
+
+
+def _sign_all(credentials, strings_to_sign, max_workers):
+    """Sign many strings, in parallel if ``max_workers`` is more than 1.
+
+    :type credentials: :class:`google.auth.credentials.Signing`
+    :param credentials: The credentials used to sign.
+
+    :type strings_to_sign: list
+    :param strings_to_sign: The bytes to sign.
+
+    :type max_workers: int
+    :param max_workers: The number of strings to sign at once, or
+                        :data:`None` to choose based on ``credentials``.
+
+    :rtype: list
+    :returns: The signature of each string.
+    """
+    if max_workers is None:
+        if _signs_remotely(credentials):
+            max_workers = _REMOTE_SIGNING_WORKERS
+        else:
+            max_workers = 1
+
+    max_workers = min(max_workers, len(strings_to_sign))
+    if max_workers <= 1:
+        return [credentials.sign_bytes(string) for string in strings_to_sign]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(credentials.sign_bytes, strings_to_sign))
+
+
+class _SignedURLCache(object):
+    """A bounded cache of signed URLs, and when they were signed.
+
+    Safe to use from many threads. When full, the oldest URLs are dropped.
+
+    :type max_size: int
+    :param max_size: The maximum number of URLs to keep.
+    """
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._urls = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, signed_after):
+        """Get a URL, if one was signed recently enough.
+
+        :type key: tuple
+        :param key: The arguments the URL was signed with.
+
+        :type signed_after: :class:`datetime.datetime`
+        :param signed_after: The earliest time the URL may have been signed.
+
+        :rtype: str
+        :returns: The URL, or :data:`None`.
+        """
+        with self._lock:
+            entry = self._urls.get(key)
+        if entry is not None and entry[1] > signed_after:
+            return entry[0]
+        return None
+
+    def put(self, key, url, signed_at):
+        """Add a URL.
+
+        :type key: tuple
+        :param key: The arguments the URL was signed with.
+
+        :type url: str
+        :param url: The signed URL.
+
+        :type signed_at: :class:`datetime.datetime`
+        :param signed_at: When the URL was signed.
+        """
+        with self._lock:
+            self._urls.pop(key, None)
+            self._urls[key] = (url, signed_at)
+            while len(self._urls) > self._max_size:
+                self._urls.popitem(last=False)
+
+
+_URL_CACHE = _SignedURLCache(max_size=100000)
@@ -19,9 +19,11 @@ from email.encoders import encode_noop
 from email.generator import Generator
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
-from email.parser import Parser
+import concurrent.futures
 import io
 import json
+import re
+import time
 
 import requests
 import six
@@ -31,6 +33,14 @@ from google.cloud import exceptions
 from google.cloud.storage._http import Connection
 
 
+_CHUNK_SIZE = 100
+_DEFAULT_MAX_WORKERS = 8
+_MAX_CHUNK_ATTEMPTS = 4
+_INITIAL_RETRY_DELAY = 1.0
+_RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+_BOUNDARY_RE = re.compile(br'boundary=(?:"([^"]+)"|([^\s;]+))', re.IGNORECASE)
+
+
 class MIMEApplicationHTTP(MIMEApplication):
     """MIME type for ``application/http``.
 
@@ -139,21 +149,55 @@ class _FutureResponse(requests.Response):
 class Batch(Connection):
     """Proxy an underlying connection, batching up change operations.
 
+    By default, a batch may defer up to 1000 requests, which are sent in a
+    single ``multipart/mixed`` request when the batch is finished.
+
+    With ``auto_chunk``, a batch may defer any number of requests. They are
+    sent in ``multipart/mixed`` requests of up to 100 requests each, with up
+    to ``max_workers`` of those sent at once, and requests which fail with a
+    transient error (e.g. 429 Too Many Requests or 503 Service Unavailable)
+    are sent again in later batch requests, after waiting 1, 2 and 4
+    seconds.
+
     :type client: :class:`google.cloud.storage.client.Client`
     :param client: The client to use for making connections.
+
+    :type auto_chunk: bool
+    :param auto_chunk: (Optional) If True, split the deferred requests into
+                       several concurrent batch requests, retrying transient
+                       errors.
+
+    :type max_workers: int
+    :param max_workers: (Optional) With ``auto_chunk``, the number of batch
+                        requests to send at once.
+
+    :type raise_exception: bool
+    :param raise_exception: (Optional) If False, :meth:`finish` returns the
+                            responses without raising an exception for those
+                            which failed.
     """
 
     _MAX_BATCH_SIZE = 1000
 
-    def __init__(self, client):
+    def __init__(
+        self,
+        client,
+        auto_chunk=False,
+        max_workers=_DEFAULT_MAX_WORKERS,
+        raise_exception=True,
+    ):
         super(Batch, self).__init__(client)
         self._requests = []
         self._target_objects = []
+        self._auto_chunk = auto_chunk
+        self._max_workers = max_workers
+        self._raise_exception = raise_exception
 
     def _do_request(self, method, url, headers, data, target_object):
         """Override Connection:  defer actual HTTP request.
 
-        Only allow up to ``_MAX_BATCH_SIZE`` requests to be deferred.
+        Only allow up to ``_MAX_BATCH_SIZE`` requests to be deferred, unless
+        ``auto_chunk`` was passed.
 
         :type method: str
         :param method: The HTTP method to use in the request.
@@ -177,7 +221,7 @@ class Batch(Connection):
                 and ``content`` (a string).
         :returns: The HTTP response object and the content of the response.
         """
-        if len(self._requests) >= self._MAX_BATCH_SIZE:
+        if not self._auto_chunk and len(self._requests) >= self._MAX_BATCH_SIZE:
             raise ValueError(
                 "Too many deferred requests (max %d)" % self._MAX_BATCH_SIZE
             )
@@ -198,24 +242,7 @@ class Batch(Connection):
         if len(self._requests) == 0:
             raise ValueError("No deferred requests")
 
-        multi = MIMEMultipart()
-
-        for method, uri, headers, body in self._requests:
-            subrequest = MIMEApplicationHTTP(method, uri, headers, body)
-            multi.attach(subrequest)
-
-        # The `email` package expects to deal with "native" strings
-        if six.PY3:  # pragma: NO COVER  Python3
-            buf = io.StringIO()
-        else:
-            buf = io.BytesIO()
-        generator = Generator(buf, False, 0)
-        generator.flatten(multi)
-        payload = buf.getvalue()
-
-        # Strip off redundant header text
-        _, body = payload.split("\n\n", 1)
-        return dict(multi._headers), body
+        return _prepare_batch_request(self._requests)
 
     def _finish_futures(self, responses):
         """Apply all the batch responses to the futures created.
@@ -242,28 +269,100 @@ class Batch(Connection):
                 except ValueError:
                     target_object._properties = subresponse.content
 
-        if exception_args is not None:
+        if exception_args is not None and self._raise_exception:
             raise exceptions.from_http_response(exception_args)
 
     def finish(self):
         """Submit a single `multipart/mixed` request with deferred requests.
 
+        With ``auto_chunk``, submits as many `multipart/mixed` requests as
+        are needed instead.
+
         :rtype: list of tuples
         :returns: one ``(headers, payload)`` tuple per deferred request.
         """
-        headers, body = self._prepare_batch_request()
+        if self._auto_chunk:
+            responses = self._finish_chunked()
+        else:
+            headers, body = self._prepare_batch_request()
 
-        url = "%s/batch/storage/v1" % self.API_BASE_URL
+            url = "%s/batch/storage/v1" % self.API_BASE_URL
+
+            # Use the private ``_base_connection`` rather than the property
+            # ``_connection``, since the property may be this
+            # current batch.
+            response = self._client._base_connection._make_request(
+                "POST", url, data=body, headers=headers
+            )
+            responses = list(_unpack_batch_response(response))
+        self._finish_futures(responses)
+        return responses
+
+    def _finish_chunked(self):
+        """Send the deferred requests in concurrent chunks, with retries.
 
-        # Use the private ``_base_connection`` rather than the property
-        # ``_connection``, since the property may be this
-        # current batch.
+        :rtype: list of :class:`requests.Response`
+        :returns: The final response to each deferred request.
+        :raises: :class:`ValueError` if no requests have been deferred.
+        """
+        if len(self._requests) == 0:
+            raise ValueError("No deferred requests")
+
+        responses = [None] * len(self._requests)
+        pending = list(range(len(self._requests)))
+        delay = _INITIAL_RETRY_DELAY
+        for attempt in range(_MAX_CHUNK_ATTEMPTS):
+            if attempt:
+                time.sleep(delay)
+                delay *= 2
+
+            chunks = [
+                pending[index : index + _CHUNK_SIZE]
+                for index in range(0, len(pending), _CHUNK_SIZE)
+            ]
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._max_workers
+            ) as executor:
+                chunk_responses = list(executor.map(self._send_chunk, chunks))
+
+            pending = []
+            for chunk, subresponses in zip(chunks, chunk_responses):
+                for index, subresponse in zip(chunk, subresponses):
+                    responses[index] = subresponse
+                    if subresponse.status_code in _RETRYABLE_STATUS_CODES:
+                        pending.append(index)
+            if not pending:
+                break
+
+        return responses
+
+    def _send_chunk(self, indexes):
+        """Send some of the deferred requests in one batch request.
+
+        :type indexes: list of int
+        :param indexes: The positions of the deferred requests to send.
+
+        :rtype: list of :class:`requests.Response`
+        :returns: The response to each request. If the batch request itself
+                  failed with a transient error, that response is returned
+                  for every request.
+        """
+        headers, body = _prepare_batch_request(
+            [self._requests[index] for index in indexes]
+        )
+        url = "%s/batch/storage/v1" % self.API_BASE_URL
         response = self._client._base_connection._make_request(
             "POST", url, data=body, headers=headers
         )
-        responses = list(_unpack_batch_response(response))
-        self._finish_futures(responses)
-        return responses
+        if response.status_code in _RETRYABLE_STATUS_CODES:
+            return [response] * len(indexes)
+        if not 200 <= response.status_code < 300:
+            raise exceptions.from_http_response(response)
+
+        subresponses = list(_unpack_batch_response(response))
+        if len(subresponses) != len(indexes):
+            raise ValueError("Expected a response for every request.")
+        return subresponses
 
     def current(self):
         """Return the topmost batch, or None."""
@@ -281,24 +380,96 @@ class Batch(Connection):
             self._client._pop_batch()
 
 
-def _generate_faux_mime_message(parser, response):
-    """Convert response, content -> (multipart) email.message.
+def _prepare_batch_request(batch_requests):
+    """Prepares headers and body for a batch request.
 
-    Helper for _unpack_batch_response.
+    :type batch_requests: list of tuples
+    :param batch_requests: The ``(method, uri, headers, body)`` of each
+                           request.
+
+    :rtype: tuple (dict, str)
+    :returns: The pair of headers and body of the batch request to be sent.
     """
-    # We coerce to bytes to get consistent concat across
-    # Py2 and Py3. Percent formatting is insufficient since
-    # it includes the b in Py3.
-    content_type = _helpers._to_bytes(response.headers.get("content-type", ""))
+    multi = MIMEMultipart()
+
+    for method, uri, headers, body in batch_requests:
+        subrequest = MIMEApplicationHTTP(method, uri, headers, body)
+        multi.attach(subrequest)
+
+    # The `email` package expects to deal with "native" strings
+    if six.PY3:  # pragma: NO COVER  Python3
+        buf = io.StringIO()
+    else:
+        buf = io.BytesIO()
+    generator = Generator(buf, False, 0)
+    generator.flatten(multi)
+    payload = buf.getvalue()
+
+    # Strip off redundant header text
+    _, body = payload.split("\n\n", 1)
+    return dict(multi._headers), body
+
+
+def _get_boundary(content_type):
+    """Get the boundary from the content type of a multipart response.
+
+    :type content_type: bytes
+    :param content_type: The value of the ``Content-Type`` header.
+
+    :rtype: bytes
+    :returns: The boundary, or :data:`None` if the response is not a
+              multipart response.
+    """
+    if not content_type.lower().startswith(b"multipart/"):
+        return None
+    match = _BOUNDARY_RE.search(content_type)
+    if match is None:
+        return None
+    return match.group(1) or match.group(2)
+
+
+def _find_headers_end(content, position, end):
+    """Find the blank line which ends a block of header lines.
+
+    :type content: bytes
+    :param content: The body of the batch response.
+
+    :type position: int
+    :param position: The start of the first header line.
+
+    :type end: int
+    :param end: The end of the part containing the headers.
+
+    :rtype: tuple (int, int)
+    :returns: The end of the last header line, and the position following
+              the blank line (or ``end``, if there is no blank line).
+    """
+    if content.startswith(b"\n", position) or content.startswith(b"\r\n", position):
+        return position, content.find(b"\n", position) + 1
+    blank = content.find(b"\n\n", position, end)
+    crlf_blank = content.find(b"\n\r\n", position, end)
+    if blank == -1 or -1 < crlf_blank < blank:
+        blank = crlf_blank
+    if blank == -1:
+        return end, end
+    return blank, content.find(b"\n", blank + 1) + 1
 
-    faux_message = b"".join(
-        [b"Content-Type: ", content_type, b"\nMIME-Version: 1.0\n\n", response.content]
-    )
 
-    if six.PY2:
-        return parser.parsestr(faux_message)
-    else:  # pragma: NO COVER  Python3
-        return parser.parsestr(faux_message.decode("utf-8"))
+def _parse_headers(block):
+    """Parse a block of header lines.
+
+    :type block: bytes
+    :param block: The header lines, without the blank line which ends them.
+
+    :rtype: list of tuple
+    :returns: The ``(name, value)`` pairs of the headers.
+    """
+    headers = []
+    for line in block.decode("latin-1").splitlines():
+        name, _, value = line.partition(":")
+        if name:
+            headers.append((name, value.strip()))
+    return headers
 
 
 def _unpack_batch_response(response):
@@ -307,29 +478,70 @@ def _unpack_batch_response(response):
     Creates a generator of tuples of emulating the responses to
     :meth:`requests.Session.request`.
 
+    Parses the ``multipart/mixed`` body one part at a time, as bytes,
+    copying only the body of each part.
+
     :type response: :class:`requests.Response`
     :param response: HTTP response / headers from a request.
-    """
-    parser = Parser()
-    message = _generate_faux_mime_message(parser, response)
 
-    if not isinstance(message._payload, list):
+    :raises: :class:`ValueError` if the response is not a well-formed
+             multipart response.
+    """
+    content_type = _helpers._to_bytes(response.headers.get("content-type", ""))
+    boundary = _get_boundary(content_type)
+    if boundary is None:
         raise ValueError("Bad response:  not multi-part")
 
-    for subrequest in message._payload:
-        status_line, rest = subrequest._payload.split("\n", 1)
-        _, status, _ = status_line.split(" ", 2)
-        sub_message = parser.parsestr(rest)
-        payload = sub_message._payload
-        msg_headers = dict(sub_message._headers)
-        content_id = msg_headers.get("Content-ID")
-
-        subresponse = requests.Response()
-        subresponse.request = requests.Request(
-            method="BATCH", url="contentid://{}".format(content_id)
-        ).prepare()
-        subresponse.status_code = int(status)
-        subresponse.headers.update(msg_headers)
-        subresponse._content = payload.encode("utf-8")
+    content = response.content
+    view = memoryview(content)
+    delimiter = b"\n--" + boundary
+    if content.startswith(delimiter[1:]):
+        position = len(delimiter) - 1
+    else:
+        position = content.find(delimiter)
+        if position == -1:
+            raise ValueError("Bad response:  not multi-part")
+        position += len(delimiter)
+
+    # Creating a ``requests.Response`` is slow, mostly due to its cookie
+    # jar, so copy the attributes of one, sharing its (empty) cookie jar.
+    template = vars(requests.Response())
+
+    while not content.startswith(b"--", position):
+        # Skip the rest of the delimiter line.
+        position = content.find(b"\n", position) + 1
+        next_delimiter = content.find(delimiter, position)
+        if position == 0 or next_delimiter == -1:
+            raise ValueError("Bad response:  missing closing boundary")
+        end = next_delimiter
+        if content[end - 1 : end] == b"\r":
+            end -= 1
+
+        headers_end, status_start = _find_headers_end(content, position, end)
+        part_headers = _parse_headers(content[position:headers_end])
+        status_end = content.find(b"\n", status_start, end)
+        if status_end == -1:
+            status_end = end
+        status_line = content[status_start:status_end].split(None, 2)
+        position = min(status_end + 1, end)
+        headers_end, body_start = _find_headers_end(content, position, end)
+        msg_headers = _parse_headers(content[position:headers_end])
+
+        content_id = None
+        for name, value in part_headers + msg_headers:
+            if name.lower() == "content-id":
+                content_id = value
+                break
+
+        subresponse = requests.Response.__new__(requests.Response)
+        subresponse.__dict__.update(template)
+        subresponse.headers = requests.structures.CaseInsensitiveDict(msg_headers)
+        subresponse.history = []
+        subresponse.request = requests.PreparedRequest()
+        subresponse.request.method = "BATCH"
+        subresponse.request.url = "contentid://{}".format(content_id)
+        subresponse.status_code = int(status_line[1])
+        subresponse._content = view[body_start:end].tobytes()
 
         yield subresponse
+        position = next_delimiter + len(delimiter)
@@ -26,14 +26,20 @@
 """
 
 import base64
+import binascii
+import concurrent.futures
 import copy
 import hashlib
 from io import BytesIO
+import io
 import mimetypes
 import os
+import threading
 import time
 import warnings
 
+import requests.exceptions
+
 from six.moves.urllib.parse import parse_qsl
 from six.moves.urllib.parse import quote
 from six.moves.urllib.parse import urlencode
@@ -52,6 +58,7 @@ from google.cloud._helpers import _to_bytes
 from google.cloud._helpers import _bytes_to_unicode
 from google.cloud.exceptions import NotFound
 from google.api_core.iam import Policy
+from google.cloud.storage import _checksums
 from google.cloud.storage._helpers import _PropertyMixin
 from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage._signing import generate_signed_url_v2
@@ -100,6 +107,25 @@ _READ_LESS_THAN_SIZE = (
 
 _DEFAULT_CHUNKSIZE = 104857600  # 1024 * 1024 B * 100 = 100 MB
 _MAX_MULTIPART_SIZE = 8388608  # 8 MB
+_DEFAULT_SLICE_SIZE = 67108864  # 1024 * 1024 B * 64 = 64 MB
+_SLICE_CHUNK_SIZE = 16777216  # 1024 * 1024 B * 16 = 16 MB
+_MAX_SLICE_ATTEMPTS = 3
+_RETRYABLE_SLICE_STATUS_CODES = (429, 500, 502, 503, 504)
+_SLICE_CHECKSUM_MISMATCH = (
+    "Checksum mismatch while downloading:\n\n  {}\n\n"
+    "The object metadata indicated a {} checksum of:\n\n  {}\n\n"
+    "but the downloaded slices had a combined checksum of:\n\n  {}\n"
+)
+_UPLOAD_CHECKSUM_MISMATCH = (
+    "Checksum mismatch while uploading:\n\n  {}\n\n"
+    "The uploaded data had a {} checksum of:\n\n  {}\n\n"
+    "but the object metadata indicated a checksum of:\n\n  {}\n\n"
+    "The object has been deleted.\n"
+)
+_DEFAULT_COMPOSITE_PART_SIZE = 67108864  # 1024 * 1024 B * 64 = 64 MB
+_MAX_COMPOSE_SOURCES = 32
+_MAX_COMPOSITE_COMPONENTS = 1024
+_COMPOSITE_PART_NAME = "{}.composite-{}-{:05d}"
 
 
 class Blob(_PropertyMixin):
@@ -585,7 +611,181 @@ class Blob(_PropertyMixin):
             while not download.finished:
                 download.consume_next_chunk(transport)
 
-    def download_to_file(self, file_obj, client=None, start=None, end=None):
+    def _do_sliced_download(
+        self,
+        transport,
+        file_obj,
+        download_url,
+        headers,
+        start,
+        end,
+        max_workers,
+        slice_size,
+    ):
+        """Download byte ranges of the blob concurrently, without error handling.
+
+        This is intended to be called by :meth:`download_to_file` so it can
+        be wrapped with error handling / remapping.
+
+        The range from ``start`` to ``end`` is split into slices of
+        ``slice_size`` bytes, which are downloaded on a pool of
+        ``max_workers`` threads and written at their offsets in ``file_obj``.
+        A slice which fails with a transient error is resumed from the last
+        byte written. When the whole object is downloaded, the data is
+        checked against the object's CRC32C checksum, combined from the
+        checksums of the slices, if a fast CRC32C implementation is
+        installed, and otherwise against the object's MD5 hash, if
+        ``file_obj`` is readable.
+
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: The transport (with credentials) that will
+                          make authenticated requests.
+
+        :type file_obj: file
+        :param file_obj: A seekable file handle to which to write the blob's
+                         data, starting at its current position.
+
+        :type download_url: str
+        :param download_url: The URL where the media can be accessed.
+
+        :type headers: dict
+        :param headers: Optional headers to be sent with the requests.
+
+        :type start: int
+        :param start: The first byte in the range to be downloaded.
+
+        :type end: int
+        :param end: The last byte in the range to be downloaded.
+
+        :type max_workers: int
+        :param max_workers: The number of slices to download at once.
+
+        :type slice_size: int
+        :param slice_size: The number of bytes in each slice.
+
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksum of the downloaded data does not match.
+        """
+        whole_object = start == 0 and end == self.size - 1
+        compute_crc32c = (
+            whole_object and self.crc32c is not None and _checksums.HAS_FAST_CRC32C
+        )
+        offset = file_obj.tell()
+        slices = [
+            (slice_start, min(slice_start + slice_size - 1, end))
+            for slice_start in range(start, end + 1, slice_size)
+        ]
+
+        writer_lock = threading.Lock()
+        _preallocate(file_obj, offset + end - start + 1)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._download_slice,
+                    transport,
+                    _SliceWriter(
+                        file_obj,
+                        writer_lock,
+                        offset + slice_start - start,
+                        compute_crc32c,
+                    ),
+                    download_url,
+                    headers,
+                    slice_start,
+                    slice_end,
+                )
+                for slice_start, slice_end in slices
+            ]
+            try:
+                slice_crcs = [future.result() for future in futures]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        file_obj.seek(offset + end - start + 1)
+
+        if compute_crc32c:
+            crc = slice_crcs[0]
+            for (slice_start, slice_end), slice_crc in zip(slices[1:], slice_crcs[1:]):
+                crc = _checksums.crc32c_combine(
+                    crc, slice_crc, slice_end - slice_start + 1
+                )
+            _check_slice_checksum(
+                download_url, "CRC32C", self.crc32c, _checksums.crc32c_to_base64(crc)
+            )
+        elif whole_object and self.md5_hash is not None and _is_readable(file_obj):
+            # MD5 hashes cannot be combined, so read the data back instead.
+            hash_obj = hashlib.md5()
+            file_obj.seek(offset)
+            _write_range_to_hash(file_obj, hash_obj, end - start + 1)
+            actual_md5 = base64.b64encode(hash_obj.digest()).decode("ascii")
+            _check_slice_checksum(download_url, "MD5", self.md5_hash, actual_md5)
+
+    def _download_slice(
+        self, transport, writer, download_url, headers, slice_start, slice_end
+    ):
+        """Download one slice of a sliced download.
+
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: The transport (with credentials) that will
+                          make authenticated requests.
+
+        :type writer: :class:`_SliceWriter`
+        :param writer: Writes the data of the slice into the file.
+
+        :type download_url: str
+        :param download_url: The URL where the media can be accessed.
+
+        :type headers: dict
+        :param headers: Optional headers to be sent with the requests.
+
+        :type slice_start: int
+        :param slice_start: The first byte of the slice.
+
+        :type slice_end: int
+        :param slice_end: The last byte of the slice.
+
+        :rtype: int
+        :returns: The CRC32C checksum of the slice, or :data:`None` if it was
+                  not computed.
+        """
+        attempt = 1
+        while True:
+            download = ChunkedDownload(
+                download_url,
+                _SLICE_CHUNK_SIZE,
+                writer,
+                # Each download sets its own range header, so copy the headers.
+                headers=dict(headers),
+                start=slice_start + writer.bytes_written,
+                end=slice_end,
+            )
+            try:
+                while not download.finished:
+                    download.consume_next_chunk(transport)
+                return writer.crc32c
+            except (
+                resumable_media.InvalidResponse,
+                requests.exceptions.RequestException,
+            ) as exc:
+                if attempt >= _MAX_SLICE_ATTEMPTS or not _is_retryable_slice_error(exc):
+                    raise
+                # Resume the slice from the first byte not yet written.
+                attempt += 1
+
+    def download_to_file(
+        self,
+        file_obj,
+        client=None,
+        start=None,
+        end=None,
+        max_workers=None,
+        slice_size=None,
+    ):
         """Download the contents of this blob into a file-like object.
 
         .. note::
@@ -625,24 +825,79 @@ class Blob(_PropertyMixin):
         :type end: int
         :param end: Optional, The last byte in a range to be downloaded.
 
+        :type max_workers: int
+        :param max_workers: Optional. If greater than 1, download the blob in
+                            slices of ``slice_size`` bytes, using up to this
+                            many threads at once. ``file_obj`` must support
+                            ``seek`` and ``tell``. If :attr:`size` is not yet
+                            loaded, makes an additional API request to load
+                            it. Blobs stored with gzip content encoding are
+                            always downloaded in a single request.
+
+        :type slice_size: int
+        :param slice_size: Optional. The number of bytes in each slice of a
+                           sliced download. Defaults to 64 MB.
+
         :raises: :class:`google.cloud.exceptions.NotFound`
         """
+        if max_workers is not None and max_workers > 1:
+            if self.size is None:
+                self.reload(client=client)
+            if slice_size is None:
+                slice_size = _DEFAULT_SLICE_SIZE
+            range_start = start if start is not None else 0
+            range_end = end if end is not None else self.size - 1
+            if (
+                range_end - range_start + 1 <= slice_size
+                or self.content_encoding == "gzip"
+            ):
+                max_workers = None
+
         download_url = self._get_download_url()
         headers = _get_encryption_headers(self._encryption_key)
         headers["accept-encoding"] = "gzip"
 
         transport = self._get_transport(client)
         try:
-            self._do_download(transport, file_obj, download_url, headers, start, end)
+            if max_workers is not None and max_workers > 1:
+                self._do_sliced_download(
+                    transport,
+                    file_obj,
+                    download_url,
+                    headers,
+                    range_start,
+                    range_end,
+                    max_workers,
+                    slice_size,
+                )
+            else:
+                self._do_download(
+                    transport, file_obj, download_url, headers, start, end
+                )
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc)
 
-    def download_to_filename(self, filename, client=None, start=None, end=None):
+    def download_to_filename(
+        self,
+        filename,
+        client=None,
+        start=None,
+        end=None,
+        max_workers=None,
+        slice_size=None,
+    ):
         """Download the contents of this blob into a named file.
 
         If :attr:`user_project` is set on the bucket, bills the API request
         to that project.
 
+        Pass ``max_workers`` to download large blobs in slices, on several
+        threads at once:
+
+        .. code-block:: python
+
+           blob.download_to_filename("/tmp/large-file", max_workers=8)
+
         :type filename: str
         :param filename: A filename to be passed to ``open``.
 
@@ -657,11 +912,30 @@ class Blob(_PropertyMixin):
         :type end: int
         :param end: Optional, The last byte in a range to be downloaded.
 
+        :type max_workers: int
+        :param max_workers: Optional. If greater than 1, download the blob in
+                            slices, using up to this many threads at once.
+                            See :meth:`download_to_file`.
+
+        :type slice_size: int
+        :param slice_size: Optional. The number of bytes in each slice of a
+                           sliced download. Defaults to 64 MB.
+
         :raises: :class:`google.cloud.exceptions.NotFound`
         """
+        # Open for reading too, so that a sliced download can check the MD5
+        # hash of the data it wrote.
+        mode = "wb+" if max_workers is not None and max_workers > 1 else "wb"
         try:
-            with open(filename, "wb") as file_obj:
-                self.download_to_file(file_obj, client=client, start=start, end=end)
+            with open(filename, mode) as file_obj:
+                self.download_to_file(
+                    file_obj,
+                    client=client,
+                    start=start,
+                    end=end,
+                    max_workers=max_workers,
+                    slice_size=slice_size,
+                )
         except resumable_media.DataCorruption:
             # Delete the corrupt downloaded file.
             os.remove(filename)
@@ -697,6 +971,125 @@ class Blob(_PropertyMixin):
         self.download_to_file(string_buffer, client=client, start=start, end=end)
         return string_buffer.getvalue()
 
+    def open(
+        self,
+        mode="r",
+        chunk_size=None,
+        encoding=None,
+        errors=None,
+        newline=None,
+        client=None,
+        content_type=None,
+        predefined_acl=None,
+        checksum=None,
+    ):
+        """Open a file-like object to stream the contents of this blob.
+
+        Reading downloads the blob in ranged requests of ``chunk_size`` bytes
+        as the data is needed, and supports ``seek``. Writing uploads the
+        data in chunks of ``chunk_size`` bytes with a resumable upload, which
+        is finished when the file is closed. Either way, only about
+        ``chunk_size`` bytes are held in memory:
+
+        .. code-block:: python
+
+           import csv
+
+           with blob.open("r") as file_obj:
+               for row in csv.reader(file_obj):
+                   process(row)
+
+        If a ``with`` block which writes to the blob raises an exception,
+        or the file is garbage collected without being closed, the upload is
+        abandoned, and the blob is left unchanged.
+
+        If :attr:`user_project` is set on the bucket, bills the API requests
+        to that project.
+
+        :type mode: str
+        :param mode: (Optional) One of ``"r"``, ``"rb"``, ``"w"`` or
+                     ``"wb"``. Text modes decode or encode with
+                     ``encoding``.
+
+        :type chunk_size: int
+        :param chunk_size: (Optional) The number of bytes to read ahead, or
+                           to upload, in each request. When writing, must be
+                           a multiple of 256 KB. Defaults to the blob's
+                           ``chunk_size``, if set, and otherwise to 40 MB.
+
+        :type encoding: str
+        :param encoding: (Optional) For text modes, as for :func:`io.open`.
+
+        :type errors: str
+        :param errors: (Optional) For text modes, as for :func:`io.open`.
+
+        :type newline: str
+        :param newline: (Optional) For text modes, as for :func:`io.open`.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type content_type: str
+        :param content_type: (Optional) When writing, the type of content
+                             being uploaded.
+
+        :type predefined_acl: str
+        :param predefined_acl: (Optional) When writing, predefined access
+                               control list
+
+        :type checksum: str
+        :param checksum: (Optional) When writing, either ``"crc32c"`` or
+                         ``"md5"``, to validate the upload with that
+                         checksum. See :meth:`upload_from_file`.
+
+        :rtype: file
+        :returns: An :class:`io.BufferedReader` around a
+                  :class:`~google.cloud.storage.fileio.BlobReader`, a
+                  :class:`~google.cloud.storage.fileio.BlobWriter`, or an
+                  :class:`io.TextIOWrapper` around one of those.
+        :raises: :exc:`ValueError` if ``mode`` is not supported, or if
+                 ``content_type``, ``predefined_acl`` or ``checksum`` is
+                 passed when reading.
+        """
+        from google.cloud.storage import fileio
+
+        if mode not in ("r", "rb", "w", "wb"):
+            raise ValueError("Unsupported mode: {!r}".format(mode))
+        if chunk_size is None:
+            chunk_size = self.chunk_size or fileio.DEFAULT_CHUNK_SIZE
+
+        if mode.startswith("r"):
+            if (
+                content_type is not None
+                or predefined_acl is not None
+                or checksum is not None
+            ):
+                raise ValueError(
+                    "'content_type', 'predefined_acl' and 'checksum' are only "
+                    "used for writing"
+                )
+            file_obj = io.BufferedReader(
+                fileio.BlobReader(self, client=client), buffer_size=chunk_size
+            )
+        else:
+            file_obj = fileio.BlobWriter(
+                self,
+                chunk_size=chunk_size,
+                client=client,
+                content_type=content_type,
+                predefined_acl=ACL.validate_predefined(predefined_acl),
+                checksum=checksum,
+            )
+
+        if mode.endswith("b"):
+            return file_obj
+        if mode == "w":
+            text_class = fileio._TextBlobWriter
+        else:
+            text_class = io.TextIOWrapper
+        return text_class(file_obj, encoding=encoding, errors=errors, newline=newline)
+
     def _get_content_type(self, content_type, filename=None):
         """Determine the content type from the current object.
 
@@ -783,7 +1176,14 @@ class Blob(_PropertyMixin):
         return headers, object_metadata, content_type
 
     def _do_multipart_upload(
-        self, client, stream, content_type, size, num_retries, predefined_acl
+        self,
+        client,
+        stream,
+        content_type,
+        size,
+        num_retries,
+        predefined_acl,
+        checksum=None,
     ):
         """Perform a multipart upload.
 
@@ -816,6 +1216,12 @@ class Blob(_PropertyMixin):
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
 
+        :type checksum: str
+        :param checksum: (Optional) Either ``"crc32c"`` or ``"md5"``. The
+                         checksum of the data is sent with the object
+                         metadata, so that the server rejects the upload if
+                         the data it receives does not match.
+
         :rtype: :class:`~requests.Response`
         :returns: The "200 OK" response object returned after the multipart
                   upload request.
@@ -833,6 +1239,11 @@ class Blob(_PropertyMixin):
         transport = self._get_transport(client)
         info = self._get_upload_arguments(content_type)
         headers, object_metadata, content_type = info
+        if checksum is not None:
+            hash_obj = _checksums.get_hash(checksum)
+            hash_obj.update(data)
+            property_name = _checksums.get_hash_property(checksum)
+            object_metadata[property_name] = _checksums.base64_digest(hash_obj)
 
         base_url = _MULTIPART_URL_TEMPLATE.format(bucket_path=self.bucket.path)
         name_value_pairs = []
@@ -962,7 +1373,14 @@ class Blob(_PropertyMixin):
         return upload, transport
 
     def _do_resumable_upload(
-        self, client, stream, content_type, size, num_retries, predefined_acl
+        self,
+        client,
+        stream,
+        content_type,
+        size,
+        num_retries,
+        predefined_acl,
+        checksum=None,
     ):
         """Perform a resumable upload.
 
@@ -997,10 +1415,21 @@ class Blob(_PropertyMixin):
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
 
+        :type checksum: str
+        :param checksum: (Optional) Either ``"crc32c"`` or ``"md5"``. The
+                         checksum of each chunk is added as it is sent, and
+                         when the upload finishes, the total is compared
+                         with the checksum of the stored object.
+
         :rtype: :class:`~requests.Response`
         :returns: The "200 OK" response object returned after the final chunk
                   is uploaded.
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 checksums do not match, after deleting the object.
         """
+        if checksum is not None:
+            stream = _checksums.HashingReader(stream, checksum)
+
         upload, transport = self._initiate_resumable_upload(
             client,
             stream,
@@ -1013,10 +1442,22 @@ class Blob(_PropertyMixin):
         while not upload.finished:
             response = upload.transmit_next_chunk(transport)
 
+        if checksum is not None:
+            _check_upload_checksum(
+                self, client, response, checksum, stream.base64_digest()
+            )
+
         return response
 
     def _do_upload(
-        self, client, stream, content_type, size, num_retries, predefined_acl
+        self,
+        client,
+        stream,
+        content_type,
+        size,
+        num_retries,
+        predefined_acl,
+        checksum=None,
     ):
         """Determine an upload strategy and then perform the upload.
 
@@ -1053,6 +1494,10 @@ class Blob(_PropertyMixin):
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
 
+        :type checksum: str
+        :param checksum: (Optional) Either ``"crc32c"`` or ``"md5"``, to
+                         compute that checksum of the data as it is sent.
+
         :rtype: dict
         :returns: The parsed JSON from the "200 OK" response. This will be the
                   **only** response in the multipart case and it will be the
@@ -1060,11 +1505,23 @@ class Blob(_PropertyMixin):
         """
         if size is not None and size <= _MAX_MULTIPART_SIZE:
             response = self._do_multipart_upload(
-                client, stream, content_type, size, num_retries, predefined_acl
+                client,
+                stream,
+                content_type,
+                size,
+                num_retries,
+                predefined_acl,
+                checksum=checksum,
             )
         else:
             response = self._do_resumable_upload(
-                client, stream, content_type, size, num_retries, predefined_acl
+                client,
+                stream,
+                content_type,
+                size,
+                num_retries,
+                predefined_acl,
+                checksum=checksum,
             )
 
         return response.json()
@@ -1078,6 +1535,7 @@ class Blob(_PropertyMixin):
         num_retries=None,
         client=None,
         predefined_acl=None,
+        checksum=None,
     ):
         """Upload the contents of this blob from a file-like object.
 
@@ -1139,8 +1597,21 @@ class Blob(_PropertyMixin):
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
 
+        :type checksum: str
+        :param checksum: (Optional) Either ``"crc32c"`` or ``"md5"``, to
+                         validate the upload with that checksum. It is
+                         computed from the data as it is sent, so the file
+                         is read only once. For a single-request upload, the
+                         server checks it; for a resumable upload, it is
+                         compared with the stored object's checksum, and
+                         the object is deleted if they differ. CRC32C is
+                         much faster with ``google-crc32c`` or ``crcmod``
+                         installed.
+
         :raises: :class:`~google.cloud.exceptions.GoogleCloudError`
-                 if the upload response returns an error status.
+                 if the upload response returns an error status, or
+                 :class:`google.resumable_media.DataCorruption` if the
+                 checksum of a resumable upload does not match.
 
         .. _object versioning: https://cloud.google.com/storage/\
                                docs/object-versioning
@@ -1154,14 +1625,122 @@ class Blob(_PropertyMixin):
 
         try:
             created_json = self._do_upload(
-                client, file_obj, content_type, size, num_retries, predefined_acl
+                client,
+                file_obj,
+                content_type,
+                size,
+                num_retries,
+                predefined_acl,
+                checksum=checksum,
             )
             self._set_properties(created_json)
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc)
 
+    def _do_composite_upload(
+        self,
+        client,
+        filename,
+        content_type,
+        size,
+        max_workers,
+        part_size,
+        checksum=None,
+    ):
+        """Upload a file as temporary parts in parallel, then compose them.
+
+        This is intended to be called by :meth:`upload_from_filename` so it
+        can be wrapped with error handling / remapping.
+
+        The file is split into parts of ``part_size`` bytes (or more, so
+        that the blob has at most 1024 components), which are uploaded as
+        temporary blobs on a pool of ``max_workers`` threads. The parts are
+        composed into this blob, through intermediate composite blobs when
+        there are more than 32 of them, and all of the temporary blobs are
+        deleted, whether or not the upload succeeds.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type filename: str
+        :param filename: The path to the file.
+
+        :type content_type: str
+        :param content_type: Type of content being uploaded.
+
+        :type size: int
+        :param size: The size of the file, in bytes.
+
+        :type max_workers: int
+        :param max_workers: The number of parts to upload at once.
+
+        :type part_size: int
+        :param part_size: The number of bytes in each part.
+
+        :type checksum: str
+        :param checksum: (Optional) Either ``"crc32c"`` or ``"md5"``, to
+                         validate the upload of each part.
+        """
+        part_size = max(part_size, -(-size // _MAX_COMPOSITE_COMPONENTS))
+        token = binascii.hexlify(os.urandom(8)).decode("ascii")
+        temporaries = []
+
+        def make_temporary():
+            blob = Blob(
+                _COMPOSITE_PART_NAME.format(self.name, token, len(temporaries)),
+                bucket=self.bucket,
+                chunk_size=self.chunk_size,
+            )
+            temporaries.append(blob)
+            return blob
+
+        def upload_part(part, offset):
+            with open(filename, "rb") as file_obj:
+                file_obj.seek(offset)
+                length = min(part_size, size - offset)
+                part.upload_from_file(
+                    _PartReader(file_obj, length),
+                    size=length,
+                    client=client,
+                    checksum=checksum,
+                )
+
+        def compose_group(composite, group):
+            composite.compose(group, client=client)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                offsets = list(range(0, size, part_size))
+                parts = [make_temporary() for _ in offsets]
+                _wait_for_all(executor, upload_part, zip(parts, offsets))
+
+                while len(parts) > _MAX_COMPOSE_SOURCES:
+                    groups = [
+                        parts[index : index + _MAX_COMPOSE_SOURCES]
+                        for index in range(0, len(parts), _MAX_COMPOSE_SOURCES)
+                    ]
+                    parts = [make_temporary() for _ in groups]
+                    _wait_for_all(executor, compose_group, zip(parts, groups))
+
+                self.content_type = content_type
+                self.compose(parts, client=client)
+            finally:
+                for future in [
+                    executor.submit(_delete_if_exists, blob, client)
+                    for blob in temporaries
+                ]:
+                    future.result()
+
     def upload_from_filename(
-        self, filename, content_type=None, client=None, predefined_acl=None
+        self,
+        filename,
+        content_type=None,
+        client=None,
+        predefined_acl=None,
+        max_workers=None,
+        part_size=None,
+        checksum=None,
     ):
         """Upload this blob's contents from the content of a named file.
 
@@ -1199,9 +1778,51 @@ class Blob(_PropertyMixin):
 
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
+
+        :type max_workers: int
+        :param max_workers: Optional. If greater than 1, upload the file as
+                            temporary parts of ``part_size`` bytes, using up
+                            to this many threads at once, and compose them
+                            into this blob. The resulting composite blob has
+                            no MD5 hash. Files no larger than ``part_size``,
+                            and blobs with a customer-supplied encryption key,
+                            a ``kms_key_name`` or a ``predefined_acl``, are
+                            always uploaded in a single upload.
+
+        :type part_size: int
+        :param part_size: Optional. The number of bytes in each part of a
+                          parallel composite upload. Defaults to 64 MB.
+
+        :type checksum: str
+        :param checksum: (Optional) Either ``"crc32c"`` or ``"md5"``, to
+                         validate the upload (or each part of a parallel
+                         composite upload) with that checksum. See
+                         :meth:`upload_from_file`.
         """
         content_type = self._get_content_type(content_type, filename=filename)
 
+        if (
+            max_workers is not None
+            and max_workers > 1
+            and self._encryption_key is None
+            and self.kms_key_name is None
+            and predefined_acl is None
+        ):
+            if part_size is None:
+                part_size = _DEFAULT_COMPOSITE_PART_SIZE
+            total_bytes = os.path.getsize(filename)
+            if total_bytes > part_size:
+                self._do_composite_upload(
+                    client,
+                    filename,
+                    content_type,
+                    total_bytes,
+                    max_workers,
+                    part_size,
+                    checksum=checksum,
+                )
+                return
+
         with open(filename, "rb") as file_obj:
             total_bytes = os.fstat(file_obj.fileno()).st_size
             self.upload_from_file(
@@ -1210,10 +1831,16 @@ class Blob(_PropertyMixin):
                 client=client,
                 size=total_bytes,
                 predefined_acl=predefined_acl,
+                checksum=checksum,
             )
 
     def upload_from_string(
-        self, data, content_type="text/plain", client=None, predefined_acl=None
+        self,
+        data,
+        content_type="text/plain",
+        client=None,
+        predefined_acl=None,
+        checksum=None,
     ):
         """Upload contents of this blob from the provided string.
 
@@ -1246,6 +1873,11 @@ class Blob(_PropertyMixin):
 
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
+
+        :type checksum: str
+        :param checksum: (Optional) Either ``"crc32c"`` or ``"md5"``, to
+                         validate the upload with that checksum. See
+                         :meth:`upload_from_file`.
         """
         data = _to_bytes(data, encoding="utf-8")
         string_buffer = BytesIO(data)
@@ -1255,6 +1887,7 @@ class Blob(_PropertyMixin):
             content_type=content_type,
             client=client,
             predefined_acl=predefined_acl,
+            checksum=checksum,
         )
 
     def create_resumable_upload_session(
@@ -1526,7 +2159,9 @@ class Blob(_PropertyMixin):
         )
         self._set_properties(api_response)
 
-    def rewrite(self, source, token=None, client=None):
+    def rewrite(
+        self, source, token=None, client=None, max_bytes_rewritten_per_call=None
+    ):
         """Rewrite source blob into this one.
 
         If :attr:`user_project` is set on the bucket, bills the API request
@@ -1545,6 +2180,13 @@ class Blob(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
 
+        :type max_bytes_rewritten_per_call: int
+        :param max_bytes_rewritten_per_call:
+            Optional. The most bytes to rewrite in this call, which must be
+            a multiple of 1 MiB. Rewrites which copy data between locations
+            or storage classes may take many calls; smaller calls return
+            sooner, with a token to continue.
+
         :rtype: tuple
         :returns: ``(token, bytes_rewritten, total_bytes)``, where ``token``
                   is a rewrite token (``None`` if the rewrite is complete),
@@ -1569,6 +2211,9 @@ class Blob(_PropertyMixin):
         if self.kms_key_name is not None:
             query_params["destinationKmsKeyName"] = self.kms_key_name
 
+        if max_bytes_rewritten_per_call is not None:
+            query_params["maxBytesRewrittenPerCall"] = max_bytes_rewritten_per_call
+
         api_response = client._connection.api_request(
             method="POST",
             path=source.path + "/rewriteTo" + self.path,
@@ -2001,6 +2646,238 @@ def _quote(value):
     return quote(value, safe="")
 
 
+class _SliceWriter(object):
+    """Write one slice of a sliced download at its offset in a file.
+
+    Uses positional writes when the file has a file descriptor and the
+    platform supports them, and otherwise seeks and writes while holding
+    a lock shared by all of the slices.
+
+    :type file_obj: file
+    :param file_obj: The file to write to.
+
+    :type lock: :class:`threading.Lock`
+    :param lock: Held while seeking and writing ``file_obj``.
+
+    :type offset: int
+    :param offset: The position in ``file_obj`` of the start of the slice.
+
+    :type compute_crc32c: bool
+    :param compute_crc32c: Whether to compute the CRC32C checksum of the
+                           data written.
+    """
+
+    def __init__(self, file_obj, lock, offset, compute_crc32c=False):
+        self._file_obj = file_obj
+        self._lock = lock
+        self._offset = offset
+        self._fileno = _get_fileno(file_obj) if hasattr(os, "pwrite") else None
+        self.bytes_written = 0
+        self.crc32c = 0 if compute_crc32c else None
+
+    def write(self, data):
+        position = self._offset + self.bytes_written
+        if self._fileno is not None:
+            view = memoryview(data)
+            while view:
+                written = os.pwrite(self._fileno, view, position)
+                view = view[written:]
+                position += written
+        else:
+            with self._lock:
+                self._file_obj.seek(position)
+                self._file_obj.write(data)
+
+        self.bytes_written += len(data)
+        if self.crc32c is not None:
+            self.crc32c = _checksums.crc32c_extend(self.crc32c, data)
+        return len(data)
+
+
+def _get_fileno(file_obj):
+    """Get the file descriptor of a file, flushing any buffered writes.
+
+    :type file_obj: file
+    :param file_obj: A file-like object.
+
+    :rtype: int
+    :returns: The file descriptor, or :data:`None` if ``file_obj`` does not
+              have one.
+    """
+    try:
+        fileno = file_obj.fileno()
+    except (AttributeError, IOError, ValueError):
+        return None
+    file_obj.flush()
+    return fileno
+
+
+def _preallocate(file_obj, size):
+    """Extend a file to at least ``size`` bytes, if it has a file descriptor.
+
+    :type file_obj: file
+    :param file_obj: A file-like object.
+
+    :type size: int
+    :param size: The minimum size of the file, in bytes.
+    """
+    fileno = _get_fileno(file_obj)
+    if fileno is not None and os.fstat(fileno).st_size < size:
+        os.ftruncate(fileno, size)
+
+
+def _is_readable(file_obj):
+    """Check whether data can be read back from a file-like object."""
+    readable = getattr(file_obj, "readable", None)
+    if readable is None:
+        return False
+    try:
+        return readable()
+    except ValueError:
+        return False
+
+
+def _write_range_to_hash(file_obj, hash_obj, size, block_size=8192 * 128):
+    """Read ``size`` bytes from a file into a hash object."""
+    while size > 0:
+        block = file_obj.read(min(block_size, size))
+        if not block:
+            break
+        hash_obj.update(block)
+        size -= len(block)
+
+
+def _is_retryable_slice_error(exc):
+    """Check whether a failed slice of a sliced download may be resumed.
+
+    :type exc: Exception
+    :param exc: The error raised while downloading the slice.
+
+    :rtype: bool
+    :returns: Whether the error is a connection error or a transient error
+              response.
+    """
+    if isinstance(exc, resumable_media.InvalidResponse):
+        return exc.response.status_code in _RETRYABLE_SLICE_STATUS_CODES
+    return isinstance(
+        exc,
+        (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.ChunkedEncodingError,
+            requests.exceptions.Timeout,
+        ),
+    )
+
+
+def _check_slice_checksum(download_url, checksum_type, expected, actual):
+    """Raise if the checksum of a sliced download does not match.
+
+    :raises: :class:`google.resumable_media.DataCorruption`
+    """
+    if actual != expected:
+        msg = _SLICE_CHECKSUM_MISMATCH.format(
+            download_url, checksum_type, expected, actual
+        )
+        raise resumable_media.DataCorruption(None, msg)
+
+
+def _check_upload_checksum(blob, client, response, checksum, actual):
+    """Delete an uploaded object, and raise, if its checksum does not match.
+
+    :type blob: :class:`Blob`
+    :param blob: The blob which was uploaded.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: The client to use to delete the object.
+
+    :type response: :class:`~requests.Response`
+    :param response: The final response of the upload.
+
+    :type checksum: str
+    :param checksum: Either ``"crc32c"`` or ``"md5"``.
+
+    :type actual: str
+    :param actual: The base64-encoded checksum of the data which was sent.
+
+    :raises: :class:`google.resumable_media.DataCorruption`
+    """
+    expected = response.json().get(_checksums.get_hash_property(checksum))
+    if expected is None or expected == actual:
+        # Objects without an MD5 hash cannot be checked.
+        return
+
+    try:
+        blob.delete(client=client)
+    except NotFound:
+        pass
+    msg = _UPLOAD_CHECKSUM_MISMATCH.format(
+        blob.path, checksum.upper(), actual, expected
+    )
+    raise resumable_media.DataCorruption(response, msg)
+
+
+class _PartReader(object):
+    """Read at most ``size`` bytes of a file, from its current position.
+
+    Used to upload one part of a parallel composite upload, so that the
+    upload stops at the end of the part.
+
+    :type file_obj: file
+    :param file_obj: A seekable file handle open for reading.
+
+    :type size: int
+    :param size: The number of bytes in the part.
+    """
+
+    def __init__(self, file_obj, size):
+        self._file_obj = file_obj
+        self._start = file_obj.tell()
+        self._size = size
+
+    def tell(self):
+        return self._file_obj.tell() - self._start
+
+    def seek(self, position, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            position += self.tell()
+        elif whence == os.SEEK_END:
+            position += self._size
+        position = min(max(position, 0), self._size)
+        self._file_obj.seek(self._start + position)
+        return position
+
+    def read(self, size=-1):
+        remaining = self._size - self.tell()
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        return self._file_obj.read(size)
+
+
+def _wait_for_all(executor, func, arguments):
+    """Call a function concurrently for each set of arguments.
+
+    :raises: The first error raised by any of the calls, after cancelling
+             those which have not yet started.
+    """
+    futures = [executor.submit(func, *args) for args in arguments]
+    try:
+        for future in futures:
+            future.result()
+    except Exception:
+        for future in futures:
+            future.cancel()
+        concurrent.futures.wait(futures)
+        raise
+
+
+def _delete_if_exists(blob, client):
+    """Delete a temporary blob, ignoring it if it was never created."""
+    try:
+        blob.delete(client=client)
+    except NotFound:
+        pass
+
+
 def _maybe_rewind(stream, rewind=False):
     """Rewind the stream if desired.
 
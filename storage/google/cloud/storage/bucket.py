@@ -15,26 +15,32 @@
 """Create / interact with Google Cloud Storage buckets."""
 
 import base64
+import collections
 import copy
 import datetime
 import json
 import warnings
 
 import six
+from six.moves import http_client
+from six.moves.urllib.parse import quote
 
 from google.api_core import page_iterator
 from google.api_core import datetime_helpers
+from google.cloud import exceptions
 from google.cloud._helpers import _datetime_to_rfc3339
 from google.cloud._helpers import _NOW
 from google.cloud._helpers import _rfc3339_to_datetime
 from google.cloud.exceptions import NotFound
 from google.api_core.iam import Policy
+from google.cloud.storage import _listing
 from google.cloud.storage import _signing
 from google.cloud.storage._helpers import _PropertyMixin
 from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage._helpers import _validate_name
 from google.cloud.storage._signing import generate_signed_url_v2
 from google.cloud.storage._signing import generate_signed_url_v4
+from google.cloud.storage._signing import generate_signed_urls_v4
 from google.cloud.storage.acl import BucketACL
 from google.cloud.storage.acl import DefaultObjectACL
 from google.cloud.storage.blob import Blob
@@ -48,6 +54,13 @@ _LOCATION_SETTER_MESSAGE = (
     "to `Bucket.create`."
 )
 _API_ACCESS_ENDPOINT = "https://storage.googleapis.com"
+_BLOB_SUMMARY_FIELDS = "items(name,size,generation),prefixes,nextPageToken"
+_DEFAULT_LISTING_WORKERS = 8
+
+
+BlobSummary = collections.namedtuple("BlobSummary", ["name", "size", "generation"])
+"""The name, size and generation of an object, as listed by
+:meth:`Bucket.list_blob_summaries`."""
 
 
 def _blobs_page_start(iterator, page, response):
@@ -89,6 +102,21 @@ def _item_to_blob(iterator, item):
     return blob
 
 
+def _item_to_blob_summary(iterator, item):
+    """Convert a JSON blob to a :class:`BlobSummary`.
+
+    :type iterator: :class:`~google.api_core.page_iterator.Iterator`
+    :param iterator: The iterator that has retrieved the item.
+
+    :type item: dict
+    :param item: An item to be converted to a summary.
+
+    :rtype: :class:`BlobSummary`
+    :returns: The next summary in the page.
+    """
+    return BlobSummary(item["name"], int(item["size"]), int(item["generation"]))
+
+
 def _item_to_notification(iterator, item):
     """Convert a JSON blob to the native object.
 
@@ -718,6 +746,7 @@ class Bucket(_PropertyMixin):
         projection="noAcl",
         fields=None,
         client=None,
+        prefetch=False,
     ):
         """Return an iterator used to find blobs in the bucket.
 
@@ -766,10 +795,140 @@ class Bucket(_PropertyMixin):
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type prefetch: bool
+        :param prefetch: (Optional) If true, request each page of results on
+                         a background thread while the previous page is
+                         being consumed.
+
         :rtype: :class:`~google.api_core.page_iterator.Iterator`
         :returns: Iterator of all :class:`~google.cloud.storage.blob.Blob`
                   in this bucket matching the arguments.
         """
+        return self._list_objects(
+            _item_to_blob,
+            max_results=max_results,
+            page_token=page_token,
+            prefix=prefix,
+            delimiter=delimiter,
+            versions=versions,
+            projection=projection,
+            fields=fields,
+            client=client,
+            prefetch=prefetch,
+        )
+
+    def list_blob_summaries(
+        self,
+        prefix=None,
+        versions=None,
+        fan_out=False,
+        delimiter="/",
+        max_workers=None,
+        max_results=None,
+        client=None,
+    ):
+        """Quickly list the name, size and generation of blobs in the bucket.
+
+        Intended for taking an inventory of a large bucket: only the
+        ``name``, ``size`` and ``generation`` fields are requested, each is
+        returned as a :class:`BlobSummary` tuple rather than as a
+        :class:`~google.cloud.storage.blob.Blob`, and each page of results
+        is requested while the previous one is being consumed.
+
+        With ``fan_out``, the bucket is listed as a hierarchy split by
+        ``delimiter``, and each "directory" found is listed in parallel, so
+        buckets with many prefixes are listed many times faster. The
+        summaries are then returned in no particular order.
+
+        If :attr:`user_project` is set, bills the API requests to that
+        project.
+
+        :type prefix: str
+        :param prefix: (Optional) prefix used to filter blobs.
+
+        :type versions: bool
+        :param versions: (Optional) Whether object versions should be returned
+                         as separate summaries.
+
+        :type fan_out: bool
+        :param fan_out: (Optional) If true, list the prefixes found with
+                        ``delimiter`` in parallel.
+
+        :type delimiter: str
+        :param delimiter: (Optional) When ``fan_out`` is true, the delimiter
+                          which splits names into prefixes to list in
+                          parallel. Defaults to ``"/"``.
+
+        :type max_workers: int
+        :param max_workers: (Optional) When ``fan_out`` is true, the number
+                            of prefixes to list at once. Defaults to 8.
+
+        :type max_results: int
+        :param max_results: (Optional) The maximum number of summaries to
+                            return. Cannot be combined with ``fan_out``.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :rtype: iterator
+        :returns: Iterator of :class:`BlobSummary` for all blobs in this
+                  bucket matching the arguments.
+        :raises: :exc:`ValueError` if both ``fan_out`` and ``max_results``
+                 are passed.
+        """
+        if not fan_out:
+            return self._list_objects(
+                _item_to_blob_summary,
+                max_results=max_results,
+                prefix=prefix,
+                versions=versions,
+                fields=_BLOB_SUMMARY_FIELDS,
+                client=client,
+                prefetch=True,
+            )
+
+        if max_results is not None:
+            raise ValueError("'max_results' cannot be combined with 'fan_out'")
+        if max_workers is None:
+            max_workers = _DEFAULT_LISTING_WORKERS
+
+        def list_pages(sub_prefix):
+            return self._list_objects(
+                _item_to_blob_summary,
+                prefix=sub_prefix,
+                delimiter=delimiter,
+                versions=versions,
+                fields=_BLOB_SUMMARY_FIELDS,
+                client=client,
+                prefetch=True,
+            ).pages
+
+        return _listing.fan_out(list_pages, prefix, max_workers)
+
+    def _list_objects(
+        self,
+        item_to_value,
+        max_results=None,
+        page_token=None,
+        prefix=None,
+        delimiter=None,
+        versions=None,
+        projection="noAcl",
+        fields=None,
+        client=None,
+        prefetch=False,
+    ):
+        """Make an iterator over the objects in the bucket.
+
+        See :meth:`list_blobs` for the arguments.
+
+        :type item_to_value: callable
+        :param item_to_value: Converts each JSON object in a page of results.
+
+        :rtype: :class:`~google.api_core.page_iterator.Iterator`
+        :returns: Iterator of the converted objects.
+        """
         extra_params = {"projection": projection}
 
         if prefix is not None:
@@ -789,11 +948,15 @@ class Bucket(_PropertyMixin):
 
         client = self._require_client(client)
         path = self.path + "/o"
-        iterator = page_iterator.HTTPIterator(
+        if prefetch:
+            iterator_class = _listing.PrefetchingHTTPIterator
+        else:
+            iterator_class = page_iterator.HTTPIterator
+        iterator = iterator_class(
             client=client,
             api_request=client._connection.api_request,
             path=path,
-            item_to_value=_item_to_blob,
+            item_to_value=item_to_value,
             page_token=page_token,
             max_results=max_results,
             extra_params=extra_params,
@@ -942,11 +1105,22 @@ class Bucket(_PropertyMixin):
             _target_object=None,
         )
 
-    def delete_blobs(self, blobs, on_error=None, client=None):
+    def delete_blobs(self, blobs, on_error=None, client=None, max_workers=None):
         """Deletes a list of blobs from the current bucket.
 
         Uses :meth:`delete_blob` to delete each individual blob.
 
+        Pass ``max_workers`` to delete the blobs with batch requests of up to
+        100 deletes each, sending up to ``max_workers`` batch requests at
+        once. Every blob is then deleted (or found to be missing) before
+        any exception is raised:
+
+        .. code-block:: python
+
+           blobs = bucket.list_blobs(prefix="logs/2018/")
+           bucket.delete_blobs(list(blobs), on_error=lambda blob: None,
+                               max_workers=8)
+
         If :attr:`user_project` is set, bills the API request to that project.
 
         :type blobs: list
@@ -963,9 +1137,18 @@ class Bucket(_PropertyMixin):
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type max_workers: int
+        :param max_workers: (Optional) If passed, delete the blobs with
+                            concurrent batch requests, sending up to this
+                            many at once.
+
         :raises: :class:`~google.cloud.exceptions.NotFound` (if
                  `on_error` is not passed).
         """
+        if max_workers is not None:
+            self._delete_blobs_batched(blobs, on_error, client, max_workers)
+            return
+
         for blob in blobs:
             try:
                 blob_name = blob
@@ -978,6 +1161,58 @@ class Bucket(_PropertyMixin):
                 else:
                     raise
 
+    def _delete_blobs_batched(self, blobs, on_error, client, max_workers):
+        """Delete blobs with concurrent batch requests.
+
+        Helper for :meth:`delete_blobs`.
+
+        :type blobs: list
+        :param blobs: A list of :class:`~google.cloud.storage.blob.Blob`-s or
+                      blob names to delete.
+
+        :type on_error: callable
+        :param on_error: Called once for each blob which was not found.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.
+
+        :type max_workers: int
+        :param max_workers: The number of batch requests to send at once.
+
+        :raises: :class:`~google.cloud.exceptions.NotFound` (if
+                 `on_error` is not passed), or the first other error.
+        """
+        blobs = list(blobs)
+        if not blobs:
+            return
+
+        client = self._require_client(client)
+        batch = client.batch(
+            auto_chunk=True, max_workers=max_workers, raise_exception=False
+        )
+        for blob in blobs:
+            blob_name = blob
+            if not isinstance(blob_name, six.string_types):
+                blob_name = blob.name
+            deleted = Blob(blob_name, bucket=self)
+            batch.api_request(
+                method="DELETE",
+                path=deleted.path,
+                query_params=deleted._query_params,
+                _target_object=None,
+            )
+        responses = batch.finish()
+
+        error_response = None
+        for blob, response in zip(blobs, responses):
+            if response.status_code == http_client.NOT_FOUND and on_error:
+                on_error(blob)
+            elif not 200 <= response.status_code < 300:
+                error_response = error_response or response
+
+        if error_response is not None:
+            raise exceptions.from_http_response(error_response)
+
     def copy_blob(
         self,
         blob,
@@ -2080,3 +2315,125 @@ class Bucket(_PropertyMixin):
             headers=headers,
             query_parameters=query_parameters,
         )
+
+    def generate_signed_urls(
+        self,
+        blob_names,
+        expiration,
+        api_access_endpoint=_API_ACCESS_ENDPOINT,
+        method="GET",
+        content_type=None,
+        response_disposition=None,
+        response_type=None,
+        headers=None,
+        query_parameters=None,
+        client=None,
+        credentials=None,
+        max_workers=None,
+        reuse_for=None,
+    ):
+        """Generates V4 signed URLs for many blobs in this bucket.
+
+        Gives the same URLs as calling
+        :meth:`~google.cloud.storage.blob.Blob.generate_signed_url` with
+        ``version="v4"`` for each blob, but the parts of the signature which
+        do not depend on the blob name are computed only once. When the
+        credentials sign remotely (for example, on Compute Engine with the
+        IAM ``signBlob`` API), the signatures are requested in parallel.
+
+        With ``reuse_for``, URLs are memoized: asking again, with the same
+        arguments, for a URL generated less than ``reuse_for`` ago returns
+        the same URL without signing it again.
+
+        :type blob_names: list of str
+        :param blob_names: The names of the blobs.
+
+        :type expiration: Union[Integer, datetime.datetime, datetime.timedelta]
+        :param expiration: Point in time when the signed URLs should expire.
+
+        :type api_access_endpoint: str
+        :param api_access_endpoint: Optional URI base.
+
+        :type method: str
+        :param method: The HTTP verb that will be used when requesting the URLs.
+
+        :type content_type: str
+        :param content_type: (Optional) The content type of the objects.
+
+        :type response_disposition: str
+        :param response_disposition: (Optional) Content disposition of
+                                     responses to requests for the signed URLs.
+
+        :type response_type: str
+        :param response_type: (Optional) Content type of responses to requests
+                              for the signed URLs.
+
+        :type headers: dict
+        :param headers:
+            (Optional) Additional HTTP headers to be included as part of the
+            signed URLs.  See:
+            https://cloud.google.com/storage/docs/xml-api/reference-headers
+            Requests using the signed URLs *must* pass the specified header
+            (name and value) with each request for the URL.
+
+        :type query_parameters: dict
+        :param query_parameters:
+            (Optional) Additional query paramters to be included as part of
+            the signed URLs.  See:
+            https://cloud.google.com/storage/docs/xml-api/reference-headers#query
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type credentials: :class:`oauth2client.client.OAuth2Credentials` or
+                           :class:`NoneType`
+        :param credentials: (Optional) The OAuth2 credentials to use to sign
+                            the URLs. Defaults to the credentials stored on the
+                            client used.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of signatures to request at
+                            once. Defaults to 8 for credentials which sign
+                            remotely, and 1 otherwise.
+
+        :type reuse_for: Union[Integer, datetime.timedelta]
+        :param reuse_for: (Optional) How long (in seconds) a URL may be
+                          reused for. When ``expiration`` is relative, a
+                          reused URL expires up to this much sooner. Must be
+                          shorter than ``expiration``.
+
+        :raises: :exc:`TypeError` when expiration is not a valid type.
+        :raises: :exc:`ValueError` when ``reuse_for`` is too long.
+        :raises: :exc:`AttributeError` if credentials is not an instance
+                of :class:`google.auth.credentials.Signing`.
+
+        :rtype: list of str
+        :returns: A signed URL for each of ``blob_names``, in the same order.
+        """
+        resources = [
+            "/{bucket_name}/{quoted_name}".format(
+                bucket_name=self.name, quoted_name=quote(blob_name.encode("utf-8"))
+            )
+            for blob_name in blob_names
+        ]
+
+        if credentials is None:
+            client = self._require_client(client)
+            credentials = client._credentials
+
+        return generate_signed_urls_v4(
+            credentials,
+            resources,
+            expiration,
+            api_access_endpoint=api_access_endpoint,
+            method=method.upper(),
+            content_type=content_type,
+            response_type=response_type,
+            response_disposition=response_disposition,
+            headers=headers,
+            query_parameters=query_parameters,
+            max_workers=max_workers,
+            reuse_for=reuse_for,
+        )
@@ -199,17 +199,39 @@ class Client(ClientWithProject):
         """
         return Bucket(client=self, name=bucket_name, user_project=user_project)
 
-    def batch(self):
+    def batch(self, auto_chunk=False, max_workers=None, raise_exception=True):
         """Factory constructor for batch object.
 
         .. note::
           This will not make an HTTP request; it simply instantiates
           a batch object owned by this client.
 
+        :type auto_chunk: bool
+        :param auto_chunk: (Optional) If True, the batch may defer any number
+                           of requests, and sends them in several concurrent
+                           batch requests, retrying transient errors.
+
+        :type max_workers: int
+        :param max_workers: (Optional) With ``auto_chunk``, the number of
+                            batch requests to send at once.
+
+        :type raise_exception: bool
+        :param raise_exception: (Optional) If False, finishing the batch
+                                does not raise an exception for requests
+                                which failed.
+
         :rtype: :class:`google.cloud.storage.batch.Batch`
         :returns: The batch object created.
         """
-        return Batch(client=self)
+        kwargs = {}
+        if max_workers is not None:
+            kwargs["max_workers"] = max_workers
+        return Batch(
+            client=self,
+            auto_chunk=auto_chunk,
+            raise_exception=raise_exception,
+            **kwargs
+        )
 
     def get_bucket(self, bucket_or_name):
         """API call: retrieve a bucket via a GET request.
@@ -0,0 +1,378 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""File-like objects which read or write the contents of a blob.
+
+These are usually created with :meth:`~google.cloud.storage.blob.Blob.open`.
+"""
+
+import io
+
+from google import resumable_media
+from google.resumable_media.requests import ChunkedDownload
+
+from google.cloud.storage import _checksums
+from google.cloud.storage.blob import _check_upload_checksum
+from google.cloud.storage.blob import _get_encryption_headers
+from google.cloud.storage.blob import _raise_from_invalid_response
+
+
+DEFAULT_CHUNK_SIZE = 41943040  # 1024 * 1024 B * 40 = 40 MB
+"""int: The number of bytes read ahead, or uploaded, in each request."""
+
+
+class BlobReader(io.RawIOBase):
+    """Read the contents of a blob with ranged requests.
+
+    Each call to :meth:`readinto` downloads at most the size of the given
+    buffer, starting at the current position, so wrap a reader in an
+    :class:`io.BufferedReader` (as :meth:`~google.cloud.storage.blob.Blob.open`
+    does) to read ahead in large requests.
+
+    If :attr:`~google.cloud.storage.blob.Blob.size` is not yet loaded,
+    makes an API request to load it.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to read.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+    """
+
+    def __init__(self, blob, client=None):
+        super(BlobReader, self).__init__()
+        if blob.size is None:
+            blob.reload(client=client)
+        self._blob = blob
+        self._client = client
+        self._position = 0
+        self._transport = None
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """Change the position at which the next read starts.
+
+        :type offset: int
+        :param offset: The offset, relative to ``whence``.
+
+        :type whence: int
+        :param whence: (Optional) One of :data:`io.SEEK_SET`,
+                       :data:`io.SEEK_CUR` or :data:`io.SEEK_END`.
+
+        :rtype: int
+        :returns: The new position.
+        """
+        _check_open(self)
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._blob.size + offset
+        else:
+            raise ValueError("Invalid whence: {!r}".format(whence))
+        if position < 0:
+            raise ValueError("Negative seek position {:d}".format(position))
+        self._position = position
+        return position
+
+    def readinto(self, buffer):
+        """Download bytes from the current position into a buffer.
+
+        :type buffer: bytearray
+        :param buffer: A writable buffer, which is filled with up to its
+                       length in bytes.
+
+        :rtype: int
+        :returns: The number of bytes read, which is zero at the end of the
+                  blob.
+        """
+        _check_open(self)
+        size = min(len(buffer), self._blob.size - self._position)
+        if size <= 0:
+            return 0
+
+        if self._transport is None:
+            self._transport = self._blob._get_transport(self._client)
+        headers = _get_encryption_headers(self._blob._encryption_key)
+        headers["accept-encoding"] = "gzip"
+        stream = io.BytesIO()
+        # Ranged requests do not return the checksum of the range, so use a
+        # chunked download, which does not check one.
+        download = ChunkedDownload(
+            self._blob._get_download_url(),
+            size,
+            stream,
+            headers=headers,
+            start=self._position,
+            end=self._position + size - 1,
+        )
+        try:
+            download.consume_next_chunk(self._transport)
+        except resumable_media.InvalidResponse as exc:
+            _raise_from_invalid_response(exc)
+
+        data = stream.getvalue()
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
+class BlobWriter(io.RawIOBase):
+    """Write the contents of a blob with a resumable upload.
+
+    Data is buffered until ``chunk_size`` bytes are available, and each
+    chunk is then uploaded, so at most about ``chunk_size`` bytes are held
+    in memory. The upload is finished, and the blob's properties are
+    updated, when the writer is closed. If less than ``chunk_size`` bytes
+    were written, they are uploaded in a single request instead.
+
+    The upload is abandoned, leaving the blob unchanged, if the ``with``
+    block using the writer raises an exception, or if the writer is garbage
+    collected without being closed.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to write.
+
+    :type chunk_size: int
+    :param chunk_size: (Optional) The number of bytes to upload in each
+                       request. Must be a multiple of 256 KB. Defaults to
+                       the blob's ``chunk_size``, if set, and otherwise to
+                       40 MB.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+
+    :type content_type: str
+    :param content_type: (Optional) Type of content being uploaded.
+
+    :type predefined_acl: str
+    :param predefined_acl: (Optional) predefined access control list
+
+    :type checksum: str
+    :param checksum: (Optional) Either ``"crc32c"`` or ``"md5"``, to
+                     validate the upload with that checksum, computed as the
+                     data is sent. See
+                     :meth:`~google.cloud.storage.blob.Blob.upload_from_file`.
+    """
+
+    def __init__(
+        self,
+        blob,
+        chunk_size=None,
+        client=None,
+        content_type=None,
+        predefined_acl=None,
+        checksum=None,
+    ):
+        super(BlobWriter, self).__init__()
+        if chunk_size is None:
+            chunk_size = blob.chunk_size or DEFAULT_CHUNK_SIZE
+        self._blob = blob
+        self._chunk_size = chunk_size
+        self._client = client
+        self._content_type = content_type
+        self._predefined_acl = predefined_acl
+        self._checksum = checksum
+        self._buffer = _SlidingBuffer()
+        self._stream = self._buffer
+        self._upload = None
+        self._transport = None
+
+    def writable(self):
+        return True
+
+    def tell(self):
+        return self._buffer.tell() + len(self._buffer)
+
+    def write(self, data):
+        """Buffer data, uploading each complete chunk.
+
+        :type data: bytes
+        :param data: The data to write.
+
+        :rtype: int
+        :returns: The number of bytes written, which is always all of
+                  ``data``.
+        """
+        _check_open(self)
+        written = self._buffer.write(data)
+        while len(self._buffer) >= self._chunk_size:
+            self._upload_chunk()
+        return written
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            # Do not finish the upload with partial data.
+            self._abandon()
+        else:
+            self.close()
+
+    def __del__(self):
+        # ``IOBase`` would close, and so finish the upload, with whatever
+        # was written before the writer was dropped.
+        self._abandon()
+
+    def _abandon(self):
+        """Close without finishing the upload."""
+        super(BlobWriter, self).close()
+
+    def close(self):
+        """Upload any remaining data and finish the upload."""
+        if self.closed:
+            return
+        try:
+            if self._upload is None:
+                self._buffer.seek(0)
+                self._blob.upload_from_file(
+                    self._buffer,
+                    size=len(self._buffer),
+                    content_type=self._content_type,
+                    client=self._client,
+                    predefined_acl=self._predefined_acl,
+                    checksum=self._checksum,
+                )
+            else:
+                # Uploading fewer than ``chunk_size`` bytes (maybe none)
+                # finishes the upload.
+                response = self._upload_chunk()
+                if self._checksum is not None:
+                    _check_upload_checksum(
+                        self._blob,
+                        self._client,
+                        response,
+                        self._checksum,
+                        self._stream.base64_digest(),
+                    )
+                self._blob._set_properties(response.json())
+        finally:
+            super(BlobWriter, self).close()
+
+    def _upload_chunk(self):
+        """Upload the next chunk, starting the upload if needed.
+
+        :rtype: :class:`requests.Response`
+        :returns: The response to the upload request.
+        """
+        if self._upload is None:
+            if self._checksum is not None:
+                self._stream = _checksums.HashingReader(self._buffer, self._checksum)
+            self._upload, self._transport = self._blob._initiate_resumable_upload(
+                self._client,
+                self._stream,
+                self._content_type,
+                None,
+                None,
+                predefined_acl=self._predefined_acl,
+                chunk_size=self._chunk_size,
+            )
+        try:
+            response = self._upload.transmit_next_chunk(self._transport)
+        except resumable_media.InvalidResponse as exc:
+            _raise_from_invalid_response(exc)
+        # Drop the data which the server has received.
+        self._buffer.discard(self._upload.bytes_uploaded)
+        return response
+
+
+class _TextBlobWriter(io.TextIOWrapper):
+    """A text wrapper which abandons the upload as :class:`BlobWriter` does.
+
+    :class:`io.TextIOWrapper` would otherwise close the writer, and so
+    finish the upload, when its ``with`` block raises an exception, or when
+    it is garbage collected.
+    """
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.buffer._abandon()
+        return super(_TextBlobWriter, self).__exit__(exc_type, exc_value, traceback)
+
+    def __del__(self):
+        # ``buffer`` is ``None`` once detached.
+        if self.buffer is not None:
+            self.buffer._abandon()
+
+
+def _check_open(file_obj):
+    if file_obj.closed:
+        raise ValueError("I/O operation on closed file.")
+
+
+class _SlidingBuffer(object):
+    """A stream which discards data once it has been uploaded.
+
+    Positions are relative to the start of everything written, as a
+    resumable upload expects, but only data which has not been discarded
+    can be read (or sought to).
+    """
+
+    def __init__(self):
+        self._buffer = io.BytesIO()
+        # The position in the stream of the start of ``_buffer``.
+        self._offset = 0
+
+    def __len__(self):
+        """The number of bytes after the current position."""
+        return self._end() - self._buffer.tell()
+
+    def _end(self):
+        position = self._buffer.tell()
+        end = self._buffer.seek(0, io.SEEK_END)
+        self._buffer.seek(position)
+        return end
+
+    def write(self, data):
+        position = self._buffer.tell()
+        self._buffer.seek(0, io.SEEK_END)
+        written = self._buffer.write(data)
+        self._buffer.seek(position)
+        return written
+
+    def read(self, size=-1):
+        return self._buffer.read(size)
+
+    def tell(self):
+        return self._offset + self._buffer.tell()
+
+    def seek(self, position, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            position += self.tell()
+        elif whence == io.SEEK_END:
+            position += self._offset + self._end()
+        if position < self._offset:
+            raise ValueError("Cannot seek to data which has been discarded.")
+        self._buffer.seek(position - self._offset)
+        return position
+
+    def discard(self, position):
+        """Discard the data before a position, and seek to it.
+
+        :type position: int
+        :param position: The position in the stream of the first byte to
+                         keep.
+        """
+        self.seek(position)
+        remaining = self._buffer.read()
+        self._buffer = io.BytesIO(remaining)
+        self._offset = position
@@ -0,0 +1,799 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Concurrent uploads, downloads and copies of many blobs.
+
+Each function transfers its blobs on a pool of worker threads (or
+processes), and returns a :class:`TransferSummary` describing the outcome
+of each transfer:
+
+.. code-block:: python
+
+   from google.cloud import storage
+   from google.cloud.storage import transfer_manager
+
+   client = storage.Client()
+   bucket = client.bucket("my-bucket")
+   summary = transfer_manager.download_bucket_prefix(
+       bucket, "datasets/2019/", "/tmp/sync", max_workers=16
+   )
+   for result in summary.errors:
+       print(result.blob.name, result.error)
+   print(summary.bytes_per_second)
+"""
+
+import concurrent.futures
+import functools
+import os
+import threading
+import time
+
+import requests.adapters
+
+
+THREAD = "thread"
+"""Transfer blobs on a pool of threads, sharing one connection pool."""
+
+PROCESS = "process"
+"""Transfer blobs on a pool of processes.
+
+Each process creates its own :class:`~google.cloud.storage.client.Client`,
+using the default credentials from the environment, so the caller's client
+(and any changes the transfers make to the caller's blobs) are not shared.
+"""
+
+_DEFAULT_MAX_WORKERS = 8
+# Transfers submitted to the pool ahead of the workers, per worker. Tasks
+# are taken from their iterable only as this window allows, so a long
+# listing is not held in memory as pending futures.
+_MAX_PENDING_PER_WORKER = 2
+_DEFAULT_REWRITE_CALL_SECONDS = 20.0
+_MIB = 1024 * 1024
+# The weight of each new observation of the rate of rewrite calls.
+_REWRITE_RATE_SMOOTHING = 0.3
+
+# A client for each worker process, created on first use.
+_PROCESS_CLIENT = None
+
+
+class TransferResult(object):
+    """The outcome of transferring one blob.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob which was uploaded, downloaded, or copied to.
+
+    :type filename: str
+    :param filename: The local file which was uploaded or downloaded, or
+                     :data:`None` for a copy.
+
+    :type size: int
+    :param size: The number of bytes transferred.
+
+    :type elapsed: float
+    :param elapsed: The time taken by the transfer, in seconds.
+
+    :type error: Exception
+    :param error: (Optional) The error raised by the transfer, if it failed.
+
+    :type source: :class:`~google.cloud.storage.blob.Blob`
+    :param source: (Optional) For a copy, the blob which was copied.
+    """
+
+    def __init__(self, blob, filename, size, elapsed, error=None, source=None):
+        self.blob = blob
+        self.filename = filename
+        self.size = size
+        self.elapsed = elapsed
+        self.error = error
+        self.source = source
+
+    def __repr__(self):
+        return "<TransferResult: {}, {}, {} bytes, error={!r}>".format(
+            self.blob.name, self.filename, self.size, self.error
+        )
+
+    @property
+    def succeeded(self):
+        """Whether the transfer finished without an error.
+
+        :rtype: bool
+        :returns: True if the transfer succeeded.
+        """
+        return self.error is None
+
+    @property
+    def bytes_per_second(self):
+        """The throughput of the transfer.
+
+        :rtype: float
+        :returns: The number of bytes transferred per second.
+        """
+        if not self.elapsed:
+            return 0.0
+        return self.size / float(self.elapsed)
+
+
+class TransferSummary(object):
+    """The outcome of transferring many blobs.
+
+    Iterating a summary yields its :class:`TransferResult` instances, in the
+    order in which the transfers were requested.
+
+    :type results: list of :class:`TransferResult`
+    :param results: The outcome of each transfer.
+
+    :type elapsed: float
+    :param elapsed: The time taken by all of the transfers, in seconds.
+    """
+
+    def __init__(self, results, elapsed):
+        self.results = results
+        self.elapsed = elapsed
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self):
+        return len(self.results)
+
+    def __repr__(self):
+        return "<TransferSummary: {} transfers, {} errors, {} bytes>".format(
+            len(self.results), len(self.errors), self.total_bytes
+        )
+
+    @property
+    def errors(self):
+        """The transfers which failed.
+
+        :rtype: list of :class:`TransferResult`
+        :returns: The results which have an ``error``.
+        """
+        return [result for result in self.results if not result.succeeded]
+
+    @property
+    def total_bytes(self):
+        """The number of bytes transferred by successful transfers.
+
+        :rtype: int
+        :returns: The total size of the successful transfers.
+        """
+        return sum(result.size for result in self.results if result.succeeded)
+
+    @property
+    def bytes_per_second(self):
+        """The combined throughput of all of the transfers.
+
+        :rtype: float
+        :returns: The number of bytes transferred per second of wall time.
+        """
+        if not self.elapsed:
+            return 0.0
+        return self.total_bytes / float(self.elapsed)
+
+
+def upload_many(
+    file_blob_pairs,
+    upload_kwargs=None,
+    max_workers=_DEFAULT_MAX_WORKERS,
+    worker_type=THREAD,
+    raise_exception=False,
+):
+    """Upload many files concurrently.
+
+    :type file_blob_pairs: iterable of tuple
+    :param file_blob_pairs: Pairs of the filename to upload and the
+                            :class:`~google.cloud.storage.blob.Blob` to
+                            upload it to. The pairs are consumed as uploads
+                            finish, so this may be a generator.
+
+    :type upload_kwargs: dict
+    :param upload_kwargs: (Optional) Keyword arguments to pass to each call
+                          of :meth:`~google.cloud.storage.blob.Blob.upload_from_filename`,
+                          such as ``content_type`` or ``predefined_acl``.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of files to upload at once.
+
+    :type worker_type: str
+    :param worker_type: (Optional) Either :data:`THREAD` or :data:`PROCESS`.
+
+    :type raise_exception: bool
+    :param raise_exception: (Optional) If True, raise the first error raised
+                            by an upload, once all of the uploads have
+                            finished, instead of only recording it in the
+                            summary.
+
+    :rtype: :class:`TransferSummary`
+    :returns: The outcome of each upload, in the order of ``file_blob_pairs``.
+    """
+    tasks = ((blob, filename) for filename, blob in file_blob_pairs)
+    return _run_transfers(
+        _upload_blob,
+        tasks,
+        upload_kwargs or {},
+        max_workers,
+        worker_type,
+        raise_exception,
+    )
+
+
+def download_many(
+    blob_file_pairs,
+    download_kwargs=None,
+    max_workers=_DEFAULT_MAX_WORKERS,
+    worker_type=THREAD,
+    raise_exception=False,
+):
+    """Download many blobs concurrently.
+
+    :type blob_file_pairs: iterable of tuple
+    :param blob_file_pairs: Pairs of the
+                            :class:`~google.cloud.storage.blob.Blob` to
+                            download and the filename to download it to. The
+                            pairs are consumed as downloads finish, so this
+                            may be a generator.
+
+    :type download_kwargs: dict
+    :param download_kwargs: (Optional) Keyword arguments to pass to each call
+                            of :meth:`~google.cloud.storage.blob.Blob.download_to_filename`.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of blobs to download at once.
+
+    :type worker_type: str
+    :param worker_type: (Optional) Either :data:`THREAD` or :data:`PROCESS`.
+
+    :type raise_exception: bool
+    :param raise_exception: (Optional) If True, raise the first error raised
+                            by a download, once all of the downloads have
+                            finished, instead of only recording it in the
+                            summary.
+
+    :rtype: :class:`TransferSummary`
+    :returns: The outcome of each download, in the order of
+              ``blob_file_pairs``.
+    """
+    return _run_transfers(
+        _download_blob,
+        blob_file_pairs,
+        download_kwargs or {},
+        max_workers,
+        worker_type,
+        raise_exception,
+    )
+
+
+def download_bucket_prefix(
+    bucket,
+    prefix,
+    destination_directory,
+    download_kwargs=None,
+    max_workers=_DEFAULT_MAX_WORKERS,
+    worker_type=THREAD,
+    raise_exception=False,
+    client=None,
+):
+    """Download every blob whose name starts with a prefix.
+
+    Each blob is downloaded to the path given by its name, relative to
+    ``destination_directory``, creating directories as needed. Blobs whose
+    names end with ``/`` are skipped, and a blob whose name would place it
+    outside of ``destination_directory`` is recorded as an error.
+
+    :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param bucket: The bucket to download from.
+
+    :type prefix: str
+    :param prefix: The prefix of the names of the blobs to download.
+
+    :type destination_directory: str
+    :param destination_directory: The local directory to download into.
+
+    :type download_kwargs: dict
+    :param download_kwargs: (Optional) Keyword arguments to pass to each call
+                            of :meth:`~google.cloud.storage.blob.Blob.download_to_filename`.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of blobs to download at once.
+
+    :type worker_type: str
+    :param worker_type: (Optional) Either :data:`THREAD` or :data:`PROCESS`.
+
+    :type raise_exception: bool
+    :param raise_exception: (Optional) If True, raise the first error raised
+                            by a download, once all of the downloads have
+                            finished.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use to list the blobs.  If not
+                   passed, falls back to the ``client`` stored on the bucket.
+
+    :rtype: :class:`TransferSummary`
+    :returns: The outcome of each download, in the order the blobs were
+              listed.
+    """
+    destination_directory = os.path.abspath(destination_directory)
+
+    def blob_file_pairs():
+        # Listed as the downloads progress, rather than all up front.
+        for blob in bucket.list_blobs(prefix=prefix, client=client):
+            if blob.name.endswith("/"):
+                continue
+            filename = os.path.abspath(os.path.join(destination_directory, blob.name))
+            yield blob, filename
+
+    return _run_transfers(
+        functools.partial(_download_blob, destination_directory=destination_directory),
+        blob_file_pairs(),
+        download_kwargs or {},
+        max_workers,
+        worker_type,
+        raise_exception,
+    )
+
+
+def copy_many(
+    source_destination_pairs,
+    max_workers=_DEFAULT_MAX_WORKERS,
+    target_call_seconds=_DEFAULT_REWRITE_CALL_SECONDS,
+    progress_callback=None,
+    raise_exception=False,
+):
+    """Copy many blobs concurrently, with server-side rewrites.
+
+    Each copy calls :meth:`~google.cloud.storage.blob.Blob.rewrite` until
+    it is done, passing on the token which continues it, so copies between
+    locations or storage classes, which can take many calls, run to
+    completion. No data passes through this process.
+
+    Rewrites of large objects between locations or storage classes are
+    split into calls of at most ``maxBytesRewrittenPerCall`` bytes. That
+    limit cannot change during a rewrite, so each new rewrite is given a
+    limit based on the rate of the calls made so far, to make each call
+    take about ``target_call_seconds``.
+
+    :type source_destination_pairs: iterable of tuple
+    :param source_destination_pairs: Pairs of the
+                                     :class:`~google.cloud.storage.blob.Blob`
+                                     to copy and the blob to copy it to. Set
+                                     properties, such as ``storage_class``, on
+                                     the destination blob to change them. The
+                                     pairs are consumed as copies finish, so
+                                     this may be a generator.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of blobs to copy at once.
+
+    :type target_call_seconds: float
+    :param target_call_seconds: (Optional) The time each rewrite call should
+                                take, if it is limited. Defaults to 20
+                                seconds. If :data:`None`, the server decides
+                                how much to rewrite in each call.
+
+    :type progress_callback: callable
+    :param progress_callback: (Optional) Called after each rewrite call with
+                              the source blob, the destination blob, the
+                              number of bytes rewritten so far, and the size
+                              of the blob. It is called on the worker
+                              threads, so it must be thread-safe.
+
+    :type raise_exception: bool
+    :param raise_exception: (Optional) If True, raise the first error raised
+                            by a copy, once all of the copies have finished,
+                            instead of only recording it in the summary.
+
+    :rtype: :class:`TransferSummary`
+    :returns: The outcome of each copy, in the order of
+              ``source_destination_pairs``. The ``blob`` of each result is
+              the destination, and the ``source`` is the source.
+    """
+    kwargs = {
+        "sizer": _RewriteSizer(target_call_seconds),
+        "progress_callback": progress_callback,
+    }
+
+    start_time = time.time()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit(task):
+            source, destination = task
+            _resize_connection_pool(destination.client, max_workers)
+            return executor.submit(
+                _timed_transfer, _copy_blob, destination, source, kwargs
+            )
+
+        tasks, outcomes = _submit_bounded(
+            submit, source_destination_pairs, max_workers * _MAX_PENDING_PER_WORKER
+        )
+    elapsed = time.time() - start_time
+
+    results = [
+        TransferResult(destination, None, size, copy_elapsed, error, source=source)
+        for (source, destination), (size, copy_elapsed, error) in zip(tasks, outcomes)
+    ]
+    return _summarize(results, elapsed, raise_exception)
+
+
+def copy_bucket_prefix(
+    source_bucket,
+    prefix,
+    destination_bucket,
+    destination_prefix=None,
+    storage_class=None,
+    max_workers=_DEFAULT_MAX_WORKERS,
+    target_call_seconds=_DEFAULT_REWRITE_CALL_SECONDS,
+    progress_callback=None,
+    raise_exception=False,
+    client=None,
+):
+    """Copy every blob whose name starts with a prefix to another bucket.
+
+    Intended for migrating objects between buckets in different locations,
+    or to a different storage class. See :func:`copy_many`.
+
+    :type source_bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param source_bucket: The bucket to copy from.
+
+    :type prefix: str
+    :param prefix: The prefix of the names of the blobs to copy. If ``None``,
+                   every blob in ``source_bucket`` is copied.
+
+    :type destination_bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param destination_bucket: The bucket to copy to. It may be the same as
+                               ``source_bucket``, with a different
+                               ``destination_prefix`` or ``storage_class``.
+
+    :type destination_prefix: str
+    :param destination_prefix: (Optional) Replaces ``prefix`` in the names of
+                               the copies, or is prepended to them if
+                               ``prefix`` is ``None``. By default the names
+                               are kept.
+
+    :type storage_class: str
+    :param storage_class: (Optional) The storage class of the copies. By
+                          default, the bucket's default storage class.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of blobs to copy at once.
+
+    :type target_call_seconds: float
+    :param target_call_seconds: (Optional) The time each rewrite call should
+                                take, if it is limited.
+
+    :type progress_callback: callable
+    :param progress_callback: (Optional) Called after each rewrite call. See
+                              :func:`copy_many`.
+
+    :type raise_exception: bool
+    :param raise_exception: (Optional) If True, raise the first error raised
+                            by a copy, once all of the copies have finished.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use to list the blobs.  If not
+                   passed, falls back to the ``client`` stored on the source
+                   bucket.
+
+    :rtype: :class:`TransferSummary`
+    :returns: The outcome of each copy, in the order the blobs were listed.
+    """
+    prefix_length = len(prefix) if prefix is not None else 0
+
+    def pairs():
+        # Listed as the copies progress, rather than all up front.
+        for source in source_bucket.list_blobs(prefix=prefix, client=client):
+            name = source.name
+            if destination_prefix is not None:
+                name = destination_prefix + name[prefix_length:]
+            destination = destination_bucket.blob(name)
+            if storage_class is not None:
+                destination.storage_class = storage_class
+            yield source, destination
+
+    return copy_many(
+        pairs(),
+        max_workers=max_workers,
+        target_call_seconds=target_call_seconds,
+        progress_callback=progress_callback,
+        raise_exception=raise_exception,
+    )
+
+
+def _run_transfers(transfer, tasks, kwargs, max_workers, worker_type, raise_exception):
+    """Run transfers on a pool of workers and summarize their outcomes.
+
+    :type transfer: callable
+    :param transfer: Transfers one blob, given the blob, the filename and
+                     ``kwargs``, and returns the number of bytes transferred.
+
+    :type tasks: iterable of tuple
+    :param tasks: Pairs of the blob and the filename to transfer. They are
+                  submitted as earlier transfers finish, with at most
+                  ``_MAX_PENDING_PER_WORKER`` per worker outstanding.
+
+    :type kwargs: dict
+    :param kwargs: Keyword arguments for each transfer.
+
+    :type max_workers: int
+    :param max_workers: The number of transfers to run at once.
+
+    :type worker_type: str
+    :param worker_type: Either :data:`THREAD` or :data:`PROCESS`.
+
+    :type raise_exception: bool
+    :param raise_exception: Whether to raise the first error.
+
+    :rtype: :class:`TransferSummary`
+    :returns: The outcome of each transfer.
+    :raises: :exc:`ValueError` if ``worker_type`` is not recognized.
+    """
+    if worker_type == THREAD:
+        executor_class = concurrent.futures.ThreadPoolExecutor
+    elif worker_type == PROCESS:
+        executor_class = concurrent.futures.ProcessPoolExecutor
+    else:
+        raise ValueError("Unknown worker_type: {!r}".format(worker_type))
+
+    start_time = time.time()
+    with executor_class(max_workers=max_workers) as executor:
+
+        def submit(task):
+            blob, filename = task
+            if worker_type == THREAD:
+                _resize_connection_pool(blob.client, max_workers)
+                return executor.submit(
+                    _timed_transfer, transfer, blob, filename, kwargs
+                )
+            return executor.submit(
+                _timed_transfer_in_process,
+                transfer,
+                _blob_to_state(blob),
+                filename,
+                kwargs,
+            )
+
+        tasks, outcomes = _submit_bounded(
+            submit, tasks, max_workers * _MAX_PENDING_PER_WORKER
+        )
+    elapsed = time.time() - start_time
+
+    results = [
+        TransferResult(blob, filename, size, transfer_elapsed, error)
+        for (blob, filename), (size, transfer_elapsed, error) in zip(tasks, outcomes)
+    ]
+    return _summarize(results, elapsed, raise_exception)
+
+
+def _submit_bounded(submit, tasks, max_pending):
+    """Submit tasks to a pool, keeping at most ``max_pending`` outstanding.
+
+    The next task is taken from ``tasks`` only once an earlier one has
+    finished, so ``tasks`` may be a lazy listing of any length.
+
+    :type submit: callable
+    :param submit: Submits one task to the pool, returning its future.
+
+    :type tasks: iterable
+    :param tasks: The tasks to submit.
+
+    :type max_pending: int
+    :param max_pending: The number of futures which may be outstanding.
+
+    :rtype: tuple
+    :returns: A list of the tasks, and a list of their outcomes, in the same
+              order.
+    """
+    submitted = []
+    outcomes = []
+    pending = {}
+    for task in tasks:
+        if len(pending) >= max_pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                outcomes[pending.pop(future)] = future.result()
+        pending[submit(task)] = len(submitted)
+        submitted.append(task)
+        outcomes.append(None)
+
+    for future, index in pending.items():
+        outcomes[index] = future.result()
+    return submitted, outcomes
+
+
+def _summarize(results, elapsed, raise_exception):
+    """Summarize transfers, raising the first error if asked to.
+
+    :type results: list of :class:`TransferResult`
+    :param results: The outcome of each transfer.
+
+    :type elapsed: float
+    :param elapsed: The time taken by all of the transfers, in seconds.
+
+    :type raise_exception: bool
+    :param raise_exception: Whether to raise the first error.
+
+    :rtype: :class:`TransferSummary`
+    :returns: The summary of ``results``.
+    """
+    if raise_exception:
+        for result in results:
+            if result.error is not None:
+                raise result.error
+    return TransferSummary(results, elapsed)
+
+
+def _timed_transfer(transfer, blob, filename, kwargs):
+    """Run one transfer, recording its size, duration and error."""
+    start_time = time.time()
+    try:
+        size = transfer(blob, filename, kwargs)
+    except Exception as exc:
+        return 0, time.time() - start_time, exc
+    return size, time.time() - start_time, None
+
+
+def _timed_transfer_in_process(transfer, blob_state, filename, kwargs):
+    """Run one transfer in a worker process, with the process's client."""
+    return _timed_transfer(transfer, _blob_from_state(blob_state), filename, kwargs)
+
+
+def _upload_blob(blob, filename, kwargs):
+    blob.upload_from_filename(filename, **kwargs)
+    return os.path.getsize(filename)
+
+
+def _download_blob(blob, filename, kwargs, destination_directory=None):
+    if destination_directory is not None:
+        if not filename.startswith(os.path.join(destination_directory, "")):
+            raise ValueError(
+                "Blob {!r} would be downloaded outside of {!r}".format(
+                    blob.name, destination_directory
+                )
+            )
+        directory = os.path.dirname(filename)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                # Another worker may have created it.
+                if not os.path.isdir(directory):
+                    raise
+    blob.download_to_filename(filename, **kwargs)
+    return os.path.getsize(filename)
+
+
+def _copy_blob(destination, source, kwargs):
+    """Rewrite a blob into another until the rewrite is done."""
+    sizer = kwargs["sizer"]
+    progress_callback = kwargs["progress_callback"]
+    # The limit must be the same for every call of one rewrite.
+    max_bytes = sizer.size()
+    token = None
+    rewritten = 0
+    while True:
+        start_time = time.time()
+        previous = rewritten
+        token, rewritten, total = destination.rewrite(
+            source, token=token, max_bytes_rewritten_per_call=max_bytes
+        )
+        if progress_callback is not None:
+            progress_callback(source, destination, rewritten, total)
+        if token is None:
+            return total
+        # Only calls which stopped short of the end measure the rate.
+        sizer.observe(rewritten - previous, time.time() - start_time)
+
+
+class _RewriteSizer(object):
+    """Choose a limit for rewrite calls, from the rate of earlier calls.
+
+    Shared by the workers copying blobs, so it is thread-safe.
+
+    :type target_seconds: float
+    :param target_seconds: The time each call should take, or :data:`None`
+                           to never limit calls.
+    """
+
+    def __init__(self, target_seconds):
+        self._target_seconds = target_seconds
+        self._rate = None
+        self._lock = threading.Lock()
+
+    def observe(self, num_bytes, seconds):
+        """Record the bytes rewritten by one call, and how long it took.
+
+        :type num_bytes: int
+        :param num_bytes: The number of bytes rewritten.
+
+        :type seconds: float
+        :param seconds: The duration of the call.
+        """
+        if num_bytes <= 0 or seconds <= 0:
+            return
+        rate = num_bytes / float(seconds)
+        with self._lock:
+            if self._rate is None:
+                self._rate = rate
+            else:
+                self._rate += _REWRITE_RATE_SMOOTHING * (rate - self._rate)
+
+    def size(self):
+        """The limit for a new rewrite.
+
+        :rtype: int
+        :returns: A multiple of 1 MiB, or :data:`None` before any calls
+                  have been observed.
+        """
+        with self._lock:
+            rate = self._rate
+        if rate is None or self._target_seconds is None:
+            return None
+        return max(1, int(rate * self._target_seconds) // _MIB) * _MIB
+
+
+def _resize_connection_pool(client, max_workers):
+    """Let a client's session keep a connection open for each worker thread.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: The client whose session will be shared by the workers.
+
+    :type max_workers: int
+    :param max_workers: The number of worker threads.
+    """
+    http = client._http
+    if not isinstance(http, requests.Session):
+        return
+    adapter = http.get_adapter("https://")
+    if not isinstance(adapter, requests.adapters.HTTPAdapter):
+        return
+    if adapter._pool_maxsize >= max_workers:
+        return
+    # Grow the caller's own adapter, rather than mounting a new one, so that
+    # its class and settings (retries, TLS options, and so on) are kept.
+    old_poolmanager = adapter.poolmanager
+    adapter.init_poolmanager(
+        adapter._pool_connections, max_workers, block=adapter._pool_block
+    )
+    old_poolmanager.clear()
+
+
+def _blob_to_state(blob):
+    """Describe a blob so that it can be recreated in a worker process."""
+    return {
+        "bucket_name": blob.bucket.name,
+        "user_project": blob.bucket.user_project,
+        "project": blob.client.project,
+        "name": blob.name,
+        "chunk_size": blob.chunk_size,
+        "encryption_key": blob._encryption_key,
+        "kms_key_name": blob.kms_key_name,
+    }
+
+
+def _blob_from_state(state):
+    """Recreate a blob in a worker process, with the process's client."""
+    global _PROCESS_CLIENT
+    from google.cloud.storage.client import Client
+
+    if _PROCESS_CLIENT is None:
+        _PROCESS_CLIENT = Client(project=state["project"])
+    bucket = _PROCESS_CLIENT.bucket(
+        state["bucket_name"], user_project=state["user_project"]
+    )
+    return bucket.blob(
+        state["name"],
+        chunk_size=state["chunk_size"],
+        encryption_key=state["encryption_key"],
+        kms_key_name=state["kms_key_name"],
+    )
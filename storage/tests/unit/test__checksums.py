@@ -0,0 +1,185 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class Test_crc32c_extend(unittest.TestCase):
+    @staticmethod
+    def _call_fut(crc, data):
+        from google.cloud.storage._checksums import crc32c_extend
+
+        return crc32c_extend(crc, data)
+
+    def test_check_value(self):
+        self.assertEqual(self._call_fut(0, b"123456789"), 0xE3069283)
+
+    def test_empty(self):
+        self.assertEqual(self._call_fut(0, b""), 0)
+
+    def test_extend(self):
+        data = bytes(bytearray(range(256)))
+        crc = self._call_fut(self._call_fut(0, data[:100]), data[100:])
+        self.assertEqual(crc, self._call_fut(0, data))
+
+    def test_pure_python(self):
+        from google.cloud.storage import _checksums
+
+        data = bytes(bytearray(range(256)))
+        expected = self._call_fut(0, data)
+        with mock.patch.object(_checksums, "_fast_crc32c_extend", new=None):
+            self.assertEqual(self._call_fut(0, b"123456789"), 0xE3069283)
+            self.assertEqual(self._call_fut(0, data), expected)
+
+
+class Test_crc32c_combine(unittest.TestCase):
+    @staticmethod
+    def _call_fut(crc1, crc2, length2):
+        from google.cloud.storage._checksums import crc32c_combine
+
+        return crc32c_combine(crc1, crc2, length2)
+
+    @staticmethod
+    def _crc32c(data):
+        from google.cloud.storage._checksums import crc32c_extend
+
+        return crc32c_extend(0, data)
+
+    def test_empty_second(self):
+        crc1 = self._crc32c(b"abc")
+        self.assertEqual(self._call_fut(crc1, 0, 0), crc1)
+
+    def test_combine(self):
+        data = bytes(bytearray(range(256))) * 5
+        for split in (1, 7, 128, 1000, len(data) - 1):
+            first, second = data[:split], data[split:]
+            combined = self._call_fut(
+                self._crc32c(first), self._crc32c(second), len(second)
+            )
+            self.assertEqual(combined, self._crc32c(data))
+
+
+class Test_crc32c_to_base64(unittest.TestCase):
+    @staticmethod
+    def _call_fut(crc):
+        from google.cloud.storage._checksums import crc32c_to_base64
+
+        return crc32c_to_base64(crc)
+
+    def test_it(self):
+        self.assertEqual(self._call_fut(0xE3069283), "4waSgw==")
+        self.assertEqual(self._call_fut(0), "AAAAAA==")
+
+
+class Test__get_fast_crc32c_extend(unittest.TestCase):
+    @staticmethod
+    def _call_fut():
+        from google.cloud.storage._checksums import _get_fast_crc32c_extend
+
+        return _get_fast_crc32c_extend()
+
+    def test_w_google_crc32c(self):
+        from google.cloud.storage import _checksums
+
+        google_crc32c = mock.Mock(implementation="c", spec=["implementation", "extend"])
+        with mock.patch.object(_checksums, "google_crc32c", new=google_crc32c):
+            self.assertIs(self._call_fut(), google_crc32c.extend)
+
+    def test_w_google_crc32c_python(self):
+        from google.cloud.storage import _checksums
+
+        google_crc32c = mock.Mock(
+            implementation="python", spec=["implementation", "extend"]
+        )
+        with mock.patch.object(
+            _checksums, "google_crc32c", new=google_crc32c
+        ), mock.patch.object(_checksums, "crcmod", new=None):
+            self.assertIsNone(self._call_fut())
+
+
+class Test_get_hash(unittest.TestCase):
+    @staticmethod
+    def _call_fut(checksum):
+        from google.cloud.storage._checksums import get_hash
+
+        return get_hash(checksum)
+
+    @staticmethod
+    def _digest(hash_obj):
+        from google.cloud.storage._checksums import base64_digest
+
+        return base64_digest(hash_obj)
+
+    def test_crc32c(self):
+        hash_obj = self._call_fut("crc32c")
+        hash_obj.update(b"12345")
+        hash_obj.update(b"6789")
+        self.assertEqual(self._digest(hash_obj), "4waSgw==")
+
+    def test_md5(self):
+        import base64
+        import hashlib
+
+        hash_obj = self._call_fut("md5")
+        hash_obj.update(b"123456789")
+        expected = base64.b64encode(hashlib.md5(b"123456789").digest())
+        self.assertEqual(self._digest(hash_obj), expected.decode("ascii"))
+
+    def test_unsupported(self):
+        with self.assertRaises(ValueError):
+            self._call_fut("sha256")
+
+
+class TestHashingReader(unittest.TestCase):
+    @staticmethod
+    def _make_one(stream, checksum="crc32c"):
+        from google.cloud.storage._checksums import HashingReader
+
+        return HashingReader(stream, checksum)
+
+    def test_read(self):
+        import io
+
+        stream = io.BytesIO(b"123456789")
+        reader = self._make_one(stream)
+
+        self.assertEqual(reader.read(4), b"1234")
+        self.assertEqual(reader.tell(), 4)
+        self.assertEqual(reader.read(), b"56789")
+        self.assertEqual(reader.read(4), b"")
+        self.assertEqual(reader.base64_digest(), "4waSgw==")
+
+    def test_read_again_after_seek(self):
+        import io
+
+        stream = io.BytesIO(b"123456789")
+        reader = self._make_one(stream)
+
+        reader.read(6)
+        reader.seek(2)
+        self.assertEqual(reader.read(5), b"34567")
+        reader.seek(0)
+        reader.read()
+        self.assertEqual(reader.base64_digest(), "4waSgw==")
+
+    def test_read_after_skip(self):
+        import io
+
+        reader = self._make_one(io.BytesIO(b"123456789"))
+        reader.seek(2)
+
+        with self.assertRaises(ValueError):
+            reader.read()
@@ -0,0 +1,186 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class TestPrefetchingHTTPIterator(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage._listing import PrefetchingHTTPIterator
+
+        return PrefetchingHTTPIterator
+
+    def _make_one(self, responses, **kw):
+        api_request = mock.Mock(side_effect=responses, spec=[])
+        iterator = self._get_target_class()(
+            client=None,
+            api_request=api_request,
+            path="/b/name/o",
+            item_to_value=lambda iterator, item: item["name"],
+            **kw
+        )
+        return iterator, api_request
+
+    def test_prefetches_next_page(self):
+        iterator, api_request = self._make_one(
+            [
+                {"items": [{"name": "a"}], "nextPageToken": "t1"},
+                {"items": [{"name": "b"}], "nextPageToken": "t2"},
+                {"items": [{"name": "c"}]},
+            ]
+        )
+        pages = iterator.pages
+
+        first = next(pages)
+        # The second page is requested before the first is consumed.
+        iterator._prefetched.result()
+        self.assertEqual(api_request.call_count, 2)
+        self.assertEqual(list(first), ["a"])
+        self.assertEqual([list(page) for page in pages], [["b"], ["c"]])
+
+        self.assertEqual(api_request.call_count, 3)
+        self.assertEqual(
+            [call[1]["query_params"] for call in api_request.call_args_list],
+            [{}, {"pageToken": "t1"}, {"pageToken": "t2"}],
+        )
+        self.assertIsNone(iterator._executor)
+
+    def test_w_max_results(self):
+        iterator, api_request = self._make_one(
+            [
+                {"items": [{"name": "a"}, {"name": "b"}], "nextPageToken": "t1"},
+                {"items": [{"name": "c"}]},
+            ],
+            max_results=3,
+        )
+
+        self.assertEqual(list(iterator), ["a", "b", "c"])
+        self.assertIsNone(iterator._executor)
+        self.assertEqual(
+            api_request.call_args[1]["query_params"],
+            {"pageToken": "t1", "maxResults": 1},
+        )
+
+    def test_w_error(self):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        iterator, _ = self._make_one(
+            [
+                {"items": [{"name": "a"}], "nextPageToken": "t1"},
+                ServiceUnavailable("try again"),
+            ]
+        )
+
+        with self.assertRaises(ServiceUnavailable):
+            list(iterator)
+
+        self.assertIsNone(iterator._executor)
+
+    def test_stops_prefetching_when_iteration_is_closed(self):
+        iterator, _ = self._make_one(
+            [
+                {"items": [{"name": "a"}, {"name": "b"}], "nextPageToken": "t1"},
+                {"items": [{"name": "c"}], "nextPageToken": "t2"},
+            ]
+        )
+        items = iter(iterator)
+        self.assertEqual(next(items), "a")
+        executor = iterator._executor
+        self.assertIsNotNone(executor)
+
+        items.close()
+
+        self.assertIsNone(iterator._executor)
+        self.assertIsNone(iterator._prefetched)
+        with self.assertRaises(RuntimeError):
+            executor.submit(lambda: None)
+
+    def test_close(self):
+        iterator, _ = self._make_one(
+            [
+                {"items": [{"name": "a"}], "nextPageToken": "t1"},
+                {"items": [{"name": "b"}], "nextPageToken": "t2"},
+            ]
+        )
+        pages = iterator.pages
+        next(pages)
+        executor = iterator._executor
+
+        iterator.close()
+
+        self.assertIsNone(iterator._executor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(lambda: None)
+
+
+class _Page(list):
+    def __init__(self, items, prefixes=()):
+        super(_Page, self).__init__(items)
+        self.prefixes = prefixes
+
+
+class Test_fan_out(unittest.TestCase):
+    @staticmethod
+    def _call_fut(list_pages, prefix, max_workers=2):
+        from google.cloud.storage._listing import fan_out
+
+        return fan_out(list_pages, prefix, max_workers)
+
+    def test_it(self):
+        listings = {
+            "": [_Page(["x"], ["a/", "b/"]), _Page(["y"])],
+            "a/": [_Page(["a/1"], ["a/b/"])],
+            "a/b/": [_Page([]), _Page(["a/b/1", "a/b/2"])],
+            "b/": [],
+        }
+
+        items = self._call_fut(lambda prefix: iter(listings[prefix]), "")
+
+        self.assertEqual(sorted(items), ["a/1", "a/b/1", "a/b/2", "x", "y"])
+
+    def test_w_error(self):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        def list_pages(prefix):
+            if prefix == "a/":
+                raise ServiceUnavailable("try again")
+            return [_Page(["x"], ["a/"])]
+
+        items = self._call_fut(list_pages, "")
+
+        with self.assertRaises(ServiceUnavailable):
+            list(items)
+
+    def test_stops_workers_when_closed(self):
+        import time
+        from google.cloud.storage import _listing
+
+        listed = []
+
+        def list_pages(prefix):
+            for index in range(100):
+                listed.append(index)
+                yield _Page([index])
+
+        with mock.patch.object(_listing, "_PUT_TIMEOUT", new=0.01):
+            items = self._call_fut(list_pages, "", max_workers=1)
+            self.assertEqual(next(items), 0)
+            items.close()
+            time.sleep(0.1)
+
+        # The queue holds two pages, so the worker stops soon after.
+        self.assertLess(len(listed), 10)
@@ -639,6 +639,151 @@ class Test_generate_signed_url_v4(unittest.TestCase):
         self._generate_helper(query_parameters={"qux": None})
 
 
+class Test_generate_signed_urls_v4(unittest.TestCase):
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage._signing import generate_signed_urls_v4
+
+        return generate_signed_urls_v4(*args, **kwargs)
+
+    def setUp(self):
+        from google.cloud.storage import _signing
+
+        patch = mock.patch.object(
+            _signing, "_URL_CACHE", new=_signing._SignedURLCache(max_size=10)
+        )
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def _call_at(self, now, *args, **kwargs):
+        with mock.patch("google.cloud.storage._signing.NOW", lambda: now):
+            return self._call_fut(*args, **kwargs)
+
+    def test_matches_single_urls(self):
+        from google.cloud.storage._signing import generate_signed_url_v4
+
+        credentials = dummy_service_account()
+        resources = ["/bucket/a", "/bucket/b%20c", "/bucket/d"]
+        kwargs = {
+            "method": "PUT",
+            "content_type": "text/plain",
+            "headers": {"x-goog-meta-foo": "bar"},
+            "query_parameters": {"qux": None},
+            "_request_timestamp": "20190301T000000Z",
+        }
+        headers = dict(kwargs["headers"])
+
+        urls = self._call_fut(credentials, resources, 3600, **kwargs)
+
+        expected = [
+            generate_signed_url_v4(credentials, resource, 3600, **kwargs)
+            for resource in resources
+        ]
+        self.assertEqual(urls, expected)
+        self.assertEqual(len(set(urls)), 3)
+        # The caller's headers are not changed.
+        self.assertEqual(kwargs["headers"], headers)
+
+    def test_signs_remotely_in_parallel(self):
+        import threading
+        import google.auth.iam
+
+        credentials = _make_credentials(signer_email="service@example.com")
+        credentials.signer = mock.Mock(spec=google.auth.iam.Signer)
+        thread_names = set()
+
+        def sign_bytes(data):
+            thread_names.add(threading.current_thread().name)
+            return b"DEADBEEF"
+
+        credentials.sign_bytes.side_effect = sign_bytes
+        resources = ["/bucket/{}".format(index) for index in range(20)]
+
+        urls = self._call_fut(credentials, resources, 3600)
+
+        self.assertEqual(len(urls), 20)
+        self.assertEqual(credentials.sign_bytes.call_count, 20)
+        self.assertNotIn(threading.current_thread().name, thread_names)
+
+    def test_signs_locally_in_caller_thread(self):
+        credentials = _make_credentials(signer_email="service@example.com")
+        credentials.sign_bytes.return_value = b"DEADBEEF"
+
+        with mock.patch("concurrent.futures.ThreadPoolExecutor") as executor:
+            urls = self._call_fut(credentials, ["/bucket/a", "/bucket/b"], 3600)
+
+        executor.assert_not_called()
+        self.assertEqual(len(urls), 2)
+
+    def test_w_reuse_for(self):
+        credentials = _make_credentials(signer_email="service@example.com")
+        credentials.sign_bytes.side_effect = [b"\x01", b"\x02", b"\x03", b"\x04"]
+        start = datetime.datetime(2019, 2, 26, 19, 53, 27)
+        reuse_for = datetime.timedelta(minutes=10)
+
+        first = self._call_at(
+            start, credentials, ["/bucket/a"], 3600, reuse_for=reuse_for
+        )
+        second = self._call_at(
+            start + datetime.timedelta(minutes=5),
+            credentials,
+            ["/bucket/b", "/bucket/a"],
+            3600,
+            reuse_for=reuse_for,
+        )
+        other_args = self._call_at(
+            start + datetime.timedelta(minutes=5),
+            credentials,
+            ["/bucket/a"],
+            3600,
+            method="PUT",
+            reuse_for=reuse_for,
+        )
+        expired = self._call_at(
+            start + datetime.timedelta(minutes=11),
+            credentials,
+            ["/bucket/a"],
+            3600,
+            reuse_for=reuse_for,
+        )
+
+        self.assertEqual(second[1], first[0])
+        self.assertTrue(second[0].endswith("X-Goog-Signature=02"))
+        self.assertTrue(other_args[0].endswith("X-Goog-Signature=03"))
+        self.assertTrue(expired[0].endswith("X-Goog-Signature=04"))
+        self.assertIn("X-Goog-Date=20190226T200427Z", expired[0])
+        self.assertEqual(credentials.sign_bytes.call_count, 4)
+
+    def test_w_reuse_for_too_long(self):
+        credentials = _make_credentials(signer_email="service@example.com")
+
+        with self.assertRaises(ValueError):
+            self._call_fut(credentials, ["/bucket/a"], 600, reuse_for=600)
+
+
+class Test_SignedURLCache(unittest.TestCase):
+    @staticmethod
+    def _make_one(max_size):
+        from google.cloud.storage._signing import _SignedURLCache
+
+        return _SignedURLCache(max_size)
+
+    def test_evicts_oldest(self):
+        cache = self._make_one(2)
+        now = datetime.datetime(2019, 2, 26)
+        before = now - datetime.timedelta(seconds=1)
+
+        cache.put("a", "url-a", now)
+        cache.put("b", "url-b", now)
+        cache.put("a", "url-a2", now)
+        cache.put("c", "url-c", now)
+
+        self.assertIsNone(cache.get("b", before))
+        self.assertEqual(cache.get("a", before), "url-a2")
+        self.assertEqual(cache.get("c", before), "url-c")
+        self.assertIsNone(cache.get("c", now))
+
+
 _DUMMY_SERVICE_ACCOUNT = None
 
 
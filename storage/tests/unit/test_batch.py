@@ -427,6 +427,148 @@ class TestBatch(unittest.TestCase):
         with self.assertRaises(ValueError):
             batch.finish()
 
+    @staticmethod
+    def _make_chunked_session(statuses):
+        """Answer each batch request, with a status for each object path.
+
+        ``statuses`` maps an object path to a list of statuses, one for each
+        time the path is requested, after which the status is 200.
+        """
+        import re
+
+        requested = []
+
+        def request(method, url, headers=None, data=None):
+            paths = re.findall(r"^(?:GET|POST|PATCH|DELETE) (\S+) HTTP", data, re.M)
+            requested.append(paths)
+            parts = []
+            for path in paths:
+                remaining = statuses.get(path)
+                status = remaining.pop(0) if remaining else 200
+                body = '{"path": "%s"}' % (path,)
+                parts.append(
+                    "--DEADBEEF=\nContent-Type: application/json\n\n"
+                    "HTTP/1.1 %d Status\nContent-Type: application/json\n"
+                    "Content-Length: %d\n\n%s\n" % (status, len(body), body)
+                )
+            parts.append("--DEADBEEF=--\n")
+            return _make_response(
+                content="\n".join(parts).encode("utf-8"),
+                headers={"content-type": 'multipart/mixed; boundary="DEADBEEF="'},
+            )
+
+        http = _make_requests_session(request)
+        http.requested = requested
+        return http
+
+    def test_finish_auto_chunk(self):
+        http = self._make_chunked_session({})
+        client = _Client(_Connection(http=http))
+        batch = self._make_one(client, auto_chunk=True, max_workers=2)
+        batch.API_BASE_URL = "http://api.example.com"
+        targets = [_MockObject() for _ in range(250)]
+
+        for index, target in enumerate(targets):
+            batch._do_request("GET", "/obj/%d" % (index,), {}, None, target)
+
+        responses = batch.finish()
+
+        self.assertEqual(len(responses), 250)
+        self.assertEqual(sorted(len(paths) for paths in http.requested), [50, 100, 100])
+        for index, target in enumerate(targets):
+            self.assertEqual(target._properties, {"path": "/obj/%d" % (index,)})
+
+    def test_finish_auto_chunk_retries_failed_subrequests(self):
+        from google.cloud.exceptions import NotFound
+
+        http = self._make_chunked_session(
+            {"/obj/3": [503, 429], "/obj/5": [404], "/obj/7": [500]}
+        )
+        client = _Client(_Connection(http=http))
+        batch = self._make_one(client, auto_chunk=True)
+        targets = [_MockObject() for _ in range(10)]
+        for index, target in enumerate(targets):
+            batch._do_request("GET", "/obj/%d" % (index,), {}, None, target)
+
+        with mock.patch("time.sleep") as sleep:
+            with self.assertRaises(NotFound):
+                batch.finish()
+
+        # Only the transient failures are sent again.
+        self.assertEqual(
+            http.requested,
+            [
+                ["/obj/%d" % (index,) for index in range(10)],
+                ["/obj/3", "/obj/7"],
+                ["/obj/3"],
+            ],
+        )
+        self.assertEqual(sleep.mock_calls, [mock.call(1.0), mock.call(2.0)])
+        self.assertEqual(targets[3]._properties, {"path": "/obj/3"})
+        self.assertEqual(targets[7]._properties, {"path": "/obj/7"})
+
+    def test_finish_auto_chunk_gives_up_after_max_attempts(self):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        http = self._make_chunked_session({"/obj/0": [503] * 10})
+        client = _Client(_Connection(http=http))
+        batch = self._make_one(client, auto_chunk=True)
+        batch._do_request("GET", "/obj/0", {}, None, None)
+
+        with mock.patch("time.sleep"):
+            with self.assertRaises(ServiceUnavailable):
+                batch.finish()
+
+        self.assertEqual(len(http.requested), 4)
+
+    def test_finish_auto_chunk_w_failed_batch_request(self):
+        from google.cloud.exceptions import Forbidden
+
+        http = _make_requests_session(
+            [_make_response(status=http_client.FORBIDDEN, content=b"{}")]
+        )
+        client = _Client(_Connection(http=http))
+        batch = self._make_one(client, auto_chunk=True)
+        batch._do_request("GET", "/obj/0", {}, None, None)
+
+        with self.assertRaises(Forbidden):
+            batch.finish()
+
+    def test_finish_auto_chunk_empty(self):
+        http = _make_requests_session([])
+        batch = self._make_one(_Client(_Connection(http=http)), auto_chunk=True)
+
+        with self.assertRaises(ValueError):
+            batch.finish()
+
+    def test__make_request_auto_chunk_many_requests(self):
+        http = _make_requests_session([])
+        batch = self._make_one(_Client(_Connection(http=http)), auto_chunk=True)
+        batch._MAX_BATCH_SIZE = 1
+
+        batch._make_request("POST", "http://example.com/api", data={"foo": 1})
+        batch._make_request("POST", "http://example.com/api", data={"foo": 2})
+
+        self.assertEqual(len(batch._requests), 2)
+
+    def test_finish_wo_raise_exception(self):
+        url = "http://api.example.com/other_api"
+        expected_response = _make_response(
+            content=_TWO_PART_MIME_RESPONSE_WITH_FAIL,
+            headers={"content-type": 'multipart/mixed; boundary="DEADBEEF="'},
+        )
+        http = _make_requests_session([expected_response])
+        batch = self._make_one(_Client(_Connection(http=http)), raise_exception=False)
+        batch._do_request("GET", url, {}, None, None)
+        batch._do_request("GET", url, {}, None, None)
+
+        responses = batch.finish()
+
+        self.assertEqual(
+            [response.status_code for response in responses],
+            [http_client.OK, http_client.NOT_FOUND],
+        )
+
     def test_as_context_mgr_wo_error(self):
         from google.cloud.storage.client import Client
 
@@ -533,6 +675,65 @@ class Test__unpack_batch_response(unittest.TestCase):
         CONTENT = _THREE_PART_MIME_RESPONSE
         self._unpack_helper(RESPONSE, CONTENT)
 
+    def test_crlf_line_endings(self):
+        RESPONSE = {"content-type": 'multipart/mixed; boundary="DEADBEEF="'}
+        CONTENT = _THREE_PART_MIME_RESPONSE.replace(b"\n", b"\r\n")
+        self._unpack_helper(RESPONSE, CONTENT)
+
+    def test_unquoted_boundary_w_preamble(self):
+        RESPONSE = {"content-type": "multipart/mixed; boundary=DEADBEEF="}
+        CONTENT = b"This is a preamble.\n" + _THREE_PART_MIME_RESPONSE
+        self._unpack_helper(RESPONSE, CONTENT)
+
+    def test_headers_and_body(self):
+        RESPONSE = {"content-type": 'multipart/mixed; boundary="DEADBEEF="'}
+        result = list(self._call_fut(RESPONSE, _THREE_PART_MIME_RESPONSE))
+
+        self.assertEqual(result[0].content, b'{"foo": 1, "bar": 2}\n')
+        self.assertEqual(
+            result[0].headers["content-type"], "application/json; charset=UTF-8"
+        )
+        self.assertEqual(result[0].headers["Content-Length"], "20")
+        self.assertEqual(
+            result[0].request.url,
+            "contentid://<response-8a09ca85-8d1d-4f45-9eb0-da8e8b07ec83+1>",
+        )
+        self.assertEqual(result[2].content, b"")
+
+    def test_body_containing_boundary(self):
+        RESPONSE = {"content-type": 'multipart/mixed; boundary="DEADBEEF="'}
+        CONTENT = b"""\
+--DEADBEEF=
+Content-Type: application/json
+
+HTTP/1.1 200 OK
+Content-Type: application/json; charset=UTF-8
+
+{"name": "--DEADBEEF="}
+
+--DEADBEEF=--
+"""
+        (result,) = self._call_fut(RESPONSE, CONTENT)
+        self.assertEqual(result.json(), {"name": "--DEADBEEF="})
+
+    def test_not_multipart(self):
+        with self.assertRaises(ValueError):
+            list(self._call_fut({"content-type": "application/json"}, b"{}"))
+
+    def test_wo_boundary_in_content(self):
+        RESPONSE = {"content-type": 'multipart/mixed; boundary="OTHER"'}
+        with self.assertRaises(ValueError):
+            list(self._call_fut(RESPONSE, _THREE_PART_MIME_RESPONSE))
+
+    def test_missing_closing_boundary(self):
+        RESPONSE = {"content-type": 'multipart/mixed; boundary="DEADBEEF="'}
+        CONTENT = _THREE_PART_MIME_RESPONSE[: -len(b"--DEADBEEF=--\n")]
+        result = self._call_fut(RESPONSE, CONTENT)
+        self.assertEqual(next(result).status_code, http_client.OK)
+        self.assertEqual(next(result).status_code, http_client.OK)
+        with self.assertRaises(ValueError):
+            next(result)
+
 
 _TWO_PART_MIME_RESPONSE_WITH_FAIL = b"""\
 --DEADBEEF=
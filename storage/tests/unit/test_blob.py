@@ -1174,6 +1174,306 @@ class Test_Blob(unittest.TestCase):
 
         self._check_session_mocks(client, transport, media_link)
 
+    def test_open_read_text(self):
+        data = u"first line\nsecond l\u00efne\n".encode("utf-8")
+        transport = self._mock_sliced_download_transport(data)
+        client = mock.Mock(_http=transport, spec=["_http"])
+        blob = self._make_one(
+            "blob-name", bucket=_Bucket(client), properties={"size": len(data)}
+        )
+
+        with blob.open("r", encoding="utf-8") as file_obj:
+            lines = list(file_obj)
+
+        self.assertEqual(lines, [u"first line\n", u"second l\u00efne\n"])
+        self.assertEqual(transport.requested_ranges, ["bytes=0-23"])
+
+    def test_open_read_binary(self):
+        import io
+        from google.cloud.storage.fileio import BlobReader
+
+        data = b"0123456789abcdefghij"
+        transport = self._mock_sliced_download_transport(data)
+        client = mock.Mock(_http=transport, spec=["_http"])
+        blob = self._make_one(
+            "blob-name", bucket=_Bucket(client), properties={"size": len(data)}
+        )
+
+        with blob.open("rb", chunk_size=8) as file_obj:
+            self.assertIsInstance(file_obj, io.BufferedReader)
+            self.assertIsInstance(file_obj.raw, BlobReader)
+            chunks = [file_obj.read(3) for _ in range(8)]
+
+        self.assertEqual(b"".join(chunks), data)
+        self.assertEqual(
+            transport.requested_ranges, ["bytes=0-7", "bytes=8-15", "bytes=16-19"]
+        )
+
+    def test_open_read_w_upload_args(self):
+        blob = self._make_one("blob-name", bucket=_Bucket(), properties={"size": 3})
+
+        with self.assertRaises(ValueError):
+            blob.open("r", content_type="text/plain")
+
+    def test_open_write(self):
+        import io
+        from google.cloud.storage.fileio import BlobWriter
+
+        blob = self._make_one("blob-name", bucket=_Bucket(), chunk_size=256 * 1024)
+        client = mock.sentinel.client
+
+        binary = blob.open(
+            "wb", client=client, content_type="text/csv", predefined_acl="private"
+        )
+        text = blob.open("w", encoding="utf-8")
+
+        self.assertIsInstance(binary, BlobWriter)
+        self.assertEqual(binary._chunk_size, 256 * 1024)
+        self.assertIs(binary._client, client)
+        self.assertEqual(binary._content_type, "text/csv")
+        self.assertEqual(binary._predefined_acl, "private")
+        self.assertIsInstance(text, io.TextIOWrapper)
+        self.assertIsInstance(text.buffer, BlobWriter)
+        self.assertEqual(text.encoding, "utf-8")
+
+    def test_open_write_text_small(self):
+        blob = self._make_one("blob-name", bucket=_Bucket())
+        uploaded = []
+
+        def upload_from_file(file_obj, size=None, **kwargs):
+            uploaded.append(file_obj.read(size))
+
+        patch = mock.patch.object(
+            blob, "upload_from_file", side_effect=upload_from_file
+        )
+        with patch:
+            with blob.open("w", encoding="utf-8") as file_obj:
+                file_obj.write(u"caf\u00e9\n")
+
+        self.assertEqual(uploaded, [u"caf\u00e9\n".encode("utf-8")])
+
+    def test_open_write_text_w_exception(self):
+        blob = self._make_one("blob-name", bucket=_Bucket())
+
+        with mock.patch.object(blob, "upload_from_file") as upload_from_file:
+            with self.assertRaises(RuntimeError):
+                with blob.open("w", encoding="utf-8") as file_obj:
+                    file_obj.write(u"partial")
+                    raise RuntimeError("failed")
+
+        self.assertTrue(file_obj.closed)
+        self.assertTrue(file_obj.buffer.closed)
+        upload_from_file.assert_not_called()
+
+    def test_open_invalid_mode(self):
+        blob = self._make_one("blob-name", bucket=_Bucket())
+
+        with self.assertRaises(ValueError):
+            blob.open("a")
+
+    def _mock_sliced_download_transport(self, data, errors=None):
+        import re
+
+        # Serve any byte range of ``data``. ``errors`` maps a range header to
+        # an exception, raised the first time that range is requested.
+        errors = dict(errors or {})
+
+        def request(method, url, data=None, headers=None, **kwargs):
+            range_header = headers["range"]
+            requested_ranges.append(range_header)
+            if range_header in errors:
+                raise errors.pop(range_header)
+            start, end = [
+                int(value)
+                for value in re.match(r"bytes=(\d+)-(\d+)", range_header).groups()
+            ]
+            end = min(end, len(payload) - 1)
+            content = payload[start : end + 1]
+            return self._mock_requests_response(
+                http_client.PARTIAL_CONTENT,
+                {
+                    "content-length": "{:d}".format(len(content)),
+                    "content-range": "bytes {:d}-{:d}/{:d}".format(
+                        start, end, len(payload)
+                    ),
+                },
+                content=content,
+            )
+
+        payload = data
+        requested_ranges = []
+        transport = mock.Mock(spec=["request"])
+        transport.request.side_effect = request
+        transport.requested_ranges = requested_ranges
+        return transport
+
+    def _make_sliced_blob(self, transport, data, **properties):
+        client = mock.Mock(_http=transport, spec=["_http"])
+        bucket = _Bucket(client)
+        properties.setdefault("mediaLink", "http://example.com/media/")
+        properties.setdefault("size", str(len(data)))
+        return self._make_one("blob-name", bucket=bucket, properties=properties)
+
+    @staticmethod
+    def _requested_ranges(transport):
+        return sorted(
+            transport.requested_ranges, key=lambda value: int(value[6:].split("-")[0])
+        )
+
+    def test_download_to_file_sliced(self):
+        data = bytes(bytearray(range(100)))
+        md5_hash = base64.b64encode(hashlib.md5(data).digest()).decode("ascii")
+        transport = self._mock_sliced_download_transport(data)
+        blob = self._make_sliced_blob(transport, data, md5Hash=md5_hash)
+        file_obj = io.BytesIO(b"prefix")
+        file_obj.seek(0, os.SEEK_END)
+
+        blob.download_to_file(file_obj, max_workers=4, slice_size=30)
+
+        self.assertEqual(file_obj.getvalue(), b"prefix" + data)
+        self.assertEqual(file_obj.tell(), 106)
+        self.assertEqual(
+            self._requested_ranges(transport),
+            ["bytes=0-29", "bytes=30-59", "bytes=60-89", "bytes=90-99"],
+        )
+
+    def test_download_to_file_sliced_w_range(self):
+        data = bytes(bytearray(range(100)))
+        transport = self._mock_sliced_download_transport(data)
+        blob = self._make_sliced_blob(transport, data, md5Hash="invalid")
+        file_obj = io.BytesIO()
+
+        blob.download_to_file(file_obj, start=10, end=49, max_workers=2, slice_size=25)
+
+        # Only a whole object can be checked against its hash.
+        self.assertEqual(file_obj.getvalue(), data[10:50])
+        self.assertEqual(
+            self._requested_ranges(transport), ["bytes=10-34", "bytes=35-49"]
+        )
+
+    def test_download_to_file_sliced_w_small_blob(self):
+        data = b"abcdef"
+        transport = self._mock_sliced_download_transport(data)
+        blob = self._make_sliced_blob(transport, data)
+
+        with mock.patch.object(blob, "_do_download") as do_download:
+            blob.download_to_file(io.BytesIO(), max_workers=4, slice_size=30)
+
+        do_download.assert_called_once()
+
+    def test_download_to_file_sliced_wo_size(self):
+        data = bytes(bytearray(range(100)))
+        transport = self._mock_sliced_download_transport(data)
+        blob = self._make_sliced_blob(transport, data)
+        del blob._properties["size"]
+
+        def reload(client=None):
+            blob._properties["size"] = str(len(data))
+
+        file_obj = io.BytesIO()
+        with mock.patch.object(blob, "reload", side_effect=reload) as reload_mock:
+            blob.download_to_file(file_obj, max_workers=4, slice_size=50)
+
+        reload_mock.assert_called_once_with(client=None)
+        self.assertEqual(file_obj.getvalue(), data)
+
+    def test_download_to_file_sliced_resumes_failed_slice(self):
+        import requests
+
+        data = bytes(bytearray(range(100)))
+        transport = self._mock_sliced_download_transport(
+            data, errors={"bytes=70-89": requests.exceptions.ConnectionError()}
+        )
+        blob = self._make_sliced_blob(transport, data)
+        file_obj = io.BytesIO()
+
+        with mock.patch("google.cloud.storage.blob._SLICE_CHUNK_SIZE", new=20):
+            blob.download_to_file(file_obj, max_workers=2, slice_size=50)
+
+        self.assertEqual(file_obj.getvalue(), data)
+        # The failed slice was resumed from its first missing byte.
+        self.assertEqual(
+            self._requested_ranges(transport),
+            [
+                "bytes=0-19",
+                "bytes=20-39",
+                "bytes=40-49",
+                "bytes=50-69",
+                "bytes=70-89",
+                "bytes=70-89",
+                "bytes=90-99",
+            ],
+        )
+
+    def test_download_to_file_sliced_w_error_response(self):
+        from google.cloud.exceptions import NotFound
+        from google.resumable_media import InvalidResponse
+
+        data = bytes(bytearray(range(100)))
+        response = self._mock_requests_response(http_client.NOT_FOUND, {})
+        response.request = mock.Mock(method="GET", url="http://example.com/media/")
+        transport = self._mock_sliced_download_transport(
+            data, errors={"bytes=50-99": InvalidResponse(response, "not found")}
+        )
+        blob = self._make_sliced_blob(transport, data)
+
+        with self.assertRaises(NotFound):
+            blob.download_to_file(io.BytesIO(), max_workers=2, slice_size=50)
+
+        self.assertEqual(
+            self._requested_ranges(transport), ["bytes=0-49", "bytes=50-99"]
+        )
+
+    def test_download_to_file_sliced_w_crc32c(self):
+        from google.cloud.storage import _checksums
+        from google.resumable_media import DataCorruption
+
+        data = bytes(bytearray(range(100)))
+        crc32c = _checksums.crc32c_to_base64(_checksums.crc32c_extend(0, data))
+
+        with mock.patch.object(_checksums, "HAS_FAST_CRC32C", new=True):
+            transport = self._mock_sliced_download_transport(data)
+            blob = self._make_sliced_blob(transport, data, crc32c=crc32c)
+            file_obj = io.BytesIO()
+            blob.download_to_file(file_obj, max_workers=3, slice_size=30)
+            self.assertEqual(file_obj.getvalue(), data)
+
+            transport = self._mock_sliced_download_transport(data)
+            blob = self._make_sliced_blob(transport, data, crc32c="AAAAAA==")
+            with self.assertRaises(DataCorruption):
+                blob.download_to_file(io.BytesIO(), max_workers=3, slice_size=30)
+
+    def test_download_to_filename_sliced(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        data = os.urandom(1000)
+        md5_hash = base64.b64encode(hashlib.md5(data).digest()).decode("ascii")
+        transport = self._mock_sliced_download_transport(data)
+        blob = self._make_sliced_blob(transport, data, md5Hash=md5_hash)
+
+        with _NamedTemporaryFile() as temp:
+            blob.download_to_filename(temp.name, max_workers=4, slice_size=128)
+            with open(temp.name, "rb") as file_obj:
+                wrote = file_obj.read()
+
+        self.assertEqual(wrote, data)
+        self.assertEqual(transport.request.call_count, 8)
+
+    def test_download_to_filename_sliced_corrupted(self):
+        from google.resumable_media import DataCorruption
+
+        data = os.urandom(1000)
+        md5_hash = base64.b64encode(hashlib.md5(b"other").digest()).decode("ascii")
+        transport = self._mock_sliced_download_transport(data)
+        blob = self._make_sliced_blob(transport, data, md5Hash=md5_hash)
+
+        filename = os.path.join(tempfile.mkdtemp(), "blob-name")
+        with self.assertRaises(DataCorruption):
+            blob.download_to_filename(filename, max_workers=4, slice_size=128)
+
+        # Make sure the file was cleaned up.
+        self.assertFalse(os.path.exists(filename))
+
     def test__get_content_type_explicit(self):
         blob = self._make_one(u"blob-name", bucket=None)
 
@@ -1276,6 +1576,8 @@ class Test_Blob(unittest.TestCase):
         user_project=None,
         predefined_acl=None,
         kms_key_name=None,
+        checksum=None,
+        expected_checksum=None,
     ):
         from six.moves.urllib.parse import urlencode
 
@@ -1292,7 +1594,13 @@ class Test_Blob(unittest.TestCase):
         stream = io.BytesIO(data)
         content_type = u"application/xml"
         response = blob._do_multipart_upload(
-            client, stream, content_type, size, num_retries, predefined_acl
+            client,
+            stream,
+            content_type,
+            size,
+            num_retries,
+            predefined_acl,
+            checksum=checksum,
         )
 
         # Check the mocks and the returned value.
@@ -1321,10 +1629,14 @@ class Test_Blob(unittest.TestCase):
 
         upload_url += "?" + urlencode(qs_params)
 
+        object_metadata = {"name": "blob-name"}
+        if checksum is not None:
+            object_metadata.update(expected_checksum)
         payload = (
             b"--==0==\r\n"
             + b"content-type: application/json; charset=UTF-8\r\n\r\n"
-            + b'{"name": "blob-name"}\r\n'
+            + json.dumps(object_metadata).encode("utf-8")
+            + b"\r\n"
             + b"--==0==\r\n"
             + b"content-type: application/xml\r\n\r\n"
             + data_read
@@ -1362,6 +1674,30 @@ class Test_Blob(unittest.TestCase):
     def test__do_multipart_upload_with_retry(self, mock_get_boundary):
         self._do_multipart_success(mock_get_boundary, num_retries=8)
 
+    @mock.patch(u"google.resumable_media._upload.get_boundary", return_value=b"==0==")
+    def test__do_multipart_upload_with_crc32c(self, mock_get_boundary):
+        from google.cloud.storage import _checksums
+
+        crc = _checksums.crc32c_extend(0, b"data here hear hier")
+        self._do_multipart_success(
+            mock_get_boundary,
+            checksum="crc32c",
+            expected_checksum={"crc32c": _checksums.crc32c_to_base64(crc)},
+        )
+
+    @mock.patch(u"google.resumable_media._upload.get_boundary", return_value=b"==0==")
+    def test__do_multipart_upload_with_md5(self, mock_get_boundary):
+        self._do_multipart_success(
+            mock_get_boundary,
+            size=4,
+            checksum="md5",
+            expected_checksum={
+                "md5Hash": base64.b64encode(hashlib.md5(b"data").digest()).decode(
+                    "ascii"
+                )
+            },
+        )
+
     def test__do_multipart_upload_bad_size(self):
         blob = self._make_one(u"blob-name", bucket=None)
 
@@ -1669,8 +2005,86 @@ class Test_Blob(unittest.TestCase):
     def test__do_resumable_upload_with_predefined_acl(self):
         self._do_resumable_helper(predefined_acl="private")
 
+    def _do_resumable_checksum_helper(self, stored_checksum):
+        bucket = _Bucket(name="yesterday")
+        blob = self._make_one(u"blob-name", bucket=bucket)
+        blob.chunk_size = blob._CHUNK_SIZE_MULTIPLE
+        data = b"<html>" + (b"A" * blob.chunk_size) + b"</html>"
+
+        resumable_url = "http://test.invalid?upload_id=and-then-there-was-1"
+        headers1 = {"location": resumable_url}
+        headers2 = {"range": "bytes=0-{:d}".format(blob.chunk_size - 1)}
+        transport, responses = self._make_resumable_transport(
+            headers1, headers2, {}, len(data)
+        )
+        responses[2]._content = json.dumps(
+            {"size": str(len(data)), "crc32c": stored_checksum}
+        ).encode("utf-8")
+        client = mock.Mock(_http=transport, spec=["_http"])
+        blob.delete = mock.Mock(spec=[])
+
+        response = blob._do_resumable_upload(
+            client, io.BytesIO(data), u"text/html", None, None, None, checksum="crc32c"
+        )
+
+        self.assertIs(response, responses[2])
+        return blob, client, data
+
+    def test__do_resumable_upload_with_checksum(self):
+        from google.cloud.storage import _checksums
+
+        data = b"<html>" + (b"A" * (256 * 1024)) + b"</html>"
+        expected = _checksums.crc32c_to_base64(_checksums.crc32c_extend(0, data))
+
+        blob, _, _ = self._do_resumable_checksum_helper(expected)
+
+        blob.delete.assert_not_called()
+
+    def test__do_resumable_upload_with_checksum_mismatch(self):
+        from google.resumable_media import DataCorruption
+
+        with self.assertRaises(DataCorruption) as exc_info:
+            self._do_resumable_checksum_helper("AAAAAA==")
+
+        self.assertIn("Checksum mismatch while uploading", str(exc_info.exception))
+        self.assertIn("AAAAAA==", str(exc_info.exception))
+
+    def test__do_resumable_upload_with_checksum_mismatch_deletes(self):
+        from google.resumable_media import DataCorruption
+        from google.cloud.storage import blob as blob_module
+
+        blob = self._make_one(u"blob-name", bucket=_Bucket(name="yesterday"))
+        blob.delete = mock.Mock(spec=[])
+        client = mock.sentinel.client
+        response = mock.Mock(spec=["json"])
+        response.json.return_value = {"crc32c": "AAAAAA=="}
+
+        with self.assertRaises(DataCorruption):
+            blob_module._check_upload_checksum(
+                blob, client, response, "crc32c", "4waSgw=="
+            )
+
+        blob.delete.assert_called_once_with(client=client)
+
+    def test__check_upload_checksum_wo_stored_checksum(self):
+        from google.cloud.storage import blob as blob_module
+
+        blob = self._make_one(u"blob-name", bucket=_Bucket(name="yesterday"))
+        blob.delete = mock.Mock(spec=[])
+        response = mock.Mock(spec=["json"])
+        response.json.return_value = {"size": "9"}
+
+        blob_module._check_upload_checksum(blob, None, response, "md5", "abc")
+
+        blob.delete.assert_not_called()
+
     def _do_upload_helper(
-        self, chunk_size=None, num_retries=None, predefined_acl=None, size=None
+        self,
+        chunk_size=None,
+        num_retries=None,
+        predefined_acl=None,
+        size=None,
+        checksum=None,
     ):
         blob = self._make_one(u"blob-name", bucket=None)
 
@@ -1694,19 +2108,37 @@ class Test_Blob(unittest.TestCase):
             size = 12345654321
         # Make the request and check the mocks.
         created_json = blob._do_upload(
-            client, stream, content_type, size, num_retries, predefined_acl
+            client,
+            stream,
+            content_type,
+            size,
+            num_retries,
+            predefined_acl,
+            checksum=checksum,
         )
         self.assertIs(created_json, mock.sentinel.json)
         response.json.assert_called_once_with()
         if size is not None and size <= google.cloud.storage.blob._MAX_MULTIPART_SIZE:
             blob._do_multipart_upload.assert_called_once_with(
-                client, stream, content_type, size, num_retries, predefined_acl
+                client,
+                stream,
+                content_type,
+                size,
+                num_retries,
+                predefined_acl,
+                checksum=checksum,
             )
             blob._do_resumable_upload.assert_not_called()
         else:
             blob._do_multipart_upload.assert_not_called()
             blob._do_resumable_upload.assert_called_once_with(
-                client, stream, content_type, size, num_retries, predefined_acl
+                client,
+                stream,
+                content_type,
+                size,
+                num_retries,
+                predefined_acl,
+                checksum=checksum,
             )
 
     def test__do_upload_uses_multipart(self):
@@ -1721,6 +2153,9 @@ class Test_Blob(unittest.TestCase):
     def test__do_upload_with_retry(self):
         self._do_upload_helper(num_retries=20)
 
+    def test__do_upload_w_checksum(self):
+        self._do_upload_helper(checksum="crc32c")
+
     def _upload_from_file_helper(self, side_effect=None, **kwargs):
         from google.cloud._helpers import UTC
 
@@ -1750,8 +2185,15 @@ class Test_Blob(unittest.TestCase):
 
         # Check the mock.
         num_retries = kwargs.get("num_retries")
+        checksum = kwargs.get("checksum")
         blob._do_upload.assert_called_once_with(
-            client, stream, content_type, len(data), num_retries, predefined_acl
+            client,
+            stream,
+            content_type,
+            len(data),
+            num_retries,
+            predefined_acl,
+            checksum=checksum,
         )
         return stream
 
@@ -1759,6 +2201,9 @@ class Test_Blob(unittest.TestCase):
         stream = self._upload_from_file_helper(predefined_acl="private")
         assert stream.tell() == 2
 
+    def test_upload_from_file_with_checksum(self):
+        self._upload_from_file_helper(checksum="md5")
+
     @mock.patch("warnings.warn")
     def test_upload_from_file_with_retries(self, mock_warn):
         from google.cloud.storage import blob as blob_module
@@ -1801,7 +2246,7 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(pos_args[3], size)
         self.assertIsNone(pos_args[4])  # num_retries
         self.assertIsNone(pos_args[5])  # predefined_acl
-        self.assertEqual(kwargs, {})
+        self.assertEqual(kwargs, {"checksum": None})
 
         return pos_args[1]
 
@@ -1836,6 +2281,174 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(stream.mode, "rb")
         self.assertEqual(stream.name, temp.name)
 
+    def _composite_upload_helper(self, data, max_workers=4, part_size=10, **kwargs):
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.storage.blob import Blob
+
+        blob = self._make_one("blob-name", bucket=_Bucket())
+        uploaded = {}
+        composed = []
+        deleted = []
+
+        def upload_from_file(part, file_obj, size=None, client=None, checksum=None):
+            uploaded[part.name] = file_obj.read()
+            self.assertEqual(len(uploaded[part.name]), size)
+
+        def compose(composite, sources, client=None):
+            composed.append((composite.name, [source.name for source in sources]))
+            uploaded[composite.name] = b"".join(
+                uploaded[source.name] for source in sources
+            )
+
+        def delete(temporary, client=None):
+            deleted.append(temporary.name)
+
+        with mock.patch.object(
+            Blob, "upload_from_file", autospec=True, side_effect=upload_from_file
+        ), mock.patch.object(
+            Blob, "compose", autospec=True, side_effect=compose
+        ), mock.patch.object(
+            Blob, "delete", autospec=True, side_effect=delete
+        ):
+            with _NamedTemporaryFile() as temp:
+                with open(temp.name, "wb") as file_obj:
+                    file_obj.write(data)
+
+                blob.upload_from_filename(
+                    temp.name,
+                    content_type="text/plain",
+                    max_workers=max_workers,
+                    part_size=part_size,
+                    **kwargs
+                )
+
+        return blob, uploaded, composed, deleted
+
+    def test_upload_from_filename_composite(self):
+        data = bytes(bytearray(range(95)))
+
+        blob, uploaded, composed, deleted = self._composite_upload_helper(data)
+
+        self.assertEqual(blob.content_type, "text/plain")
+        self.assertEqual(len(composed), 1)
+        name, sources = composed[0]
+        self.assertEqual(name, "blob-name")
+        self.assertEqual(len(sources), 10)
+        self.assertEqual(uploaded["blob-name"], data)
+        self.assertEqual(sorted(deleted), sorted(sources))
+        for source in sources:
+            self.assertTrue(source.startswith("blob-name.composite-"))
+
+    def test_upload_from_filename_composite_w_intermediate_composites(self):
+        data = os.urandom(1000)
+
+        _, uploaded, composed, deleted = self._composite_upload_helper(data)
+
+        # 100 parts are composed into 4 intermediate blobs, then into one.
+        self.assertEqual(len(composed), 5)
+        self.assertEqual(
+            sorted(len(sources) for _, sources in composed[:4]), [4, 32, 32, 32]
+        )
+        self.assertEqual(composed[-1][0], "blob-name")
+        self.assertEqual(
+            sorted(composed[-1][1]), sorted(name for name, _ in composed[:4])
+        )
+        self.assertEqual(uploaded["blob-name"], data)
+        self.assertEqual(len(deleted), 104)
+        self.assertNotIn("blob-name", deleted)
+
+    def test_upload_from_filename_composite_w_component_limit(self):
+        from google.cloud.storage.blob import _MAX_COMPOSITE_COMPONENTS
+
+        data = os.urandom(_MAX_COMPOSITE_COMPONENTS * 2)
+
+        _, uploaded, _, deleted = self._composite_upload_helper(data, part_size=1)
+
+        self.assertEqual(uploaded["blob-name"], data)
+        parts = [name for name in deleted if len(uploaded[name]) == 2]
+        self.assertEqual(len(parts), _MAX_COMPOSITE_COMPONENTS)
+
+    def test_upload_from_filename_composite_cleans_up_on_error(self):
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.exceptions import NotFound
+        from google.cloud.exceptions import ServiceUnavailable
+        from google.cloud.storage.blob import Blob
+
+        blob = self._make_one("blob-name", bucket=_Bucket())
+        deleted = []
+
+        def upload_from_file(part, file_obj, size=None, client=None, checksum=None):
+            if part.name.endswith("00002"):
+                raise ServiceUnavailable("try again")
+
+        def delete(temporary, client=None):
+            deleted.append(temporary.name)
+            raise NotFound("never created")
+
+        with mock.patch.object(
+            Blob, "upload_from_file", autospec=True, side_effect=upload_from_file
+        ), mock.patch.object(
+            Blob, "compose", autospec=True
+        ) as compose, mock.patch.object(
+            Blob, "delete", autospec=True, side_effect=delete
+        ):
+            with _NamedTemporaryFile() as temp:
+                with open(temp.name, "wb") as file_obj:
+                    file_obj.write(b"x" * 50)
+
+                with self.assertRaises(ServiceUnavailable):
+                    blob.upload_from_filename(temp.name, max_workers=2, part_size=10)
+
+        compose.assert_not_called()
+        self.assertEqual(len(deleted), 5)
+
+    def test_upload_from_filename_composite_w_small_file(self):
+        blob = self._make_one("blob-name", bucket=None)
+        blob._do_upload = mock.Mock(return_value={}, spec=[])
+        blob._do_composite_upload = mock.Mock(spec=[])
+
+        with tempfile.NamedTemporaryFile() as temp:
+            temp.write(b"small")
+            temp.flush()
+            blob.upload_from_filename(temp.name, max_workers=4, part_size=10)
+
+        blob._do_composite_upload.assert_not_called()
+        blob._do_upload.assert_called_once()
+
+    def test_upload_from_filename_composite_w_predefined_acl(self):
+        blob = self._make_one("blob-name", bucket=None)
+        blob._do_upload = mock.Mock(return_value={}, spec=[])
+        blob._do_composite_upload = mock.Mock(spec=[])
+
+        with tempfile.NamedTemporaryFile() as temp:
+            temp.write(b"x" * 50)
+            temp.flush()
+            blob.upload_from_filename(
+                temp.name, max_workers=4, part_size=10, predefined_acl="private"
+            )
+
+        blob._do_composite_upload.assert_not_called()
+        blob._do_upload.assert_called_once()
+
+    def test_upload_from_filename_composite_w_kms_key_name(self):
+        kms_resource = (
+            "projects/test-project-123/"
+            "locations/us/"
+            "keyRings/test-ring/"
+            "cryptoKeys/test-key"
+        )
+        blob = self._make_one("blob-name", bucket=None, kms_key_name=kms_resource)
+        blob._do_upload = mock.Mock(return_value={}, spec=[])
+        blob._do_composite_upload = mock.Mock(spec=[])
+
+        with tempfile.NamedTemporaryFile() as temp:
+            temp.write(b"x" * 50)
+            temp.flush()
+            blob.upload_from_filename(temp.name, max_workers=4, part_size=10)
+
+        blob._do_composite_upload.assert_not_called()
+        blob._do_upload.assert_called_once()
+
     def _upload_from_string_helper(self, data, **kwargs):
         from google.cloud._helpers import _to_bytes
 
@@ -2350,6 +2963,33 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(rewritten, 33)
         self.assertEqual(size, 42)
 
+    def test_rewrite_w_max_bytes_rewritten_per_call(self):
+        RESPONSE = {
+            "totalBytesRewritten": 1048576,
+            "objectSize": 4194304,
+            "done": False,
+            "rewriteToken": "TOKEN2",
+        }
+        response = ({"status": http_client.OK}, RESPONSE)
+        connection = _Connection(response)
+        client = _Client(connection)
+        bucket = _Bucket(client=client)
+        source_blob = self._make_one("source", bucket=bucket)
+        dest_blob = self._make_one("dest", bucket=bucket)
+
+        token, rewritten, size = dest_blob.rewrite(
+            source_blob, token="TOKEN1", max_bytes_rewritten_per_call=1048576
+        )
+
+        self.assertEqual(token, "TOKEN2")
+        self.assertEqual(rewritten, 1048576)
+        self.assertEqual(size, 4194304)
+        kw = connection._requested
+        self.assertEqual(
+            kw[0]["query_params"],
+            {"rewriteToken": "TOKEN1", "maxBytesRewrittenPerCall": 1048576},
+        )
+
     def test_rewrite_w_generations(self):
         SOURCE_BLOB = "source"
         SOURCE_GENERATION = 42
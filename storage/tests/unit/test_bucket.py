@@ -16,6 +16,7 @@ import datetime
 import unittest
 
 import mock
+from six.moves import http_client
 
 
 def _create_signing_credentials():
@@ -795,6 +796,116 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw["path"], "/b/%s/o" % NAME)
         self.assertEqual(kw["query_params"], {"projection": "noAcl"})
 
+    def test_list_blobs_w_prefetch(self):
+        from google.cloud.storage import _listing
+        from google.cloud.storage.blob import Blob
+
+        NAME = "name"
+        connection = _Connection(
+            {"items": [{"name": "a"}], "nextPageToken": "token"},
+            {"items": [{"name": "b"}]},
+        )
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+
+        iterator = bucket.list_blobs(prefetch=True)
+        blobs = list(iterator)
+
+        self.assertIsInstance(iterator, _listing.PrefetchingHTTPIterator)
+        self.assertEqual([blob.name for blob in blobs], ["a", "b"])
+        self.assertIsInstance(blobs[0], Blob)
+        self.assertEqual(
+            [kw["query_params"] for kw in connection._requested],
+            [{"projection": "noAcl"}, {"projection": "noAcl", "pageToken": "token"}],
+        )
+
+    def test_list_blob_summaries(self):
+        from google.cloud.storage.bucket import _BLOB_SUMMARY_FIELDS
+        from google.cloud.storage.bucket import BlobSummary
+
+        NAME = "name"
+        USER_PROJECT = "user-project-123"
+        connection = _Connection(
+            {
+                "items": [{"name": "a", "size": "3", "generation": "12"}],
+                "nextPageToken": "token",
+            },
+            {"items": [{"name": "b", "size": "0", "generation": "34"}]},
+        )
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME, user_project=USER_PROJECT)
+
+        summaries = list(bucket.list_blob_summaries(prefix="pre", versions=True))
+
+        self.assertEqual(summaries, [BlobSummary("a", 3, 12), BlobSummary("b", 0, 34)])
+        expected = {
+            "projection": "noAcl",
+            "prefix": "pre",
+            "versions": True,
+            "fields": _BLOB_SUMMARY_FIELDS,
+            "userProject": USER_PROJECT,
+        }
+        self.assertEqual(connection._requested[0]["query_params"], expected)
+        expected["pageToken"] = "token"
+        self.assertEqual(connection._requested[1]["query_params"], expected)
+
+    def test_list_blob_summaries_w_fan_out(self):
+        import threading
+        from google.cloud.storage.bucket import BlobSummary
+
+        def item(name):
+            return {"name": name, "size": str(len(name)), "generation": "1"}
+
+        # Listings of each prefix, with "/" as the delimiter.
+        responses = {
+            (None, None): {
+                "items": [item("top")],
+                "prefixes": ["a/", "b/"],
+                "nextPageToken": "more",
+            },
+            (None, "more"): {"items": [item("top2")], "prefixes": ["c/"]},
+            ("a/", None): {"items": [item("a/1"), item("a/2")], "prefixes": ["a/x/"]},
+            ("a/x/", None): {"items": [item("a/x/1")]},
+            ("b/", None): {},
+            ("c/", None): {"items": [item("c/1")]},
+        }
+        lock = threading.Lock()
+        requested = []
+
+        def api_request(method, path, query_params):
+            with lock:
+                requested.append(query_params)
+            key = (query_params.get("prefix"), query_params.get("pageToken"))
+            return responses[key]
+
+        connection = mock.Mock(spec=["api_request"])
+        connection.api_request.side_effect = api_request
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name="name")
+
+        summaries = bucket.list_blob_summaries(fan_out=True, max_workers=3)
+
+        self.assertEqual(
+            sorted(summaries),
+            [
+                BlobSummary("a/1", 3, 1),
+                BlobSummary("a/2", 3, 1),
+                BlobSummary("a/x/1", 5, 1),
+                BlobSummary("c/1", 3, 1),
+                BlobSummary("top", 3, 1),
+                BlobSummary("top2", 4, 1),
+            ],
+        )
+        self.assertEqual(len(requested), 6)
+        for query_params in requested:
+            self.assertEqual(query_params["delimiter"], "/")
+
+    def test_list_blob_summaries_w_fan_out_and_max_results(self):
+        bucket = self._make_one(client=_Client(_Connection()), name="name")
+
+        with self.assertRaises(ValueError):
+            bucket.list_blob_summaries(fan_out=True, max_results=10)
+
     def test_list_notifications(self):
         from google.cloud.storage.notification import BucketNotification
         from google.cloud.storage.notification import _TOPIC_REF_FMT
@@ -1044,6 +1155,92 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw[1]["method"], "DELETE")
         self.assertEqual(kw[1]["path"], "/b/%s/o/%s" % (NAME, NONESUCH))
 
+    def _delete_blobs_batched_helper(self, statuses, **kwargs):
+        NAME = "name"
+        client = mock.Mock(spec=["batch"])
+        batch = client.batch.return_value
+        batch.finish.return_value = [
+            mock.Mock(status_code=status, spec=["status_code"]) for status in statuses
+        ]
+        bucket = self._make_one(client=client, name=NAME, user_project="billed")
+        blob = self._make_blob(NAME, "blob-2")
+        blobs = ["blob-%d" % (index,) for index in range(len(statuses))]
+        blobs[2] = blob
+        return bucket, client, batch, blobs
+
+    def test_delete_blobs_batched(self):
+        bucket, client, batch, blobs = self._delete_blobs_batched_helper(
+            [http_client.NO_CONTENT] * 3
+        )
+
+        bucket.delete_blobs(blobs, max_workers=4)
+
+        client.batch.assert_called_once_with(
+            auto_chunk=True, max_workers=4, raise_exception=False
+        )
+        self.assertEqual(
+            batch.api_request.mock_calls,
+            [
+                mock.call(
+                    method="DELETE",
+                    path="/b/name/o/blob-%d" % (index,),
+                    query_params={"userProject": "billed"},
+                    _target_object=None,
+                )
+                for index in range(3)
+            ],
+        )
+        batch.finish.assert_called_once_with()
+
+    def test_delete_blobs_batched_empty(self):
+        client = mock.Mock(spec=["batch"])
+        bucket = self._make_one(client=client, name="name")
+
+        bucket.delete_blobs([], max_workers=4)
+
+        client.batch.assert_not_called()
+
+    def test_delete_blobs_batched_miss_w_on_error(self):
+        bucket, _, _, blobs = self._delete_blobs_batched_helper(
+            [http_client.NOT_FOUND, http_client.NO_CONTENT, http_client.NOT_FOUND]
+        )
+        errors = []
+
+        bucket.delete_blobs(blobs, on_error=errors.append, max_workers=4)
+
+        self.assertEqual(errors, [blobs[0], blobs[2]])
+
+    def test_delete_blobs_batched_miss_no_on_error(self):
+        from google.cloud.exceptions import NotFound
+
+        bucket, _, batch, blobs = self._delete_blobs_batched_helper(
+            [http_client.NO_CONTENT, http_client.NOT_FOUND, http_client.NO_CONTENT]
+        )
+        for response in batch.finish.return_value:
+            response.json = mock.Mock(return_value={})
+            response.request = mock.Mock(method="DELETE", url="contentid://1")
+
+        with self.assertRaises(NotFound):
+            bucket.delete_blobs(blobs, max_workers=4)
+
+        self.assertEqual(len(batch.api_request.mock_calls), 3)
+
+    def test_delete_blobs_batched_w_other_error(self):
+        from google.cloud.exceptions import Forbidden
+
+        bucket, _, batch, blobs = self._delete_blobs_batched_helper(
+            [http_client.NOT_FOUND, http_client.FORBIDDEN, http_client.NO_CONTENT]
+        )
+        for response in batch.finish.return_value:
+            response.json = mock.Mock(return_value={})
+            response.request = mock.Mock(method="DELETE", url="contentid://1")
+        errors = []
+
+        with self.assertRaises(Forbidden):
+            bucket.delete_blobs(blobs, on_error=errors.append, max_workers=4)
+
+        self.assertEqual(errors, [blobs[0]])
+
     @staticmethod
     def _make_blob(bucket_name, blob_name):
         from google.cloud.storage.blob import Blob
@@ -2740,6 +2937,55 @@ class Test_Bucket(unittest.TestCase):
         credentials = object()
         self._generate_signed_url_v4_helper(credentials=credentials)
 
+    def test_generate_signed_urls(self):
+        import datetime
+
+        bucket = self._make_one(name="bucket_name")
+        credentials = mock.sentinel.credentials
+        expiration = datetime.timedelta(hours=1)
+        urls = ["url-a", "url-b"]
+
+        with mock.patch(
+            "google.cloud.storage.bucket.generate_signed_urls_v4", return_value=urls
+        ) as signer:
+            found = bucket.generate_signed_urls(
+                ["a", u"b \u2603"],
+                expiration,
+                method="get",
+                response_type="text/plain",
+                credentials=credentials,
+                max_workers=4,
+                reuse_for=600,
+            )
+
+        self.assertEqual(found, urls)
+        signer.assert_called_once_with(
+            credentials,
+            ["/bucket_name/a", "/bucket_name/b%20%E2%98%83"],
+            expiration,
+            api_access_endpoint="https://storage.googleapis.com",
+            method="GET",
+            content_type=None,
+            response_type="text/plain",
+            response_disposition=None,
+            headers=None,
+            query_parameters=None,
+            max_workers=4,
+            reuse_for=600,
+        )
+
+    def test_generate_signed_urls_w_client_credentials(self):
+        credentials = _create_signing_credentials()
+        credentials.sign_bytes.return_value = b"DEADBEEF"
+        client = mock.Mock(_credentials=credentials, spec=["_credentials"])
+        bucket = self._make_one(client=client, name="bucket_name")
+
+        urls = bucket.generate_signed_urls(["a", "b"], 3600)
+
+        self.assertEqual(len(urls), 2)
+        self.assertIn("/bucket_name/a?", urls[0])
+        self.assertIn("/bucket_name/b?", urls[1])
+
 
 class _Connection(object):
     _delete_bucket = False
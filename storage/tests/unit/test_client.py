@@ -283,6 +283,16 @@ class TestClient(unittest.TestCase):
         self.assertIsInstance(batch, Batch)
         self.assertIs(batch._client, client)
 
+    def test_batch_w_auto_chunk(self):
+        PROJECT = "PROJECT"
+        CREDENTIALS = _make_credentials()
+
+        client = self._make_one(project=PROJECT, credentials=CREDENTIALS)
+        batch = client.batch(auto_chunk=True, max_workers=4, raise_exception=False)
+        self.assertTrue(batch._auto_chunk)
+        self.assertEqual(batch._max_workers, 4)
+        self.assertFalse(batch._raise_exception)
+
     def test_get_bucket_with_string_miss(self):
         from google.cloud.exceptions import NotFound
 
@@ -0,0 +1,456 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import unittest
+
+import mock
+from six.moves import http_client
+
+
+def _make_blob(size=None, chunk_size=None):
+    blob = mock.Mock(
+        size=size,
+        chunk_size=chunk_size,
+        _encryption_key=None,
+        spec=[
+            "size",
+            "chunk_size",
+            "_encryption_key",
+            "reload",
+            "_get_transport",
+            "_get_download_url",
+            "_initiate_resumable_upload",
+            "_set_properties",
+            "upload_from_file",
+            "delete",
+            "path",
+        ],
+    )
+    blob._get_download_url.return_value = "https://example.com/blob?alt=media"
+    return blob
+
+
+def _ranged_transport(data):
+    """A transport which serves ranges of ``data``."""
+    import requests
+
+    def request(method, url, data=None, headers=None, **kwargs):
+        start, end = headers["range"][len("bytes=") :].split("-")
+        start, end = int(start), int(end)
+        response = requests.Response()
+        response.status_code = http_client.PARTIAL_CONTENT
+        response.headers["content-range"] = "bytes {:d}-{:d}/{:d}".format(
+            start, end, len(served)
+        )
+        response._content = served[start : end + 1]
+        response.headers["content-length"] = str(len(response._content))
+        return response
+
+    served = data
+    return mock.Mock(request=mock.Mock(side_effect=request), spec=["request"])
+
+
+class TestBlobReader(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.fileio import BlobReader
+
+        return BlobReader
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_reloads_size(self):
+        blob = _make_blob()
+        client = mock.sentinel.client
+
+        def reload(client=None):
+            blob.size = 3
+
+        blob.reload.side_effect = reload
+
+        reader = self._make_one(blob, client=client)
+
+        blob.reload.assert_called_once_with(client=client)
+        self.assertTrue(reader.readable())
+        self.assertTrue(reader.seekable())
+        self.assertFalse(reader.writable())
+
+    def test_read_ranges(self):
+        data = b"0123456789"
+        blob = _make_blob(size=len(data))
+        transport = _ranged_transport(data)
+        blob._get_transport.return_value = transport
+        reader = self._make_one(blob)
+
+        self.assertEqual(reader.read(4), b"0123")
+        self.assertEqual(reader.tell(), 4)
+        self.assertEqual(reader.read(100), b"456789")
+        self.assertEqual(reader.read(4), b"")
+
+        ranges = [
+            call[1]["headers"]["range"] for call in transport.request.call_args_list
+        ]
+        self.assertEqual(ranges, ["bytes=0-3", "bytes=4-9"])
+        self.assertEqual(
+            transport.request.call_args[1]["headers"]["accept-encoding"], "gzip"
+        )
+        blob._get_transport.assert_called_once_with(None)
+
+    def test_seek(self):
+        data = b"0123456789"
+        blob = _make_blob(size=len(data))
+        blob._get_transport.return_value = _ranged_transport(data)
+        reader = self._make_one(blob)
+
+        self.assertEqual(reader.seek(6), 6)
+        self.assertEqual(reader.read(2), b"67")
+        self.assertEqual(reader.seek(-4, io.SEEK_CUR), 4)
+        self.assertEqual(reader.read(1), b"4")
+        self.assertEqual(reader.seek(-2, io.SEEK_END), 8)
+        self.assertEqual(reader.read(), b"89")
+        self.assertEqual(reader.seek(20), 20)
+        self.assertEqual(reader.read(1), b"")
+
+    def test_seek_invalid(self):
+        reader = self._make_one(_make_blob(size=10))
+
+        with self.assertRaises(ValueError):
+            reader.seek(-1)
+        with self.assertRaises(ValueError):
+            reader.seek(0, 5)
+
+    def test_read_w_error(self):
+        import requests
+        from google.cloud.exceptions import NotFound
+
+        blob = _make_blob(size=10)
+        response = requests.Response()
+        response.status_code = http_client.NOT_FOUND
+        response.request = requests.Request("GET", "http://example.com").prepare()
+        response._content = b"Not found"
+        transport = mock.Mock(spec=["request"])
+        transport.request.return_value = response
+        blob._get_transport.return_value = transport
+        reader = self._make_one(blob)
+
+        with self.assertRaises(NotFound):
+            reader.read(4)
+
+    def test_read_after_close(self):
+        reader = self._make_one(_make_blob(size=10))
+        reader.close()
+
+        with self.assertRaises(ValueError):
+            reader.read(1)
+
+
+class _FakeUpload(object):
+    """Uploads ``chunk_size`` bytes from a stream on each request."""
+
+    def __init__(self, stream, chunk_size):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self.bytes_uploaded = 0
+        self.chunks = []
+        self.finished = False
+
+    def transmit_next_chunk(self, transport):
+        self._stream.seek(self.bytes_uploaded)
+        chunk = self._stream.read(self._chunk_size)
+        self.chunks.append(chunk)
+        self.bytes_uploaded += len(chunk)
+        if len(chunk) < self._chunk_size:
+            self.finished = True
+        response = mock.Mock(spec=["json"])
+        response.json.return_value = {
+            "size": str(self.bytes_uploaded),
+            "crc32c": "4waSgw==",
+        }
+        return response
+
+
+class TestBlobWriter(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.fileio import BlobWriter
+
+        return BlobWriter
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _expect_upload(blob):
+        uploads = []
+
+        def initiate(client, stream, content_type, size, num_retries, **kwargs):
+            upload = _FakeUpload(stream, kwargs["chunk_size"])
+            uploads.append(upload)
+            return upload, mock.sentinel.transport
+
+        blob._initiate_resumable_upload.side_effect = initiate
+        return uploads
+
+    def test_ctor_defaults(self):
+        from google.cloud.storage.fileio import DEFAULT_CHUNK_SIZE
+
+        writer = self._make_one(_make_blob())
+
+        self.assertEqual(writer._chunk_size, DEFAULT_CHUNK_SIZE)
+        self.assertTrue(writer.writable())
+        self.assertFalse(writer.readable())
+
+    def test_ctor_w_blob_chunk_size(self):
+        writer = self._make_one(_make_blob(chunk_size=1024))
+        self.assertEqual(writer._chunk_size, 1024)
+
+    def test_write_in_chunks(self):
+        blob = _make_blob()
+        uploads = self._expect_upload(blob)
+        client = mock.sentinel.client
+        writer = self._make_one(
+            blob,
+            chunk_size=4,
+            client=client,
+            content_type="text/plain",
+            predefined_acl="private",
+        )
+
+        writer.write(b"012")
+        self.assertEqual(uploads, [])
+        writer.write(b"3456789ab")
+        self.assertEqual(writer.tell(), 12)
+        (upload,) = uploads
+        self.assertEqual(upload.chunks, [b"0123", b"4567", b"89ab"])
+        # Uploaded data is not kept.
+        self.assertEqual(len(writer._buffer), 0)
+
+        writer.write(b"c")
+        writer.close()
+
+        self.assertEqual(upload.chunks, [b"0123", b"4567", b"89ab", b"c"])
+        self.assertTrue(upload.finished)
+        self.assertTrue(writer.closed)
+        blob._set_properties.assert_called_once_with(
+            {"size": "13", "crc32c": "4waSgw=="}
+        )
+        blob._initiate_resumable_upload.assert_called_once_with(
+            client,
+            writer._buffer,
+            "text/plain",
+            None,
+            None,
+            predefined_acl="private",
+            chunk_size=4,
+        )
+        blob.upload_from_file.assert_not_called()
+
+    def test_close_w_checksum(self):
+        blob = _make_blob()
+        uploads = self._expect_upload(blob)
+        writer = self._make_one(blob, chunk_size=4, checksum="crc32c")
+
+        writer.write(b"123456789")
+        writer.close()
+
+        (upload,) = uploads
+        self.assertEqual(upload.chunks, [b"1234", b"5678", b"9"])
+        blob.delete.assert_not_called()
+        blob._set_properties.assert_called_once_with(
+            {"size": "9", "crc32c": "4waSgw=="}
+        )
+
+    def test_close_w_checksum_mismatch(self):
+        from google.resumable_media import DataCorruption
+
+        blob = _make_blob()
+        blob.path = "/b/bucket/o/blob"
+        self._expect_upload(blob)
+        writer = self._make_one(blob, chunk_size=4, checksum="crc32c")
+
+        writer.write(b"987654321")
+        with self.assertRaises(DataCorruption):
+            writer.close()
+
+        self.assertTrue(writer.closed)
+        blob.delete.assert_called_once_with(client=None)
+        blob._set_properties.assert_not_called()
+
+    def test_close_w_whole_chunks(self):
+        blob = _make_blob()
+        uploads = self._expect_upload(blob)
+        writer = self._make_one(blob, chunk_size=4)
+
+        writer.write(b"01234567")
+        writer.close()
+
+        (upload,) = uploads
+        self.assertEqual(upload.chunks, [b"0123", b"4567", b""])
+        self.assertTrue(upload.finished)
+
+    def test_close_w_small_file(self):
+        blob = _make_blob()
+        uploaded = []
+        blob.upload_from_file.side_effect = lambda file_obj, **kwargs: uploaded.append(
+            file_obj.read()
+        )
+        writer = self._make_one(blob, chunk_size=4, content_type="text/plain")
+
+        writer.write(b"01")
+        writer.close()
+        writer.close()
+
+        self.assertEqual(uploaded, [b"01"])
+        blob.upload_from_file.assert_called_once_with(
+            writer._buffer,
+            size=2,
+            content_type="text/plain",
+            client=None,
+            predefined_acl=None,
+            checksum=None,
+        )
+        blob._initiate_resumable_upload.assert_not_called()
+
+    def test_context_manager_w_exception(self):
+        blob = _make_blob()
+        uploads = self._expect_upload(blob)
+
+        with self.assertRaises(RuntimeError):
+            with self._make_one(blob, chunk_size=4) as writer:
+                writer.write(b"012345")
+                raise RuntimeError("failed")
+
+        self.assertTrue(writer.closed)
+        (upload,) = uploads
+        self.assertEqual(upload.chunks, [b"0123"])
+        self.assertFalse(upload.finished)
+        blob._set_properties.assert_not_called()
+        blob.upload_from_file.assert_not_called()
+
+    def test_del_wo_close(self):
+        blob = _make_blob()
+        uploads = self._expect_upload(blob)
+        writer = self._make_one(blob, chunk_size=4)
+        writer.write(b"012345")
+
+        writer.__del__()
+
+        self.assertTrue(writer.closed)
+        (upload,) = uploads
+        self.assertFalse(upload.finished)
+        blob._set_properties.assert_not_called()
+
+    def test_text_wrapper_w_exception(self):
+        from google.cloud.storage.fileio import _TextBlobWriter
+
+        blob = _make_blob()
+        writer = self._make_one(blob, chunk_size=4)
+
+        with self.assertRaises(RuntimeError):
+            with _TextBlobWriter(writer, encoding="utf-8") as file_obj:
+                file_obj.write(u"01")
+                raise RuntimeError("failed")
+
+        self.assertTrue(writer.closed)
+        blob.upload_from_file.assert_not_called()
+
+    def test_text_wrapper_del_wo_close(self):
+        from google.cloud.storage.fileio import _TextBlobWriter
+
+        blob = _make_blob()
+        writer = self._make_one(blob, chunk_size=4)
+        file_obj = _TextBlobWriter(writer, encoding="utf-8")
+        file_obj.write(u"01")
+
+        file_obj.__del__()
+
+        self.assertTrue(writer.closed)
+        blob.upload_from_file.assert_not_called()
+
+    def test_text_wrapper_del_detached(self):
+        from google.cloud.storage.fileio import _TextBlobWriter
+
+        writer = self._make_one(_make_blob())
+        file_obj = _TextBlobWriter(writer, encoding="utf-8")
+        file_obj.detach()
+
+        file_obj.__del__()
+
+        self.assertFalse(writer.closed)
+
+    def test_write_after_close(self):
+        blob = _make_blob()
+        writer = self._make_one(blob)
+        writer.close()
+
+        with self.assertRaises(ValueError):
+            writer.write(b"0")
+
+    def test_upload_w_error(self):
+        from google import resumable_media
+        from google.cloud.exceptions import Forbidden
+
+        blob = _make_blob()
+        upload = mock.Mock(spec=["transmit_next_chunk"])
+        response = mock.Mock(
+            status_code=http_client.FORBIDDEN,
+            text="denied",
+            request=mock.Mock(method="PUT", url="http://example.com"),
+            spec=["status_code", "text", "request", "json"],
+        )
+        upload.transmit_next_chunk.side_effect = resumable_media.InvalidResponse(
+            response
+        )
+        blob._initiate_resumable_upload.return_value = (upload, None)
+        writer = self._make_one(blob, chunk_size=4)
+
+        with self.assertRaises(Forbidden):
+            writer.write(b"0123")
+
+
+class Test_SlidingBuffer(unittest.TestCase):
+    @staticmethod
+    def _make_one():
+        from google.cloud.storage.fileio import _SlidingBuffer
+
+        return _SlidingBuffer()
+
+    def test_write_and_read(self):
+        buff = self._make_one()
+
+        self.assertEqual(buff.write(b"0123"), 4)
+        self.assertEqual(buff.tell(), 0)
+        self.assertEqual(len(buff), 4)
+        self.assertEqual(buff.read(2), b"01")
+        self.assertEqual(buff.write(b"45"), 2)
+        self.assertEqual(buff.tell(), 2)
+        self.assertEqual(buff.read(), b"2345")
+
+    def test_discard(self):
+        buff = self._make_one()
+        buff.write(b"0123456789")
+
+        buff.discard(6)
+
+        self.assertEqual(buff.tell(), 6)
+        self.assertEqual(len(buff), 4)
+        self.assertEqual(buff.read(), b"6789")
+        self.assertEqual(buff.seek(7), 7)
+        self.assertEqual(buff.read(1), b"7")
+        self.assertEqual(buff.seek(-1, io.SEEK_CUR), 7)
+        self.assertEqual(buff.seek(-2, io.SEEK_END), 8)
+        with self.assertRaises(ValueError):
+            buff.seek(5)
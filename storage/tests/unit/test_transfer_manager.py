@@ -0,0 +1,637 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+
+def _make_blob(name, data=b"", error=None):
+    blob = mock.Mock(
+        spec=["name", "client", "upload_from_filename", "download_to_filename"]
+    )
+    blob.name = name
+    blob.client = mock.Mock(_http=None, spec=["_http"])
+
+    def download_to_filename(filename, **kwargs):
+        if error is not None:
+            raise error
+        with open(filename, "wb") as file_obj:
+            file_obj.write(data)
+
+    def upload_from_filename(filename, **kwargs):
+        if error is not None:
+            raise error
+
+    blob.download_to_filename.side_effect = download_to_filename
+    blob.upload_from_filename.side_effect = upload_from_filename
+    return blob
+
+
+class Test_TransferResult(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.transfer_manager import TransferResult
+
+        return TransferResult
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_succeeded(self):
+        result = self._make_one(_make_blob("a"), "a", 100, 2.0)
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.bytes_per_second, 50.0)
+
+    def test_failed(self):
+        error = ValueError("failed")
+        result = self._make_one(_make_blob("a"), "a", 0, 0.0, error)
+        self.assertFalse(result.succeeded)
+        self.assertIs(result.error, error)
+        self.assertEqual(result.bytes_per_second, 0.0)
+
+
+class Test_TransferSummary(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.transfer_manager import TransferSummary
+
+        return TransferSummary
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_it(self):
+        from google.cloud.storage.transfer_manager import TransferResult
+
+        ok1 = TransferResult(_make_blob("a"), "a", 100, 1.0)
+        ok2 = TransferResult(_make_blob("b"), "b", 300, 2.0)
+        failed = TransferResult(_make_blob("c"), "c", 0, 1.0, ValueError())
+        summary = self._make_one([ok1, failed, ok2], 2.0)
+
+        self.assertEqual(list(summary), [ok1, failed, ok2])
+        self.assertEqual(len(summary), 3)
+        self.assertEqual(summary.errors, [failed])
+        self.assertEqual(summary.total_bytes, 400)
+        self.assertEqual(summary.bytes_per_second, 200.0)
+
+    def test_wo_elapsed(self):
+        summary = self._make_one([], 0.0)
+        self.assertEqual(summary.bytes_per_second, 0.0)
+
+
+class _TempDirMixin(object):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+
+class Test_upload_many(_TempDirMixin, unittest.TestCase):
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage.transfer_manager import upload_many
+
+        return upload_many(*args, **kwargs)
+
+    def _write_file(self, name, data):
+        filename = os.path.join(self.temp_dir, name)
+        with open(filename, "wb") as file_obj:
+            file_obj.write(data)
+        return filename
+
+    def test_it(self):
+        from google.cloud.exceptions import Forbidden
+
+        pairs = [
+            (self._write_file("a", b"abc"), _make_blob("a")),
+            (self._write_file("b", b"abcdef"), _make_blob("b", error=Forbidden("no"))),
+            (self._write_file("c", b"abcdefgh"), _make_blob("c")),
+        ]
+
+        summary = self._call_fut(
+            pairs, upload_kwargs={"content_type": "text/plain"}, max_workers=2
+        )
+
+        self.assertEqual([result.blob for result in summary], [b for _, b in pairs])
+        self.assertEqual([result.size for result in summary], [3, 0, 8])
+        self.assertEqual(summary.total_bytes, 11)
+        self.assertEqual(len(summary.errors), 1)
+        self.assertIsInstance(summary.errors[0].error, Forbidden)
+        for filename, blob in pairs:
+            blob.upload_from_filename.assert_called_once_with(
+                filename, content_type="text/plain"
+            )
+
+    def test_w_raise_exception(self):
+        from google.cloud.exceptions import Forbidden
+
+        ok_blob = _make_blob("b")
+        pairs = [
+            (self._write_file("a", b"abc"), _make_blob("a", error=Forbidden("no"))),
+            (self._write_file("b", b"abc"), ok_blob),
+        ]
+
+        with self.assertRaises(Forbidden):
+            self._call_fut(pairs, raise_exception=True)
+
+        # The other uploads still finish.
+        ok_blob.upload_from_filename.assert_called_once()
+
+    def test_w_unknown_worker_type(self):
+        with self.assertRaises(ValueError):
+            self._call_fut([], worker_type="fiber")
+
+
+class Test_download_many(_TempDirMixin, unittest.TestCase):
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage.transfer_manager import download_many
+
+        return download_many(*args, **kwargs)
+
+    def test_it(self):
+        pairs = [
+            (_make_blob("a", b"abc"), os.path.join(self.temp_dir, "a")),
+            (_make_blob("b", b"abcdef"), os.path.join(self.temp_dir, "b")),
+        ]
+
+        summary = self._call_fut(pairs, download_kwargs={"start": 0})
+
+        self.assertEqual(summary.errors, [])
+        self.assertEqual([result.size for result in summary], [3, 6])
+        for blob, filename in pairs:
+            blob.download_to_filename.assert_called_once_with(filename, start=0)
+
+    def test_consumes_pairs_as_downloads_finish(self):
+        from google.cloud.storage import transfer_manager
+
+        listed = []
+        blobs = []
+
+        def pairs():
+            for index in range(6):
+                started = sum(blob.download_to_filename.call_count for blob in blobs)
+                # Only a bounded number of downloads are waiting for workers.
+                self.assertLessEqual(len(listed) - started, 2)
+                name = str(index)
+                listed.append(name)
+                blobs.append(_make_blob(name, b"abc"))
+                yield blobs[-1], os.path.join(self.temp_dir, name)
+
+        with mock.patch.object(transfer_manager, "_MAX_PENDING_PER_WORKER", 2):
+            summary = self._call_fut(pairs(), max_workers=1)
+
+        self.assertEqual([result.blob.name for result in summary], listed)
+        self.assertEqual(summary.total_bytes, 18)
+
+    def test_w_process_workers(self):
+        import concurrent.futures
+        from google.cloud.storage import transfer_manager
+
+        blob = _make_blob("a", b"abc")
+        filename = os.path.join(self.temp_dir, "a")
+        state = {"name": "a"}
+
+        with mock.patch.object(
+            concurrent.futures,
+            "ProcessPoolExecutor",
+            new=concurrent.futures.ThreadPoolExecutor,
+        ), mock.patch.object(
+            transfer_manager, "_blob_to_state", return_value=state
+        ) as to_state, mock.patch.object(
+            transfer_manager, "_blob_from_state", return_value=blob
+        ) as from_state:
+            summary = self._call_fut(
+                [(blob, filename)], worker_type=transfer_manager.PROCESS
+            )
+
+        to_state.assert_called_once_with(blob)
+        from_state.assert_called_once_with(state)
+        self.assertEqual(summary.total_bytes, 3)
+
+
+class Test_download_bucket_prefix(_TempDirMixin, unittest.TestCase):
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage.transfer_manager import download_bucket_prefix
+
+        return download_bucket_prefix(*args, **kwargs)
+
+    def test_it(self):
+        blobs = [
+            _make_blob("data/", b""),
+            _make_blob("data/a", b"abc"),
+            _make_blob("data/sub/b", b"abcdef"),
+            _make_blob("data/../../escape", b"x"),
+        ]
+        bucket = mock.Mock(spec=["list_blobs"])
+        bucket.list_blobs.return_value = iter(blobs)
+        client = mock.sentinel.client
+
+        summary = self._call_fut(bucket, "data/", self.temp_dir, client=client)
+
+        bucket.list_blobs.assert_called_once_with(prefix="data/", client=client)
+        self.assertEqual(
+            [result.blob.name for result in summary],
+            ["data/a", "data/sub/b", "data/../../escape"],
+        )
+        self.assertEqual(summary.total_bytes, 9)
+        with open(os.path.join(self.temp_dir, "data", "sub", "b"), "rb") as file_obj:
+            self.assertEqual(file_obj.read(), b"abcdef")
+        (error,) = summary.errors
+        self.assertIsInstance(error.error, ValueError)
+        blobs[3].download_to_filename.assert_not_called()
+
+
+def _make_copy_destination(name, calls=1, total=3, error=None):
+    """A destination blob whose rewrites finish after ``calls`` calls."""
+    blob = mock.Mock(spec=["name", "client", "storage_class", "rewrite"])
+    blob.name = name
+    blob.client = mock.Mock(_http=None, spec=["_http"])
+    step = total // calls
+
+    def rewrite(source, token=None, max_bytes_rewritten_per_call=None):
+        if error is not None:
+            raise error
+        done = step if token is None else token + step
+        if done >= total:
+            return None, total, total
+        return done, done, total
+
+    blob.rewrite.side_effect = rewrite
+    return blob
+
+
+class Test_copy_many(unittest.TestCase):
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage.transfer_manager import copy_many
+
+        return copy_many(*args, **kwargs)
+
+    def test_it(self):
+        from google.cloud.exceptions import NotFound
+
+        sources = [_make_blob("a"), _make_blob("b"), _make_blob("c")]
+        destinations = [
+            _make_copy_destination("a", calls=3, total=30),
+            _make_copy_destination("b", error=NotFound("no")),
+            _make_copy_destination("c", total=5),
+        ]
+        progress = []
+
+        def progress_callback(source, destination, rewritten, total):
+            progress.append((destination.name, rewritten, total))
+
+        summary = self._call_fut(
+            list(zip(sources, destinations)),
+            max_workers=2,
+            progress_callback=progress_callback,
+        )
+
+        self.assertEqual([result.blob for result in summary], destinations)
+        self.assertEqual([result.source for result in summary], sources)
+        self.assertEqual([result.filename for result in summary], [None] * 3)
+        self.assertEqual([result.size for result in summary], [30, 0, 5])
+        (error,) = summary.errors
+        self.assertIsInstance(error.error, NotFound)
+        self.assertEqual(destinations[0].rewrite.call_count, 3)
+        self.assertEqual(
+            [entry for entry in progress if entry[0] == "a"],
+            [("a", 10, 30), ("a", 20, 30), ("a", 30, 30)],
+        )
+
+    def test_w_raise_exception(self):
+        from google.cloud.exceptions import NotFound
+
+        ok_destination = _make_copy_destination("b")
+        pairs = [
+            (_make_blob("a"), _make_copy_destination("a", error=NotFound("no"))),
+            (_make_blob("b"), ok_destination),
+        ]
+
+        with self.assertRaises(NotFound):
+            self._call_fut(pairs, raise_exception=True)
+
+        ok_destination.rewrite.assert_called_once()
+
+
+class Test__submit_bounded(unittest.TestCase):
+    @staticmethod
+    def _call_fut(submit, tasks, max_pending):
+        from google.cloud.storage.transfer_manager import _submit_bounded
+
+        return _submit_bounded(submit, tasks, max_pending)
+
+    def test_limits_pending_futures(self):
+        import concurrent.futures
+        import time
+
+        futures = []
+
+        def tasks():
+            for index in range(6):
+                # Taken only once fewer than two futures are outstanding.
+                self.assertLessEqual(
+                    len([future for future in futures if not future.done()]), 2
+                )
+                yield index
+
+        def work(task):
+            time.sleep(0.01)
+            return task * 10
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+
+            def submit(task):
+                futures.append(executor.submit(work, task))
+                return futures[-1]
+
+            submitted, outcomes = self._call_fut(submit, tasks(), 2)
+
+        self.assertEqual(submitted, [0, 1, 2, 3, 4, 5])
+        self.assertEqual(outcomes, [0, 10, 20, 30, 40, 50])
+
+
+class Test__copy_blob(unittest.TestCase):
+    @staticmethod
+    def _call_fut(destination, source, kwargs):
+        from google.cloud.storage.transfer_manager import _copy_blob
+
+        return _copy_blob(destination, source, kwargs)
+
+    def test_keeps_limit_for_whole_rewrite(self):
+        source = _make_blob("a")
+        destination = _make_copy_destination("a", calls=3, total=30)
+        sizer = mock.Mock(spec=["size", "observe"])
+        sizer.size.side_effect = [4 * 1024 * 1024, 8 * 1024 * 1024]
+        kwargs = {"sizer": sizer, "progress_callback": None}
+
+        size = self._call_fut(destination, source, kwargs)
+
+        self.assertEqual(size, 30)
+        sizer.size.assert_called_once_with()
+        self.assertEqual(
+            destination.rewrite.mock_calls,
+            [
+                mock.call(source, token=None, max_bytes_rewritten_per_call=4194304),
+                mock.call(source, token=10, max_bytes_rewritten_per_call=4194304),
+                mock.call(source, token=20, max_bytes_rewritten_per_call=4194304),
+            ],
+        )
+        # The last call, which finished the rewrite, is not observed.
+        self.assertEqual(sizer.observe.call_count, 2)
+        for call in sizer.observe.mock_calls:
+            self.assertEqual(call[1][0], 10)
+
+
+class Test__RewriteSizer(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.transfer_manager import _RewriteSizer
+
+        return _RewriteSizer
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_wo_observations(self):
+        sizer = self._make_one(10.0)
+        self.assertIsNone(sizer.size())
+
+    def test_wo_target(self):
+        sizer = self._make_one(None)
+        sizer.observe(1024 * 1024, 1.0)
+        self.assertIsNone(sizer.size())
+
+    def test_rounds_to_mebibytes(self):
+        mib = 1024 * 1024
+        sizer = self._make_one(10.0)
+
+        sizer.observe(3 * mib + 1, 2.0)
+
+        self.assertEqual(sizer.size(), 15 * mib)
+
+    def test_at_least_one_mebibyte(self):
+        sizer = self._make_one(1.0)
+        sizer.observe(10, 1.0)
+        self.assertEqual(sizer.size(), 1024 * 1024)
+
+    def test_smooths_rate(self):
+        from google.cloud.storage import transfer_manager
+
+        mib = 1024 * 1024
+        sizer = self._make_one(1.0)
+
+        sizer.observe(100 * mib, 1.0)
+        sizer.observe(0, 1.0)
+        sizer.observe(mib, 0.0)
+        sizer.observe(200 * mib, 1.0)
+
+        expected = 100 + transfer_manager._REWRITE_RATE_SMOOTHING * 100
+        self.assertEqual(sizer.size(), int(expected) * mib)
+
+
+class Test_copy_bucket_prefix(unittest.TestCase):
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage.transfer_manager import copy_bucket_prefix
+
+        return copy_bucket_prefix(*args, **kwargs)
+
+    def test_it(self):
+        sources = [_make_blob("data/a"), _make_blob("data/sub/b")]
+        source_bucket = mock.Mock(spec=["list_blobs"])
+        source_bucket.list_blobs.return_value = iter(sources)
+        destination_bucket = mock.Mock(spec=["blob"])
+        destination_bucket.blob.side_effect = _make_copy_destination
+        client = mock.sentinel.client
+
+        summary = self._call_fut(
+            source_bucket,
+            "data/",
+            destination_bucket,
+            destination_prefix="archive/",
+            storage_class="COLDLINE",
+            client=client,
+        )
+
+        source_bucket.list_blobs.assert_called_once_with(prefix="data/", client=client)
+        self.assertEqual(
+            [result.blob.name for result in summary], ["archive/a", "archive/sub/b"]
+        )
+        self.assertEqual([result.source for result in summary], sources)
+        for result in summary:
+            self.assertEqual(result.blob.storage_class, "COLDLINE")
+        self.assertEqual(summary.errors, [])
+
+    def test_lists_as_copies_finish(self):
+        from google.cloud.storage import transfer_manager
+
+        listed = []
+        started = []
+
+        def list_blobs(prefix=None, client=None):
+            for index in range(6):
+                listed.append(index)
+                # Only a bounded number of copies are waiting for workers.
+                self.assertLessEqual(len(listed) - len(started), 3)
+                yield _make_blob("data/{}".format(index))
+
+        def make_destination(name):
+            destination = _make_copy_destination(name)
+            rewrite = destination.rewrite.side_effect
+
+            def tracked_rewrite(*args, **kwargs):
+                started.append(name)
+                return rewrite(*args, **kwargs)
+
+            destination.rewrite.side_effect = tracked_rewrite
+            return destination
+
+        source_bucket = mock.Mock(spec=["list_blobs"])
+        source_bucket.list_blobs.side_effect = list_blobs
+        destination_bucket = mock.Mock(spec=["blob"])
+        destination_bucket.blob.side_effect = make_destination
+
+        with mock.patch.object(transfer_manager, "_MAX_PENDING_PER_WORKER", 2):
+            summary = self._call_fut(
+                source_bucket, "data/", destination_bucket, max_workers=1
+            )
+
+        self.assertEqual(
+            [result.blob.name for result in summary],
+            ["data/{}".format(index) for index in range(6)],
+        )
+
+    def test_keeps_names(self):
+        source_bucket = mock.Mock(spec=["list_blobs"])
+        source_bucket.list_blobs.return_value = iter([_make_blob("data/a")])
+        destination_bucket = mock.Mock(spec=["blob"])
+        destination_bucket.blob.side_effect = _make_copy_destination
+
+        summary = self._call_fut(source_bucket, "data/", destination_bucket)
+
+        (result,) = summary
+        self.assertEqual(result.blob.name, "data/a")
+
+    def test_wo_prefix(self):
+        source_bucket = mock.Mock(spec=["list_blobs"])
+        source_bucket.list_blobs.return_value = iter([_make_blob("data/a")])
+        destination_bucket = mock.Mock(spec=["blob"])
+        destination_bucket.blob.side_effect = _make_copy_destination
+
+        summary = self._call_fut(
+            source_bucket, None, destination_bucket, destination_prefix="archive/"
+        )
+
+        source_bucket.list_blobs.assert_called_once_with(prefix=None, client=None)
+        (result,) = summary
+        self.assertEqual(result.blob.name, "archive/data/a")
+
+
+class Test__resize_connection_pool(unittest.TestCase):
+    @staticmethod
+    def _call_fut(client, max_workers):
+        from google.cloud.storage.transfer_manager import _resize_connection_pool
+
+        return _resize_connection_pool(client, max_workers)
+
+    def test_grows_pool(self):
+        import requests
+
+        session = requests.Session()
+        adapter = session.get_adapter("https://")
+        client = mock.Mock(_http=session, spec=["_http"])
+
+        self._call_fut(client, 32)
+
+        self.assertIs(session.get_adapter("https://"), adapter)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 32)
+
+    def test_keeps_custom_adapter(self):
+        import requests
+        import requests.adapters
+
+        class CustomAdapter(requests.adapters.HTTPAdapter):
+            def init_poolmanager(self, *args, **kwargs):
+                kwargs["timeout"] = 42
+                super(CustomAdapter, self).init_poolmanager(*args, **kwargs)
+
+        session = requests.Session()
+        adapter = CustomAdapter(max_retries=5, pool_block=True)
+        session.mount("https://", adapter)
+        client = mock.Mock(_http=session, spec=["_http"])
+
+        self._call_fut(client, 32)
+
+        self.assertIs(session.get_adapter("https://"), adapter)
+        self.assertEqual(adapter.max_retries.total, 5)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        pool_kw = adapter.poolmanager.connection_pool_kw
+        self.assertEqual(pool_kw["maxsize"], 32)
+        self.assertTrue(pool_kw["block"])
+        self.assertEqual(pool_kw["timeout"], 42)
+
+    def test_keeps_larger_pool(self):
+        import requests
+
+        session = requests.Session()
+        adapter = session.get_adapter("https://")
+        client = mock.Mock(_http=session, spec=["_http"])
+
+        self._call_fut(client, 2)
+
+        self.assertIs(session.get_adapter("https://"), adapter)
+
+    def test_wo_session(self):
+        client = mock.Mock(_http=object(), spec=["_http"])
+        self._call_fut(client, 32)
+
+
+class Test__blob_from_state(unittest.TestCase):
+    def test_round_trip(self):
+        from google.cloud.storage import transfer_manager
+        from google.cloud.storage.blob import Blob
+        from google.cloud.storage.bucket import Bucket
+
+        client = mock.Mock(project="project", spec=["project"])
+        bucket = Bucket(client, name="bucket", user_project="billed")
+        blob = Blob("blob-name", bucket, chunk_size=1024 * 1024, kms_key_name="key")
+
+        state = transfer_manager._blob_to_state(blob)
+        process_client = mock.Mock(spec=["bucket"])
+        process_client.bucket.side_effect = lambda name, user_project=None: Bucket(
+            process_client, name=name, user_project=user_project
+        )
+        patch = mock.patch(
+            "google.cloud.storage.client.Client", return_value=process_client
+        )
+        with patch as client_class, mock.patch.object(
+            transfer_manager, "_PROCESS_CLIENT", new=None
+        ):
+            copied = transfer_manager._blob_from_state(state)
+
+        client_class.assert_called_once_with(project="project")
+        self.assertEqual(copied.name, "blob-name")
+        self.assertEqual(copied.bucket.name, "bucket")
+        self.assertEqual(copied.bucket.user_project, "billed")
+        self.assertEqual(copied.chunk_size, 1024 * 1024)
+        self.assertEqual(copied.kms_key_name, "key")